@@ -0,0 +1,57 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+
+
+# Micro benchmark of reference state offset overhead per MEoS state
+#
+# Run from pychemqt root folder:
+#     python3 .script/bench_meosref.py
+#
+# It compare the registry in memory with the previous procedure, reading the
+# MEoSref.json file in each state calculation
+
+import json
+import os
+import sys
+import timeit
+
+
+os.environ["pychemqt"] = os.path.abspath('.')
+for lib in ("freesteam", "openbabel", "CoolProp", "refprop", "ezodf",
+            "openpyxl", "xlwt", "icu", "reportlab", "Qsci"):
+    os.environ[lib] = "False"
+sys.path.insert(0, os.path.abspath('.'))
+sys.path.insert(0, os.path.join(os.path.abspath('.'), "tests"))
+
+import initialization  # noqa
+from lib import meos  # noqa
+from lib.mEoS import H2O  # noqa
+
+
+N = 200
+STATES = [(300+2*i, 1e5+1e5*i) for i in range(N)]
+
+
+def legacy(st, ref="OTO"):
+    """Offset lookup of previous version, reading the file in each state"""
+    name = "%s-%s" % (st.__class__.__name__, st._code)
+    with open(meos._refOffsets.filename, "r") as archivo:
+        dat = json.load(archivo)
+    return dat[name][ref]["h"], dat[name][ref]["s"]
+
+
+# First state, to calculate the offsets and load the registry
+st = H2O(T=300, P=1e5)
+
+t_state = timeit.timeit(
+    lambda: [H2O(T=T, P=P) for T, P in STATES], number=1)/N
+t_registry = timeit.timeit(
+    lambda: st._refOffset("OTO", None), number=10*N)/N/10
+t_legacy = timeit.timeit(lambda: legacy(st), number=10*N)/N/10
+size = os.path.getsize(meos._refOffsets.filename)
+
+print(f"H2O(T, P) state          {t_state*1e6:10.1f} μs")
+print(f"offset, registry         {t_registry*1e6:10.2f} μs")
+print(f"offset, file per state   {t_legacy*1e6:10.2f} μs "
+      f"({size} bytes file)")
+print(f"saved per state          {(t_legacy-t_registry)/t_state*100:10.1f} %")
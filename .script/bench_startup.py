@@ -0,0 +1,87 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+
+
+# Benchmark of startup time, importing the thermodynamic library and launching
+# the main program, each run in a new python interpreter
+#
+# Run from pychemqt root folder:
+#     python3 .script/bench_startup.py [number of runs]
+#
+# The program launch is done without splash and closing at the start of qt
+# main loop, with the offscreen platform if there isn't other defined
+
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+
+N = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+
+PREAMBLE = """
+import os, sys
+os.environ["pychemqt"] = os.path.abspath('.')
+for lib in ("freesteam", "openbabel", "CoolProp", "refprop", "ezodf",
+            "openpyxl", "xlwt", "icu", "reportlab", "Qsci"):
+    os.environ[lib] = "False"
+sys.path.insert(0, os.path.abspath('.'))
+sys.path.insert(0, os.path.join(os.path.abspath('.'), "tests"))
+import initialization
+"""
+
+REPORT = """
+n = len([m for m in sys.modules if m.startswith("lib.mEoS.")])
+print(n, file=sys.stderr)
+"""
+
+LAUNCH = """
+import runpy, sys
+from tools.qt import QtWidgets
+QtWidgets.QApplication.exec = lambda self: 0
+sys.argv = ["pychemqt.py", "-n"]
+try:
+    runpy.run_path("pychemqt.py", run_name="__main__")
+except SystemExit:
+    pass
+"""
+
+CASES = {
+    "import lib.mEoS": PREAMBLE + "import lib.mEoS" + REPORT,
+    "import lib.corriente": PREAMBLE + "import lib.corriente" + REPORT,
+    "launch pychemqt.py": LAUNCH + REPORT}
+
+
+def run(code):
+    """Return the wall time of a new interpreter running code and the number
+    of mEoS fluid modules imported"""
+    env = os.environ.copy()
+    env.setdefault("QT_QPA_PLATFORM", "offscreen")
+    start = time.perf_counter()
+    proc = subprocess.run([sys.executable, "-c", code], env=env,
+                          capture_output=True, text=True, check=False)
+    elapsed = time.perf_counter() - start
+    if proc.returncode:
+        return None, proc.stderr.strip().split("\n")[-1]
+    return elapsed, proc.stderr.strip().split("\n")[-1]
+
+
+# Interpreter without imports, to show the fixed cost of each run
+base = min(run("pass")[0] for i in range(N))
+print(f"{'python interpreter':24} {base*1e3:10.1f} ms")
+
+for name, code in CASES.items():
+    times = []
+    for i in range(N):
+        elapsed, info = run(code)
+        if elapsed is None:
+            break
+        times.append(elapsed)
+
+    if not times:
+        print(f"{name:24} {'failed':>10}    {info}")
+        continue
+    print(f"{name:24} {min(times)*1e3:10.1f} ms "
+          f"(mean {statistics.mean(times)*1e3:0.1f} ms, "
+          f"{info} mEoS modules)")
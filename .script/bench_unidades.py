@@ -0,0 +1,62 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+
+
+# Micro benchmark of unidades instancing, time and memory per instance
+#
+# Run from pychemqt root folder:
+#     python3 .script/bench_unidades.py [reference_unidades.py]
+#
+# Optionally it can be compared with other version of the module, i.e. with
+#     git show <commit>:lib/unidades.py > /tmp/unidades_ref.py
+
+import importlib.util
+import os
+import sys
+import timeit
+import tracemalloc
+
+
+os.environ["pychemqt"] = os.path.abspath('.')
+for lib in ("freesteam", "openbabel", "CoolProp", "refprop", "ezodf",
+            "openpyxl", "xlwt", "icu", "reportlab", "Qsci"):
+    os.environ[lib] = "False"
+sys.path.insert(0, os.path.abspath('.'))
+sys.path.insert(0, os.path.join(os.path.abspath('.'), "tests"))
+
+import initialization  # noqa
+from lib import unidades  # noqa
+
+
+N = 20000
+CASES = (("Temperature", 300.), ("Pressure", 101325.), ("Density", 998.),
+         ("Enthalpy", 2.5e6), ("Energy", 1e3), ("Currency", 1.))
+
+
+def bench(module):
+    """Return time (μs) and memory (bytes) per instance for each case"""
+    results = {}
+    for name, value in CASES:
+        cls = getattr(module, name)
+        t = timeit.timeit(lambda: cls(value), number=N)
+
+        tracemalloc.start()
+        instances = [cls(value) for i in range(N)]
+        size, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        del instances
+        results[name] = (t/N*1e6, size/N)
+    return results
+
+
+modules = [("current", unidades)]
+if len(sys.argv) > 1:
+    spec = importlib.util.spec_from_file_location("reference", sys.argv[1])
+    reference = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(reference)
+    modules.insert(0, ("reference", reference))
+
+for title, module in modules:
+    print(title)
+    for name, (t, size) in bench(module).items():
+        print(f"    {name:12s} {t:8.2f} μs {size:10.1f} bytes")
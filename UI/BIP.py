@@ -28,7 +28,7 @@ Module for UI binary interaction parameter viewer
 from tools.qt import QtWidgets
 
 from lib.bip import Kij, EoSBIP
-from lib.sql import databank
+from lib.sql import getElements
 from UI.widgets import Tabla
 
 
@@ -59,10 +59,8 @@ class Ui_BIP(QtWidgets.QDialog):
 
         # Get component names to show in table header
         names = []
-        for cmp in ids:
-            databank.execute(
-                f"SELECT id, name FROM compuestos WHERE id=={cmp}")
-            names.append("%4i - %s" % databank.fetchone())
+        for cmp in getElements(ids):
+            names.append("%4i - %s" % (cmp[0], cmp[2]))
 
         kw = {"stretch": False, "readOnly": True, "horizontalHeader": names,
               "verticalHeaderLabels": names}
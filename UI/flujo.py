@@ -190,6 +190,9 @@ class GraphicsView(QtWidgets.QGraphicsView):
             elif config.getboolean("Thermo", "meos") and \
                     config.getboolean("Thermo", "coolprop"):
                 txt = "CoolProp"
+            elif config.getboolean("Thermo", "meos") and \
+                    config.getboolean("Thermo", "tabular", fallback=False):
+                txt = "MEoS (tabular)"
             elif config.getboolean("Thermo", "meos"):
                 txt = "MEoS"
             else:
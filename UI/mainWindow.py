@@ -29,7 +29,7 @@ import time
 
 
 import equipment
-from lib import config
+from lib import config, projectFile
 from lib.config import conf_dir, setMainWindowConfig, IMAGE_PATH, Preferences
 from lib.project import Project
 import plots as charts
@@ -1296,82 +1296,86 @@ class UI_pychemqt(QtWidgets.QMainWindow):
         if not self.filename[indice]:
             self.fileSaveAs()
         else:
-            with open(self.filename[indice], "w") as file:
-                data = {}
-                self.getScene(indice).project.writeToJSON(data)
-
-                PFD = {}
-                win = self.centralWidget().currentWidget().subWindowList()[0]
-
-                PFD["minimized"] = win.isMinimized()
-                PFD["maximized"] = win.isMaximized()
+            data = {}
+            self.getScene(indice).project.writeToJSON(data)
+
+            PFD = {}
+            win = self.centralWidget().currentWidget().subWindowList()[0]
+
+            PFD["minimized"] = win.isMinimized()
+            PFD["maximized"] = win.isMaximized()
+            if win.isMinimized():
+                win.showNormal()
+                PFD["x"] = win.pos().x()
+                PFD["y"] = win.pos().y()
+                PFD["height"] = win.size().height()
+                PFD["width"] = win.size().width()
+                win.showMinimized()
+            elif win.isMaximized():
+                win.showNormal()
+                PFD["x"] = win.pos().x()
+                PFD["y"] = win.pos().y()
+                PFD["height"] = win.size().height()
+                PFD["width"] = win.size().width()
+                win.showMaximized()
+            else:
+                PFD["x"] = win.pos().x()
+                PFD["y"] = win.pos().y()
+                PFD["height"] = win.size().height()
+                PFD["width"] = win.size().width()
+
+            self.currentScene.writeToJSON(PFD)
+            data["PFD"] = PFD
+
+            other = {}
+            ventanas = self.centralWidget().currentWidget().subWindowList()
+            for ind, win in enumerate(ventanas[1:]):
+                ventana = {}
+                ventana["class"] = win.widget().__class__.__name__
+                ventana["minimized"] = win.isMinimized()
+                ventana["maximized"] = win.isMaximized()
                 if win.isMinimized():
                     win.showNormal()
-                    PFD["x"] = win.pos().x()
-                    PFD["y"] = win.pos().y()
-                    PFD["height"] = win.size().height()
-                    PFD["width"] = win.size().width()
+                    ventana["x"] = win.pos().x()
+                    ventana["y"] = win.pos().y()
+                    ventana["height"] = win.size().height()
+                    ventana["width"] = win.size().width()
                     win.showMinimized()
                 elif win.isMaximized():
                     win.showNormal()
-                    PFD["x"] = win.pos().x()
-                    PFD["y"] = win.pos().y()
-                    PFD["height"] = win.size().height()
-                    PFD["width"] = win.size().width()
+                    ventana["x"] = win.pos().x()
+                    ventana["y"] = win.pos().y()
+                    ventana["height"] = win.size().height()
+                    ventana["width"] = win.size().width()
                     win.showMaximized()
                 else:
-                    PFD["x"] = win.pos().x()
-                    PFD["y"] = win.pos().y()
-                    PFD["height"] = win.size().height()
-                    PFD["width"] = win.size().width()
-
-                self.currentScene.writeToJSON(PFD)
-                data["PFD"] = PFD
-
-                other = {}
-                ventanas = self.centralWidget().currentWidget().subWindowList()
-                for ind, win in enumerate(ventanas[1:]):
-                    ventana = {}
-                    ventana["class"] = win.widget().__class__.__name__
-                    ventana["minimized"] = win.isMinimized()
-                    ventana["maximized"] = win.isMaximized()
-                    if win.isMinimized():
-                        win.showNormal()
-                        ventana["x"] = win.pos().x()
-                        ventana["y"] = win.pos().y()
-                        ventana["height"] = win.size().height()
-                        ventana["width"] = win.size().width()
-                        win.showMinimized()
-                    elif win.isMaximized():
-                        win.showNormal()
-                        ventana["x"] = win.pos().x()
-                        ventana["y"] = win.pos().y()
-                        ventana["height"] = win.size().height()
-                        ventana["width"] = win.size().width()
-                        win.showMaximized()
-                    else:
-                        ventana["x"] = win.pos().x()
-                        ventana["y"] = win.pos().y()
-                        ventana["height"] = win.size().height()
-                        ventana["width"] = win.size().width()
-
-                    widget = {}
-                    win.widget().writeToJSON(widget)
-                    ventana["window"] = widget
-                    other[ind] = ventana
-
-                    # Add dependences from other windows
-                    if widget.get("external_dependences", None):
-                        data["external_dependences"].add(
-                            widget["external_dependences"])
-
-                data["other"] = other
-
-                # python set are not serializable so convert to list
-                data["external_dependences"] = list(
-                    data["external_dependences"])
-
-                json.dump(data, file, indent=4)
+                    ventana["x"] = win.pos().x()
+                    ventana["y"] = win.pos().y()
+                    ventana["height"] = win.size().height()
+                    ventana["width"] = win.size().width()
+
+                widget = {}
+                win.widget().writeToJSON(widget)
+                ventana["window"] = widget
+                other[ind] = ventana
+
+                # Add dependences from other windows
+                if widget.get("external_dependences", None):
+                    data["external_dependences"].add(
+                        widget["external_dependences"])
+
+            data["other"] = other
+
+            # python set are not serializable so convert to list
+            data["external_dependences"] = list(
+                data["external_dependences"])
+
+            if projectFile.isBinary(self.filename[indice]):
+                projectFile.write(self.filename[indice], data)
+            else:
+                with open(self.filename[indice], "w") as file:
+                    json.dump(data, file, indent=4,
+                              default=projectFile.default)
 
             self.dirty[self.idTab] = False
             self.updateStatus(self.tr("Saved as")+" "+self.filename[indice])
@@ -1386,11 +1390,12 @@ class UI_pychemqt(QtWidgets.QMainWindow):
         fname = QtWidgets.QFileDialog.getSaveFileName(
             self,
             self.tr("Save project"),
-            folder, "pychemqt project file (*.pcq)")
+            folder, "pychemqt project file (*.pcq);;"
+            "pychemqt binary project file (*%s)" % projectFile.EXTENSION)
 
         if fname[0]:
             name = fname[0]
-            if name.split(".")[-1] != "pcq":
+            if name.split(".")[-1] not in ("pcq", projectFile.EXTENSION[1:]):
                 name += ".pcq"
             self.addRecentFile(name)
             self.filename[indice] = name
@@ -1414,7 +1419,8 @@ class UI_pychemqt(QtWidgets.QMainWindow):
             fname = QtWidgets.QFileDialog.getOpenFileName(
                 self,
                 self.tr("Open project"),
-                folder, self.tr("pychemqt project file") + " (*.pcq)")[0]
+                folder, self.tr("pychemqt project file") + " (*.pcq *%s)" %
+                projectFile.EXTENSION)[0]
 
         if fname:
             try:
@@ -1440,8 +1446,7 @@ class UI_pychemqt(QtWidgets.QMainWindow):
             else:
                 return
 
-        with open(fname, "r") as file:
-            data = json.load(file)
+        data = projectFile.load(fname)
 
         # Check availability of optional dependences necessary for the file
         if "external_dependences" in data:
@@ -0,0 +1,168 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+
+"""Pychemqt, Chemical Engineering Process simulator
+Copyright (C) 2009-2025, Juan José Gómez Romera <jjgomera@gmail.com>
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <http://www.gnu.org/licenses/>."""
+
+
+# Main script for performance benchmarks, run from pychemqt root folder:
+#
+#     python3 benchmarks --save baseline.json
+#     python3 benchmarks --compare baseline.json
+#
+# The second run report the benchmarks with statistically significant
+# changes, and exit with error status if any is slower. Use -k to select the
+# benchmarks by name, i.e. -k meos.H2O -k cubic, and --help to see all
+# options. The baselines are dependent of machine, so the comparison must be
+# done with a baseline saved in the same machine.
+
+
+import argparse
+import fnmatch
+import os
+import sys
+import warnings
+
+import numpy as np
+
+
+# Define pychemqt environment
+os.environ["pychemqt"] = os.path.abspath('.')
+os.environ["freesteam"] = "False"
+os.environ["openbabel"] = "False"
+os.environ["CoolProp"] = "False"
+os.environ["refprop"] = "False"
+os.environ["ezodf"] = "False"
+os.environ["openpyxl"] = "False"
+os.environ["xlwt"] = "False"
+os.environ["icu"] = "False"
+os.environ["reportlab"] = "False"
+os.environ["Qsci"] = "False"
+
+# The equipment modules import qt but don't create any widget, so the
+# benchmarks don't need display. The QtWebEngine module, unavailable without
+# display server libraries, is optional in tools.qt. Force the offscreen
+# platform plugin too in case any code try to connect to display
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+sys.path.insert(0, os.path.abspath('.'))
+sys.path.insert(0, os.path.join(os.path.abspath('.'), "tests"))
+
+import initialization  # noqa
+import runner  # noqa
+from workloads import BENCHMARKS  # noqa
+
+# Don't print the numpy RuntimeWarning
+np.seterr("ignore")
+
+warnings.simplefilter("ignore")
+
+
+parser = argparse.ArgumentParser(
+    prog="python3 benchmarks",
+    description="Performance benchmarks of pychemqt thermodynamic library "
+    "and equipment.")
+parser.add_argument(
+    "-k", "--select", action="append", default=[], metavar="PATTERN",
+    help="Run only the benchmarks with name starting with PATTERN or "
+    "matching it as wildcard pattern, it can be repeated")
+parser.add_argument(
+    "-r", "--repeat", type=int, default=7,
+    help="Number of samples of each benchmark, default 7")
+parser.add_argument(
+    "--min-time", type=float, default=0.1, metavar="SECONDS",
+    help="Minimum time of each sample, default 0.1 s")
+parser.add_argument(
+    "--save", metavar="FILE", help="Save the results as json baseline")
+parser.add_argument(
+    "--compare", metavar="FILE", help="Compare the results with a json "
+    "baseline")
+parser.add_argument(
+    "--alpha", type=float, default=0.05,
+    help="Significance level of comparison, default 0.05")
+parser.add_argument(
+    "--threshold", type=float, default=0.05,
+    help="Minimum relative change of median time to report, default 0.05")
+parser.add_argument(
+    "-l", "--list", action="store_true", help="List the benchmarks and exit")
+args = parser.parse_args()
+
+
+def selected(name):
+    """Check if a benchmark is selected in command line"""
+    if not args.select:
+        return True
+    for pattern in args.select:
+        if name.startswith(pattern) or fnmatch.fnmatch(name, pattern):
+            return True
+    return False
+
+
+benchmarks = [bench for bench in BENCHMARKS if selected(bench.name)]
+if not benchmarks:
+    sys.exit("No benchmarks selected")
+if args.list:
+    for bench in benchmarks:
+        print(bench.name)
+    sys.exit()
+
+if args.compare:
+    meta, baseline = runner.load(args.compare)
+    print(f"Baseline {args.compare}: {meta['date']}, commit "
+          f"{meta['commit'] or '-'}, python {meta['python']}")
+else:
+    baseline = None
+if args.repeat < 4 and baseline is not None:
+    print("Warning: the comparison need at least 4 samples to detect "
+          "changes")
+
+results = {}
+for bench in benchmarks:
+    result = runner.measure(bench, args.repeat, args.min_time)
+    results[bench.name] = result
+    if "error" in result:
+        print(f"{bench.name:32} {'failed':>12}    {result['error']}")
+    else:
+        print(f"{bench.name:32} {runner.formatTime(result['median']):>12} "
+              f"± {runner.formatTime(result['stdev']):>10}   "
+              f"({args.repeat}×{result['number']})")
+    sys.stdout.flush()
+
+if args.save:
+    runner.save(args.save, results)
+    print(f"Results saved in {args.save}")
+
+if baseline is None:
+    sys.exit()
+
+print()
+print(f"{'benchmark':32} {'baseline':>12} {'current':>12} {'ratio':>7} "
+      f"{'p-value':>8}  status")
+comparison = runner.compare(baseline, results, args.alpha, args.threshold)
+for row in comparison:
+    old = runner.formatTime(row["baseline"]) if row["baseline"] else "-"
+    new = runner.formatTime(row["current"]) if row["current"] else "-"
+    ratio = f"{row['ratio']:0.3f}" if row["ratio"] else "-"
+    pvalue = f"{row['pvalue']:0.4f}" if row["pvalue"] is not None else "-"
+    print(f"{row['name']:32} {old:>12} {new:>12} {ratio:>7} {pvalue:>8}  "
+          f"{row['status']}")
+
+status = [row["status"] for row in comparison]
+print()
+print(", ".join(f"{status.count(key)} {key}" for key in (
+    "slower", "faster", "same", "new", "failed") if key in status))
+if "slower" in status:
+    sys.exit(1)
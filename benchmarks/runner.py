@@ -0,0 +1,269 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+
+"""Pychemqt, Chemical Engineering Process simulator
+Copyright (C) 2009-2025, Juan José Gómez Romera <jjgomera@gmail.com>
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <http://www.gnu.org/licenses/>."""
+
+
+###############################################################################
+# Timing of benchmarks, json baselines and statistical comparison
+#   - Benchmark: Definition of a workload to time
+#   - measure: Time a benchmark, returning its samples and statistics
+#   - metadata: Information of machine and versions of a run
+#   - save: Save the results of a run as json baseline
+#   - load: Load a json baseline
+#   - compare: Compare the results with a baseline
+#   - formatTime: Format a time in seconds with adequate unit
+###############################################################################
+
+
+from datetime import datetime
+import gc
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+from time import perf_counter
+
+import numpy
+import scipy
+from scipy.stats import mannwhitneyu
+
+
+class Benchmark(object):
+    """Definition of a workload to time
+
+    Parameters
+    ----------
+    name : str
+        Name of benchmark, with format group.name
+    func : callable
+        Workload to time, called with the values returned by setup
+    setup : callable, optional
+        Procedure to prepare the arguments of func, not timed. It's called
+        once, or before each call of func if fresh is True
+    fresh : boolean
+        Run setup before each call, for workloads that modify its arguments,
+        i.e. the incremental calculation of a project
+    teardown : callable, optional
+        Procedure to call after all the samples, not timed
+    """
+
+    def __init__(self, name, func, setup=None, fresh=False, teardown=None):
+        self.name = name
+        self.group = name.split(".")[0]
+        self.func = func
+        self.setup = setup
+        self.fresh = fresh
+        self.teardown = teardown
+
+    def args(self):
+        """Return the arguments of func"""
+        if self.setup is None:
+            return ()
+        return self.setup()
+
+
+def _time(func, args, number):
+    """Return the mean time of number calls of func, with the garbage
+    collector disabled like timeit"""
+    gcold = gc.isenabled()
+    gc.disable()
+    try:
+        t0 = perf_counter()
+        for i in range(number):
+            func(*args)
+        return (perf_counter()-t0)/number
+    finally:
+        if gcold:
+            gc.enable()
+
+
+def measure(bench, repeat=7, min_time=0.1):
+    """Time a benchmark. A first untimed call is done to warm up the caches
+    and imports and calibrate the number of calls of each sample so each one
+    last at least min_time
+
+    Parameters
+    ----------
+    bench : Benchmark
+        Benchmark to time
+    repeat : int
+        Number of samples
+    min_time : float
+        Minimum time of each sample, [s]
+
+    Returns
+    -------
+    result : dict
+        Results of benchmark, with keys:
+
+            * group: Group of benchmark
+            * samples: Mean time of a call in each sample, [s]
+            * number: Number of calls of each sample
+            * min, median, mean, stdev: Statistics of samples, [s]
+            * error: Error message if the benchmark fail, in this case the
+              other keys aren't defined
+    """
+    try:
+        try:
+            args = bench.args()
+            t = _time(bench.func, args, 1)
+            if bench.fresh:
+                number = 1
+            else:
+                number = max(1, int(min_time/max(t, 1e-9)))
+
+            samples = []
+            for i in range(repeat):
+                if bench.fresh:
+                    args = bench.args()
+                samples.append(_time(bench.func, args, number))
+        finally:
+            if bench.teardown is not None:
+                bench.teardown()
+    except Exception as error:
+        return {"group": bench.group,
+                "error": f"{error.__class__.__name__}: {error}"}
+
+    return {"group": bench.group,
+            "samples": samples,
+            "number": number,
+            "min": min(samples),
+            "median": statistics.median(samples),
+            "mean": statistics.mean(samples),
+            "stdev": statistics.stdev(samples) if repeat > 1 else 0}
+
+
+def metadata():
+    """Return the information of machine and versions of a run"""
+    path = os.environ.get("pychemqt", os.path.abspath("."))
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=path,
+            capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = ""
+
+    return {"date": datetime.now().isoformat(timespec="seconds"),
+            "commit": commit,
+            "python": sys.version.split()[0],
+            "numpy": numpy.__version__,
+            "scipy": scipy.__version__,
+            "platform": platform.platform(),
+            "processor": platform.processor() or platform.machine()}
+
+
+def save(fname, results):
+    """Save the results of a run as json baseline, with the run metadata"""
+    data = {"metadata": metadata(), "results": results}
+    with open(fname, "w", encoding="utf-8") as file:
+        json.dump(data, file, indent=1)
+
+
+def load(fname):
+    """Load a json baseline, returning its metadata and results"""
+    with open(fname, encoding="utf-8") as file:
+        data = json.load(file)
+    return data["metadata"], data["results"]
+
+
+def compare(baseline, results, alpha=0.05, threshold=0.05):
+    """Compare the results of a run with a baseline. The samples of each
+    benchmark are compared with the Mann-Whitney U test, a change is only
+    reported if the difference is statistically significant and the ratio of
+    medians is greater than threshold, so the noise of measurement isn't
+    reported as change
+
+    Parameters
+    ----------
+    baseline : dict
+        Results of reference run
+    results : dict
+        Results of current run
+    alpha : float
+        Significance level of test
+    threshold : float
+        Minimum relative change of median to report, [-]
+
+    Returns
+    -------
+    comparison : list
+        List of dicts with the keys name, baseline and current median time,
+        ratio of medians, pvalue of test and status, any of:
+
+            * slower: Significant regression
+            * faster: Significant improvement
+            * same: Without significant change
+            * new: Benchmark not available in baseline
+            * failed: Benchmark failed in current run or in baseline
+
+    Examples
+    --------
+    >>> old = {"a": {"samples": [1.0, 1.01, 0.99, 1.02, 0.98]}}
+    >>> new = {"a": {"samples": [1.2, 1.21, 1.19, 1.22, 1.18]}}
+    >>> compare(old, new)[0]["status"], compare(new, old)[0]["status"]
+    ('slower', 'faster')
+    >>> compare(old, old)[0]["status"]
+    'same'
+    """
+    comparison = []
+    for name, current in results.items():
+        row = {"name": name, "baseline": None, "current": None,
+               "ratio": None, "pvalue": None}
+        comparison.append(row)
+        old = baseline.get(name)
+        if old is None:
+            row["status"] = "new"
+        if "error" in current or (old is not None and "error" in old):
+            row["status"] = "failed"
+        if "status" in row:
+            if "error" not in current:
+                row["current"] = statistics.median(current["samples"])
+            continue
+
+        row["baseline"] = statistics.median(old["samples"])
+        row["current"] = statistics.median(current["samples"])
+        row["ratio"] = row["current"]/row["baseline"]
+        row["pvalue"] = float(mannwhitneyu(
+            old["samples"], current["samples"],
+            alternative="two-sided").pvalue)
+
+        if row["pvalue"] < alpha and row["ratio"] > 1+threshold:
+            row["status"] = "slower"
+        elif row["pvalue"] < alpha and row["ratio"] < 1-threshold:
+            row["status"] = "faster"
+        else:
+            row["status"] = "same"
+    return comparison
+
+
+def formatTime(t):
+    """Format a time in seconds with adequate unit
+
+    Examples
+    --------
+    >>> formatTime(2.5e-5), formatTime(0.1234), formatTime(12)
+    ('25.00 μs', '123.40 ms', '12.00 s')
+    """
+    for unit, factor in (("s", 1), ("ms", 1e-3), ("μs", 1e-6)):
+        if t >= factor:
+            break
+    else:
+        unit, factor = "ns", 1e-9
+    return f"{t/factor:0.2f} {unit}"
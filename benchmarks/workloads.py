@@ -0,0 +1,252 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+
+"""Pychemqt, Chemical Engineering Process simulator
+Copyright (C) 2009-2025, Juan José Gómez Romera <jjgomera@gmail.com>
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <http://www.gnu.org/licenses/>."""
+
+
+###############################################################################
+# Representative workloads of thermodynamic library and equipment
+#   - meos: Single MEoS states of H2O, CO2, R134a and CH4 per input pair,
+#     each call calculate 10 states
+#   - saturation: Sweep of 20 saturation points of MEoS fluids
+#   - cubic: Peng-Robinson flash of mixtures with 5, 20 and 50 components
+#   - gerg: GERG-2008 states of a natural gas
+#   - corriente: Creation of streams
+#   - friction: Sweeps of friction factor correlations
+#   - zfactor: Sweeps of gas compressibility factor correlations
+#   - flowsheet: Solution of project files in Samples folder
+#
+# The modules are imported in the setup of workloads, so the import time
+# isn't timed and a failure only affect to its benchmarks
+###############################################################################
+
+
+import glob
+import os
+
+from runner import Benchmark
+
+
+BENCHMARKS = []
+
+MEOS = ("H2O", "CO2", "R134a", "CH4")
+
+# Mixtures for cubic flash, ids in database, from methane to carbon dioxide
+CUBIC = (5, 20, 50)
+
+# Natural gas composition, index of components in GERG
+NATURAL_GAS = ([0, 1, 2, 3, 14], [0.85, 0.05, 0.04, 0.03, 0.03])
+
+
+def _fluid(name):
+    """Return the MEoS class of fluid"""
+    from lib import mEoS
+    return getattr(mEoS, name)
+
+
+def _points(fluid):
+    """Return the T, P input points of a fluid, in liquid, vapor and
+    supercritical regions"""
+    from numpy import linspace
+
+    Tmin = max(1.05*fluid.Tt, 0.6*fluid.Tc)
+    points = []
+    for T in linspace(Tmin, 1.4*fluid.Tc, 5):
+        for P in (0.3*fluid.Pc, 3*fluid.Pc):
+            points.append((float(T), float(P)))
+    return points
+
+
+def _meos(name, pair):
+    """Return the setup of a MEoS benchmark, the fluid class and the list of
+    input kwargs"""
+    def setup():
+        from numpy import linspace
+
+        fluid = _fluid(name)
+        if pair == "T-x":
+            Tmin = max(1.05*fluid.Tt, 0.6*fluid.Tc)
+            return fluid, [{"T": float(T), "x": 0.5}
+                           for T in linspace(Tmin, 0.95*fluid.Tc, 10)]
+
+        kwargs = []
+        for T, P in _points(fluid):
+            if pair == "T-P":
+                kwargs.append({"T": T, "P": P})
+            else:
+                st = fluid(T=T, P=P)
+                prop = pair[-1]
+                kwargs.append({"P": P, prop: float(getattr(st, prop))})
+        return fluid, kwargs
+    return setup
+
+
+def _states(fluid, kwargs):
+    for kw in kwargs:
+        fluid(**kw)
+
+
+for name in MEOS:
+    for pair in ("T-P", "P-h", "P-s", "T-x"):
+        BENCHMARKS.append(Benchmark(
+            f"meos.{name}.{pair}", _states, _meos(name, pair)))
+
+
+def _saturationSetup(name):
+    def setup():
+        from numpy import linspace
+
+        fluid = _fluid(name)
+        st = fluid(T=fluid.Tc*0.8, x=0.5)
+        Tmin = max(1.05*fluid.Tt, 0.6*fluid.Tc)
+        return st, [float(T) for T in linspace(Tmin, 0.99*fluid.Tc, 20)]
+    return setup
+
+
+def _saturation(st, temperatures):
+    for T in temperatures:
+        st._saturation(T)
+
+
+for name in MEOS:
+    BENCHMARKS.append(Benchmark(
+        f"saturation.{name}", _saturation, _saturationSetup(name)))
+
+
+def _cubicSetup(n):
+    def setup():
+        from lib.EoS.Cubic import PR
+        from lib.mezcla import Mezcla
+
+        ids = list(range(2, 2+n))
+        x = [0.8**i for i in range(n)]
+        return PR, Mezcla(2, ids=ids, caudalUnitarioMolar=x)
+    return setup
+
+
+def _flash(eos, mezcla):
+    eos(300, 2e6, mezcla)
+
+
+for n in CUBIC:
+    BENCHMARKS.append(Benchmark(f"cubic.PR.{n}", _flash, _cubicSetup(n)))
+
+
+def _gergSetup():
+    from lib.gerg import GERG
+    return GERG, NATURAL_GAS[0], NATURAL_GAS[1]
+
+
+def _gerg(eq, componente, fraccion):
+    for T in (250, 300, 350):
+        for P in (1e6, 5e6):
+            eq(T=T, P=P, componente=componente, fraccion=fraccion)
+
+
+BENCHMARKS.append(Benchmark("gerg.T-P", _gerg, _gergSetup))
+
+
+def _corrienteSetup(ids, x, **kwargs):
+    def setup():
+        from lib.corriente import Corriente
+        return Corriente, ids, x, kwargs
+    return setup
+
+
+def _corriente(corriente, ids, x, kwargs):
+    corriente(T=300, P=1e6, caudalMasico=1, ids=ids, fraccionMolar=x,
+              **kwargs)
+
+
+BENCHMARKS.append(Benchmark("corriente.water", _corriente, _corrienteSetup(
+    [62], [1])))
+BENCHMARKS.append(Benchmark(
+    "corriente.hydrocarbons", _corriente, _corrienteSetup(
+        [2, 3, 4, 6], [.4, .3, .2, .1], K="PR", H="PR")))
+
+
+def _frictionSetup():
+    from numpy import logspace, meshgrid
+    from lib.friction import f_friccion, f_list
+
+    Re, eD = meshgrid(logspace(3.5, 8, 20), [0, 1e-5, 1e-4, 1e-3, 1e-2])
+    return f_friccion, f_list, Re.ravel(), eD.ravel()
+
+
+def _frictionScalar(f_friccion, f_list, Re, eD):
+    for re, ed in zip(Re, eD):
+        f_friccion(re, ed)
+
+
+def _frictionArray(f_friccion, f_list, Re, eD):
+    for f in f_list:
+        f(Re, eD)
+
+
+BENCHMARKS.append(Benchmark(
+    "friction.colebrook", _frictionScalar, _frictionSetup))
+BENCHMARKS.append(Benchmark("friction.array", _frictionArray, _frictionSetup))
+
+
+def _zfactorSetup():
+    from numpy import linspace, meshgrid
+    from lib.crude import Z_array, Z_list
+
+    Tr, Pr = meshgrid(linspace(1.2, 2.4, 10), linspace(0.5, 10, 10))
+    return Z_array, Z_list, Tr.ravel(), Pr.ravel()
+
+
+def _zfactorScalar(Z_array, Z_list, Tr, Pr):
+    for tr, pr in zip(Tr, Pr):
+        Z_list[0](tr, pr)
+
+
+def _zfactorArray(Z_array, Z_list, Tr, Pr):
+    for Z in Z_list:
+        Z_array(Z, Tr, Pr)
+
+
+BENCHMARKS.append(Benchmark(
+    "zfactor.Hall_Yarborough", _zfactorScalar, _zfactorSetup))
+BENCHMARKS.append(Benchmark("zfactor.array", _zfactorArray, _zfactorSetup))
+
+
+def _projectSetup(fname):
+    def setup():
+        from lib.batch import load
+        return (load(fname), )
+    return setup
+
+
+def _solve(project):
+    project.solve()
+
+
+def _restoreConfig():
+    """Restore the configuration of project files to the temporal one"""
+    from lib.config import conf_dir, currentConfig
+    currentConfig.read(conf_dir + "pychemqtrc_temporal")
+
+
+# The flowsheets are calculated with a new project in each call, loaded from
+# file out of timing, because the solution is incremental
+path = os.path.join(os.environ.get("pychemqt", "."), "Samples")
+for fname in sorted(glob.glob(os.path.join(path, "*.pcq"))):
+    name = os.path.splitext(os.path.basename(fname))[0]
+    BENCHMARKS.append(Benchmark(
+        f"flowsheet.{name}", _solve, _projectSetup(fname), fresh=True,
+        teardown=_restoreConfig))
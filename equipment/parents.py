@@ -31,6 +31,7 @@ import os
 
 from tools.qt import QtCore, QtGui, QtWidgets, translate
 
+from lib import instrument
 from lib.config import Entity, IMAGE_PATH
 from lib.thread import Evaluate
 from tools.costIndex import indiceBase, indiceActual
@@ -140,7 +141,7 @@ class equipment(Entity):
                     kw_new[key] = value
             logging.debug('kwarg; %s' % kw_new)
             QtWidgets.QApplication.processEvents()
-            self.calculo()
+            self._calculo()
             if self.statusCoste:
                 self.coste()
 
@@ -149,6 +150,18 @@ class equipment(Entity):
         """Each child class must define if its calculable for input kwargs"""
         pass
 
+    def _describe(self, result, record):
+        """Fill the instrumentation record with the equipment status"""
+        record["status"] = self.status
+        record["converged"] = self.status in (1, 3)
+        if not record["converged"]:
+            record["msg"] = self.msg
+
+    @instrument.instrumented("equipment", _describe, "calculo")
+    def _calculo(self):
+        """Run the equipment calculation, instrumented"""
+        self.calculo()
+
     def calculo(self):
         """Procedure to calcute equipment, defined in child class"""
         pass
@@ -145,6 +145,20 @@ class BWRS(EoS):
         h = \sum_i x_i h_i\\
         \end{array}
 
+    Examples
+    --------
+    Two phases split of a light hydrocarbon mixture, near to the Peng-Robinson
+    equation result
+
+    >>> from lib.mezcla import Mezcla
+    >>> from lib.EoS.Cubic import PR
+    >>> zi = [0.5, 0.2, 0.2, 0.1]
+    >>> mix = Mezcla(2, ids=[2, 4, 6, 10], caudalUnitarioMolar=zi)
+    >>> eq = BWRS(300, 2e6, mix)
+    >>> "β = %0.3f" % eq.x
+    'β = 0.630'
+    >>> abs(eq.x-PR(300, 2e6, mix).x) < 0.05
+    True
     """
     __title__ = "Benedict-Webb-Rubin-Starling (1973)"
     __status__ = "BWRS"
@@ -457,9 +471,9 @@ class BWRS(EoS):
         Returns
         -------
         tital : list
-            List with liquid phase component fugacities
+            List with liquid phase component fugacity coefficients
         titav : list
-            List with vapour phase component fugacities
+            List with vapour phase component fugacity coefficients
         """
         kw = self._mix(xi)
 
@@ -467,10 +481,14 @@ class BWRS(EoS):
         Vci = self.mezcla._arraylize("Vc")
         wi = self.mezcla._arraylize("f_acent")
         Mi = self.mezcla._arraylize("M")
-        rho0 = RhoL_CostaldMix(T, xi, Tci, wi, Vci, Mi)
-        Zl = self._Z(xi, rho0=rho0, **kw)
+        # Initial liquid density from COSTALD correlation in molar base
+        M = sum(x*m for x, m in zip(xi, Mi))
+        rho0 = RhoL_CostaldMix(T, xi, Tci, wi, Vci, Mi)/M
+        Zl = self._Z(xi, rho0=rho0, **kw)[0]
         tital = self._fugacity(Zl, xi, **kw)
-        Zv = self._Z(yi, rho0=0, **kw)
+
+        kw = self._mix(yi)
+        Zv = self._Z(yi, rho0=0, **kw)[0]
         titav = self._fugacity(Zv, yi, **kw)
         return tital, titav
 
@@ -519,9 +537,10 @@ class BWRS(EoS):
                              exp(-gamma*rho**2))) -\
                 (2*(c/self.T**2+g/self.T**8+h/self.T**17)*self.gammai[i]**0.5 /
                  gamma**1.5)*(
-                    (1-exp(-gamma*rho**2)) *
+                    1-exp(-gamma*rho**2) *
                     (1+gamma*rho**2+gamma**2*rho**4/2))
-            tita.append(exp(rhs/k.R/self.T)*xi)
+            # rhs is the logarithm of fugacity divided by molar fraction
+            tita.append(exp(rhs/k.R/self.T)/self.P.kPa)
         return tita
 
     def _Hexc(self, Z, T, **kw):
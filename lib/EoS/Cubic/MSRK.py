@@ -352,10 +352,11 @@ class MSRK(SRK):
     >>> from lib.mezcla import Mezcla
     >>> mix = Mezcla(5, ids=[4], caudalMolar=1, fraccionMolar=[1])
     >>> eq = MSRK(300, 9.9742e5, mix)
-    >>> '%0.1f' % ( eq.Vl.ccmol)
+    >>> Zl = eq._Z(eq.zi, eq.T, eq.P)[0]
+    >>> '%0.1f' % (Zl*eq.R*eq.T/eq.P*1e6)
     '98.2'
     >>> eq = MSRK(300, 42.477e5, mix)
-    >>> '%0.1f' % (eq.Vg.ccmol)
+    >>> '%0.1f' % (eq.Vl.ccmol)
     '94.9'
     """
     __title__ = "M-SRK (1979)"
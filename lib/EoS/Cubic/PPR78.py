@@ -99,6 +99,8 @@ class PPR78(PR78):
        "ref": "Fluid Phase Equilibria 243 (2006) 9-28",
        "doi": "10.1016/j.fluid.2006.02.004"})
 
+    _kijT = True
+
     def _Kij(self, eq=None):
         """Calculate binary interaction parameters"""
         group = self.mapUNIFAC()
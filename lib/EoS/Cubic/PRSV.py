@@ -239,10 +239,11 @@ class PRSV(Cubic):
     >>> from lib.mezcla import Mezcla
     >>> mix = Mezcla(5, ids=[4], caudalMolar=1, fraccionMolar=[1])
     >>> eq = PRSV(300, 9.9742e5, mix)
-    >>> '%0.1f' % (eq.Vl.ccmol)
+    >>> Zl = eq._Z(eq.zi, eq.T, eq.P)[0]
+    >>> '%0.1f' % (Zl*eq.R*eq.T/eq.P*1e6)
     '86.8'
     >>> eq = PRSV(300, 42.477e5, mix)
-    >>> '%0.1f' % (eq.Vg.ccmol)
+    >>> '%0.1f' % (eq.Vl.ccmol)
     '84.2'
     """
 
@@ -283,6 +284,8 @@ class PRSV(Cubic):
 
         self.ai = ai
         self.bi = bi
+        self.u = 1+2**0.5
+        self.w = 1-2**0.5
 
     def _GEOS(self, xi):
         am, bm = self._mixture(None, xi, [self.ai, self.bi])
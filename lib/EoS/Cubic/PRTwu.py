@@ -46,10 +46,11 @@ class PRTwu(PR):
     >>> from lib.mezcla import Mezcla
     >>> mix = Mezcla(5, ids=[4], caudalMolar=1, fraccionMolar=[1])
     >>> eq = PRTwu(300, 9.9742e5, mix)
-    >>> '%0.1f' % (eq.Vl.ccmol)
+    >>> Zl = eq._Z(eq.zi, eq.T, eq.P)[0]
+    >>> '%0.1f' % (Zl*eq.R*eq.T/eq.P*1e6)
     '86.8'
     >>> eq = PRTwu(300, 42.477e5, mix)
-    >>> '%0.1f' % (eq.Vg.ccmol)
+    >>> '%0.1f' % (eq.Vl.ccmol)
     '84.1'
 
     It give better result than in example references
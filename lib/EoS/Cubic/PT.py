@@ -157,10 +157,11 @@ class PT(Cubic):
     >>> from lib.mezcla import Mezcla
     >>> mix = Mezcla(5, ids=[4], caudalMolar=1, fraccionMolar=[1])
     >>> eq = PT(300, 9.9742e5, mix)
-    >>> '%0.1f' % (eq.Vl.ccmol)
+    >>> Zl = eq._Z(eq.zi, eq.T, eq.P)[0]
+    >>> '%0.1f' % (Zl*eq.R*eq.T/eq.P*1e6)
     '90.9'
     >>> eq = PT(300, 42.477e5, mix)
-    >>> '%0.1f' % (eq.Vg.ccmol)
+    >>> '%0.1f' % (eq.Vl.ccmol)
     '88.1'
     """
 
@@ -45,10 +45,11 @@ class SRKPeneloux(SRK):
     >>> from lib.mezcla import Mezcla
     >>> mix = Mezcla(5, ids=[4], caudalMolar=1, fraccionMolar=[1])
     >>> eq = SRKPeneloux(300, 9.9742e5, mix)
-    >>> '%0.1f' % (eq.Vl.ccmol)
+    >>> Zl = eq._Z(eq.zi, eq.T, eq.P)[0]
+    >>> '%0.1f' % ((Zl*eq.R*eq.T/eq.P-eq._shift())*1e6)
     '93.1'
     >>> eq = SRKPeneloux(300, 42.477e5, mix)
-    >>> '%0.1f' % (eq.Vg.ccmol)
+    >>> '%0.1f' % (eq.Vl.ccmol)
     '89.7'
 
     # Tiny desviation
@@ -69,12 +70,16 @@ class SRKPeneloux(SRK):
          "ref": "McGraw-Hill, New York, 2001",
          "doi": ""})
 
-    def _volumeCorrection(self):
-        """Apply volume correction to the rhoL property"""
+    def _shift(self):
+        """Volume translation of mixture, [m³/mol]"""
         c = 0
         for cmp, x in zip(self.componente, self.xi):
             c += 0.40768*R*cmp.Tc/cmp.Pc*(0.29441-cmp.rackett)           # Eq 8
+        return c
 
+    def _volumeCorrection(self):
+        """Apply volume correction to the rhoL property"""
+        c = self._shift()
         if self.rhoL:
             v = self.Vl.m3mol-c
             self.rhoL = unidades.MolarDensity(1/v, "molm3")
@@ -43,11 +43,20 @@ class vdW(Cubic):
     >>> from lib.mezcla import Mezcla
     >>> mix = Mezcla(5, ids=[4], caudalMolar=1, fraccionMolar=[1])
     >>> eq = vdW(300, 9.9742e5, mix)
-    >>> '%0.1f' % (eq.Vl.ccmol)
+    >>> Zl = eq._Z(eq.zi, eq.T, eq.P)[0]
+    >>> '%0.1f' % (Zl*eq.R*eq.T/eq.P*1e6)
     '145.4'
     >>> eq = vdW(300, 42.477e5, mix)
-    >>> '%0.1f' % (eq.Vg.ccmol)
+    >>> '%0.1f' % (eq.Vl.ccmol)
     '135.5'
+
+    Two phases flash of a natural gas liquid mixture
+
+    >>> x = [0.5, 0.2, 0.2, 0.1]
+    >>> mix = Mezcla(2, ids=[2, 4, 6, 10], caudalUnitarioMolar=x)
+    >>> eq = vdW(300, 2e6, mix)
+    >>> '%0.3f' % eq.x
+    '0.852'
     """
 
     __title__ = "van der Waals (1890)"
@@ -213,7 +213,7 @@ class Grayson_Streed(EoS):
         nio = self._nio(T, P)
         tital = [n*g for n, g in zip(nio, gi)]
 
-        self.rk._cubicDefinition(T)
+        self.rk._cubicParameters(T)
         Bi = [bi*P/R/T for bi in self.rk.bi]
         Ai = [ai*P/(R*T)**2 for ai in self.rk.ai]
         Z = self.rk._Z(yi, T, P)[-1]
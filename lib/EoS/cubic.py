@@ -53,8 +53,9 @@ not suitable for nonpolar substances with large molecular weight.
 """
 
 
-from math import log, exp
+from math import log
 
+from numpy import asarray, exp
 from scipy.constants import R
 from tools.qt import translate
 
@@ -261,6 +262,11 @@ class Cubic(EoS):
         \delta_2 = -\frac{\sqrt{\delta^2-4\epsilon}+\delta}{2b}
     """
 
+    # Equations with temperature dependent binary interaction parameters,
+    # they are recalculated when the temperature of the component parameters
+    # change, as in saturation point iterations
+    _kijT = False
+
     def __init__(self, T, P, mezcla, **kwargs):
         EoS.__init__(self, T, P, mezcla, **kwargs)
 
@@ -269,7 +275,12 @@ class Cubic(EoS):
         else:
             self.R = R
 
-        self._cubicDefinition(T)
+        # Binary interaction parameters, calculated in the first call to the
+        # mixing rules and reused while the temperature don't change
+        self.kij = None
+        self._Tkij = None
+        self._Tdefinition = None
+        self._cubicParameters(T)
 
 #         if self.mezcla.Tc < T:
 #             self.x = 1
@@ -326,6 +337,14 @@ class Cubic(EoS):
         # to speed up
         pass
 
+    def _cubicParameters(self, T):
+        """Calculate the individual component parameters at temperature T,
+        the values are reused while the temperature don't change, as in
+        flash iterations"""
+        if T != self._Tdefinition:
+            self._cubicDefinition(T)
+            self._Tdefinition = T
+
     def _GEOS(self, xi):
         """Definition of parameters of generalized cubic equation of state,
         each child class must define in this procedure the values of mixture
@@ -362,8 +381,13 @@ class Cubic(EoS):
             List with real root of equation
         """
 
-        self._cubicDefinition(T)
-        tita, b, delta, epsilon = self._GEOS(xi)
+        self._cubicParameters(T)
+        return self._roots(self._GEOS(xi), T, P)
+
+    def _roots(self, parameters, T, P):
+        """Calculate root of cubic polynomial from the parameters of mixture
+        calculated with _GEOS"""
+        tita, b, delta, epsilon = parameters
         B = b*P/self.R/T
         A = tita*P/(self.R*T)**2
 
@@ -383,6 +407,12 @@ class Cubic(EoS):
         except TypeError:
             Z = Z[0:1]
 
+        # Remove the roots without physical meaning, with volume lower than
+        # covolume
+        Zphys = [z for z in Z if z > B]
+        if Zphys:
+            Z = Zphys
+
         return Z
 
     def _fug(self, xi, yi, T, P):
@@ -406,20 +436,20 @@ class Cubic(EoS):
         titav : list
             List with vapour phase component fugacities
         """
-        self._cubicDefinition(T)
-        Bi = [bi*P/self.R/T for bi in self.bi]
-        Ai = [ai*P/(self.R*T)**2 for ai in self.ai]
-
-        al, bl, deltal, epsilonl = self._GEOS(xi)
-        Bl = bl*P/self.R/T
-        Al = al*P/(self.R*T)**2
-        Zl = self._Z(xi, T, P)[0]
+        self._cubicParameters(T)
+        Bi = asarray(self.bi)*P/self.R/T
+        Ai = asarray(self.ai)*P/(self.R*T)**2
+
+        parl = self._GEOS(xi)
+        Bl = parl[1]*P/self.R/T
+        Al = parl[0]*P/(self.R*T)**2
+        Zl = self._roots(parl, T, P)[0]
         tital = self._fugacity(Zl, xi, Al, Bl, Ai, Bi)
 
-        Zv = self._Z(yi, T, P)[-1]
-        av, bv, deltav, epsilonv = self._GEOS(yi)
-        Bv = bv*P/self.R/T
-        Av = av*P/(self.R*T)**2
+        parv = self._GEOS(yi)
+        Bv = parv[1]*P/self.R/T
+        Av = parv[0]*P/(self.R*T)**2
+        Zv = self._roots(parv, T, P)[-1]
         titav = self._fugacity(Zv, yi, Av, Bv, Ai, Bi)
         return tital, titav
 
@@ -431,21 +461,24 @@ class Cubic(EoS):
         Any other subclass with different formulation must overwrite this
         method
         """
-        # Precalculation of inner sum in equation
-        aij = []
-        for ai, kiji in zip(Ai, self.kij):
-            suma = 0
-            for xj, aj, kij in zip(zi, Ai, kiji):
-                suma += xj*(1-kij)*(ai*aj)**0.5
-            aij.append(suma)
-
-        tita = []
-        for bi, aai in zip(Bi, aij):
-            rhs = bi/B*(Z-1) - log(Z-B) + A/B/(self.u-self.w)*(
-                    bi/B-2/A*aai) * log((Z+self.u*B)/(Z+self.w*B))
-            tita.append(exp(rhs))
+        if getattr(self, "u", None) is None:
+            msg = "Derived class %s don't define Liquid-Vapor fugacities" % (
+                self.__class__.__name__)
+            raise NotImplementedError(msg)
 
-        return tita
+        # Precalculation of inner sum in equation
+        Ai = asarray(Ai, dtype=float)
+        Bi = asarray(Bi, dtype=float)
+        sqrtAi = Ai**0.5
+        aij = sqrtAi*((1-self.kij) @ (asarray(zi, dtype=float)*sqrtAi))
+
+        if self.u == self.w:
+            # Limit of logarithmic term for equal parameters, i.e. vdW
+            rhs = Bi/B*(Z-1) - log(Z-B) + (A*Bi/B-2*aij)/(Z+self.u*B)
+        else:
+            rhs = Bi/B*(Z-1) - log(Z-B) + A/B/(self.u-self.w)*(
+                Bi/B-2/A*aij) * log((Z+self.u*B)/(Z+self.w*B))
+        return exp(rhs).tolist()
 
     def _mixture(self, eq, xi, par):
         """Apply mixing rules to individual parameters to get the mixture
@@ -469,7 +502,10 @@ class Cubic(EoS):
         mixpar : list
             List with mixture parameters, [-]
         """
-        self.kij = self._Kij(eq)
+        if self.kij is None or \
+                self._kijT and self._Tkij != self._Tdefinition:
+            self.kij = asarray(self._Kij(eq), dtype=float)
+            self._Tkij = self._Tdefinition
         mixpar = Mixing_Rule(xi, par, self.kij)
         return mixpar
 
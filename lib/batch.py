@@ -0,0 +1,431 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+
+'''Pychemqt, Chemical Engineering Process simulator
+Copyright (C) 2009-2025, Juan José Gómez Romera <jjgomera@gmail.com>
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <http://www.gnu.org/licenses/>.'''
+
+
+###############################################################################
+# Headless calculation of project files and parametric case studies
+#   - load: Load a project file without graphical interface
+#   - parseValue: Convert a command line value to python object
+#   - sweep: Parse a sweep definition
+#   - cases: List of cases of several sweeps
+#   - readCases: Read the cases from a csv file
+#   - setCase: Set the values of a case in a project
+#   - getValue: Get a property of project
+#   - calculate: Calculate a case of project
+#   - run: Calculate a list of cases, optionally in parallel
+#   - write: Save the results in a columnar file, csv or json
+#   - main: Command line entry point, see run.py
+###############################################################################
+
+
+from ast import literal_eval
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+import csv
+from itertools import product
+import json
+import logging
+import multiprocessing
+import os
+import sys
+from time import perf_counter
+
+from numpy import linspace
+
+from lib import projectFile
+from lib.project import Project
+
+
+# Project instance of worker process
+_project = None
+
+
+def load(fname):
+    """Load a project file without the graphical interface. The pychemqt
+    temporal configuration file is not modified
+
+    Parameters
+    ----------
+    fname : str
+        Path of project file, json or binary format
+
+    Returns
+    -------
+    project : Project
+        Project instance, not calculated
+    """
+    data = projectFile.load(fname)
+
+    # Check availability of optional dependences necessary for the file
+    for dep in data.get("external_dependences") or []:
+        if os.environ.get(dep) != "True":
+            raise ImportError(
+                "%s require %s" % (fname, ", ".join(
+                    data["external_dependences"])))
+
+    project = Project(items={}, streams={})
+    project.readFromJSON(data, huella=False)
+    return project
+
+
+def parseValue(txt):
+    """Convert a value in text format to python object, number, list or
+    string if it isn't a python literal
+
+    Examples
+    --------
+    >>> parseValue("1e5"), parseValue("[0.5, 0.5]"), parseValue("name")
+    (100000.0, [0.5, 0.5], 'name')
+    """
+    try:
+        return literal_eval(txt)
+    except (ValueError, SyntaxError):
+        return txt
+
+
+def sweep(spec):
+    """Parse a sweep definition of a property, with format ID.KWARG=VALUES,
+    where ID is the id of equipment or input stream, KWARG the name of input
+    kwarg to change and VALUES any of:
+
+        * START:STOP:NUM: NUM values equally spaced from START to STOP
+        * A list of values separated with comma
+        * A single value
+
+    Parameters
+    ----------
+    spec : str
+        Sweep definition
+
+    Returns
+    -------
+    key : str
+        Property changed, ID.KWARG
+    values : list
+        List of values of property
+
+    Examples
+    --------
+    >>> sweep("e1.Pout=1e5:2e5:3")
+    ('e1.Pout', [100000.0, 150000.0, 200000.0])
+    >>> sweep("i1.T=300, 350")
+    ('i1.T', [300, 350])
+    >>> sweep("i1.fraccionMolar=[0.2, 0.8]")
+    ('i1.fraccionMolar', [[0.2, 0.8]])
+    """
+    key, txt = spec.split("=", 1)
+    key = key.strip()
+    if "." not in key:
+        raise ValueError("Bad property %s, use ID.KWARG format" % key)
+
+    if ":" in txt:
+        start, stop, num = txt.split(":")
+        values = linspace(float(start), float(stop), int(num)).tolist()
+    else:
+        value = parseValue(txt)
+        if isinstance(value, tuple):
+            values = list(value)
+        else:
+            values = [value]
+    return key, values
+
+
+def cases(sweeps, base=None):
+    """List of cases of a full factorial case study
+
+    Parameters
+    ----------
+    sweeps : list
+        List of sweeps, tuples with key and values, see :func:`sweep`
+    base : list, optional
+        List of initial cases, dicts with the properties values, default a
+        single case without changes
+
+    Returns
+    -------
+    cases : list
+        List of dicts with the values of properties of each case
+
+    Examples
+    --------
+    >>> cases([("e1.Pout", [1, 2]), ("i1.T", [300, 350])])
+    ... # doctest: +NORMALIZE_WHITESPACE
+    [{'e1.Pout': 1, 'i1.T': 300}, {'e1.Pout': 1, 'i1.T': 350},
+     {'e1.Pout': 2, 'i1.T': 300}, {'e1.Pout': 2, 'i1.T': 350}]
+    """
+    if base is None:
+        base = [{}]
+    keys = [key for key, values in sweeps]
+    combinations = list(product(*[values for key, values in sweeps]))
+    return [dict(case, **dict(zip(keys, values)))
+            for case in base for values in combinations]
+
+
+def readCases(fname):
+    """Read cases from a csv file, with the properties ID.KWARG in header
+    and a case in each row"""
+    with open(fname, newline="") as file:
+        return [{key: parseValue(value) for key, value in row.items()}
+                for row in csv.DictReader(file)]
+
+
+def setCase(project, case):
+    """Set the values of a case in project
+
+    Parameters
+    ----------
+    project : Project
+        Project instance
+    case : dict
+        Values of properties, with keys ID.KWARG, where ID can be an
+        equipment, e1, or an input stream, i1
+    """
+    for key, value in case.items():
+        idx, kwarg = key.split(".", 1)
+        if idx[0] == "e":
+            project.items[idx].cleanOldValues(**{kwarg: value})
+        elif idx[0] == "i":
+            for stream, (up, down, ind_up, ind_down, obj) in \
+                    project.getDownToEquip(idx):
+                new = obj.clone(**{kwarg: value})
+                project.streams[stream] = (up, down, ind_up, ind_down, new)
+                if project.items.get(idx) is not None:
+                    project.items[idx] = new
+        else:
+            raise ValueError("Bad property %s, only equipment and input "
+                             "stream can be changed" % key)
+
+
+def getValue(project, key):
+    """Get a property of project, with format ID.PROPERTY where ID is the id
+    of an equipment, e1, or a stream, s1, i1 or o1 for the stream of input or
+    output. The units magnitudes are returned in SI units and the not
+    available properties as None"""
+    idx, prop = key.split(".", 1)
+    if idx[0] == "s":
+        obj = project.getStream(int(idx[1:]))
+    elif idx[0] in "io":
+        # Stream connected to input or output
+        obj = None
+        for up, down, ind_up, ind_down, stream in project.streams.values():
+            if idx in (up, down):
+                obj = stream
+    else:
+        obj = project.items.get(idx)
+
+    value = obj
+    for attr in prop.split("."):
+        value = getattr(value, attr, None)
+
+    if isinstance(value, bool) or value is None:
+        return value
+    if isinstance(value, (int, float)):
+        return float(value)
+    if isinstance(value, (list, tuple)) or hasattr(value, "tolist"):
+        return [float(v) for v in value]
+    return str(value)
+
+
+def calculate(project, case, report, method="wegstein"):
+    """Calculate a case of project
+
+    Parameters
+    ----------
+    project : Project
+        Project instance
+    case : dict
+        Values of properties of case, see :func:`setCase`
+    report : list
+        Properties to report, see :func:`getValue`
+    method : str, optional
+        Acceleration method of recycle convergence, see
+        :meth:`lib.project.Project.solve`
+
+    Returns
+    -------
+    row : dict
+        Values of case, the status of calculation, error message if any and
+        the properties of report
+    """
+    row = dict(case)
+    try:
+        setCase(project, case)
+        result = project.solve(method=method)
+    except Exception as error:
+        logging.error("Case %s failed: %s" % (case, error))
+        row["status"] = False
+        row["error"] = repr(error)
+        row.update({key: None for key in report})
+        return row
+
+    row["status"] = result["converged"]
+    row["error"] = ""
+    for key in report:
+        try:
+            row[key] = getValue(project, key)
+        except (KeyError, ValueError, TypeError):
+            row[key] = None
+    return row
+
+
+def _init(project):
+    """Initializer of worker process, save the project to calculate"""
+    global _project
+    _project = project
+
+
+def _calculate(args):
+    """Calculate a case in a worker process"""
+    return calculate(_project, *args)
+
+
+def run(project, cases, report, method="wegstein", workers=None):
+    """Calculate a list of cases of a project. With workers the cases are
+    calculated in a pool of process created with fork, so the project is
+    loaded only once. In platforms without fork the cases are calculated in
+    serial mode. The consecutive cases calculated in a process reuse the
+    unchanged equipment.
+
+    Parameters
+    ----------
+    project : Project
+        Project instance
+    cases : list
+        List of cases, see :func:`cases`
+    report : list
+        Properties to report, see :func:`getValue`
+    method : str, optional
+        Acceleration method of recycle convergence
+    workers : int, optional
+        Number of worker process, default calculate in serial mode
+
+    Returns
+    -------
+    columns : dict
+        Dict with the values of each column in a list, in the order of cases
+    """
+    args = [(case, report, method) for case in cases]
+    if workers and workers > 1 and \
+            "fork" in multiprocessing.get_all_start_methods():
+        context = multiprocessing.get_context("fork")
+        chunksize = max(1, len(args)//(4*workers))
+        with ProcessPoolExecutor(workers, context, initializer=_init,
+                                 initargs=(project, )) as pool:
+            rows = list(pool.map(_calculate, args, chunksize=chunksize))
+    else:
+        rows = [calculate(project, *arg) for arg in args]
+
+    columns = {}
+    for row in rows:
+        for key in row:
+            columns.setdefault(key, [])
+    for row in rows:
+        for key, column in columns.items():
+            column.append(row.get(key))
+    return columns
+
+
+def write(columns, fname=None):
+    """Save the results of a case study in a columnar file, json format if
+    the file has json extension, otherwise csv, default print in csv format
+    to standard output"""
+    if fname and os.path.splitext(fname)[1].lower() == ".json":
+        with open(fname, "w") as file:
+            json.dump(columns, file, indent=1)
+        return
+
+    if fname:
+        file = open(fname, "w", newline="")
+    else:
+        file = sys.stdout
+    try:
+        writer = csv.writer(file)
+        writer.writerow(columns.keys())
+        writer.writerows(zip(*columns.values()))
+    finally:
+        if fname:
+            file.close()
+
+
+def main(argv=None):
+    """Command line entry point of headless calculation"""
+    parser = argparse.ArgumentParser(
+        prog="python -m pychemqt.run",
+        description="Calculate pychemqt project files without graphical "
+        "interface, optionally a parametric case study.",
+        epilog="Properties are defined as ID.NAME, where ID is the id of "
+        "equipment (e1), input stream (i1), output stream (o1) or stream "
+        "(s1) in project, and NAME the kwarg name or the property name, "
+        "i.e. e1.Pout, s2.T. The values are in SI units.")
+    parser.add_argument("projectFile", help="Project file to calculate")
+    parser.add_argument(
+        "-o", "--output", help="Output file, csv or json format by "
+        "extension, default print in csv format to standard output")
+    parser.add_argument(
+        "-s", "--set", action="append", default=[], metavar="ID.KWARG=VALUE",
+        help="Set a value in all cases")
+    parser.add_argument(
+        "--sweep", action="append", default=[],
+        metavar="ID.KWARG=START:STOP:NUM", help="Add a property to sweep, "
+        "with values equally spaced or a list of values separated by comma. "
+        "Several sweeps are combined in a full factorial case study")
+    parser.add_argument(
+        "--cases", metavar="FILE", help="csv file with the cases, with the "
+        "properties in header and a case in each row")
+    parser.add_argument(
+        "-r", "--report", action="append", default=[], metavar="ID.PROPERTY",
+        help="Property to report, default temperature, pressure and mass "
+        "flow of all streams")
+    parser.add_argument(
+        "-w", "--workers", type=int, default=1,
+        help="Number of process to calculate cases in parallel")
+    parser.add_argument(
+        "--method", default="wegstein",
+        choices=["wegstein", "broyden", "substitution"],
+        help="Acceleration method of recycle loops")
+    args = parser.parse_args(argv)
+
+    # Report the missing optional dependences or a wrong file without
+    # traceback
+    try:
+        project = load(args.projectFile)
+    except (ImportError, OSError) as error:
+        parser.error(str(error))
+
+    base = [{}]
+    for spec in args.set:
+        key, value = spec.split("=", 1)
+        base[0][key.strip()] = parseValue(value)
+    if args.cases:
+        base = [dict(case, **row) for case in base
+                for row in readCases(args.cases)]
+    lista = cases([sweep(spec) for spec in args.sweep], base)
+
+    report = args.report
+    if not report:
+        for stream in sorted(project.streams):
+            for prop in ("T", "P", "caudalmasico"):
+                report.append("s%i.%s" % (stream, prop))
+
+    t0 = perf_counter()
+    columns = run(project, lista, report, args.method, args.workers)
+    logging.info("Calculated %i cases in %0.2f s" % (
+        len(lista), perf_counter()-t0))
+    write(columns, args.output)
+    return 0 if all(columns["status"]) else 1
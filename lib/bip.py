@@ -18,14 +18,30 @@ You should have received a copy of the GNU General Public License
 along with this program.  If not, see <http://www.gnu.org/licenses/>.'''
 
 
-from numpy import zeros
+from numpy import asarray, zeros
 
 from lib import config
-from lib.sql import databank
+from lib.sql import query
 
 
 EoSBIP = ["SRK", "PR", "APISRK", "BWRS", "NRTL", "UNIQUAC", "WILSON"]
 
+# In-memory index of bip tables, loaded in a single query the first time each
+# table is used, with format {EOS: {(i, j): (values, ...)}}
+_bipIndex = {}
+
+
+def _bipTable(EOS):
+    """Return the index of bip table of EOS, loading it from database if it's
+    not loaded yet"""
+    table = _bipIndex.get(EOS)
+    if table is None:
+        table = {}
+        for row in query("SELECT * FROM %sbip" % EOS):
+            table[(row[1], row[2])] = tuple(float(v or 0) for v in row[3:])
+        _bipIndex[EOS] = table
+    return table
+
 
 def Kij(ids, EOS=None, dat=None):
     """Calculate binary interaction matrix for component of mixture,
@@ -39,6 +55,20 @@ def Kij(ids, EOS=None, dat=None):
         Code of equation of state: SRK, APISRK, PR, BWRS, NRTL, UNIQUAC, WILSON
     dat : dict
         For EoS with interaction parameter don't defined in database
+
+    Examples
+    --------
+    Methane, ethane and nitrogen with the Peng-Robinson bip
+
+    >>> kij = Kij([2, 3, 46], "PR")
+    >>> "%0.4f %0.4f %0.4f" % (kij[0][1], kij[0][2], kij[2][1])
+    '-0.0026 0.0311 0.0515'
+
+    The NRTL parameters are asymmetric and include the α matrix
+
+    >>> Gij, alpha = Kij([51, 62], "NRTL")
+    >>> "%0.2f %0.3f %0.5f" % (Gij[0][1], Gij[1][0], alpha[1][0])
+    '2383.66 -372.398 0.10406'
     """
     # Return null bip if EOS is not specified
     if EOS is None or (EOS not in EoSBIP and dat is None):
@@ -46,26 +76,7 @@ def Kij(ids, EOS=None, dat=None):
         return kij
 
     # Continue with real procedure
-    # Simple case with only a symetric parameter
-    if EOS in ["SRK", "APISRK", "PR", "BWRS"]:
-        kij = []
-        query = "SELECT kij FROM %sbip WHERE i=? AND j=?" % EOS
-        for i in ids:
-            kiji = []
-            for j in ids:
-                i_ = min(i, j)
-                j_ = max(i, j)
-                databank.execute(query, (i_, j_))
-                k = databank.fetchone()
-                if k:
-                    kiji.append(float(k[0]))
-                else:
-                    kiji.append(0)
-
-            kij.append(kiji)
-        return kij
-
-    elif EOS == "LK":
+    if EOS == "LK":
         kij = []
         for i in ids:
             kiji = []
@@ -81,66 +92,50 @@ def Kij(ids, EOS=None, dat=None):
             kij.append(kiji)
         return kij
 
-    # Asymetric BIP
-    else:
-        kij = []
-        query = "SELECT * FROM %sbip WHERE i=? AND j=?" % EOS
-        for i in ids:
-            kiji = []
-            for j in ids:
-                i_ = min(i, j)
-                j_ = max(i, j)
-                databank.execute(query, (i_, j_))
-                k = databank.fetchone()
-                if i == i_ and k:
-                    kiji.append(float(k[3]))
-                elif k:
-                    kiji.append(float(k[4]))
+    table = _bipTable(EOS)
+    kij = zeros((len(ids), len(ids)))
+    if EOS == "NRTL":
+        alpha = zeros((len(ids), len(ids)))
+
+    for n, i in enumerate(ids):
+        for m, j in enumerate(ids):
+            k = table.get((min(i, j), max(i, j)))
+            if k is None:
+                continue
+
+            # Simple case with only a symetric parameter
+            if EOS in ["SRK", "APISRK", "PR", "BWRS"]:
+                kij[n, m] = k[0]
+
+            # Asymetric BIP
+            else:
+                if i <= j:
+                    kij[n, m] = k[0]
                 else:
-                    kiji.append(0)
-            kij.append(kiji)
+                    kij[n, m] = k[1]
 
-        # Get second parameter for NRTL
-        if EOS == "NRTL":
-            alpha = []
-            query = "SELECT alpha FROM NRTLbip WHERE i=? AND j=?"
-            for i in ids:
-                alphai = []
-                for j in ids:
-                    i_ = min(i, j)
-                    j_ = max(i, j)
-                    databank.execute(query, (i_, j_))
-                    a = databank.fetchone()
-                    if a:
-                        alphai.append(float(a[0]))
-                    else:
-                        alphai.append(0)
-                alpha.append(alphai)
-
-            return kij, alpha
-        else:
-            return kij
+                # Get second parameter for NRTL
+                if EOS == "NRTL":
+                    alpha[n, m] = k[2]
+
+    if EOS == "NRTL":
+        return kij, alpha
+    return kij
 
 
 # Mixing Rules
 def Mix_vdW1f(xi, parameters, kij):
     """Mixing rules of van der Waals"""
-    ai = parameters[0]
+    xi = asarray(xi, dtype=float)
+    ai = asarray(parameters[0], dtype=float)
     bi = parameters[1:]
 
     # Geometric mean rule for croos-energy parameter
-    a = 0
-    for x_i, a_i, kiji in zip(xi, ai, kij):
-        for x_j, a_j, k in zip(xi, ai, kiji):
-            a += x_i * x_j * (a_i*a_j)**0.5 * (1-k)
+    xai = xi*ai**0.5
+    a = float(xai @ (1-asarray(kij, dtype=float)) @ xai)
 
     # Arithmetic mean rule for the aditional parameters
-    b = []
-    for b_i in bi:
-        suma = 0
-        for x_i, bii in zip(xi, b_i):
-            suma += x_i*bii
-        b.append(suma)
+    b = [float(xi @ asarray(b_i, dtype=float)) for b_i in bi]
 
     return tuple([a]+b)
 
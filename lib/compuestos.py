@@ -4827,6 +4827,26 @@ def Henry(T, args):
     return unidades.Pressure(H, "psi")
 
 
+# Text fields of databank records parsed once and shared by all the instances
+# of the same compound, keyed by id and validated against the cached record
+_parsedRecords = {}
+
+
+def _parseRecord(cmp):
+    """Return the parsed text fields of a databank record, atomic
+    decomposition of formula and UNIFAC groups"""
+    parsed = _parsedRecords.get(cmp[0])
+    if parsed is None or parsed[0] is not cmp:
+        decmp = atomic_decomposition(cmp[1])
+        if cmp[133]:
+            unifac = tuple(tuple(ai) for ai in literal_eval(cmp[133]))
+        else:
+            unifac = ()
+        parsed = (cmp, decmp, unifac)
+        _parsedRecords[cmp[0]] = parsed
+    return parsed[1:]
+
+
 class Componente(object):
     """Class to define a chemical compound from the database
 
@@ -5117,6 +5137,7 @@ class Componente(object):
         self.kwargs.update(kwargs)
         self.Config = config.getMainWindowConfig()
         cmp = sql.getElement(id)
+        decmp, unifac = _parseRecord(cmp)
         self.formula = cmp[1]
         self.name = cmp[2]
         self.M = cmp[3]
@@ -5192,8 +5213,8 @@ class Componente(object):
         self.stiel = cmp[128]
         self.CASNumber = str(cmp[131])
         self.alternateFormula = str(cmp[132])
-        if cmp[133]:
-            self.UNIFAC = {ai[0]: ai[1] for ai in literal_eval(cmp[133])}
+        if unifac:
+            self.UNIFAC = {ai[0]: ai[1] for ai in unifac}
         else:
             self.UNIFAC = []
 
@@ -5216,7 +5237,6 @@ class Componente(object):
         self.smile = str(cmp[149])
 
         # Desglosar formula en elementos y átomos de cada elemento
-        decmp = atomic_decomposition(self.formula)
         atoms = sum([val for val in decmp.values()])
         self.C = decmp.get("C", 0)
         self.H = decmp.get("H", 0)
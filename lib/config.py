@@ -41,10 +41,9 @@ Configuration tools
 
 from ast import literal_eval
 from configparser import ConfigParser
+import hashlib
 import os
 
-from tools.qt import QtWidgets
-
 # TODO: Delete when it isn´t necessary debug
 # os.environ["pychemqt"] = "/home/jjgomera/Programacion/pychemqt/"
 # os.environ["freesteam"] = "False"
@@ -59,7 +58,7 @@ from tools.qt import QtWidgets
 # os.environ["Qsci"] = "False"
 
 
-from lib.sql import databank
+from lib.sql import getElements
 
 
 conf_dir = os.path.expanduser('~') + os.sep + ".pychemqt" + os.sep
@@ -110,12 +109,9 @@ def getComponents(solidos=False, config=None, name=True):
     if name:
         nombres = []
         M = []
-        for idx in indices:
-            query = f"select name, M from compuestos where id == {idx}"
-            databank.execute(query)
-            texto = databank.fetchone()
-            nombres.append(texto[0])
-            M.append(texto[1])
+        for cmp in getElements(indices):
+            nombres.append(cmp[2])
+            M.append(cmp[3])
         return indices, nombres, M
 
     return indices
@@ -133,6 +129,9 @@ def setMainWindowConfig(config=None):
         currentConfig = config
         return
 
+    # Imported here so the library can be used without qt, see run.py
+    from tools.qt import QtWidgets
+
     widget = QtWidgets.QApplication.activeWindow()
     if isinstance(widget, QtWidgets.QMainWindow) and \
        widget.__class__.__name__ == "UI_pychemqt":
@@ -146,6 +145,22 @@ def setMainWindowConfig(config=None):
                 break
 
 
+def _freeze(value):
+    """Convert a kwargs value to a hashable representation independent of
+    the instance, the entities are represented by its fingerprint"""
+    if isinstance(value, Entity):
+        return value.fingerprint()
+    if isinstance(value, dict):
+        return tuple((key, _freeze(v)) for key, v in sorted(value.items()))
+    if hasattr(value, "tolist"):
+        value = value.tolist()
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(v) for v in value)
+    if isinstance(value, float):
+        return float(value)
+    return value
+
+
 class Entity():
     """General class for model object, with basic functionality:
 
@@ -182,9 +197,26 @@ class Entity():
         if kwargs:
             self.__call__(**kwargs)
 
+    def __getattr__(self, name):
+        """Load the state not loaded yet from a binary project file when any
+        state property is accessed, see :class:`lib.projectFile.State`"""
+        if name.startswith("__") or "_state" not in self.__dict__:
+            raise AttributeError(
+                "'%s' object has no attribute '%s'" % (
+                    self.__class__.__name__, name))
+        self._loadState()
+        return getattr(self, name)
+
+    def _loadState(self):
+        """Load the state pending from a binary project file"""
+        state = self.__dict__.pop("_state", None)
+        if state is not None:
+            self.readStatefromJSON(state.load())
+
     def __call__(self, **kwargs):
         """Add callable functionality, so it can be possible add kwargs,
         advanced functionality can be added in subclass"""
+        self._loadState()
         self._oldkwargs = self.kwargs.copy()
         self.cleanOldValues(**kwargs)
         self._bool = True
@@ -202,6 +234,28 @@ class Entity():
         here can be implemented kwarg incompatibiity input and more"""
         self.kwargs.update(kwargs)
 
+    def fingerprint(self, **kwargs):
+        """Stable fingerprint of entity inputs, the kwargs without notes and
+        with any entity, i.e. input streams, replaced by its own fingerprint,
+        so it changes with any change upstream. The optional kwargs override
+        the current values, to check a change before calculation
+
+        Examples
+        --------
+        >>> class Dummy(Entity):
+        ...     kwargs = {"a": 0.0, "b": [], "notas": ""}
+        >>> x = Dummy(a=1.5, b=[1, 2])
+        >>> x.fingerprint() == Dummy(a=1.5, b=[1, 2], notas="x").fingerprint()
+        True
+        >>> x.fingerprint() == x.fingerprint(a=2)
+        False
+        """
+        kw = self.kwargs.copy()
+        kw.update(kwargs)
+        kw.pop("notas", None)
+        txt = repr((self.__class__.__name__, _freeze(kw)))
+        return hashlib.sha1(txt.encode()).hexdigest()
+
     def clear(self):
         """Clear entity and stay as new instance"""
         self.kwargs = self.__class__.kwargs
@@ -251,7 +305,10 @@ class Entity():
         data["external_dependences"] = self._dependence
         data["notas"] = self.notas
         data["notasPlain"] = self.notasPlain
-        if self.status:
+        if "_state" in self.__dict__:
+            # State not loaded, saved as is
+            data["state"] = self._state
+        elif self.status:
             state = {}
             self.writeStatetoJSON(state)
             data["state"] = state
@@ -280,7 +337,11 @@ class Entity():
         self.notas = data["notas"]
         self.notasPlain = data["notasPlain"]
         if self.status:
-            self.readStatefromJSON(data["state"])
+            if isinstance(data["state"], dict):
+                self.readStatefromJSON(data["state"])
+            else:
+                # State in binary project file, loaded when it's needed
+                self._state = data["state"]
 
 #        if run:
 #            self.__call__()
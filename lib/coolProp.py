@@ -57,14 +57,15 @@ __doi__ = {
          "doi": "10.1021/ie4033999"}}
 
 
-# Automatic loading of coolProp name from meos subclass _coolPropName property
+# Automatic loading of coolProp name from meos subclass _coolPropName property,
+# using the mEoS registry to avoid import all fluid modules
 all__ = {}
 noIds = []
-for cmp in mEoS.__all__:
-    if cmp.id and cmp._coolPropName:
-        all__[cmp.id] = cmp._coolPropName
-    elif cmp._coolPropName:
-        noIds.append(cmp._coolPropName)
+for cmp in mEoS.registry.values():
+    if cmp["id"] and cmp["coolprop"]:
+        all__[cmp["id"]] = cmp["coolprop"]
+    elif cmp["coolprop"]:
+        noIds.append(cmp["coolprop"])
 
 
 class CoolProp(ThermoAdvanced):
@@ -35,6 +35,7 @@ from tools.qt import QtWidgets, translate
 from lib.physics import R_atml
 from lib import unidades, config
 from lib import EoS, mEoS, gerg, iapws97, freeSteam, refProp, coolProp
+from lib import tabular
 from lib.solids import Solid
 from lib.mezcla import Mezcla, mix_molarflow_molarfraction
 from lib.psycrometry import PsychroState
@@ -88,6 +89,7 @@ class Corriente(config.Entity):
         -freesteam: Use freesteam external library for water
         -coolProp: Use coolProp external library if is available
         -refprop: Use refProp external library if is available
+        -tabular: Use interpolated property tables for MEoS compounds
     """
     kwargs = {"T": 0.0,
               "P": 0.0,
@@ -120,7 +122,8 @@ class Corriente(config.Entity):
               "GERG": None,
               "freesteam": None,
               "coolProp": None,
-              "refprop": None}
+              "refprop": None,
+              "tabular": None}
 
     status = 0
     msg = translate("Corriente", "Unknown variables")
@@ -132,6 +135,8 @@ class Corriente(config.Entity):
         self.__call__(**kwargs)
 
     def __call__(self, **kwargs):
+        self._loadState()
+
         # Clean input parameters to get only the defined in the last run
         if kwargs.get("mezcla", None):
             kwargs.update(kwargs["mezcla"].kwargs)
@@ -389,6 +394,14 @@ class Corriente(config.Entity):
                 compuesto = class_(T=T, x=x)
             elif self.tipoTermodinamica == "Px":
                 compuesto = class_(P=P, x=x)
+        elif self._thermo == "tabular":
+            class_ = mEoS.__all__[mEoS.id_mEoS.index(self.ids[0])]
+            if self.tipoTermodinamica == "TP":
+                compuesto = tabular.Tabular(fluid=class_, T=T, P=P)
+            elif self.tipoTermodinamica == "Tx":
+                compuesto = tabular.Tabular(fluid=class_, T=T, x=x)
+            elif self.tipoTermodinamica == "Px":
+                compuesto = tabular.Tabular(fluid=class_, P=P, x=x)
         elif self._thermo == "eos":
             if self.kwargs["K"]:
                 index = EoS.K_name.index(self.kwargs["K"])
@@ -600,7 +613,8 @@ class Corriente(config.Entity):
         """Find the thermodynamic method to use
         Define internal variables to know the definition:
             _thermo: Method of definition, one of this values:
-                eos, iapws, freesteam, meos, coolprop, refprop, gerg
+                eos, iapws, freesteam, meos, coolprop, refprop, gerg,
+                tabular
             _dependence: In advanced method with external dependencias define
                 the neccesary dependences to calculate
         """
@@ -614,6 +628,12 @@ class Corriente(config.Entity):
         mEoS_available = self.ids[0] in mEoS.id_mEoS
         MEoS = _meos and len(self.ids) == 1 and mEoS_available
 
+        # Interpolated tables of MEoS availability
+        if self.kwargs["tabular"] is not None:
+            _tabular = self.kwargs["tabular"]
+        else:
+            _tabular = Config.getboolean("Thermo", "tabular", fallback=False)
+
         # iapws availability
         if self.kwargs["iapws"] is not None:
             _iapws = self.kwargs["iapws"]
@@ -673,6 +693,8 @@ class Corriente(config.Entity):
         elif _meos and COOLPROP:
             self._thermo = "coolprop"
             self._dependence = "CoolProp"
+        elif MEoS and _tabular:
+            self._thermo = "tabular"
         elif MEoS and GERG:
             self._thermo = "gerg"
         elif MEoS and len(self.ids)==1:
@@ -941,6 +963,10 @@ class Corriente(config.Entity):
         if self._thermo == "meos":
             title = translate("Corriente", "Advanced MEoS properties")
             doc_param = [self.cmp._constants["__doi__"]]
+        elif self._thermo == "tabular":
+            title = translate("Corriente", "Advanced MEoS properties")
+            doc_param = [self.cmp._constants["__doi__"]]
+            doc_param += tabular.__doi__.values()
         else:
             title = translate("Corriente", "Advanced thermo properties")
             doc_param = self.cmp.__doi__
@@ -1017,7 +1043,7 @@ class Corriente(config.Entity):
         if state["liquid"]:
             state["liquid"]["sigma"] = self.Liquido.sigma
 
-        if self._thermo == "meos":
+        if self._thermo in ["meos", "tabular"]:
             state["meos_eq"] = self.cmp.kwargs["eq"]
 
     def readFromJSON(self, data):
@@ -1065,7 +1091,9 @@ class Corriente(config.Entity):
             self.cmp = refProp.RefProp(ids=self.ids)
         elif self._thermo == "coolprop":
             self.cmp = coolProp.CoolProp(ids=self.ids)
-        elif self._thermo == "meos":
+        elif self._thermo in ["meos", "tabular"]:
+            # The saved state only need the fluid definition, so the tables
+            # aren't loaded
             eq = state["meos_eq"]
             self.cmp = mEoS.__all__[mEoS.id_mEoS.index(self.ids[0])](eq=eq)
 
@@ -1077,7 +1105,7 @@ class Corriente(config.Entity):
         if self._thermo in ["iapws", "freesteam"]:
             self.Liquido = ThermoWater()
             self.Gas = ThermoWater()
-        elif self._thermo in ["coolprop", "meos"]:
+        elif self._thermo in ["coolprop", "meos", "tabular"]:
             self.Liquido = ThermoAdvanced()
             self.Gas = ThermoAdvanced()
         elif self._thermo == "refprop":
@@ -49,21 +49,23 @@ factor of a natural gas:
   * :func:`Z_Elsharkawy`: Elsharkawy (2003)
   * :func:`Z_Hall_Iglesias`: Hall-Iglesias (2007)
 
+All the correlations can be calculated too for arrays of reduced temperature
+and pressure, solving all points at once, with :func:`Z_array`
+
 API reference
 -------------
 
 '''
 
 
-from math import pi, exp, log, sin
 import warnings
 
-from numpy.lib.scimath import log10
-from scipy.optimize import fsolve
+from numpy import (asarray, broadcast_arrays, errstate, exp, inf, isfinite,
+                   log, log10, nan, ones_like, pi, select, sin, where)
 
 from lib import unidades
 from lib.petro import Petroleo
-from lib.sql import databank
+from lib.sql import query
 from lib.utilities import refDoc
 from tools.qt import translate
 
@@ -203,6 +205,61 @@ __doi__ = {
 
 
 # Gas compresibility factor
+def _newton(f, x0, lower=0, upper=inf, tol=1e-10, maxiter=100):
+    """Solve f(x)=0 for all points of an array at once using the
+    Newton-Raphson method with numerical derivative. The iteration is kept
+    inside the (lower, upper) interval, the domain of the equations
+
+    Parameters
+    ----------
+    f : function
+        Function to solve, operating elementwise in arrays
+    x0 : array_like
+        Initial values
+    lower : float, optional
+        Lower bound of solution
+    upper : float, optional
+        Upper bound of solution
+    tol : float, optional
+        Relative tolerance in solution
+    maxiter : int, optional
+        Maximum number of iterations
+
+    Returns
+    -------
+    x : array
+        Solution, nan for the not converged points
+    """
+    x = asarray(x0, dtype=float)
+    for i in range(maxiter):
+        fx = f(x)
+        h = 1e-7*abs(x)
+        dx = fx*h/(f(x+h)-fx)
+        new = x - dx
+        new = where(new <= lower, (x+lower)/2, new)
+        new = where(new >= upper, (x+upper)/2, new)
+        converged = abs(new-x) <= tol*abs(x)
+        x = new
+        if (converged | ~isfinite(x)).all():
+            break
+
+    # Discard the points converged to a false solution
+    converged &= abs(f(x)) < 1e-6
+    return where(converged, x, nan)
+
+
+def _scalar(method, Tr, Pr, iterative=False, **kwargs):
+    """Calculate a single point with the array version of a correlation. The
+    not converged points of iterative correlations raise an exception, the
+    explicit correlations return nan out of its domain"""
+    with errstate(all="ignore"):
+        Z = method(asarray(Tr, dtype=float), asarray(Pr, dtype=float),
+                   **kwargs)
+    if iterative and not isfinite(Z):
+        raise ValueError("Iteration not converge")
+    return unidades.Dimensionless(float(Z))
+
+
 @refDoc(__doi__, [1, 2])
 def Z_Papay(Tr, Pr):
     """Calculate gas compressibility factor using the correlation of Papay
@@ -225,8 +282,13 @@ def Z_Papay(Tr, Pr):
     >>> "%0.4f" % Z_Papay(2, 3)
     '0.9422'
     """
+    return _scalar(_Z_Papay, Tr, Pr)
+
+
+def _Z_Papay(Tr, Pr):
+    """Array version of :func:`Z_Papay`"""
     Z = 1 - 3.53*Pr/10**(0.9813*Tr) + 0.274*Pr**2/10**(0.8157*Tr)
-    return unidades.Dimensionless(Z)
+    return Z
 
 
 @refDoc(__doi__, [1, 3])
@@ -250,6 +312,11 @@ def Z_Hall_Yarborough(Tr, Pr):
     if Tr <= 1:
         warnings.warn("Using extrapolated values")
 
+    return _scalar(_Z_Hall_Yarborough, Tr, Pr, iterative=True)
+
+
+def _Z_Hall_Yarborough(Tr, Pr):
+    """Array version of :func:`Z_Hall_Yarborough`"""
     X1 = -0.06125*Pr/Tr*exp(-1.2*(1-1/Tr)**2)
     X2 = 14.76/Tr - 9.76/Tr**2 + 4.58/Tr**3
     X3 = 90.7/Tr - 242.2/Tr**2 + 42.4/Tr**3
@@ -259,13 +326,9 @@ def Z_Hall_Yarborough(Tr, Pr):
         return X1+(Y+Y**2+Y**3-Y**4)/(1-Y)**3-X2*Y**2+X3*Y**X4
 
     Yo = 0.0125*Pr/Tr*exp(-1.2*(1-1/Tr)**2)
-    Y = fsolve(f, Yo, full_output=True)
-    if Y[2] == 1 and abs(Y[1]["fvec"][0]) < 1e-5:
-        Z = 0.06125*Pr/Tr/Y[0][0]*exp(-1.2*(1-1/Tr)**2)
-    else:
-        raise ValueError("Iteration not converge")
-
-    return unidades.Dimensionless(Z)
+    Y = _newton(f, Yo, upper=1)
+    Z = 0.06125*Pr/Tr/Y*exp(-1.2*(1-1/Tr)**2)
+    return Z
 
 
 @refDoc(__doi__, [4])
@@ -296,6 +359,11 @@ def Z_Dranchuk_Abu_Kassem(Tr, Pr):
     if Tr < 1 or Tr > 3 or Pr < 0.2 or Pr > 30:
         raise NotImplementedError("Incoming out of bound")
 
+    return _scalar(_Z_Dranchuk_Abu_Kassem, Tr, Pr, iterative=True)
+
+
+def _Z_Dranchuk_Abu_Kassem(Tr, Pr):
+    """Array version of :func:`Z_Dranchuk_Abu_Kassem`"""
     C1 = 0.3265 - 1.07/Tr - 0.5339/Tr**3 + 0.01569/Tr**4 - 0.05165/Tr**5
     C2 = 0.5475 - 0.7361/Tr + 0.1844/Tr**2
     C3 = 0.1056*(-0.7361/Tr + 0.1844/Tr**2)
@@ -306,14 +374,9 @@ def Z_Dranchuk_Abu_Kassem(Tr, Pr):
         Z = 0.27*Pr/Tr/rho
         return 1 + C1*rho + C2*rho**2 - C3*rho**5 + C4*exp(-0.721*rho**2) - Z
 
-    rho0 = 0.27*Pr/Tr
-    rho = fsolve(f, rho0, full_output=True)
-    if rho[2] == 1:
-        Z = 0.27*Pr/Tr/rho[0]
-    else:
-        raise ValueError("Iteration not converge")
-
-    return unidades.Dimensionless(Z)
+    rho = _newton(f, 0.27*Pr/Tr)
+    Z = 0.27*Pr/Tr/rho
+    return Z
 
 
 @refDoc(__doi__, [5])
@@ -344,6 +407,11 @@ def Z_Dranchuk_Purvis_Robinson(Tr, Pr):
     if Tr < 1.05 or Tr > 3 or Pr < 0.2 or Pr > 30:
         raise NotImplementedError("Incoming out of bound")
 
+    return _scalar(_Z_Dranchuk_Purvis_Robinson, Tr, Pr, iterative=True)
+
+
+def _Z_Dranchuk_Purvis_Robinson(Tr, Pr):
+    """Array version of :func:`Z_Dranchuk_Purvis_Robinson`"""
     C1 = 0.31506237 - 1.0467099/Tr - 0.5783272/Tr**3
     C2 = 0.53530771 - 0.61232032/Tr
     C3 = 0.61232032*0.10488813/Tr
@@ -355,14 +423,9 @@ def Z_Dranchuk_Purvis_Robinson(Tr, Pr):
         Z = 0.27*Pr/Tr/rho
         return 1 + C1*rho + C2*rho**2 + C3*rho**5 + C4*exp(-A8*rho**2) - Z
 
-    rho0 = 0.27*Pr/Tr
-    rho = fsolve(f, rho0, full_output=True)
-    if rho[2] == 1:
-        Z = 0.27*Pr/Tr/rho[0]
-    else:
-        raise ValueError("Iteration not converge")
-
-    return unidades.Dimensionless(Z)
+    rho = _newton(f, 0.27*Pr/Tr)
+    Z = 0.27*Pr/Tr/rho
+    return Z
 
 
 @refDoc(__doi__, [6, 7])
@@ -393,13 +456,18 @@ def Z_Brill_Beggs(Tr, Pr):
     if Tr < 1.15 or Tr > 2.4 or Pr < 0.2 or Pr > 15:
         raise NotImplementedError("Incoming out of bound")
 
+    return _scalar(_Z_Brill_Beggs, Tr, Pr)
+
+
+def _Z_Brill_Beggs(Tr, Pr):
+    """Array version of :func:`Z_Brill_Beggs`"""
     A = 1.39*(Tr-0.92)**0.5 - 0.36*Tr - 0.101
     B = (0.62-0.23*Tr)*Pr + (0.066/(Tr-0.86)-0.037)*Pr**2 + \
         0.32/10**(9*(Tr-1))*Pr**6
     C = 0.132 - 0.32*log10(Tr)
     D = 10**(0.3016-0.49*Tr+0.1824*Tr**2)
     Z = A + (1-A)/exp(B) + C*Pr**D
-    return unidades.Dimensionless(Z)
+    return Z
 
 
 @refDoc(__doi__, [7, 8])
@@ -426,42 +494,53 @@ def Z_Gopal(Tr, Pr):
         * 1.05 ≤ Tr ≤ 3
         * 0.2 ≤ Pr ≤ 15
     """
-    if Pr <= 1.2 and Tr <= 3:
-        if Tr <= 1.2:
-            A, B, C, D = 1.6643, -2.2114, -0.3647, 1.4385
-        elif 1.2 <= Tr < 1.4:
-            A, B, C, D = 0.0522, -0.8511, -0.0364, 1.0490
-        elif 1.4 <= Tr < 2.0:
-            A, B, C, D = 0.1391, -0.2988, 0.0007, 0.9969
-        elif 2.0 <= Tr <= 3.0:
-            A, B, C, D = 0.0295, -0.0825, 0.0009, 0.9967
-    elif 1.2 <= Pr < 2.8 and Tr <= 3:
-        if Tr <= 1.2:
-            A, B, C, D = -1.3570, 1.4942, 4.6315, -4.7009
-        elif 1.2 <= Tr < 1.4:
-            A, B, C, D = 0.1717, -0.3232, 0.5869, 0.1229
-        elif 1.4 <= Tr < 2.0:
-            A, B, C, D = 0.0984, -0.2053, 0.0621, 0.8580
-        elif 2.0 <= Tr <= 3.0:
-            A, B, C, D = 0.0211, -0.0527, 0.0127, 0.9549
-    elif 2.8 <= Pr <= 5.4 and Tr <= 3:
-        if Tr <= 1.2:
-            A, B, C, D = -0.3278, 0.4752, 1.8223, -1.9036
-        elif 1.2 <= Tr < 1.4:
-            A, B, C, D = -0.2521, 0.3871, 1.6087, -1.6635
-        elif 1.4 <= Tr < 2.0:
-            A, B, C, D = -0.0284, 0.0625, 0.4714, -0.0011
-        elif 2.0 <= Tr <= 3.0:
-            A, B, C, D = 0.0041, 0.0039, 0.0607, 0.7927
-    elif 5.4 <= Pr < 15:
-        Z = Pr*(0.711 + 3.66*Tr)**-1.4667 - 1.637/(0.319*Tr+0.522) + 2.071
-        return unidades.Dimensionless(Z)
-    else:
-        # Input not in range of validity
+    # Check input in range of validity
+    if not _Gopal_range(Tr, Pr):
         raise NotImplementedError("Incoming out of bound")
 
-    Z = Pr*(A*Tr+B) + C*Tr + D
-    return unidades.Dimensionless(Z)
+    return _scalar(_Z_Gopal, Tr, Pr)
+
+
+def _Z_Gopal(Tr, Pr):
+    """Array version of :func:`Z_Gopal`"""
+    # Coefficients A, B, C, D for each Tr interval, for each Pr interval
+    coef = [
+        [(1.6643, -2.2114, -0.3647, 1.4385),
+         (0.0522, -0.8511, -0.0364, 1.0490),
+         (0.1391, -0.2988, 0.0007, 0.9969),
+         (0.0295, -0.0825, 0.0009, 0.9967)],
+        [(-1.3570, 1.4942, 4.6315, -4.7009),
+         (0.1717, -0.3232, 0.5869, 0.1229),
+         (0.0984, -0.2053, 0.0621, 0.8580),
+         (0.0211, -0.0527, 0.0127, 0.9549)],
+        [(-0.3278, 0.4752, 1.8223, -1.9036),
+         (-0.2521, 0.3871, 1.6087, -1.6635),
+         (-0.0284, 0.0625, 0.4714, -0.0011),
+         (0.0041, 0.0039, 0.0607, 0.7927)]]
+
+    # The first matching interval is used in the boundaries
+    Prs = [(Pr <= 1.2), (1.2 <= Pr) & (Pr < 2.8), (2.8 <= Pr) & (Pr <= 5.4)]
+    Trs = [(Tr <= 1.2), (1.2 <= Tr) & (Tr < 1.4), (1.4 <= Tr) & (Tr < 2.0),
+           (2.0 <= Tr) & (Tr <= 3.0)]
+
+    conditions = []
+    choices = []
+    for Pr_interval, Pr_coef in zip(Prs, coef):
+        for Tr_interval, (A, B, C, D) in zip(Trs, Pr_coef):
+            conditions.append(Pr_interval & Tr_interval)
+            choices.append(Pr*(A*Tr+B) + C*Tr + D)
+
+    conditions.append((5.4 <= Pr) & (Pr < 15))
+    choices.append(
+        Pr*(0.711 + 3.66*Tr)**-1.4667 - 1.637/(0.319*Tr+0.522) + 2.071)
+
+    Z = select(conditions, choices, nan)
+    return Z
+
+
+def _Gopal_range(Tr, Pr):
+    """Range of validity of :func:`Z_Gopal`"""
+    return (Pr <= 5.4) & (Tr <= 3) | (5.4 <= Pr) & (Pr < 15)
 
 
 @refDoc(__doi__, [7])
@@ -481,6 +560,11 @@ def Z_ShellOil(Tr, Pr):
     Z : float
         Gas compressibility factor [-]
     """
+    return _scalar(_Z_ShellOil, Tr, Pr)
+
+
+def _Z_ShellOil(Tr, Pr):
+    """Array version of :func:`Z_ShellOil`"""
     A = -0.101 - 0.36*Tr + 1.3868*(Tr-0.919)**0.5
     B = 0.021 + 0.04275/(Tr-0.65)
     C = 0.6222 - 0.224*Tr
@@ -489,7 +573,7 @@ def Z_ShellOil(Tr, Pr):
     F = 0.122*exp(-11.3*(Tr-1))
     G = Pr*(C + D*Pr + E*Pr**4)
     Z = A + B*Pr + (1-A)*exp(-G) - F*(Pr/10)**4
-    return unidades.Dimensionless(Z)
+    return Z
 
 
 @refDoc(__doi__, [9])
@@ -519,6 +603,11 @@ def Z_Sarem(Tr, Pr):
     if Tr < 1.05 or Tr > 2.95 or Pr < 0.1 or Pr > 14.9:
         raise NotImplementedError("Incoming out of bound")
 
+    return _scalar(_Z_Sarem, Tr, Pr)
+
+
+def _Z_Sarem(Tr, Pr):
+    """Array version of :func:`Z_Sarem`"""
     x = (2.*Pr-15)/14.8
     y = (2.*Tr-4)/1.9
     Aij = [
@@ -540,7 +629,7 @@ def Z_Sarem(Tr, Pr):
     for i in range(6):
         for j in range(6):
             Z += Aij[i][j]*P[i](x)*P[j](y)
-    return unidades.Dimensionless(Z)
+    return Z
 
 
 @refDoc(__doi__, [10])
@@ -573,6 +662,11 @@ def Z_Leung(Tr, Pr):
     if Tr < 1.1 or Tr > 2.6 or Pr < 0.5 or Pr > 11:
         raise NotImplementedError("Incoming out of bound")
 
+    return _scalar(_Z_Leung, Tr, Pr)
+
+
+def _Z_Leung(Tr, Pr):
+    """Array version of :func:`Z_Leung`"""
     Bij = [
         [1.877, -4.936, 8.987, -5.215],
         [0.6562, 3.692, -6.477, 3.077],
@@ -583,7 +677,7 @@ def Z_Leung(Tr, Pr):
     for i in range(4):
         for j in range(4):
             Z += Bij[i][j] * Pr**(i-1) * Tr**(1-j)
-    return unidades.Dimensionless(Z)
+    return Z
 
 
 @refDoc(__doi__, [11, 12])
@@ -612,17 +706,29 @@ def Z_Burnett(Tr, Pr):
 
         * 1.3 ≤ Tr ≤ 3
         * 0.2 ≤ Pr ≤ 4
+
+    Examples
+    --------
+    The correlation isn't defined in part of the checked range
+
+    >>> Z_Burnett(1.1, 0.6)
+    nan
     """
     # FIXME: Don't work
     # Check input in range of validity
     if Tr < 1.1 or Tr > 2.6 or Pr < 0.5 or Pr > 11:
         raise NotImplementedError("Incoming out of bound")
 
+    return _scalar(_Z_Burnett, Tr, Pr)
+
+
+def _Z_Burnett(Tr, Pr):
+    """Array version of :func:`Z_Burnett`"""
     Zo = 0.3379*log(log(Tr)) + 1.091
     Po = 21.46*Zo - 11.9*Zo**2 - 5.9
     N = (1.1 + 0.26*Tr + (1.04-1.42*Tr)*Pr/Po)*exp(Pr/Po)/Tr
     Z = 1 + (Zo-1) * sin(pi/2*Pr/Po)**N
-    return unidades.Dimensionless(Z)
+    return Z
 
 
 @refDoc(__doi__, [13])
@@ -653,18 +759,22 @@ def Z_Sanjari_Lay(Tr, Pr):
     if Tr < 1.01 or Tr > 3 or Pr < 0.01 or Pr > 15:
         raise NotImplementedError("Incoming out of bound")
 
+    return _scalar(_Z_Sanjari_Lay, Tr, Pr)
+
+
+def _Z_Sanjari_Lay(Tr, Pr):
+    """Array version of :func:`Z_Sanjari_Lay`"""
     # Table 1
-    if Pr < 3:
-        A = [0, 0.007698, 0.003839, -0.467212, 1.018801, 3.805723, -0.087361,
-             7.138305, 0.083440]
-    else:
-        A = [0, 0.015642, 0.000701, 2.341511, -0.657903, 8.902112, -1.136000,
+    Alow = [0, 0.007698, 0.003839, -0.467212, 1.018801, 3.805723, -0.087361,
+            7.138305, 0.083440]
+    Ahigh = [0, 0.015642, 0.000701, 2.341511, -0.657903, 8.902112, -1.136000,
              3.543614, 0.134041]
+    A = [where(Pr < 3, low, high) for low, high in zip(Alow, Ahigh)]
 
     # Eq 16
     Z = 1 + A[1]*Pr + A[2]*Pr**2 + A[3]*Pr**A[4]/Tr**A[5] + \
         A[6]*Pr**(A[4]+1)/Tr**A[7] + A[8]*Pr**(A[4]+2)/Tr**(A[7]+1)
-    return unidades.Dimensionless(Z)
+    return Z
 
 
 @refDoc(__doi__, [15])
@@ -695,6 +805,11 @@ def Z_Heidaryan_Salarabadi(Tr, Pr):
     if Tr < 1.2 or Tr > 3 or Pr < 0.2 or Pr > 15:
         raise NotImplementedError("Incoming out of bound")
 
+    return _scalar(_Z_Heidaryan_Salarabadi, Tr, Pr)
+
+
+def _Z_Heidaryan_Salarabadi(Tr, Pr):
+    """Array version of :func:`Z_Heidaryan_Salarabadi`"""
     # Table 1
     A = [0, 1.11532372699824, -.0790395208876, .01588138045027, .0088613449601,
          -2.16190792611599, 1.1575311867207, -0.05367780720737,
@@ -705,7 +820,7 @@ def Z_Heidaryan_Salarabadi(Tr, Pr):
         A[5]/Tr + A[6]/Tr**2
     dem = 1 + A[7]*log(Pr) + A[8]*log(Pr)**2 + A[9]/Tr + A[10]/Tr**2
     Z = log(num/dem)
-    return unidades.Dimensionless(Z)
+    return Z
 
 
 @refDoc(__doi__, [14])
@@ -736,15 +851,19 @@ def Z_Heidaryan_Moghadasi(Tr, Pr):
     if Tr < 1.2 or Tr > 3 or Pr < 0.2 or Pr > 15:
         raise NotImplementedError("Incoming out of bound")
 
+    return _scalar(_Z_Heidaryan_Moghadasi, Tr, Pr)
+
+
+def _Z_Heidaryan_Moghadasi(Tr, Pr):
+    """Array version of :func:`Z_Heidaryan_Moghadasi`"""
     # Table 1
-    if Pr < 3:
-        A = [0, 2.827793, -4.688191e-1, -1.262288, -1.536524, -4.535045,
-             6.895104e-2, 1.903869e-1, 6.200089e-1, 1.838479, 4.052367e-1,
-             1.073574]
-    else:
-        A = [0, 3.252838, -1.306424e-1, -6.449194e-1, -1.518028, -5.391019,
+    Alow = [0, 2.827793, -4.688191e-1, -1.262288, -1.536524, -4.535045,
+            6.895104e-2, 1.903869e-1, 6.200089e-1, 1.838479, 4.052367e-1,
+            1.073574]
+    Ahigh = [0, 3.252838, -1.306424e-1, -6.449194e-1, -1.518028, -5.391019,
              -1.379588e-2, 6.600633e-2, 6.120783e-1, 2.317431, 1.632223e-1,
              5.660595e-1]
+    A = [where(Pr < 3, low, high) for low, high in zip(Alow, Ahigh)]
 
     # Eq 8
     num = A[1] + A[3]*log(Pr) + A[5]/Tr + A[7]*log(Pr)**2 + A[9]/Tr**2 + \
@@ -752,7 +871,7 @@ def Z_Heidaryan_Moghadasi(Tr, Pr):
     dem = 1 + A[2]*log(Pr) + A[4]/Tr + A[6]*log(Pr)**2 + A[8]/Tr**2 + \
         A[10]/Tr*log(Pr)
     Z = log(num/dem)
-    return unidades.Dimensionless(Z)
+    return Z
 
 
 @refDoc(__doi__, [16])
@@ -783,6 +902,11 @@ def Z_Azizi(Tr, Pr):
     if Tr < 1.1 or Tr > 2 or Pr < 0.2 or Pr > 11:
         raise NotImplementedError("Incoming out of bound")
 
+    return _scalar(_Z_Azizi, Tr, Pr)
+
+
+def _Z_Azizi(Tr, Pr):
+    """Array version of :func:`Z_Azizi`"""
     # Table 1
     a = 0.0373142485385592
     b = -0.0140807151485369
@@ -813,7 +937,7 @@ def Z_Azizi(Tr, Pr):
     E = p*log(Tr)**1.18 + q*log(Tr)**2.1 + r*log(Pr) + s*log(Pr)**2 + \
         t*log(Pr)*log(Tr)                                                # Eq 6
     Z = A + (B + C) / (D + E)                                            # Eq 1
-    return unidades.Dimensionless(Z)
+    return Z
 
 
 @refDoc(__doi__, [18])
@@ -833,7 +957,11 @@ def Z_Shokir(Tr, Pr):
     Z : float
         Gas compressibility factor [-]
     """
-    # Eq 8
+    return _scalar(_Z_Shokir, Tr, Pr)
+
+
+def _Z_Shokir(Tr, Pr):
+    """Array version of :func:`Z_Shokir`"""
     A = 2.679562*(2*Tr-Pr-1)/((Pr**2+Tr**3)/Pr)
     B = -7.686825*((Pr*Tr+Pr**2)/(Tr*Pr+2*Tr**2+Tr**3))
     C = -0.000624*(Tr**2*Pr-Tr*Pr**2+Tr*Pr**3+2*Tr*Pr-2*Pr**2+2*Pr**3)
@@ -841,7 +969,7 @@ def Z_Shokir(Tr, Pr):
     E = 0.068059/Tr/Pr + 0.139489*Tr**2 + 0.081873*Pr**2 - 0.041098*Tr/Pr + \
         8.152325*Pr/Tr - 1.63028*Pr + 0.24287*Tr - 2.64988
     Z = A + B + C + D + E
-    return unidades.Dimensionless(Z)
+    return Z
 
 
 @refDoc(__doi__, [19])
@@ -879,12 +1007,17 @@ def Z_Bahadori(Tr, Pr):
     if Tr < 1.05 or Tr > 2.4 or Pr < 0.2 or Pr > 16:
         raise NotImplementedError("Incoming out of bound")
 
+    return _scalar(_Z_Bahadori, Tr, Pr)
+
+
+def _Z_Bahadori(Tr, Pr):
+    """Array version of :func:`Z_Bahadori`"""
     a = 0.969469 - 1.349238*Tr + 1.443959*Tr**2 - 0.36860*Tr**3         # Eq 8
     b = -0.107783 - 0.127013*Tr + 0.100828*Tr**2 - 0.012319*Tr**3       # Eq 9
     c = 0.0184810 + 0.0523405*Tr - 0.050688*Tr**2 + 0.010870*Tr**3      # Eq 10
     d = -0.000584 - 0.002146*Tr + 0.0020961*Tr**2 - 0.000459*Tr**3      # Eq 11
     Z = a + b*Pr + c*Pr**2 + d*Pr**3                                    # Eq 7
-    return unidades.Dimensionless(Z)
+    return Z
 
 
 @refDoc(__doi__, [20])
@@ -907,6 +1040,11 @@ def Z_Londono_DAK(Tr, Pr, pure=False):
     Z : float
         Gas compressibility factor [-]
     """
+    return _scalar(_Z_Londono_DAK, Tr, Pr, iterative=True, pure=pure)
+
+
+def _Z_Londono_DAK(Tr, Pr, pure=False):
+    """Array version of :func:`Z_Londono_DAK`"""
     if pure:
         # Eq 34b
         C1 = 0.2965749 - 1.032952/Tr - 0.05394955/Tr**3 - 0.7694/Tr**4 + \
@@ -931,14 +1069,9 @@ def Z_Londono_DAK(Tr, Pr, pure=False):
         Z = 0.27*Pr/Tr/rho
         return 1 + C1*rho + C2*rho**2 - C3*rho**5 + C4*exp(-A11*rho**2) - Z
 
-    rho0 = 0.27*Pr/Tr
-    rho = fsolve(f, rho0, full_output=True)
-    if rho[2] == 1:
-        Z = 0.27*Pr/Tr/rho[0]
-    else:
-        raise ValueError("Iteration not converge")
-
-    return unidades.Dimensionless(Z)
+    rho = _newton(f, 0.27*Pr/Tr)
+    Z = 0.27*Pr/Tr/rho
+    return Z
 
 
 @refDoc(__doi__, [20])
@@ -961,6 +1094,11 @@ def Z_Londono_NS(Tr, Pr, pure=False):
     Z : float
         Gas compressibility factor [-]
     """
+    return _scalar(_Z_Londono_NS, Tr, Pr, iterative=True, pure=pure)
+
+
+def _Z_Londono_NS(Tr, Pr, pure=False):
+    """Array version of :func:`Z_Londono_NS`"""
     if pure:
         # Eq 37b
         A1 = 4.645095e-1
@@ -1006,14 +1144,9 @@ def Z_Londono_NS(Tr, Pr, pure=False):
         Z = 0.27*Pr/Tr/rho
         return 1 + C1*rho + C2*rho**2 - C3*rho**5 + C4*exp(-A15*rho**2) - Z
 
-    rho0 = 0.27*Pr/Tr
-    rho = fsolve(f, rho0, full_output=True)
-    if rho[2] == 1:
-        Z = 0.27*Pr/Tr/rho[0]
-    else:
-        raise ValueError("Iteration not converge")
-
-    return unidades.Dimensionless(Z)
+    rho = _newton(f, 0.27*Pr/Tr)
+    Z = 0.27*Pr/Tr/rho
+    return Z
 
 
 @refDoc(__doi__, [17, 21])
@@ -1034,6 +1167,11 @@ def Z_Hall_Iglesias(Tr, Pr):
     Z : float
         Gas compressibility factor [-]
     """
+    return _scalar(_Z_Hall_Iglesias, Tr, Pr, iterative=True)
+
+
+def _Z_Hall_Iglesias(Tr, Pr):
+    """Array version of :func:`Z_Hall_Iglesias`"""
     X1 = 14.54/Tr-8.23/Tr**2+3.39*Tr**3.5
     X2 = 90.7/Tr-242.2/Tr**2+42.4/Tr**3
     X3 = 1.18+2.82/Tr
@@ -1046,11 +1184,8 @@ def Z_Hall_Iglesias(Tr, Pr):
         return Z - (1+Y+Y**2-Y**3)/(1-Y)**3 - X1*Y + X2*Y**X3 + \
             k1*Y*exp(-k2*(Y-0.421)**2) + k3*Y**10*exp(-69279*(Y-0.374)**4)
 
-    Z = fsolve(f, 0.5, full_output=True)
-    if Z[2] != 1:
-        raise ValueError("Iteration not converge")
-
-    return unidades.Dimensionless(Z[0])
+    Z = _newton(f, 0.5*ones_like(Tr*Pr))
+    return Z
 
 
 @refDoc(__doi__, [22])
@@ -1070,6 +1205,11 @@ def Z_Elsharkawy(Tr, Pr):
     Z : float
         Gas compressibility factor [-]
     """
+    return _scalar(_Z_Elsharkawy, Tr, Pr, iterative=True)
+
+
+def _Z_Elsharkawy(Tr, Pr):
+    """Array version of :func:`Z_Elsharkawy`"""
     C1 = 0.3265 - 1.07/Tr - 0.5339/Tr**3 + 0.01569/Tr**4 - 0.05165/Tr**5
     C2 = 0.5475 - 0.7361/Tr + 0.1844/Tr**2
     C3 = 0.1056*(0.7361/Tr + 0.1844/Tr**2)
@@ -1080,14 +1220,9 @@ def Z_Elsharkawy(Tr, Pr):
         Z = 0.27*Pr/Tr/rho
         return 1 + C1*rho + C2*rho**2 - C3*rho**5 + C4*exp(-0.721*rho**2) - Z
 
-    rho0 = 0.27*Pr/Tr
-    rho = fsolve(f, rho0, full_output=True)
-    if rho[2] == 1:
-        Z = 0.27*Pr/Tr/rho[0]
-    else:
-        raise ValueError("Iteration not converge")
-
-    return unidades.Dimensionless(Z)
+    rho = _newton(f, 0.27*Pr/Tr)
+    Z = 0.27*Pr/Tr/rho
+    return Z
 
 
 Z_list = (Z_Hall_Yarborough, Z_Papay, Z_Dranchuk_Abu_Kassem,
@@ -1097,6 +1232,89 @@ Z_list = (Z_Hall_Yarborough, Z_Papay, Z_Dranchuk_Abu_Kassem,
           Z_Londono_NS, Z_Elsharkawy, Z_Hall_Iglesias)
 
 
+# Array version of correlations and range of validity as Tr, Pr limits or
+# function returning a mask with the points in range
+_Z_array = {
+    Z_Hall_Yarborough: (_Z_Hall_Yarborough, None),
+    Z_Papay: (_Z_Papay, None),
+    Z_Dranchuk_Abu_Kassem: (_Z_Dranchuk_Abu_Kassem, (1, 3, 0.2, 30)),
+    Z_Dranchuk_Purvis_Robinson: (
+        _Z_Dranchuk_Purvis_Robinson, (1.05, 3, 0.2, 30)),
+    Z_ShellOil: (_Z_ShellOil, None),
+    Z_Brill_Beggs: (_Z_Brill_Beggs, (1.15, 2.4, 0.2, 15)),
+    Z_Sarem: (_Z_Sarem, (1.05, 2.95, 0.1, 14.9)),
+    Z_Gopal: (_Z_Gopal, _Gopal_range),
+    Z_Leung: (_Z_Leung, (1.1, 2.6, 0.5, 11)),
+    Z_Burnett: (_Z_Burnett, (1.1, 2.6, 0.5, 11)),
+    Z_Sanjari_Lay: (_Z_Sanjari_Lay, (1.01, 3, 0.01, 15)),
+    Z_Heidaryan_Salarabadi: (_Z_Heidaryan_Salarabadi, (1.2, 3, 0.2, 15)),
+    Z_Heidaryan_Moghadasi: (_Z_Heidaryan_Moghadasi, (1.2, 3, 0.2, 15)),
+    Z_Azizi: (_Z_Azizi, (1.1, 2, 0.2, 11)),
+    Z_Shokir: (_Z_Shokir, None),
+    Z_Bahadori: (_Z_Bahadori, (1.05, 2.4, 0.2, 16)),
+    Z_Londono_DAK: (_Z_Londono_DAK, None),
+    Z_Londono_NS: (_Z_Londono_NS, None),
+    Z_Elsharkawy: (_Z_Elsharkawy, None),
+    Z_Hall_Iglesias: (_Z_Hall_Iglesias, None)}
+
+
+def Z_array(method, Tr, Pr, **kwargs):
+    """Calculate gas compressibility factor with any correlation for arrays
+    of reduced temperature and pressure. All points are calculated at once,
+    the implicit correlations are solved with a vectorized Newton-Raphson
+    iteration, so it's much faster than calculate each point
+
+    Parameters
+    ----------
+    method : function
+        Correlation to use, any function of :data:`Z_list`
+    Tr : array_like
+        Reduced temperature, [-]
+    Pr : array_like
+        Reduced pressure, [-]
+    kwargs : dict
+        Optional parameters of correlation, pure in Londono correlations
+
+    Returns
+    -------
+    Z : array
+        Gas compressibility factor, nan in the invalid points, [-]
+    inRange : array
+        Boolean mask with the input pairs in range of validity of
+        correlation
+    converged : array
+        Boolean mask with the points with a valid value, the iteration
+        converged in implicit correlations
+
+    Examples
+    --------
+    >>> Z, inRange, converged = Z_array(Z_Dranchuk_Abu_Kassem, 1.5, [0.1, 2])
+    >>> inRange
+    array([False,  True])
+    >>> "%0.4f" % Z[1] == "%0.4f" % Z_Dranchuk_Abu_Kassem(1.5, 2)
+    True
+    """
+    Tr, Pr = broadcast_arrays(asarray(Tr, dtype=float),
+                              asarray(Pr, dtype=float))
+    core, limits = _Z_array[method]
+
+    with errstate(all="ignore"):
+        Z = core(Tr, Pr, **kwargs)*ones_like(Tr)
+        converged = isfinite(Z)
+
+        if limits is None:
+            inRange = ones_like(Tr, dtype=bool)
+        elif callable(limits):
+            inRange = limits(Tr, Pr)
+        else:
+            Trmin, Trmax, Prmin, Prmax = limits
+            inRange = (Tr >= Trmin) & (Tr <= Trmax) & (Pr >= Prmin) & \
+                (Pr <= Prmax)
+
+    Z = where(inRange & converged, Z, nan)
+    return Z, inRange, converged
+
+
 class Crudo(Petroleo):
     """Class to model a hypotetical component from a defined crude oil
 
@@ -1140,8 +1358,7 @@ class Crudo(Petroleo):
 
     def calculo(self):
         idx = self.kwargs["index"]
-        databank.execute(f"SELECT * FROM CrudeOil WHERE id=={idx}")
-        prop = databank.fetchone()
+        prop = query("SELECT * FROM CrudeOil WHERE id==?", (idx, ))[0]
 
         API = prop[4]
         SG = 141.5/(API+131.5)
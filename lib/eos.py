@@ -18,11 +18,11 @@ You should have received a copy of the GNU General Public License
 along with this program.  If not, see <http://www.gnu.org/licenses/>.'''
 
 
-from numpy import exp
+from numpy import asarray, exp
 from numpy.lib.scimath import log
-from scipy.optimize import fsolve
 
-from lib import unidades
+from lib import instrument, unidades
+from lib.flash import envelope, flash
 from lib.utilities import refDoc
 
 
@@ -47,6 +47,33 @@ __doi__ = {
         }
 
 
+def _describeFlash(eos, result, record):
+    """Fill the instrumentation record of a flash calculation"""
+    q = result[0]
+    record["mode"] = "T-P"
+    if q == 1:
+        record["region"] = "vapor"
+    elif q == 0:
+        record["region"] = "liquid"
+    else:
+        record["region"] = "two phases"
+    record["evaluations"] += eos.flashInfo.get("fug", 0)
+    record["converged"] = eos.flashInfo.get("converged", True)
+    if not record["converged"]:
+        record["msg"] = "Flash iteration don't converge"
+
+
+def _describeSaturation(eos, result, record):
+    """Fill the instrumentation record of a saturation point calculation"""
+    if record["solver"].endswith("_T"):
+        record["mode"] = "P"
+    else:
+        record["mode"] = "T"
+    record["converged"] = bool(result[1])
+    if not record["converged"]:
+        record["msg"] = "Reach limit iteration count"
+
+
 # TODO: Add UI configuration support for specific parameters
 # Grayson-Streed: Flory option
 # SRK: alpha option
@@ -79,71 +106,66 @@ class EoS(object):
             self.__class__.__name__)
         raise NotImplementedError(msg)
 
+    @instrument.instrumented("EoS", _describeFlash)
     def _Flash(self):
         """Calculation K values for liquid-vapour phase equilibrium
-        Naji, H.S.
-        Conventional and Rapid Flash Calculations for the Soave-Redlich-Kwong
-        and Peng-Robinson Equations of State
-        Emirates J. Eng. Res. 13(3) (2008) 81-91
+
+        The mixture is checked with the Michelsen stability test and the
+        phase split is solved with accelerated successive substitution and
+        Newton iterations, see :func:`lib.flash.flash`. The solver statistics
+        are saved in the flashInfo attribute.
         """
-        # Initial estimation using Wilson correlation, Eq 19
+        # Initial estimation using Wilson correlation
         Ki = []
         for c in self.componente:
             Ki.append(c.Pc/self.P*exp(5.37*(1.+c.f_acent)*(1.-c.Tc/self.T)))
-
-        # Rachford-Rice equation, [1]_
-        def RR(q):
-            f = 0
-            for zi, ki in zip(self.zi, Ki):
-                f += zi*(1-ki)/(1+q*(ki-1))
-            return f
-
-        if RR(0) > 0 and RR(1) > 0:
-            # q>1, superheated gas
-            xi = self.zi
-            yi = self.zi
-            q = 1
+        if instrument.enabled():
+            instrument.note(guesses={"Ki": [float(k) for k in Ki]})
+
+        def fug(xi, yi):
+            return self._fug(xi, yi, self.T, self.P)
+
+        try:
+            q, xi, yi, Ki, self.flashInfo = flash(self.zi, Ki, fug)
+        except NotImplementedError:
+            # Equation without fugacities support, the single phase region
+            # can be still detected with the Wilson K values
+            q = self._WilsonPhase(Ki)
+            Ki = asarray(Ki)
+            self.flashInfo = {"stable": True, "converged": True, "fug": 0}
+
+        if q == 1:
+            xi = yi = self.zi
             Zv = self._Z(self.zi, self.T, self.P)[-1]
             Zl = None
-        elif RR(0) < 0 and RR(1) < 0:
-            # q<0, subcooled liquid
-            xi = self.zi
-            yi = self.zi
-            q = 0
+        elif q == 0:
+            xi = yi = self.zi
             Zl = self._Z(self.zi, self.T, self.P)[0]
             Zv = None
         else:
-            q = 0.5
-            while True:
-                qo = q
-                solucion = fsolve(RR, q, full_output=True)
-                if solucion[2] != 1:
-                    break
-                else:
-                    q = solucion[0][0]
-                    xi = []
-                    yi = []
-                    for zi, ki in zip(self.zi, Ki):
-                        xi.append(zi/(1+q*(ki-1)))
-                        yi.append(zi*ki/(1+q*(ki-1)))
-
-                    tital, titav = self._fug(xi, yi, self.T, self.P)
-
-                    fiv = [z*t*self.P for z, t in zip(yi, titav)]
-                    fil = [z*t*self.P for z, t in zip(xi, tital)]
-
-                    # criterio de convergencia Eq 21
-                    err = sum([abs(l/v-1) for l, v in zip(fil, fiv)])
-                    if err < 1e-12 and (q-qo)**2 < 1e-15:
-                        break
-                    else:
-                        Ki = [l/v for l, v in zip(tital, titav)]
-
+            xi = xi.tolist()
+            yi = yi.tolist()
             Zl = self._Z(xi, self.T, self.P)[0]
             Zv = self._Z(yi, self.T, self.P)[-1]
 
-        return q, Zl, Zv, xi, yi, Ki
+        return q, Zl, Zv, xi, yi, Ki.tolist()
+
+    def _WilsonPhase(self, Ki):
+        """Phase of a single phase feed from Wilson equilibrium ratios, used
+        by equations without fugacities support. Raise NotImplementedError if
+        the feed can be in two phases region"""
+        if sum(z*k for z, k in zip(self.zi, Ki)) <= 1:
+            # Below bubble point, subcooled liquid
+            return 0
+        if sum(z/k for z, k in zip(self.zi, Ki)) <= 1:
+            # Over dew point, superheated gas
+            return 1
+
+        msg = "Derived class %s don't define Liquid-Vapor fugacities" % (
+            self.__class__.__name__)
+        raise NotImplementedError(msg)
 
+    @instrument.instrumented("EoS", _describeSaturation)
     def _Bubble_T(self, P):
         """Calculation Bubble Point Temperature"""
         # Initial estimation of temperature
@@ -152,6 +174,8 @@ class EoS(object):
             Ti = cmp.Tc/(1-3*log(P/cmp.Pc)/(log(10)*(7+7*cmp.f_acent)))
             T += Ti*xi
 
+        instrument.note(guesses={"T0": float(T)})
+
         # Initial estimation of K using inverted Wilson correlation
         Ki = []
         for c in self.componente:
@@ -171,6 +195,7 @@ class EoS(object):
         while True:
             c += 1
             tital, titav = self._fug(self.zi, yi, T, P)
+            instrument.count()
             Ki = [l/v for l, v in zip(tital, titav)]
             if abs(f()) <= 1e-9:
                 find = 1
@@ -194,6 +219,7 @@ class EoS(object):
 
         return T, find
 
+    @instrument.instrumented("EoS", _describeSaturation)
     def _Dew_T(self, P):
         """Calculation Dew Point Temperature"""
         # Initial estimation of temperature
@@ -202,6 +228,8 @@ class EoS(object):
             Ti = cmp.Tc/(1-3*log(P/cmp.Pc)/(log(10)*(7+7*cmp.f_acent)))
             T += Ti*xi
 
+        instrument.note(guesses={"T0": float(T)})
+
         # Initial estimation of K using inverted Wilson correlation
         Ki = []
         for c in self.componente:
@@ -221,6 +249,7 @@ class EoS(object):
         while True:
             c += 1
             tital, titav = self._fug(xi, self.zi, T, P)
+            instrument.count()
             # print(xi, tital, titav)
             Ki = [l/v for l, v in zip(tital, titav)]
             if abs(f()) <= 1e-9:
@@ -245,6 +274,7 @@ class EoS(object):
 
         return T, find
 
+    @instrument.instrumented("EoS", _describeSaturation)
     def _Bubble_P(self, T):
         """Calculation Bubble Point Pressure"""
         # Initial estimation of pressure
@@ -256,6 +286,8 @@ class EoS(object):
             else:
                 P += (Pi*cmp.Pc)**0.5*xi
 
+        instrument.note(guesses={"P0": float(P)})
+
         # Initial estimation of K using inverted Wilson correlation
         Ki = []
         for c in self.componente:
@@ -273,6 +305,7 @@ class EoS(object):
         while True:
             c += 1
             tital, titav = self._fug(self.zi, yi, T, P)
+            instrument.count()
             Ki = [l/v for l, v in zip(tital, titav)]
             if abs(f()) <= 1e-9:
                 find = 1
@@ -293,6 +326,7 @@ class EoS(object):
 
         return P, find
 
+    @instrument.instrumented("EoS", _describeSaturation)
     def _Dew_P(self, T):
         """Calculation Dew Point Pressure"""
         # Initial estimation of pressure
@@ -305,6 +339,8 @@ class EoS(object):
                 P += xi/(Pi*cmp.Pc)**0.5
         P = 1/P
 
+        instrument.note(guesses={"P0": float(P)})
+
         # Initial estimation of K using inverted Wilson correlation
         Ki = []
         for c in self.componente:
@@ -324,6 +360,7 @@ class EoS(object):
         while True:
             c += 1
             tital, titav = self._fug(xi, self.zi, T, P)
+            instrument.count()
             # print(xi, tital, titav)
             Ki = [l/v for l, v in zip(tital, titav)]
             if abs(f()) <= 1e-9:
@@ -345,30 +382,26 @@ class EoS(object):
 
         return P, find
 
-    def envelope(self):
-        # TODO: Implement algorithm
-        from numpy import logspace
-        P = logspace(6, 7, 50)
-        Pd = []
-        dew = []
-        Pb = []
-        bubble = []
-        for p in P:
-            try:
-                print(p)
-                Td, success = self._Dew_T(p)
-                if success:
-                    Pd.append(p)
-                    dew.append(Td)
-                Tb, success = self._Bubble_T(p)
-                if success:
-                    Pb.append(p)
-                    bubble.append(Tb)
-            except:
-                pass
-
-        from pylab import plot, show
-        plot(dew, Pd, "o")
-        plot(bubble, Pb, "x")
-        # yscale("log")
-        show()
+    def envelope(self, P=101325, **kwargs):
+        """Calculate the phase envelope of mixture, see
+        :func:`lib.flash.envelope` for the details of procedure and the
+        optional parameters. The solver statistics are saved in the
+        envelopeInfo attribute.
+
+        Parameters
+        ----------
+        P : float, optional
+            Pressure of initial bubble point and end of dew curve, [Pa]
+
+        Returns
+        -------
+        result : dict
+            Dict with bubble and dew curves, critical point, cricondentherm
+            and cricondenbar
+        """
+        Tc = [c.Tc for c in self.componente]
+        Pc = [c.Pc for c in self.componente]
+        w = [c.f_acent for c in self.componente]
+        result, self.envelopeInfo = envelope(
+            self.zi, Tc, Pc, w, self._fug, P, **kwargs)
+        return result
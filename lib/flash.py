@@ -0,0 +1,792 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+
+'''Pychemqt, Chemical Engineering Process simulator
+Copyright (C) 2009-2025, Juan José Gómez Romera <jjgomera@gmail.com>
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+
+Module with the isothermal liquid-vapour flash algorithm, independent of the
+thermodynamic model used to calculate the fugacity coefficients:
+
+    * :func:`RachfordRice`: Vapour fraction from the Rachford-Rice equation
+    * :func:`stability`: Tangent plane stability test of a mixture
+    * :func:`flash`: Two phase flash calculation
+    * :func:`envelope`: Phase envelope of a mixture
+
+The fugacity coefficients are given as a function with the same signature as
+the `_fug` method of :class:`lib.eos.EoS` without the temperature and pressure
+parameters, `fug(xi, yi)`, returning the fugacity coefficients of liquid phase
+with composition xi and vapour phase with composition yi. The phase envelope
+calculation use the complete signature `fug(xi, yi, T, P)`.
+
+'''
+
+
+from math import copysign, inf
+from time import perf_counter
+
+from numpy import argmax, array, asarray, dot, empty, errstate, exp, log, zeros
+from numpy.linalg import LinAlgError, solve
+
+from lib.utilities import refDoc
+
+
+__doi__ = {
+    1:
+        {"autor": "Rachford, H.H., Rice, J.D.",
+         "title": "Procedure for Use of Electronic Digital Computers in "
+                  "Calculating Flash Vaporization Hydrocarbon Equilibrium",
+         "ref": "Petroleum Transactions, AIME 195 (1952) 327-328",
+         "doi": "10.2118/952327-G"},
+    2:
+        {"autor": "Whitson, C.H., Michelsen, M.L.",
+         "title": "The Negative Flash",
+         "ref": "Fluid Phase Equilibria 53 (1989) 51-71",
+         "doi": "10.1016/0378-3812(89)80072-X"},
+    3:
+        {"autor": "Michelsen, M.L.",
+         "title": "The Isothermal Flash Problem. Part I. Stability",
+         "ref": "Fluid Phase Equilibria 9(1) (1982) 1-19",
+         "doi": "10.1016/0378-3812(82)85001-2"},
+    4:
+        {"autor": "Michelsen, M.L.",
+         "title": "The Isothermal Flash Problem. Part II. Phase-Split "
+                  "Calculation",
+         "ref": "Fluid Phase Equilibria 9(1) (1982) 21-40",
+         "doi": "10.1016/0378-3812(82)85002-4"},
+    5:
+        {"autor": "Crowe, C.M., Nishio, M.",
+         "title": "Convergence Promotion in the Simulation of Chemical "
+                  "Processes - The General Dominant Eigenvalue Method",
+         "ref": "AIChE Journal 21(3) (1975) 528-533",
+         "doi": "10.1002/aic.690210314"},
+    6:
+        {"autor": "Michelsen, M.L.",
+         "title": "Calculation of Phase Envelopes and Critical Points for "
+                  "Multicomponent Mixtures",
+         "ref": "Fluid Phase Equilibria 4(1-2) (1980) 1-10",
+         "doi": "10.1016/0378-3812(80)80001-X"},
+}
+
+
+@refDoc(__doi__, [1, 2])
+def RachfordRice(zi, Ki, tol=1e-14, maxiter=100):
+    """Solve the Rachford-Rice equation for the vapour fraction using a
+    Newton method safeguarded with bisection in the interval where the
+    denominators are positive, [2]_
+
+    .. math::
+        \\sum_i \\frac{z_i\\left(K_i-1\\right)}{1+V\\left(K_i-1\\right)} = 0
+
+    The solution can be outside the [0, 1] interval (negative flash), useful
+    in the successive substitution iterations. If all the K values are
+    greater (lower) than unity there is no solution and the procedure returns
+    1 (0).
+
+    Parameters
+    ----------
+    zi : array_like
+        Molar fraction of component in feed, [-]
+    Ki : array_like
+        Equilibrium ratio of components, [-]
+    tol : float, optional
+        Tolerance in vapour fraction, [-]
+    maxiter : int, optional
+        Maximum number of iterations
+
+    Returns
+    -------
+    V : float
+        Vapour fraction, [-]
+
+    Examples
+    --------
+    >>> "%0.4f" % RachfordRice([0.5, 0.5], [2, 0.5])
+    '0.5000'
+    >>> "%0.4f" % RachfordRice([0.2, 0.3, 0.5], [3.5, 1.2, 0.2])
+    '0.1206'
+    """
+    zi = asarray(zi, dtype=float)
+    Ki = asarray(Ki, dtype=float)
+    Kmax = Ki.max()
+    Kmin = Ki.min()
+    if Kmin >= 1:
+        return 1.
+    if Kmax <= 1:
+        return 0.
+
+    # Interval with positive denominator for all components
+    lo = 1/(1-Kmax)
+    hi = 1/(1-Kmin)
+    V = min(max(0.5, lo), hi)
+    if V in (lo, hi):
+        V = (lo+hi)/2
+
+    c = Ki-1
+    for i in range(maxiter):
+        d = 1+V*c
+        f = dot(zi, c/d)
+        df = -dot(zi, (c/d)**2)
+
+        # f is monotonically decreasing in V
+        if f > 0:
+            lo = V
+        else:
+            hi = V
+
+        Vn = V-f/df
+        if not lo < Vn < hi:
+            Vn = (lo+hi)/2
+        if abs(Vn-V) <= tol*max(1, abs(V)):
+            return float(Vn)
+        V = Vn
+    return float(V)
+
+
+def _gdem(du, du0):
+    """Dominant eigenvalue extrapolation factor from the two last steps of
+    a successive substitution, [5]_. Return 0 when the extrapolation is not
+    advisable"""
+    num = dot(du, du)
+    den = dot(du, du0)
+    if den <= 0:
+        return 0
+    lmbda = num/den
+    if not 0 < lmbda < 1:
+        return 0
+    return min(lmbda/(1-lmbda), 20)
+
+
+@refDoc(__doi__, [3, 5])
+def stability(zi, Ki, fug, tol=1e-12, maxiter=500):
+    """Michelsen tangent plane stability test of a mixture, using a vapour
+    like and a liquid like trial phases initialized with the Ki values, [3]_.
+    The successive substitution is accelerated with the general dominant
+    eigenvalue method, [5]_
+
+    Parameters
+    ----------
+    zi : array_like
+        Molar fraction of component in feed, [-]
+    Ki : array_like
+        Initial estimation of equilibrium ratio, i.e. from Wilson correlation
+    fug : function
+        Function with signature fug(xi, yi) returning the fugacity
+        coefficients of liquid phase of xi composition and vapour phase of yi
+        composition
+    tol : float, optional
+        Tolerance in the sum of squared change of ln W of trial phases
+    maxiter : int, optional
+        Maximum number of iterations
+
+    Returns
+    -------
+    stable : bool
+        True if the mixture is stable as a single phase
+    K : array
+        Estimation of equilibrium ratio for the flash from the unstable trial
+        phases, Ki if the mixture is stable
+    phase : int
+        Phase of the feed with minimum Gibbs free energy, 0 liquid, 1 vapour.
+        For pure components and for equations with only one root the phase is
+        defined by the sum of zi·Ki, greater than unity for vapour
+    count : int
+        Number of calls to fug
+
+    Examples
+    --------
+    Ideal mixture following the Raoult law, with P/Psat ratios
+
+    >>> fug = lambda x, y: ([2, 0.5], [1, 1])
+    >>> stable, K, phase, count = stability([0.5, 0.5], [2, 0.5], fug)
+    >>> stable, "%0.4f %0.4f" % tuple(K)
+    (False, '2.5000 0.6250')
+    >>> fug = lambda x, y: ([1.2, 0.5], [1, 1])
+    >>> stable, K, phase, count = stability([0.5, 0.5], [1.2, 0.5], fug)
+    >>> stable, phase
+    (True, 0)
+    """
+    zi = asarray(zi, dtype=float)
+    Ki = asarray(Ki, dtype=float)
+    mask = zi > 0
+
+    # A pure component can't split in two phases at fixed temperature and
+    # pressure, the phase is defined by the vapour pressure estimated by Ki
+    if mask.sum() == 1:
+        return True, Ki, int(dot(zi, Ki) > 1), 0
+
+    # Feed phase with minimum Gibbs free energy
+    count = 1
+    tital, titav = fug(zi.tolist(), zi.tolist())
+    lnphil = log(asarray(tital, dtype=float))
+    lnphiv = log(asarray(titav, dtype=float))
+    gl = dot(zi, lnphil)
+    gv = dot(zi, lnphiv)
+    if abs(gl-gv) < 1e-10:
+        # Equation with only one root, use the Ki values to check the phase
+        phase = int(dot(zi, Ki) > 1)
+    else:
+        phase = int(gv < gl)
+    lnphiz = lnphiv if phase else lnphil
+
+    with errstate(divide="ignore"):
+        d = log(zi) + lnphiz
+
+    # Trial phases, 0 liquid like, 1 vapour like
+    lnW = [log(zi[mask]/Ki[mask]), log(zi[mask]*Ki[mask])]
+    done = [False, False]
+    trivial = [False, False]
+    steps = [None, None]
+    for i in range(maxiter):
+        W = [zeros(zi.size), zeros(zi.size)]
+        for j in (0, 1):
+            W[j][mask] = exp(lnW[j])
+        Wl = W[0]/W[0].sum()
+        Wv = W[1]/W[1].sum()
+        count += 1
+        tital, titav = fug(Wl.tolist(), Wv.tolist())
+        lnphi = [log(asarray(tital, dtype=float))[mask],
+                 log(asarray(titav, dtype=float))[mask]]
+
+        for j in (0, 1):
+            if done[j]:
+                continue
+
+            du = d[mask]-lnphi[j]-lnW[j]
+            lnW[j] = lnW[j]+du
+
+            # Acceleration each fifth iteration
+            if steps[j] is not None and i % 5 == 4:
+                lnW[j] = lnW[j]+_gdem(du, steps[j])*du
+            steps[j] = du
+
+            if dot(du, du) < tol:
+                done[j] = True
+
+            # Check trivial solution, trial phase equal to feed
+            Y = exp(lnW[j])
+            dY = log(Y/Y.sum()/zi[mask])
+            if dot(dY, dY) < 1e-8:
+                done[j] = True
+                trivial[j] = True
+
+        # A converged trial phase with negative tangent plane distance is
+        # enough to know the mixture is unstable
+        if all(done) or any(
+                done[j] and not trivial[j] and exp(lnW[j]).sum() > 1+1e-8
+                for j in (0, 1)):
+            break
+
+    # Tangent plane distance, the phase is unstable with ΣW > 1
+    unstable = []
+    for j in (0, 1):
+        unstable.append(not trivial[j] and exp(lnW[j]).sum() > 1+1e-8)
+
+    if not any(unstable):
+        return True, Ki, phase, count
+
+    Yl = exp(lnW[0])
+    Yl /= Yl.sum()
+    Yv = exp(lnW[1])
+    Yv /= Yv.sum()
+    K = Ki.copy()
+    if all(unstable):
+        K[mask] = Yv/Yl
+    elif unstable[1]:
+        K[mask] = Yv/zi[mask]
+    else:
+        K[mask] = zi[mask]/Yl
+    return False, K, phase, count
+
+
+@refDoc(__doi__, [1, 2, 3, 4, 5])
+def flash(zi, Ki, fug, tol=1e-12, maxiter=500):
+    """Isothermal two phase flash calculation, [4]_
+
+    The mixture is checked first with the tangent plane stability test. For
+    unstable mixtures the phase split is calculated by successive
+    substitution, accelerated with the general dominant eigenvalue method,
+    switching to a Newton method in ln K when the convergence is slow.
+
+    Parameters
+    ----------
+    zi : array_like
+        Molar fraction of component in feed, [-]
+    Ki : array_like
+        Initial estimation of equilibrium ratio, i.e. from Wilson correlation
+    fug : function
+        Function with signature fug(xi, yi) returning the fugacity
+        coefficients of liquid phase of xi composition and vapour phase of yi
+        composition
+    tol : float, optional
+        Tolerance in the sum of squared ln(f_L/f_V) of components
+    maxiter : int, optional
+        Maximum number of iterations
+
+    Returns
+    -------
+    V : float
+        Vapour fraction, 0 for liquid and 1 for vapour single phase, [-]
+    xi : array
+        Molar fraction of component in liquid phase, [-]
+    yi : array
+        Molar fraction of component in vapour phase, [-]
+    Ki : array
+        Equilibrium ratio of components, [-]
+    info : dict
+        Dict with solver statistics:
+
+            * stable: Result of stability test
+            * stability: Number of iterations of stability test
+            * converged: Boolean with the convergence status, False too if
+              the phase split goes to the trivial solution
+            * iterations: Number of iterations of phase split
+            * ssi: Number of successive substitution steps
+            * gdem: Number of accelerated steps
+            * newton: Number of Newton steps
+            * fug: Number of evaluations of fugacity coefficients
+            * error: Sum of squared error in ln K
+            * time: Time used in calculation, [s]
+
+    Examples
+    --------
+    Ideal mixture following the Raoult law, with P/Psat ratios
+
+    >>> fug = lambda x, y: ([3.5, 1.2, 0.2], [1, 1, 1])
+    >>> V, x, y, K, info = flash([0.2, 0.3, 0.5], [1, 1, 1], fug)
+    >>> "%0.4f %0.4f %0.4f %0.4f" % (V, *x)
+    '0.1206 0.1537 0.2929 0.5534'
+    >>> info["stable"], info["converged"]
+    (False, True)
+    >>> fug = lambda x, y: ([3.5, 1.2, 0.8], [1, 1, 1])
+    >>> V, x, y, K, info = flash([0.2, 0.3, 0.5], [1, 1, 1], fug)
+    >>> V, info["stable"]
+    (1, True)
+    """
+    t0 = perf_counter()
+    zi = asarray(zi, dtype=float)
+    mask = zi > 0
+    info = {"stable": True, "converged": True, "stability": 0,
+            "iterations": 0, "ssi": 0, "gdem": 0, "newton": 0, "fug": 0,
+            "error": 0}
+
+    stable, Ki, phase, count = stability(zi, Ki, fug)
+    info["stability"] = count
+    info["fug"] = count
+    if stable:
+        info["time"] = perf_counter()-t0
+        return phase, zi, zi, Ki, info
+    info["stable"] = False
+
+    def split(lnK):
+        """Phase compositions and residual of ln K for a K values vector"""
+        K = exp(lnK)
+        V = RachfordRice(zi, K)
+        xi = zi/(1+V*(K-1))
+        yi = K*xi
+        tital, titav = fug(xi.tolist(), yi.tolist())
+        info["fug"] += 1
+        g = log(asarray(tital, dtype=float)) \
+            - log(asarray(titav, dtype=float)) - lnK
+        return V, xi, yi, g
+
+    lnK = log(asarray(Ki, dtype=float))
+    step0 = None
+    err0 = inf
+    newton = False
+    for i in range(maxiter):
+        info["iterations"] += 1
+        V, xi, yi, g = split(lnK)
+        err = dot(g[mask], g[mask])
+        if err < tol:
+            break
+
+        # Trivial solution, all phases with the same composition
+        if dot(lnK+g, lnK+g) < 1e-10:
+            info["converged"] = False
+            break
+
+        if newton:
+            # Jacobian of residual by finite differences
+            N = lnK.size
+            J = zeros((N, N))
+            for j in range(N):
+                h = 1e-7*max(1, abs(lnK[j]))
+                lnKh = lnK.copy()
+                lnKh[j] += h
+                J[:, j] = (split(lnKh)[3]-g)/h
+            try:
+                du = solve(J, -g)
+            except LinAlgError:
+                du = g
+                newton = False
+            info["newton"] += 1
+
+        else:
+            du = g
+            info["ssi"] += 1
+
+            # Dominant eigenvalue acceleration each fifth step
+            if step0 is not None and info["ssi"] % 5 == 0:
+                factor = _gdem(du, step0)
+                if factor:
+                    du = du*(1+factor)
+                    info["gdem"] += 1
+            step0 = g
+
+            # Switch to Newton method with slow convergence near solution
+            if err < 1e-4 and err > 0.5*err0:
+                newton = True
+
+        # Return to successive substitution if Newton method diverge
+        if newton and err > err0:
+            newton = False
+        err0 = err
+        lnK = lnK+du
+    else:
+        info["converged"] = False
+
+    info["error"] = err
+    K = exp(lnK)
+
+    # Negative flash solution, single phase
+    if V <= 0:
+        V, xi, yi = 0, zi, zi
+    elif V >= 1:
+        V, xi, yi = 1, zi, zi
+
+    info["time"] = perf_counter()-t0
+    return V, array(xi), array(yi), K, info
+
+
+def _saturation(zi, X, s, flip, fug, info, tol=1e-8, maxiter=20):
+    """Solve the saturation point equations with a Newton method, [6]_
+
+    The variables are X = [ln K, ln T, ln P], with the incipient phase
+    composition yi = zi·Ki and the specification X[s] fixed to its initial
+    value. With flip the feed is the vapour phase and the incipient phase is
+    the liquid.
+
+    Return the solution, the jacobian used in the last iteration and the
+    number of iterations, or None if the solution is not found
+    """
+    N = zi.size
+    S = X[s]
+
+    def residual(X):
+        yi = zi*exp(X[:N])
+        T = exp(X[N])
+        P = exp(X[N+1])
+        info["fug"] += 1
+        if flip:
+            tita, titb = fug((yi/yi.sum()).tolist(), zi.tolist(), T, P)
+            lnphiy = log(asarray(tita, dtype=float))
+            lnphix = log(asarray(titb, dtype=float))
+        else:
+            tita, titb = fug(zi.tolist(), (yi/yi.sum()).tolist(), T, P)
+            lnphix = log(asarray(tita, dtype=float))
+            lnphiy = log(asarray(titb, dtype=float))
+
+        F = empty(N+2)
+        F[:N] = X[:N] + lnphiy - lnphix
+        F[N] = yi.sum()-1
+        F[N+1] = X[s]-S
+        return F
+
+    def jacobian(X, F):
+        """Jacobian by finite differences, _fug don't give derivatives"""
+        J = zeros((N+2, N+2))
+        J[N+1, s] = 1
+        for j in range(N+2):
+            h = 1e-7*max(1, abs(X[j]))
+            Xh = X.copy()
+            Xh[j] += h
+            J[:N+1, j] = (residual(Xh)[:N+1]-F[:N+1])/h
+        return J
+
+    J = None
+    for it in range(1, maxiter+1):
+        F = residual(X)
+        if abs(F).max() < tol:
+            break
+        J = jacobian(X, F)
+        try:
+            dX = solve(J, -F)
+        except LinAlgError:
+            return None
+
+        # Limit the step for the initial point with poor estimation
+        m = abs(dX).max()
+        if m > 1:
+            dX /= m
+        X = X+dX
+
+        # With quadratic convergence the error of next iteration is lower
+        # than tolerance
+        if m < tol:
+            break
+    else:
+        return None
+
+    if J is None:
+        J = jacobian(X, F)
+
+    # Check trivial solution with both phases equal
+    if abs(X[:N]).max() < 1e-4:
+        return None
+    return X, J, it
+
+
+def _hermite(u, u0, X0, t0, u1, X1, t1):
+    """Cubic Hermite interpolation of vector X at u, from two points with
+    its derivatives dX/du"""
+    h = u1-u0
+    r = (u-u0)/h
+    return (2*r**3-3*r**2+1)*X0 + (r**3-2*r**2+r)*h*t0 + \
+        (3*r**2-2*r**3)*X1 + (r**3-r**2)*h*t1
+
+
+@refDoc(__doi__, [6])
+def envelope(zi, Tc, Pc, w, fug, P=101325, Pmax=1e9, step=0.05,
+             maxstep=0.25, maxpoints=500):
+    """Phase envelope of a mixture by continuation of saturation points, [6]_
+
+    The curve is traced from the bubble point at low pressure, stepping in
+    the variable with the largest sensitivity between ln K, ln T and ln P,
+    with a linear extrapolation of the previous point as initial estimation.
+    Near the critical point the specification change to the ln K of a
+    component to cross the critical point, where the bubble curve goes on as
+    dew curve. The procedure ends when the dew curve goes down to the initial
+    pressure.
+
+    Parameters
+    ----------
+    zi : array_like
+        Molar fraction of component in mixture, [-]
+    Tc : array_like
+        Critical temperature of components, [K]
+    Pc : array_like
+        Critical pressure of components, [Pa]
+    w : array_like
+        Acentric factor of components, [-]
+    fug : function
+        Function with signature fug(xi, yi, T, P) returning the fugacity
+        coefficients of liquid phase of xi composition and vapour phase of yi
+        composition
+    P : float, optional
+        Pressure of initial bubble point and end of dew curve, [Pa]
+    Pmax : float, optional
+        Maximum pressure of envelope, [Pa]
+    step : float, optional
+        Initial step in the specification variable
+    maxstep : float, optional
+        Maximum step in the specification variable
+    maxpoints : int, optional
+        Maximum number of points calculated
+
+    Returns
+    -------
+    result : dict
+        Dict with the envelope, each value a tuple with temperature and
+        pressure, arrays for the branches of curve and floats for points:
+
+            * bubble: Bubble curve
+            * dew: Dew curve
+            * critical: Critical point, None if it isn't found
+            * cricondentherm: Point with the maximum temperature
+            * cricondenbar: Point with the maximum pressure
+    info : dict
+        Dict with solver statistics:
+
+            * points: Number of points calculated
+            * iterations: Total number of Newton iterations
+            * fug: Number of evaluations of fugacity coefficients
+            * time: Time used in calculation, [s]
+
+    Examples
+    --------
+    Ideal mixture following the Raoult law with Wilson vapour pressure, the
+    bubble pressure is the mean of vapour pressure of components
+
+    >>> zi, w = [0.5, 0.5], [0.15, 0.2]
+    >>> Tc, Pc = [369.8, 425.1], [4.25e6, 3.80e6]
+    >>> def Psat(T):
+    ...     return [p*exp(5.373*(1+f)*(1-t/T)) for t, p, f in zip(Tc, Pc, w)]
+    >>> def fug(x, y, T, P):
+    ...     return [p/P for p in Psat(T)], [1, 1]
+    >>> result, info = envelope(zi, Tc, Pc, w, fug, Pmax=5e6)
+    >>> T, P = result["bubble"]
+    >>> "%0.2f %0.0f" % (T[0], P[0])
+    '243.41 101325'
+    >>> max(abs(dot(zi, Psat(t))/p-1) for t, p in zip(T, P)) < 1e-8
+    True
+
+    The ideal mixture has no critical point, so the bubble curve goes on to
+    the maximum pressure
+
+    >>> result["critical"], len(result["dew"][0])
+    (None, 0)
+    """
+    t0 = perf_counter()
+    zi = asarray(zi, dtype=float)
+    Tc = asarray(Tc, dtype=float)
+    Pc = asarray(Pc, dtype=float)
+    w = asarray(w, dtype=float)
+    N = zi.size
+    info = {"points": 0, "iterations": 0, "fug": 0}
+
+    # Initial bubble temperature with K values from Wilson correlation
+    T = dot(zi, Tc)
+    for i in range(50):
+        K = Pc/P*exp(5.373*(1+w)*(1-Tc/T))
+        dlnT = -log(dot(zi, K))*dot(zi, K)/dot(zi, K*5.373*(1+w)*Tc/T)
+        T *= exp(min(max(dlnT, -0.5), 0.5))
+        if abs(dlnT) < 1e-10:
+            break
+    K = Pc/P*exp(5.373*(1+w)*(1-Tc/T))
+
+    X = empty(N+2)
+    X[:N] = log(K)
+    X[N] = log(T)
+    X[N+1] = log(P)
+    flip = False
+    sol = _saturation(zi, X, N+1, flip, fug, info, maxiter=50)
+    if sol is None:
+        raise ValueError("Initial bubble point not found")
+    X, J, it = sol
+    info["iterations"] += it
+    info["points"] += 1
+
+    # Sensitivity of variables with the specification of point
+    e = zeros(N+2)
+    e[N+1] = 1
+    v = solve(J, e)
+
+    points = [(X, v, flip)]
+    critical = None
+    direction = 1
+    Xold = vold = None
+    while info["points"] < maxpoints and step > 1e-5:
+        # Specification in the variable with the greater sensitivity, with
+        # the step in ln K relative to its value
+        s = argmax(abs(v))
+        t = v/v[s]
+        sign = copysign(1, v[s]*direction)
+        if s < N:
+            dS = sign*step*max(1, abs(X[s]))
+        else:
+            dS = sign*step
+        Xp = X + t*dS
+
+        # Cubic extrapolation with the previous point when available
+        if Xold is not None and vold[s] and X[s] != Xold[s]:
+            Xp = _hermite(X[s]+dS, Xold[s], Xold, vold/vold[s], X[s], X, t)
+
+        # Check critical point crossing, the ln K change sign
+        cross = dot(Xp[:N], X[:N]) <= 0 or abs(Xp[:N]).max() < 0.1
+        if cross:
+            if abs(X[:N]).max() > 0.2:
+                step /= 2
+                continue
+
+            # Specification in the ln K with greater value, jumping to the
+            # opposite value
+            s = argmax(abs(X[:N]))
+            t = v/v[s]
+            Xp = X - t*2*X[s]
+            if Xold is not None and vold[s] and X[s] != Xold[s]:
+                Xp = _hermite(-X[s], Xold[s], Xold, vold/vold[s], X[s], X, t)
+            sign = copysign(1, -X[s])
+
+        sol = _saturation(zi, Xp, s, flip ^ cross, fug, info)
+        if sol is None:
+            step /= 2
+            continue
+
+        Xn, J, it = sol
+        info["iterations"] += it
+        info["points"] += 1
+        direction = sign
+        Xold, vold = X, v
+        X = Xn
+        v = solve(J, e)
+
+        if cross:
+            flip = not flip
+            Xc = _hermite(0, Xold[s], Xold, vold/vold[s], X[s], X, v/v[s])
+            critical = (exp(Xc[N]), exp(Xc[N+1]))
+
+        if X[N+1] < log(P) or X[N+1] > log(Pmax):
+            break
+        points.append((X, v, flip))
+
+        # Step control by number of iterations
+        if it <= 3:
+            step = min(step*1.5, maxstep)
+        elif it > 5:
+            step /= 2
+
+    lnT = array([X[N] for X, v, flip in points])
+    lnP = array([X[N+1] for X, v, flip in points])
+    dew = array([flip for X, v, flip in points])
+
+    # Points with maximum temperature and pressure, located by the zero of
+    # derivative along the curve with regula falsi method between the
+    # neighbours of the calculated point with the maximum value
+    extreme = []
+    for iy, ix in ((N, N+1), (N+1, N)):
+        i = argmax([X[iy] for X, v, flip in points])
+        X, v, flip = points[i]
+        if 0 < i < len(points)-1:
+            bracket = []
+            for X0, v0, flip0 in points[i-1:i+2]:
+                bracket.append((X0, v0[iy]/v0[ix]))
+            if bracket[0][1]*bracket[1][1] < 0:
+                (Xa, ga), (Xb, gb) = bracket[:2]
+            else:
+                (Xa, ga), (Xb, gb) = bracket[1:]
+
+            for k in range(10):
+                if ga*gb >= 0:
+                    break
+                f = ga/(ga-gb)
+                sol = _saturation(zi, Xa+f*(Xb-Xa), ix, flip, fug, info)
+                if sol is None:
+                    break
+                X, J, it = sol
+                info["iterations"] += it
+                v = solve(J, e)
+                g = v[iy]/v[ix]
+                if abs(g) < 1e-6:
+                    break
+
+                # Illinois modification of regula falsi
+                if g*ga > 0:
+                    Xa, ga = X, g
+                    gb /= 2
+                else:
+                    Xb, gb = X, g
+                    ga /= 2
+        extreme.append((exp(X[N]), exp(X[N+1])))
+
+    result = {
+        "bubble": (exp(lnT[~dew]), exp(lnP[~dew])),
+        "dew": (exp(lnT[dew]), exp(lnP[dew])),
+        "critical": critical,
+        "cricondentherm": extreme[0],
+        "cricondenbar": extreme[1]}
+    info["time"] = perf_counter()-t0
+    return result, info
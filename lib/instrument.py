@@ -0,0 +1,358 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+
+'''Pychemqt, Chemical Engineering Process simulator
+Copyright (C) 2009-2025, Juan José Gómez Romera <jjgomera@gmail.com>
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+
+Opt-in instrumentation of solvers, to find the fluids, regions and
+equipments dominating the calculation time. When it's enabled each call of
+instrumented procedures (MEoS states, EoS flashes and saturation points and
+equipment calculations) save a record with:
+
+    * kind: Type of calculation, MEoS, EoS or equipment
+    * name: Class name of fluid, equation or equipment
+    * solver: Name of procedure or solver used
+    * mode: Input pair of calculation
+    * region: Phase region of solution
+    * guesses: Initial values of iteration
+    * evaluations: Number of residual function evaluations, including the
+      evaluations of nested calls
+    * calls: Number of nested instrumented calls
+    * time: Wall time, [s]
+    * status: Status code of calculation
+    * converged: Boolean with the success of calculation
+    * msg: Failure reason
+
+When it's disabled the instrumented procedures only check a global variable,
+so the overhead is negligible.
+
+    * :class:`Collector`: Records of calls, with aggregation and export
+    * :func:`collect`: Context manager to enable the instrumentation
+    * :func:`enable`: Enable the instrumentation for the next calls
+    * :func:`disable`: Disable the instrumentation
+    * :func:`enabled`: Check if the instrumentation is enabled
+    * :func:`instrumented`: Decorator to record the calls of a method
+    * :func:`note`: Add information to the running record
+    * :func:`count`: Add residual evaluations to the running record
+    * :func:`counted`: Wrap a residual function to count its evaluations
+
+API reference
+-------------
+
+'''
+
+
+from contextlib import contextmanager
+import csv
+from functools import wraps
+import json
+from math import floor, log10
+import threading
+from time import perf_counter
+
+
+FIELDS = ["kind", "name", "solver", "mode", "region", "guesses",
+          "evaluations", "calls", "time", "status", "converged", "msg"]
+
+# Decades of time histogram, from 1 μs to 10 s
+BINS = [10**i for i in range(-6, 2)]
+
+# Active collector, None when the instrumentation is disabled
+_collector = None
+
+# Stack of running records of each thread
+_local = threading.local()
+
+
+def _stack():
+    """Return the stack of running records of current thread"""
+    try:
+        return _local.stack
+    except AttributeError:
+        _local.stack = []
+        return _local.stack
+
+
+class Collector():
+    """
+    Collection of records of instrumented calls, with procedures to
+    aggregate and export the data
+
+    Examples
+    --------
+    >>> from lib.mEoS import H2O
+    >>> with collect() as collector:
+    ...     st = H2O(T=400, P=1e6)
+    ...     st = H2O(P=1e6, h=2e6)
+    >>> [(r["name"], r["mode"], r["converged"]) for r in collector.records]
+    [('H2O', 'T-P', True), ('H2O', 'P-h', True)]
+    >>> collector.records[1]["evaluations"] > 0
+    True
+    >>> summary = collector.summary(["kind", "name"])
+    >>> summary[0]["kind"], summary[0]["name"], summary[0]["count"]
+    ('MEoS', 'H2O', 2)
+    """
+
+    def __init__(self):
+        self.records = []
+        self._lock = threading.Lock()
+
+    def add(self, record):
+        """Add a record to collection, thread safe"""
+        with self._lock:
+            self.records.append(record)
+
+    def clear(self):
+        """Remove all records"""
+        with self._lock:
+            self.records = []
+
+    def summary(self, by=("kind", "name", "mode")):
+        """Aggregate the records in groups
+
+        Parameters
+        ----------
+        by : list
+            Name of record fields to group the records
+
+        Returns
+        -------
+        summary : list
+            List of dicts with the statistics of each group, sorted by total
+            time, with the group fields and:
+
+                * count: Number of records
+                * failures: Number of not converged records
+                * time: Total time, [s]
+                * time_mean: Mean time, [s]
+                * time_max: Maximum time, [s]
+                * evaluations: Total number of residual evaluations
+                * evaluations_mean: Mean number of residual evaluations
+                * histogram: Count of records with time in each decade of
+                  BINS, with the first for faster calls and the last for
+                  slower calls
+        """
+        with self._lock:
+            records = list(self.records)
+
+        groups = {}
+        for record in records:
+            key = tuple(record[field] for field in by)
+            groups.setdefault(key, []).append(record)
+
+        summary = []
+        for key, group in groups.items():
+            times = [record["time"] for record in group]
+            evaluations = sum(record["evaluations"] for record in group)
+            histogram = [0]*(len(BINS)+1)
+            for t in times:
+                if t > 0:
+                    index = int(floor(log10(t)))-int(log10(BINS[0]))+1
+                else:
+                    index = 0
+                histogram[min(max(index, 0), len(BINS))] += 1
+
+            item = dict(zip(by, key))
+            item["count"] = len(group)
+            item["failures"] = sum(
+                1 for record in group if not record["converged"])
+            item["time"] = sum(times)
+            item["time_mean"] = item["time"]/len(group)
+            item["time_max"] = max(times)
+            item["evaluations"] = evaluations
+            item["evaluations_mean"] = evaluations/len(group)
+            item["histogram"] = histogram
+            summary.append(item)
+
+        summary.sort(key=lambda item: item["time"], reverse=True)
+        return summary
+
+    def toCSV(self, fname, by=None):
+        """Export the records to a csv file
+
+        Parameters
+        ----------
+        fname : str
+            Path of file
+        by : list, optional
+            Name of fields to group the records, if it's defined the summary
+            is exported in place of records
+        """
+        if by:
+            rows = self.summary(by)
+            fields = list(by) + [
+                "count", "failures", "time", "time_mean", "time_max",
+                "evaluations", "evaluations_mean", "histogram"]
+        else:
+            with self._lock:
+                rows = list(self.records)
+            fields = FIELDS
+
+        with open(fname, "w", newline="", encoding="utf-8") as file:
+            writer = csv.DictWriter(file, fields, extrasaction="ignore")
+            writer.writeheader()
+            for row in rows:
+                row = row.copy()
+                for key in ("guesses", "histogram"):
+                    if key in row:
+                        row[key] = json.dumps(row[key])
+                writer.writerow(row)
+
+    def toJSON(self, fname, by=("kind", "name", "mode")):
+        """Export the records and its summary to a json file
+
+        Parameters
+        ----------
+        fname : str
+            Path of file
+        by : list
+            Name of fields to group the records in summary
+        """
+        with self._lock:
+            records = list(self.records)
+        data = {"bins": BINS, "summary": self.summary(by), "records": records}
+        with open(fname, "w", encoding="utf-8") as file:
+            json.dump(data, file, default=float)
+
+
+def enable(collector=None):
+    """Enable the instrumentation for all threads, returning the collector
+    where the records are saved"""
+    global _collector
+    if collector is None:
+        collector = Collector()
+    _collector = collector
+    return collector
+
+
+def disable():
+    """Disable the instrumentation"""
+    global _collector
+    _collector = None
+
+
+def enabled():
+    """Return True if the instrumentation is enabled, to build the data of
+    records only when they are saved
+
+    Examples
+    --------
+    >>> enabled()
+    False
+    >>> with collect():
+    ...     enabled()
+    True
+    """
+    return _collector is not None
+
+
+@contextmanager
+def collect(collector=None):
+    """Context manager to enable the instrumentation inside a block,
+    restoring the previous state at exit"""
+    global _collector
+    previous = _collector
+    collector = enable(collector)
+    try:
+        yield collector
+    finally:
+        _collector = previous
+
+
+def instrumented(kind, describe=None, solver=None):
+    """Decorator to record the calls of a method
+
+    Parameters
+    ----------
+    kind : str
+        Type of calculation
+    describe : callable, optional
+        Procedure called with the instance, the returned value and the record
+        to fill the record with the result of calculation, the record is
+        discarded if it returns False
+    solver : str, optional
+        Name of solver, default the method name
+    """
+    def decorator(func):
+        name = solver or func.__name__
+
+        @wraps(func)
+        def wrapper(self, *args, **kwargs):
+            collector = _collector
+            if collector is None:
+                return func(self, *args, **kwargs)
+
+            record = {
+                "kind": kind, "name": self.__class__.__name__,
+                "solver": name, "mode": "", "region": "", "guesses": None,
+                "evaluations": 0, "calls": 0, "time": 0, "status": None,
+                "converged": True, "msg": ""}
+            stack = _stack()
+            stack.append(record)
+            keep = True
+            t0 = perf_counter()
+            try:
+                result = func(self, *args, **kwargs)
+            except Exception as error:
+                record["converged"] = False
+                record["msg"] = f"{error.__class__.__name__}: {error}"
+                raise
+            else:
+                if describe is not None:
+                    keep = describe(self, result, record) is not False
+            finally:
+                record["time"] = perf_counter()-t0
+                stack.pop()
+                if keep:
+                    if stack:
+                        stack[-1]["calls"] += record["calls"]+1
+                        stack[-1]["evaluations"] += record["evaluations"]
+                    collector.add(record)
+            return result
+        return wrapper
+    return decorator
+
+
+def note(**kwargs):
+    """Update the fields of running record with kwargs"""
+    if _collector is None:
+        return
+    stack = _stack()
+    if stack:
+        stack[-1].update(kwargs)
+
+
+def count(n=1):
+    """Add n residual evaluations to the running record"""
+    if _collector is None:
+        return
+    stack = _stack()
+    if stack:
+        stack[-1]["evaluations"] += n
+
+
+def counted(f):
+    """Return the residual function f counting its evaluations in the
+    running record, or f itself if the instrumentation is disabled"""
+    if _collector is None or f is None:
+        return f
+
+    @wraps(f)
+    def wrapper(*args, **kwargs):
+        count()
+        return f(*args, **kwargs)
+    return wrapper
@@ -194,7 +194,7 @@ class Test(TestCase):
         self.assertEqual(round(st.Liquido.cvM.JmolK, 10), 54.1084845523)
         self.assertEqual(round(st.Liquido.cpM.JmolK, 10), 81.5266043376)
         self.assertEqual(round(st.Liquido.w, 8), 1794.54046849)
-        self.assertEqual(round(st.Liquido.aM.Jmol, 8), -9027.99755817)
+        self.assertEqual(round(st.Liquido.aM.Jmol, 8), -9027.99755819)
         self.assertEqual(round(st.Gas.rhoM, 10), 0.0004315688)
         self.assertEqual(round(st.Gas.hM.Jmol, 8), -4103.02312657)
         self.assertEqual(round(st.Gas.sM.JmolK, 10), 24.6247126168)
@@ -754,3 +754,14 @@ class Test(TestCase):
         self.assertEqual(round(fluid.k.mWmK, 6), 448.883487)
         fluid = H2O(rho=750, T=647.35)
         self.assertEqual(round(fluid.k.mWmK, 6), 600.961346)
+
+    def test_batch(self):
+        """Batch calculation of subcooled liquid at low pressure, the dense
+        liquid root must be found, not the metastable vapour"""
+        T = [275, 300, 330, 355]
+        P = [1e3, 5e3, 2e4, 1e5]
+        res = H2O.batch(T=T, P=P, props=["rho", "h"])
+        for i, (Ti, Pi) in enumerate(zip(T, P)):
+            st = H2O(T=Ti, P=Pi)
+            self.assertEqual(round(res["rho"][i], 6), round(st.rho, 6))
+            self.assertEqual(round(res["h"][i], 3), round(st.h, 3))
@@ -728,3 +728,14 @@ class Test(TestCase):
         self.assertEqual(round(R134a(T=350, rho=0).mu.muPas, 5), 13.77874)
         self.assertEqual(round(R134a(T=350, rho=100).mu.muPas, 5), 14.70183)
         self.assertEqual(round(R134a(T=350, rho=1000).mu.muPas, 5), 107.98464)
+
+    def test_batch(self):
+        """Batch calculation of subcooled liquid at low pressure, the dense
+        liquid root must be found, not the metastable vapour"""
+        T = [178.3425, 190, 210, 230]
+        P = [4059, 2e4, 5e4, 1e5]
+        res = R134a.batch(T=T, P=P, props=["rho", "h"])
+        for i, (Ti, Pi) in enumerate(zip(T, P)):
+            st = R134a(T=Ti, P=Pi)
+            self.assertEqual(round(res["rho"][i], 6), round(st.rho, 6))
+            self.assertEqual(round(res["h"][i], 3), round(st.h, 3))
@@ -18,248 +18,223 @@ You should have received a copy of the GNU General Public License
 along with this program.  If not, see <http://www.gnu.org/licenses/>.'''
 
 
+import json
+import os
+import sys
+from collections.abc import Sequence
+from importlib import import_module
+from types import ModuleType
 from unittest import TestCase
 
-# Noble Gases
-from lib.mEoS.He import He
-from lib.mEoS.Ne import Ne
-from lib.mEoS.Ar import Ar
-from lib.mEoS.Kr import Kr
-from lib.mEoS.Xe import Xe
-
-# Gases
-from lib.mEoS.H2 import H2
-from lib.mEoS.D2 import D2, pD2, oD2
-from lib.mEoS.pH2 import pH2
-from lib.mEoS.oH2 import oH2
-from lib.mEoS.N2 import N2
-from lib.mEoS.O2 import O2
-from lib.mEoS.F2 import F2
-from lib.mEoS.Cl2 import Cl2
-from lib.mEoS.H2O import H2O
-from lib.mEoS.D2O import D2O
-from lib.mEoS.CO2 import CO2
-from lib.mEoS.CO import CO
-from lib.mEoS.N2O import N2O
-from lib.mEoS.SO2 import SO2
-from lib.mEoS.COS import COS
-from lib.mEoS.NH3 import NH3
-from lib.mEoS.H2S import H2S
-
-# Alkanes
-from lib.mEoS.CH4 import CH4
-from lib.mEoS.C2 import C2
-from lib.mEoS.C3 import C3
-from lib.mEoS.nC4 import nC4
-from lib.mEoS.iC4 import iC4
-from lib.mEoS.nC5 import nC5
-from lib.mEoS.neoC5 import neoC5
-from lib.mEoS.iC5 import iC5
-from lib.mEoS.nC6 import nC6
-from lib.mEoS.iC6 import iC6
-from lib.mEoS.nC7 import nC7
-from lib.mEoS.nC8 import nC8
-from lib.mEoS.iC8 import iC8
-from lib.mEoS.nC9 import nC9
-from lib.mEoS.nC10 import nC10
-from lib.mEoS.nC11 import nC11
-from lib.mEoS.nC12 import nC12
-from lib.mEoS.nC13 import nC13
-from lib.mEoS.nC14 import nC14
-from lib.mEoS.nC15 import nC15
-from lib.mEoS.nC16 import nC16
-from lib.mEoS.nC22 import nC22
-from lib.mEoS.C3_pentane import C3_pentane
-from lib.mEoS.C22_butane import C22_butane
-from lib.mEoS.C23_butane import C23_butane
-
-# Naphthenes
-from lib.mEoS.Cyclopropane import Cyclopropane
-from lib.mEoS.Cyclopentane import Cyclopentane
-from lib.mEoS.Cyclohexane import Cyclohexane
-from lib.mEoS.C1Cyclohexane import C1Cyclohexane
-from lib.mEoS.C3Cyclohexane import C3Cyclohexane
-
-# Alkenes
-from lib.mEoS.Benzene import Benzene
-from lib.mEoS.Toluene import Toluene
-from lib.mEoS.oXylene import oXylene
-from lib.mEoS.mXylene import mXylene
-from lib.mEoS.pXylene import pXylene
-from lib.mEoS.EthylBenzene import EthylBenzene
-from lib.mEoS.Ethylene import Ethylene
-from lib.mEoS.Propylene import Propylene
-from lib.mEoS.Butene_1 import Butene_1
-from lib.mEoS.Propadiene import Propadiene
-from lib.mEoS.Butadiene13 import Butadiene13
-from lib.mEoS.iButene import iButene
-from lib.mEoS.Cis_2_butene import Cis_2_butene
-from lib.mEoS.Trans_2_butene import Trans_2_butene
-from lib.mEoS.Pentene_1 import Pentene_1
-from lib.mEoS.Hexene_1 import Hexene_1
-from lib.mEoS.Acetylene import Acetylene
-from lib.mEoS.Propyne import Propyne
-from lib.mEoS.Butyne_1 import Butyne_1
-from lib.mEoS.Cyclobutene import Cyclobutene
-from lib.mEoS.C1Oleate import C1Oleate
-from lib.mEoS.C1Linolenate import C1Linolenate
-from lib.mEoS.C1Linoleate import C1Linoleate
-from lib.mEoS.C1Palmitate import C1Palmitate
-from lib.mEoS.C1Stearate import C1Stearate
-
-# Heteroatom
-from lib.mEoS.Methanol import Methanol
-from lib.mEoS.Ethanol import Ethanol
-from lib.mEoS.nPropanol import nPropanol
-from lib.mEoS.Acetone import Acetone
-from lib.mEoS.EthyOxide import EthyOxide
-from lib.mEoS.PropylenOxide import PropylenOxide
-from lib.mEoS.EthylenGlycol import EthylenGlycol
-from lib.mEoS.PropylenGlycol import PropylenGlycol
-from lib.mEoS.AceticAcid import AceticAcid
-from lib.mEoS.DME import DME
-from lib.mEoS.DEE import DEE
-from lib.mEoS.THF import THF
-from lib.mEoS.DEA import DEA
-from lib.mEoS.MEA import MEA
-from lib.mEoS.DMC import DMC
-from lib.mEoS.NF3 import NF3
-from lib.mEoS.SF6 import SF6
-from lib.mEoS.HCl import HCl
-
-# CFCs
-from lib.mEoS.R13I1 import R13I1
-from lib.mEoS.R11 import R11
-from lib.mEoS.R12 import R12
-from lib.mEoS.R13 import R13
-from lib.mEoS.R14 import R14
-from lib.mEoS.R21 import R21
-from lib.mEoS.R22 import R22
-from lib.mEoS.R23 import R23
-from lib.mEoS.R32 import R32
-from lib.mEoS.R40 import R40
-from lib.mEoS.R41 import R41
-from lib.mEoS.R113 import R113
-from lib.mEoS.R114 import R114
-from lib.mEoS.R115 import R115
-from lib.mEoS.R116 import R116
-from lib.mEoS.R123 import R123
-from lib.mEoS.R124 import R124
-from lib.mEoS.R125 import R125
-from lib.mEoS.R134a import R134a
-from lib.mEoS.R141b import R141b
-from lib.mEoS.R142b import R142b
-from lib.mEoS.R143a import R143a
-from lib.mEoS.R150 import R150
-from lib.mEoS.R152a import R152a
-from lib.mEoS.R161 import R161
-from lib.mEoS.R218 import R218
-from lib.mEoS.R227ea import R227ea
-from lib.mEoS.R236ea import R236ea
-from lib.mEoS.R236fa import R236fa
-from lib.mEoS.R245ca import R245ca
-from lib.mEoS.R245fa import R245fa
-from lib.mEoS.R365mfc import R365mfc
-from lib.mEoS.RC318 import RC318
-from lib.mEoS.R1123 import R1123
-from lib.mEoS.R1130 import R1130
-from lib.mEoS.R1224ydZ import R1224ydZ
-from lib.mEoS.R1234yf import R1234yf
-from lib.mEoS.R1234zeE import R1234zeE
-from lib.mEoS.R1234zeZ import R1234zeZ
-from lib.mEoS.R1243zf import R1243zf
-from lib.mEoS.R1216 import R1216
-from lib.mEoS.R1233zd import R1233zd
-from lib.mEoS.R1336mzzE import R1336mzzE
-from lib.mEoS.R1336mzzZ import R1336mzzZ
-from lib.mEoS.RE1132 import RE1132
-from lib.mEoS.RE143a import RE143a
-from lib.mEoS.RE245cb2 import RE245cb2
-from lib.mEoS.RE245fa2 import RE245fa2
-from lib.mEoS.RE347mcc import RE347mcc
-from lib.mEoS.Novec649 import Novec649
-from lib.mEoS.VinylCl import VinylCl
-from lib.mEoS.ClBenzene import ClBenzene
-from lib.mEoS.C4F10 import C4F10
-from lib.mEoS.C5F12 import C5F12
-from lib.mEoS.C6F14 import C6F14
-
-# Siloxanes
-from lib.mEoS.D4 import D4
-from lib.mEoS.D5 import D5
-from lib.mEoS.D6 import D6
-from lib.mEoS.MDM import MDM
-from lib.mEoS.MD2M import MD2M
-from lib.mEoS.MD3M import MD3M
-from lib.mEoS.MD4M import MD4M
-from lib.mEoS.MM import MM
-
-# PseudoCompound
-from lib.mEoS.Air import Air
-from lib.mEoS.R404a import R404a
-from lib.mEoS.R407c import R407c
-from lib.mEoS.R410a import R410a
-from lib.mEoS.R507a import R507a
-
-# Others
-from lib.mEoS.LJ import LJ
+
+# The fluid modules are imported on demand, at first access to its class, the
+# basic data of fluids are saved in a registry file to be available without
+# import the module with the big coefficients dicts
+
+# Component grouping by chemical class, with the name of mEoS classes
+groups = {
+    "Nobles": ["He", "Ne", "Ar", "Kr", "Xe"],
+    "Gases": ["H2", "D2", "pD2", "oD2", "pH2", "oH2", "N2", "O2", "F2",
+              "Cl2", "H2O", "D2O", "CO2", "CO", "N2O", "SO2", "COS", "NH3",
+              "H2S"],
+    "Alkanes": ["CH4", "C2", "C3", "nC4", "iC4", "nC5", "neoC5", "iC5",
+                "nC6", "iC6", "nC7", "nC8", "iC8", "nC9", "nC10", "nC11",
+                "nC12", "nC13", "nC14", "nC15", "nC16", "nC22", "C3_pentane",
+                "C22_butane", "C23_butane"],
+    "Naphthenes": ["Cyclopropane", "Cyclopentane", "Cyclohexane",
+                   "C1Cyclohexane", "C3Cyclohexane"],
+    "Alkenes": ["Benzene", "Toluene", "oXylene", "mXylene", "pXylene",
+                "EthylBenzene", "Ethylene", "Propylene", "Butene_1",
+                "Propadiene", "Butadiene13", "iButene", "Cis_2_butene",
+                "Trans_2_butene", "Pentene_1", "Hexene_1", "Acetylene",
+                "Propyne", "Butyne_1", "Cyclobutene", "C1Oleate",
+                "C1Linolenate", "C1Linoleate", "C1Palmitate", "C1Stearate"],
+    "Heteroatom": ["Methanol", "Ethanol", "nPropanol", "Acetone",
+                   "EthyOxide", "PropylenOxide", "EthylenGlycol",
+                   "PropylenGlycol", "AceticAcid", "DME", "DEE", "THF",
+                   "DEA", "MEA", "DMC", "NF3", "SF6", "HCl"],
+    "CFCs": ["R13I1", "R11", "R12", "R13", "R14", "R21", "R22", "R23", "R32",
+             "R40", "R41", "R113", "R114", "R115", "R116", "R123", "R124",
+             "R125", "R134a", "R141b", "R142b", "R143a", "R150", "R152a",
+             "R161", "R218", "R227ea", "R236ea", "R236fa", "R245ca",
+             "R245fa", "R365mfc", "RC318", "R1123", "R1130", "R1224ydZ",
+             "R1234yf", "R1234zeE", "R1234zeZ", "R1243zf", "R1216",
+             "R1233zd", "R1336mzzE", "R1336mzzZ", "RE1132", "RE143a",
+             "RE245cb2", "RE245fa2", "RE347mcc", "Novec649", "VinylCl",
+             "ClBenzene", "C4F10", "C5F12", "C6F14"],
+    "Siloxanes": ["D4", "D5", "D6", "MDM", "MD2M", "MD3M", "MD4M", "MM"],
+    "PseudoCompounds": ["Air", "R404a", "R407c", "R410a", "R507a"],
+    "Others": ["LJ"],
+}
+
+# Registry file with fluid data
+fname_registry = os.path.join(os.environ["pychemqt"], "dat", "mEoS.json")
+registry = {}
+
+
+class _Package(ModuleType):
+    """Package module class to bind the fluid classes in place of fluid
+    modules, set as package attributes by the import system"""
+
+    def __setattr__(self, name, value):
+        if isinstance(value, ModuleType) and \
+                value.__name__ == "lib.mEoS." + name:
+            for cls, data in registry.items():
+                if data["module"] == name:
+                    ModuleType.__setattr__(self, cls, getattr(value, cls))
+        else:
+            ModuleType.__setattr__(self, name, value)
+
+
+sys.modules[__name__].__class__ = _Package
+
+
+def generateRegistry():
+    """Generate the registry file importing all fluid modules, it must be
+    run after any change in fluid modules data"""
+    from lib.meos import MEoS
+
+    classes = {}
+    for fname in sorted(os.listdir(os.path.dirname(__file__))):
+        module, ext = os.path.splitext(fname)
+        if ext != ".py" or module == "__init__":
+            continue
+        mod = import_module("lib.mEoS." + module)
+        for name, obj in vars(mod).items():
+            if isinstance(obj, type) and issubclass(obj, MEoS) and \
+                    obj.__module__ == mod.__name__:
+                classes[name] = obj
+
+    data = {}
+    for names in groups.values():
+        for name in names:
+            cls = classes[name]
+            data[name] = {
+                "module": cls.__module__.split(".")[-1],
+                "name": cls.name,
+                "id": cls.id,
+                "CAS": cls.CASNumber,
+                "Tc": float(cls.Tc),
+                "Pc": float(cls.Pc),
+                "Tt": float(cls.Tt),
+                "refprop": cls._refPropName,
+                "coolprop": cls._coolPropName}
+
+    try:
+        with open(fname_registry, "w", encoding="utf-8") as file:
+            json.dump(data, file, indent=2)
+    except OSError:
+        pass
+    return data
+
+
+def _readRegistry():
+    """Load the registry file, generating it if it's not available"""
+    try:
+        with open(fname_registry, encoding="utf-8") as file:
+            return json.load(file)
+    except (OSError, ValueError):
+        return generateRegistry()
+
+
+registry.update(_readRegistry())
+
+
+def __getattr__(name):
+    """Import the fluid module at first access to its class"""
+    if name in registry:
+        module = import_module("lib.mEoS." + registry[name]["module"])
+        globals()[name] = getattr(module, name)
+        return globals()[name]
+    if name == "__doi__":
+        globals()["__doi__"] = _doi()
+        return globals()["__doi__"]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def _fluid(name):
+    """Return the mEoS class with the name"""
+    if name in globals():
+        return globals()[name]
+    return __getattr__(name)
+
+
+class _Fluids(Sequence):
+    """List of mEoS classes, importing the fluid module only when its class
+    is accessed"""
+
+    def __init__(self, names):
+        self.names = names
+
+    def __len__(self):
+        return len(self.names)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [_fluid(name) for name in self.names[index]]
+        return _fluid(self.names[index])
+
+    def __contains__(self, value):
+        name = getattr(value, "__name__", None)
+        return name in self.names and _fluid(name) is value
+
+    def index(self, value, start=0, stop=None):
+        """Return the index of class, without import the other fluids"""
+        if value not in self:
+            raise ValueError(f"{value!r} is not in list")
+        if stop is None:
+            stop = len(self.names)
+        return self.names.index(value.__name__, start, stop)
+
+    def __add__(self, other):
+        return list(self) + list(other)
+
+    def __repr__(self):
+        return f"<mEoS fluids: {', '.join(self.names)}>"
 
 
 # Component grouping by chemical class
-Nobles = [He, Ne, Ar, Kr, Xe]
-Gases = [H2, D2, pD2, oD2, pH2, oH2, N2, O2, F2, Cl2, H2O, D2O, CO2, CO, N2O,
-         SO2, COS, NH3, H2S]
-Alkanes = [CH4, C2, C3, nC4, iC4, nC5, neoC5, iC5, nC6, iC6, nC7, nC8, iC8,
-           nC9, nC10, nC11, nC12, nC13, nC14, nC15, nC16, nC22, C3_pentane,
-           C22_butane, C23_butane]
-Naphthenes = [Cyclopropane, Cyclopentane, Cyclohexane, C1Cyclohexane,
-              C3Cyclohexane]
-Alkenes = [Benzene, Toluene, oXylene, mXylene, pXylene, EthylBenzene,
-           Ethylene, Propylene, Butene_1, Propadiene, Butadiene13, iButene,
-           Cis_2_butene, Trans_2_butene, Pentene_1, Hexene_1, Acetylene,
-           Propyne, Butyne_1, Cyclobutene, C1Oleate, C1Linolenate, C1Linoleate,
-           C1Palmitate, C1Stearate]
-Heteroatom = [Methanol, Ethanol, nPropanol, Acetone, EthyOxide, PropylenOxide,
-              EthylenGlycol, PropylenGlycol, AceticAcid, DME, DEE, THF, DEA,
-              MEA, DMC, NF3, SF6, HCl]
-CFCs = [R13I1, R11, R12, R13, R14, R21, R22, R23, R32, R40, R41, R113, R114,
-        R115, R116, R123, R124, R125, R134a, R141b, R142b, R143a, R150, R152a,
-        R161, R218, R227ea, R236ea, R236fa, R245ca, R245fa, R365mfc, RC318,
-        R1123, R1130, R1224ydZ, R1234yf, R1234zeE, R1234zeZ, R1243zf, R1216,
-        R1233zd, R1336mzzE, R1336mzzZ, RE1132, RE143a, RE245cb2, RE245fa2,
-        RE347mcc, Novec649, VinylCl, ClBenzene, C4F10, C5F12, C6F14]
-Siloxanes = [D4, D5, D6, MDM, MD2M, MD3M, MD4M, MM]
-PseudoCompounds = [Air, R404a, R407c, R410a, R507a]
-Others = [LJ]
-
-__all__ = Nobles + Gases + Alkanes + Naphthenes + Alkenes + Heteroatom + \
-    CFCs + Siloxanes + PseudoCompounds + Others
+Nobles = _Fluids(groups["Nobles"])
+Gases = _Fluids(groups["Gases"])
+Alkanes = _Fluids(groups["Alkanes"])
+Naphthenes = _Fluids(groups["Naphthenes"])
+Alkenes = _Fluids(groups["Alkenes"])
+Heteroatom = _Fluids(groups["Heteroatom"])
+CFCs = _Fluids(groups["CFCs"])
+Siloxanes = _Fluids(groups["Siloxanes"])
+PseudoCompounds = _Fluids(groups["PseudoCompounds"])
+Others = _Fluids(groups["Others"])
+
+__all__ = _Fluids([name for names in groups.values() for name in names])
 
 # Id of compound supported for meos library
-id_mEoS = [i.id for i in __all__]
-
-
-# Add references from equation hardcoded in __doi__ property
-__doi__ = {}
-for obj in __all__:
-    subdict = {}
-    for prop in ["eq", "_viscosity", "_thermal"]:
-        if prop not in obj.__dict__ or not obj.__dict__[prop]:
-            continue
-        for i, eq in enumerate(obj.__dict__[prop]):
-            if eq and "__doi__" in eq:
-                key = "%s_%i" % (prop.replace("_", ""), i)
-                subdict[key] = eq["__doi__"]
-    if obj._surface and "__doi__" in obj._surface:
-        subdict["surface"] = obj._surface["__doi__"]
-    if obj._dielectric and "__doi__" in obj._dielectric:
-        subdict["dielectric"] = obj._dielectric["__doi__"]
-    if obj._melting and "__doi__" in obj._melting:
-        subdict["melting"] = obj._melting["__doi__"]
-    if obj._sublimation and "__doi__" in obj._sublimation:
-        subdict["sublimation"] = obj._sublimation["__doi__"]
-
-    __doi__[obj.__name__] = subdict
+id_mEoS = [registry[name]["id"] for name in __all__.names]
+
+
+def _doi():
+    """Add references from equation hardcoded in __doi__ property, it need
+    import all fluids so it's calculated at first access"""
+    doi = {}
+    for obj in __all__:
+        subdict = {}
+        for prop in ["eq", "_viscosity", "_thermal"]:
+            if prop not in obj.__dict__ or not obj.__dict__[prop]:
+                continue
+            for i, eq in enumerate(obj.__dict__[prop]):
+                if eq and "__doi__" in eq:
+                    key = "%s_%i" % (prop.replace("_", ""), i)
+                    subdict[key] = eq["__doi__"]
+        if obj._surface and "__doi__" in obj._surface:
+            subdict["surface"] = obj._surface["__doi__"]
+        if obj._dielectric and "__doi__" in obj._dielectric:
+            subdict["dielectric"] = obj._dielectric["__doi__"]
+        if obj._melting and "__doi__" in obj._melting:
+            subdict["melting"] = obj._melting["__doi__"]
+        if obj._sublimation and "__doi__" in obj._sublimation:
+            subdict["sublimation"] = obj._sublimation["__doi__"]
+
+        doi[obj.__name__] = subdict
+    return doi
 
 
 # TODO: Add 2-propanol from 10.1063/1.3112608
@@ -306,6 +281,8 @@ for obj in __all__:
 class Test(TestCase):
     def test_meos(self):
         """Cycle input parameter from selected point to check iteration"""
+        H2O = _fluid("H2O")
+
         # The input pair T-h, P-s, h-u has inconsistency, several point has
         # equal values so are not good as input definition, they need another
         # input like saturation state
@@ -383,3 +360,21 @@ class Test(TestCase):
         f_su = H2O(s=f_hs.s, u=f_hs.u)
         self.assertEqual(round(f_su.P-P, 1), 0)
         self.assertEqual(round(f_su.T-T, 5), 0)
+
+    def test_registry(self):
+        """Check the registry file is updated with fluid modules data"""
+        self.assertEqual(list(registry), __all__.names)
+        for name, data in registry.items():
+            cls = _fluid(name)
+            self.assertIs(getattr(sys.modules["lib.mEoS"], name), cls)
+            self.assertEqual(cls.__module__, "lib.mEoS." + data["module"])
+            self.assertEqual(cls.name, data["name"])
+            self.assertEqual(cls.id, data["id"])
+            self.assertEqual(cls.CASNumber, data["CAS"])
+            self.assertEqual(float(cls.Tc), data["Tc"])
+            self.assertEqual(float(cls.Pc), data["Pc"])
+            self.assertEqual(float(cls.Tt), data["Tt"])
+            self.assertEqual(cls._refPropName, data["refprop"])
+            self.assertEqual(cls._coolPropName, data["coolprop"])
+        H2O = _fluid("H2O")
+        self.assertEqual(__all__.index(H2O), id_mEoS.index(H2O.id))
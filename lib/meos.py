@@ -134,6 +134,9 @@ The module include the following functions:
 
 :class:`MEoS`: Main class with all functionality
 
+Multiple states can be calculated in a single call with :func:`MEoS.batch`,
+returning the properties as arrays
+
 The module implement too high accuracy correlation for viscosity and thermal
 conductivity, see the documentation of its calculation procedure:
 
@@ -143,6 +146,8 @@ conductivity, see the documentation of its calculation procedure:
 
 Other functions used in iteration calculation to try to speed up it:
 
+    * :func:`_Helmholtz_terms`
+    * :func:`_Helmholtz_residual`
     * :func:`_Helmholtz_phir`
     * :func:`_Helmholtz_phird`
     * :func:`_Helmholtz_phirt`
@@ -158,16 +163,32 @@ Other functions used in iteration calculation to try to speed up it:
 '''
 
 from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from hashlib import md5
 from itertools import product, repeat
 import json
 import logging
 import os
+import threading
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+try:
+    import msvcrt
+except ImportError:
+    msvcrt = None
 
 from numpy import sin, tan, sinh, cosh, tanh, arctan, arccos, exp, log
+from numpy import (array, asarray, broadcast_arrays, concatenate, errstate,
+                   full, geomspace, isfinite, linspace, log10, nan, nonzero,
+                   unique, where, zeros)
 from scipy.constants import Boltzmann, pi, Avogadro, R, u, epsilon_0
+from scipy.interpolate import PchipInterpolator
 from scipy.optimize import fsolve, newton
 
-from lib import unidades
+from lib import instrument, unidades
 from lib.config import conf_dir
 from lib.compuestos import RhoL_Costald, Pv_Lee_Kesler, MuG_Chung, MuG_P_Chung
 from lib.compuestos import ThG_Chung, ThG_P_Chung, Tension_Pitzer
@@ -364,7 +385,514 @@ __doi__ = {
     }
 
 
-def _Helmholtz_phir(tau, delta, coef):
+# Precompiled residual terms of equations, built only once for each fluid and
+# equation code
+_termTables = {}
+
+# Saturation tables of fluids, saved in memory and in disk in configuration
+# folder, the version must be changed if the table format change
+_satTables = {}
+_satVersion = 2
+
+
+class _SaturationTable(object):
+    """Saturation curve of fluid tabulated with monotone cubic interpolation
+    (PCHIP), used as initial guess of saturation iterations and as index to
+    check the phase of states
+
+    Parameters
+    ----------
+    data : dict
+        Tabulated saturation properties in SI units:
+
+            * T: Temperature, [K]
+            * P: Saturation pressure, [Pa]
+            * rhoL: Saturated liquid density, [kg/m³]
+            * rhoG: Saturated vapor density, [kg/m³]
+            * hL, hG: Saturated phases enthalpy, [J/kg]
+            * sL, sG: Saturated phases entropy, [J/kgK]
+
+        The enthalpy and entropy are saved without the offset of reference
+        state, so the table is shared by all reference states
+    """
+
+    keys = ("P", "rhoL", "rhoG", "hL", "hG", "sL", "sG")
+
+    def __init__(self, data):
+        self.data = data
+        self.Tmin = data["T"][0]
+        self.Tmax = data["T"][-1]
+        self._spline = {}
+        for key in self.keys:
+            value = data[key]
+            if key == "P":
+                value = log(value)
+            self._spline[key] = PchipInterpolator(data["T"], value)
+        self._Tsat = PchipInterpolator(log(data["P"]), data["T"])
+
+    def __call__(self, T, ref=(0, 0)):
+        """Return the interpolated saturation state at T, None if T is out of
+        table range. ref is the enthalpy and entropy offset of reference
+        state to add to the tabulated values, [J/kg], [J/kgK]"""
+        if not self.Tmin <= T <= self.Tmax:
+            return None
+        prop = {key: float(spline(T)) for key, spline in self._spline.items()}
+        prop["P"] = exp(prop["P"])
+        for key in ("hL", "hG"):
+            prop[key] += ref[0]
+        for key in ("sL", "sG"):
+            prop[key] += ref[1]
+        return prop
+
+    def Tsat(self, P):
+        """Return the interpolated saturation temperature at P, None if P is
+        out of table range"""
+        P = asarray(P, dtype=float)
+        if (P < self.data["P"][0]).any() or (P > self.data["P"][-1]).any():
+            return None
+        return self._Tsat(log(P))[()]
+
+
+@contextmanager
+def _fileLock(filename):
+    """Exclusive lock between process using an auxiliary lock file, in
+    platforms without file locking support only the atomic write protect the
+    file"""
+    with open(filename, "a") as archivo:
+        if fcntl is not None:
+            fcntl.flock(archivo, fcntl.LOCK_EX)
+        elif msvcrt is not None:
+            msvcrt.locking(archivo.fileno(), msvcrt.LK_LOCK, 1)
+        try:
+            yield
+        finally:
+            if fcntl is not None:
+                fcntl.flock(archivo, fcntl.LOCK_UN)
+            elif msvcrt is not None:
+                msvcrt.locking(archivo.fileno(), msvcrt.LK_UNLCK, 1)
+
+
+class _ReferenceOffsets(object):
+    """Registry of enthalpy and entropy offsets of reference states shared by
+    all instances in process, indexed by (fluid name-equation code, reference
+    state code). The file is loaded only in the first use, and rewritten
+    atomically with the changes of other processes merged when a new
+    reference state is calculated
+
+    Parameters
+    ----------
+    filename : str
+        Path of json file with the offsets saved, with format
+        {name: {ref: {"h": hoffset, "s": soffset}}}
+    """
+
+    def __init__(self, filename):
+        self.filename = filename
+        self._data = None
+        self._lock = threading.Lock()
+
+    def _read(self):
+        """Read the offsets saved in file"""
+        try:
+            with open(self.filename, "r") as archivo:
+                dat = json.load(archivo)
+        except (OSError, ValueError):
+            dat = {}
+
+        data = {}
+        for name, refs in dat.items():
+            for ref, offset in refs.items():
+                data[(name, ref)] = (offset["h"], offset["s"])
+        return data
+
+    def get(self, name, ref, reload=False):
+        """Return the (hoffset, soffset) tuple of reference state, None if
+        it isn't calculated yet. With reload the file is read again to get
+        the offsets saved by other processes"""
+        if self._data is None or reload:
+            with self._lock:
+                self._data = self._read()
+        return self._data.get((name, ref))
+
+    def set(self, name, ref, hoffset, soffset):
+        """Save the offsets of a new reference state"""
+        with self._lock:
+            try:
+                with _fileLock(self.filename+".lock"):
+                    data = self._read()
+                    data[(name, ref)] = (hoffset, soffset)
+
+                    dat = {}
+                    for (nm, rf), (h, s) in data.items():
+                        dat.setdefault(nm, {})[rf] = {"h": h, "s": s}
+                    tmp = "%s.%i" % (self.filename, os.getpid())
+                    with open(tmp, "w") as archivo:
+                        json.dump(dat, archivo)
+                    os.replace(tmp, self.filename)
+            except OSError:
+                # Not writable configuration folder, the offsets are used
+                # only in memory
+                data = dict(self._data or {})
+                data[(name, ref)] = (hoffset, soffset)
+            self._data = data
+
+
+# Reference state offsets of all fluids
+_refOffsets = _ReferenceOffsets(conf_dir+"MEoSref.json")
+
+
+# Properties calculated in batch mode without instance definition
+_batchProps = ("T", "P", "rho", "v", "x", "h", "s", "u", "a", "g", "cv", "cp",
+               "w", "Z", "dpdT_rho", "dpdrho_T")
+
+
+def _Helmholtz_terms(coef):
+    r"""Precompile the residual terms of a Helmholtz equation of state as
+    contiguous float arrays, to avoid parse the coefficient dict in each
+    iteration step
+
+    The polynomial, exponential and gaussian terms share the general form
+    :math:`n_i\delta^{d_i}\tau^{t_i}e^{L_i(\delta, \tau)}`, so they are
+    saved joined in the same arrays, the gaussian terms at end:
+
+    .. math::
+        L_i = -\gamma_i\delta^{c_i}-\alpha_i\left(\delta-\epsilon_i\right)^
+        {e1_i}-\beta_i\left(\tau-\gamma'_i\right)^{e2_i}
+
+    Parameters
+    ----------
+    coef : dict
+        Parameters of multiparameter equation of state
+
+    Returns
+    -------
+    terms : dict
+        Precompiled coefficients of equation, with keys:
+
+            * main: Joined polynomial, exponential and gaussian terms
+            * gauss: Gaussian specific coefficients, optional
+            * na: Nonanalytic terms, optional
+            * ass: Associative terms from Gao correlation, optional
+            * piazza: Associative term from Piazza correlation, optional
+            * saul: Special term from Saul-Wagner equation, optional
+    """
+    def family(*keys, **default):
+        """Get the coefficient lists of a term family truncated to the
+        shorter one, like the zip used in the iteration over terms"""
+        lists = []
+        for key in keys:
+            lists.append(list(coef.get(key, default.get(key, []))))
+        k = min(len(lst) for lst in lists)
+        return [array(lst[:k], dtype=float) for lst in lists]
+
+    nr1, d1, t1 = family("nr1", "d1", "t1")
+    nr2, d2, t2, g2, c2 = family("nr2", "d2", "t2", "gamma2", "c2")
+    k3 = len(coef.get("nr3", []))
+    nr3, d3, t3, a3, e3, b3, g3, ex1, ex2 = family(
+        "nr3", "d3", "t3", "alfa3", "epsilon3", "beta3", "gamma3", "exp1",
+        "exp2", exp1=[2]*k3, exp2=[2]*k3)
+    k12 = len(nr1)+len(nr2)
+    k3 = len(nr3)
+
+    main = {}
+    main["n"] = concatenate((nr1, nr2, nr3))
+    main["d"] = concatenate((d1, d2, d3))
+    main["t"] = concatenate((t1, t2, t3))
+    main["c"] = concatenate((zeros(len(nr1)), c2, zeros(k3)))
+    main["g"] = concatenate((zeros(len(nr1)), g2, zeros(k3)))
+    terms = {"main": main}
+
+    # The products of coefficients used in derivatives are saved too
+    if k3:
+        terms["gauss"] = {
+            "k": k12,
+            "a": a3, "e": e3, "b": b3, "g": g3, "ex1": ex1, "ex2": ex2,
+            "ex1_1": ex1-1, "ex2_1": ex2-1, "ex1_2": ex1-2, "ex2_2": ex2-2,
+            "aex1": a3*ex1, "bex2": b3*ex2,
+            "aex1_1": a3*ex1*(ex1-1), "bex2_1": b3*ex2*(ex2-1)}
+
+    na = family("nr4", "a4", "b4", "A", "B", "C", "D", "beta4")
+    if len(na[0]):
+        n, a, b, A, B, C, D, bt = na
+        terms["na"] = {
+            "n": n, "a": a, "b": b, "A": A, "B": B, "C": C, "D": D,
+            "a_1": a-1, "b_1": b-1, "b_2": b-2, "bt_": 0.5/bt,
+            "bt_1": 0.5/bt-1, "2ABt": 2*A/bt, "2Ba": 2*B*a}
+
+    if "nr_ass" in coef:
+        ass = family("nr_ass", "d_ass", "t_ass", "alfa_ass", "epsilon_ass",
+                     "beta_ass", "gamma_ass", "b_ass")
+        terms["ass"] = dict(zip(("n", "d", "t", "a", "e", "bt", "g", "b"),
+                                ass))
+
+    if "type_ass" in coef:
+        terms["piazza"] = {
+            "m": coef["m_ass"],
+            "v": coef["v_ass"],
+            "k": coef["k_ass"],
+            "e": coef["e_ass"],
+            "sites": (1, 2)[coef["type_ass"] == "2B"]}
+
+    if "nr_saul" in coef:
+        saul = family("nr_saul", "d_saul", "t_saul")
+        terms["saul"] = dict(zip(("n", "d", "t"), saul))
+
+    return terms
+
+
+def _Helmholtz_residual(tau, delta, terms, order=2):
+    r"""Residual contribution to the free Helmholtz energy and its
+    derivatives calculated in one pass over the precompiled terms
+
+    The input can be arrays to evaluate several states in one call, for
+    example the points of a isoline
+
+    Parameters
+    ----------
+    tau : float or array
+        Inverse reduced temperature, Tc/T [-]
+    delta : float or array
+        Reduced density, rho/rhoc [-]
+    terms : dict
+        Precompiled equation parameters, from :func:`_Helmholtz_terms`
+    order : int, default 2
+        Maximum order of derivatives to calculate
+
+    Returns
+    -------
+    prop : dict
+        Dict with residual Helmholtz free energy and derivatives, with the
+        shape of the broadcasted inputs:
+
+            * fir  [-]
+            * fird: [∂fir/∂δ]τ  [-], order 1
+            * firt: [∂fir/∂τ]δ  [-], order 1
+            * firdd: [∂²fir/∂δ²]τ  [-], order 2
+            * firtt: [∂²fir/∂τ²]δ  [-], order 2
+            * firdt: [∂²fir/∂τ∂δ]  [-], order 2
+
+    Examples
+    --------
+    >>> from lib.mEoS import H2O
+    >>> terms = _Helmholtz_terms(H2O.eq[0])
+    >>> prop = _Helmholtz_residual(H2O.Tc/500, 838.025/H2O.rhoc, terms)
+    >>> "%0.8f %0.8f" % (prop["fir"], prop["fird"])
+    '-3.42693206 -0.36436665'
+    >>> prop = _Helmholtz_residual(H2O.Tc/500, [1e-3, 1, 2.6], terms)
+    >>> prop["fir"].shape
+    (3,)
+    """
+    tau = asarray(tau, dtype=float)
+    delta = asarray(delta, dtype=float)
+    if tau.shape != delta.shape:
+        tau, delta = broadcast_arrays(tau, delta)
+
+    # Null density states are calculated with a dummy value and set to zero
+    # at end
+    null = delta == 0
+    if null.any():
+        delta = where(null, 1., delta)
+    else:
+        null = None
+
+    t = tau[..., None]
+    d = delta[..., None]
+    prop = {}
+
+    # Polynomial, exponential and gaussian terms with the joined form, the
+    # exponent of terms and its derivatives
+    m = terms["main"]
+    dc = m["g"]*d**m["c"]
+    L = -dc
+    if order:
+        Ld = (m["d"]-m["c"]*dc)/d
+        Lt = m["t"]/t
+    if order > 1:
+        Ldd = -(m["d"]+m["c"]*(m["c"]-1)*dc)/d**2
+        Ltt = -m["t"]/t**2
+
+    if "gauss" in terms:
+        gs = terms["gauss"]
+        k = gs["k"]
+        de = d-gs["e"]
+        tg = t-gs["g"]
+        L[..., k:] -= gs["a"]*de**gs["ex1"] + gs["b"]*tg**gs["ex2"]
+        if order:
+            Ld[..., k:] -= gs["aex1"]*de**gs["ex1_1"]
+            Lt[..., k:] -= gs["bex2"]*tg**gs["ex2_1"]
+        if order > 1:
+            Ldd[..., k:] -= gs["aex1_1"]*de**gs["ex1_2"]
+            Ltt[..., k:] -= gs["bex2_1"]*tg**gs["ex2_2"]
+
+    term = m["n"]*d**m["d"]*t**m["t"]*exp(L)
+    prop["fir"] = term.sum(axis=-1)
+    if order:
+        termd = term*Ld
+        prop["fird"] = termd.sum(axis=-1)
+        prop["firt"] = (term*Lt).sum(axis=-1)
+    if order > 1:
+        prop["firdd"] = (termd*Ld+term*Ldd).sum(axis=-1)
+        prop["firtt"] = (term*(Lt**2+Ltt)).sum(axis=-1)
+        prop["firdt"] = (termd*Lt).sum(axis=-1)
+
+    # Non analitic terms
+    if "na" in terms:
+        na = terms["na"]
+        n, a, b, bt = na["n"], na["a"], na["b"], na["bt_"]
+        A, B, C, D = na["A"], na["B"], na["C"], na["D"]
+        d1 = d-1
+        d12 = d1**2
+        Tita = (1-t)+A*d12**bt
+        F = exp(-C*d12-D*(t-1)**2)
+        Delta = Tita**2+B*d12**a
+        DeltaB = Delta**b
+        prop["fir"] += (n*DeltaB*d*F).sum(axis=-1)
+
+        if order:
+            Fd = -2*C*F*d1
+            Ft = -2*D*F*(t-1)
+            Deltad = d1*(na["2ABt"]*Tita*d12**na["bt_1"]
+                         + na["2Ba"]*d12**na["a_1"])
+            DeltaB1 = Delta**na["b_1"]
+            zero = Delta == 0
+            if zero.any():
+                DeltaB1 = where(zero, 0, DeltaB1)
+            DeltaBd = b*DeltaB1*Deltad
+            DeltaBt = -2*Tita*b*DeltaB1
+
+            prop["fird"] += (n*(DeltaB*(F+d*Fd) + DeltaBd*d*F)).sum(axis=-1)
+            prop["firt"] += (n*d*(DeltaBt*F+DeltaB*Ft)).sum(axis=-1)
+
+        if order > 1:
+            Fdd = 2*C*F*(2*C*d12-1)
+            Ftt = 2*D*F*(2*D*(t-1)**2-1)
+            Fdt = 4*C*D*F*d1*(t-1)
+            with errstate(divide="ignore", invalid="ignore"):
+                Deltadd = where(d1 == 0, 0, Deltad/d1+d12*(
+                    4*B*a*na["a_1"]*d12**(a-2)
+                    + 2*A**2*bt**2*4*(d12**na["bt_1"])**2
+                    + A*Tita*8*bt*na["bt_1"]*d12**(bt-2)))
+                DeltaB2 = where(zero, 0, Delta**na["b_2"])
+            DeltaBdd = b*(DeltaB1*Deltadd + na["b_1"]*DeltaB2*Deltad**2)
+            DeltaBtt = 2*b*DeltaB1+4*Tita**2*b*na["b_1"]*DeltaB2
+            DeltaBdt = -na["2ABt"]*b*DeltaB1*d1*d12**na["bt_1"] \
+                - 2*Tita*b*na["b_1"]*DeltaB2*Deltad
+
+            prop["firdd"] += (n*(DeltaB*(2*Fd+d*Fdd) + 2*DeltaBd*(F+d*Fd)
+                                 + DeltaBdd*d*F)).sum(axis=-1)
+            prop["firtt"] += (n*d*(DeltaBtt*F+2*DeltaBt*Ft+DeltaB*Ftt)).sum(
+                axis=-1)
+            prop["firdt"] += (n*(DeltaB*(Ft+d*Fdt) + d*DeltaBd*Ft
+                                 + DeltaBt*(F+d*Fd)
+                                 + DeltaBdt*d*F)).sum(axis=-1)
+
+    # Associative term from Gao correlation for ammonia
+    if "ass" in terms:
+        ass = terms["ass"]
+        n, dd, tt, a = ass["n"], ass["d"], ass["t"], ass["a"]
+        e, bt, g, b = ass["e"], ass["bt"], ass["g"], ass["b"]
+        den = bt*(t-g)**2+b
+        term = n*d**dd*t**tt*exp(-a*(d-e)**2+1/den)
+        prop["fir"] += term.sum(axis=-1)
+        if order:
+            Ed = dd/d - 2*a*(d-e)
+            Et = tt/t - 2*bt*(t-g)/den**2
+            prop["fird"] += (term*Ed).sum(axis=-1)
+            prop["firt"] += (term*Et).sum(axis=-1)
+        if order > 1:
+            Edd = dd*(dd-1)/d**2 - 4*a*(d-e)*dd/d - (2*a-4*a**2*(d-e)**2)
+            Ett = Et**2 - tt/t**2 - 2*bt/den**2 + 8*bt**2*(t-g)**2/den**3
+            prop["firdd"] += (term*Edd).sum(axis=-1)
+            prop["firtt"] += (term*Ett).sum(axis=-1)
+            prop["firdt"] += (term*Ed*Et).sum(axis=-1)
+
+    # Associative term from Piazza correlations
+    if "piazza" in terms:
+        pz = terms["piazza"]
+        vn, kappa, epsilon = pz["v"], pz["k"], pz["e"]
+        m_ass = pz["m"]*pz["sites"]
+
+        nu = vn*delta
+        gnu = (2-nu)/2/(1-nu)**3
+        Delta = gnu*(exp(epsilon*tau)-1)*kappa
+        X = (-1 + (1+4*Delta*delta)**0.5)/2/Delta/delta
+        prop["fir"] += m_ass*(log(X) - X/2 + 0.5)
+
+        if order:
+            dgnu = 0.5*(5-2*nu)/(1-nu)**4
+            alfa = dgnu * (exp(epsilon*tau)-1)*kappa*vn            # Eq A35
+            Xd = -X**2/(2*Delta*delta*X+1)*(Delta+delta*alfa)      # Eq A36
+            beta = gnu*kappa*exp(epsilon*tau)*epsilon              # Eq A55
+            Xt = -delta*X**2/(2*Delta*delta*X+1)*beta              # Eq A56
+            prop["fird"] += m_ass*(1/X-0.5)*Xd
+            prop["firt"] += m_ass*(1/X-0.5)*Xt
+
+        if order > 1:
+            d2gnu = 3*(3-nu)/(1-nu)**5
+            gamma = d2gnu * (exp(epsilon*tau)-1)*kappa*vn**2       # Eq A76
+            # Eq A77
+            Xdd = X**2*(2*Delta**2*X-alfa)/(2*delta*Delta*X+1)**2 \
+                + 2*Delta*X**2*(Delta+alfa*delta)*(Delta*delta*X**2+X) \
+                / (2*delta*Delta*X+1)**3 \
+                + 2*delta*X**2*(Delta+alfa*delta)*(Delta*delta*X**2+X) \
+                * alfa / (2*delta*Delta*X+1)**3 \
+                + X**2*(2*delta**2*X*alfa-1)*alfa/(2*delta*Delta*X+1)**2 \
+                - delta*X**2*gamma/(2*delta*Delta*X+1)
+
+            eta = gnu*kappa*exp(epsilon*tau)*epsilon**2            # Eq A83
+            # Eq A84
+            Xtt = -2*beta*delta*X*(Delta*delta*X+1)/(1+2*Delta*delta*X)**2 \
+                * (-delta*X**2/(2*Delta*delta*X+1))*beta \
+                + 2*delta**2*X**3/(1+2*Delta*delta*X)**2 * beta**2 \
+                - delta*X**2/(2*Delta*delta*X+1)*eta
+
+            teta = dgnu*exp(epsilon*tau)*epsilon*kappa*vn          # Eq A89
+            # Eq A90
+            Xdt = 2*delta*X**2*(Delta+delta*alfa)*(Delta*delta*X**2+X) \
+                * beta / (2*delta*Delta*X+1)**3 \
+                + X**2*(2*delta**2*X*alfa-1)*beta/(2*delta*Delta*X+1)**2 \
+                - delta*X**2*teta/(2*delta*Delta*X+1)
+
+            prop["firdd"] += m_ass*((1/X-0.5)*Xdd - Xd**2/X**2)
+            prop["firtt"] += m_ass*((1/X-0.5)*Xtt - Xt**2/X**2)
+            prop["firdt"] += m_ass*(-Xt/X**2*Xd + Xdt*(1/X-0.5))
+
+    # Special form from Saul-Wagner Water 58 coefficient equation
+    if "saul" in terms:
+        sl = terms["saul"]
+        term = sl["n"]*d**sl["d"]*t**sl["t"]
+        fr = term.sum(axis=-1)
+
+        e1 = exp(-0.4*delta**6)
+        e2 = exp(-2*delta**6)
+        factor = where(delta < 0.2, 1.6*delta**6*(1-1.2*delta**6), e1-e2)
+        prop["fir"] += factor*fr
+
+        if order:
+            frd = (term*sl["d"]/d).sum(axis=-1)
+            frt = (term*sl["t"]/t).sum(axis=-1)
+            factord = delta**5*(-2.4*e1+12*e2)
+            prop["fird"] += factord*fr + factor*frd
+            prop["firt"] += factor*frt
+
+        if order > 1:
+            frdd = (term*sl["d"]*(sl["d"]-1)/d**2).sum(axis=-1)
+            frtt = (term*sl["t"]*(sl["t"]-1)/t**2).sum(axis=-1)
+            frdt = (term*sl["d"]*sl["t"]/d/t).sum(axis=-1)
+            factordd = 5*delta**4*(-2.4*e1+12*e2) \
+                + delta**10*(5.76*e1-144*e2)
+            prop["firdd"] += factordd*fr + 2*factord*frd + factor*frdd
+            prop["firtt"] += factor*frtt
+            prop["firdt"] += factord*frt + factor*frdt
+
+    for key, value in prop.items():
+        if null is not None:
+            value = where(null, 0, value)
+        prop[key] = value[()]
+    return prop
+
+
+def _Helmholtz_phir(tau, delta, terms):
     r"""Residual contribution to the free Helmholtz energy
 
     Parameters
@@ -373,115 +901,18 @@ def _Helmholtz_phir(tau, delta, coef):
         Inverse reduced temperature, Tc/T [-]
     delta : float
         Reduced density, rho/rhoc [-]
-    coef : dict
-        Parameters of multiparameter equation of state
+    terms : dict
+        Precompiled equation parameters, from :func:`_Helmholtz_terms`
 
     Returns
     -------
     fir : float
         :math:`\phi^r`, adimensional free Helmholtz energy, [-]
     """
-    fir = 0
-
-    if delta:
-        # Polinomial terms
-        nr1 = coef.get("nr1", [])
-        d1 = coef.get("d1", [])
-        t1 = coef.get("t1", [])
-        for n, d, t in zip(nr1, d1, t1):
-            fir += n*delta**d*tau**t
-
-        # Exponential terms
-        nr2 = coef.get("nr2", [])
-        d2 = coef.get("d2", [])
-        g2 = coef.get("gamma2", [])
-        t2 = coef.get("t2", [])
-        c2 = coef.get("c2", [])
-        for n, d, g, t, c in zip(nr2, d2, g2, t2, c2):
-            fir += n*delta**d*tau**t*exp(-g*delta**c)
-
-        # Gaussian terms
-        nr3 = coef.get("nr3", [])
-        d3 = coef.get("d3", [])
-        t3 = coef.get("t3", [])
-        a3 = coef.get("alfa3", [])
-        e3 = coef.get("epsilon3", [])
-        b3 = coef.get("beta3", [])
-        g3 = coef.get("gamma3", [])
-        exp1 = coef.get("exp1", [2]*len(nr3))
-        exp2 = coef.get("exp2", [2]*len(nr3))
-        for n, d, t, a, e, b, g, ex1, ex2 in zip(
-                nr3, d3, t3, a3, e3, b3, g3, exp1, exp2):
-            expr = exp(-a*(delta-e)**ex1-b*(tau-g)**ex2)
-            fir += n*delta**d*tau**t * expr
-
-        # Non analitic terms
-        ni = coef.get("nr4", [])
-        ai = coef.get("a4", [])
-        bi = coef.get("b4", [])
-        Ai = coef.get("A", [])
-        Bi = coef.get("B", [])
-        Ci = coef.get("C", [])
-        Di = coef.get("D", [])
-        b_ = coef.get("beta4", [])
-
-        for n, a, b, A, B, C, D, bt in zip(ni, ai, bi, Ai, Bi, Ci, Di, b_):
-            Tita = (1-tau)+A*((delta-1)**2)**(0.5/bt)
-            F = exp(-C*(delta-1)**2-D*(tau-1)**2)
-            Delta = Tita**2+B*((delta-1)**2)**a
-            fir += n*Delta**b*delta*F
-
-        # Associative term from Gao correlation for ammonia
-        if "nr_ass" in coef:
-            nr_ass = coef.get("nr_ass", [])
-            d5 = coef.get("d_ass", [])
-            t5 = coef.get("t_ass", [])
-            a5 = coef.get("alfa_ass", [])
-            e5 = coef.get("epsilon_ass", [])
-            bt5 = coef.get("beta_ass", [])
-            g5 = coef.get("gamma_ass", [])
-            b5 = coef.get("b_ass", [])
-            for n, d, t, a, e, bt, g, b in zip(
-                    nr_ass, d5, t5, a5, e5, bt5, g5, b5):
-                expr = exp(-a*(delta-e)**2+1/(bt*(tau-g)**2+b))
-                fir += n*delta**d*tau**t * expr
-
-        # Associative term from Piazza correlations
-        if "type_ass" in coef:
-            m = coef.get("m_ass")
-            vn = coef.get("v_ass")
-            kappa = coef.get("k_ass")
-            epsilon = coef.get("e_ass")
-
-            nu = vn*delta
-            gnu = (2-nu)/2/(1-nu)**3
-            Delta = gnu*(exp(epsilon*tau)-1)*kappa
-            X = (-1 + (1+4*Delta*delta)**0.5)/2/Delta/delta
-
-            fass = log(X) - X/2 + 0.5
-            if coef.get("type_ass") == "2B":
-                fass *= 2
-            fir += m*fass
-
-        # Special form from Saul-Wagner Water 58 coefficient equation
-        if "nr_saul" in coef:
-            if delta < 0.2:
-                factor = 1.6*delta**6*(1-1.2*delta**6)
-            else:
-                factor = exp(-0.4*delta**6)-exp(-2*delta**6)
-
-            nr5 = coef.get("nr_saul", [])
-            d5 = coef.get("d_saul", [])
-            t5 = coef.get("t_saul", [])
-            fr = 0
-            for n, d, t in zip(nr5, d5, t5):
-                fr += n*delta**d*tau**t
-            fir += factor*fr
+    return _Helmholtz_residual(tau, delta, terms, order=0)["fir"]
 
-    return fir
 
-
-def _Helmholtz_phird(tau, delta, coef):
+def _Helmholtz_phird(tau, delta, terms):
     r"""Residual contribution to the free Helmholtz energy, delta derivative
 
     Parameters
@@ -490,130 +921,18 @@ def _Helmholtz_phird(tau, delta, coef):
         Inverse reduced temperature, Tc/T [-]
     delta : float
         Reduced density, rho/rhoc [-]
-    coef : dict
-        Parameters of multiparameter equation of state
+    terms : dict
+        Precompiled equation parameters, from :func:`_Helmholtz_terms`
 
     Returns
     -------
     fird : float
         :math:`\left.\frac{\partial \phi^r}{\partial \delta}\right|_{\tau}`
     """
-    fird = 0
-
-    if delta:
-        # Polinomial terms
-        nr1 = coef.get("nr1", [])
-        d1 = coef.get("d1", [])
-        t1 = coef.get("t1", [])
-        for n, d, t in zip(nr1, d1, t1):
-            fird += n*d*delta**(d-1)*tau**t
-
-        # Exponential terms
-        nr2 = coef.get("nr2", [])
-        d2 = coef.get("d2", [])
-        g2 = coef.get("gamma2", [])
-        t2 = coef.get("t2", [])
-        c2 = coef.get("c2", [])
-        for n, d, g, t, c in zip(nr2, d2, g2, t2, c2):
-            fird += n*exp(-g*delta**c)*delta**(d-1)*tau**t*(d-g*c*delta**c)
-
-        # Gaussian terms
-        nr3 = coef.get("nr3", [])
-        d3 = coef.get("d3", [])
-        t3 = coef.get("t3", [])
-        a3 = coef.get("alfa3", [])
-        e3 = coef.get("epsilon3", [])
-        b3 = coef.get("beta3", [])
-        g3 = coef.get("gamma3", [])
-        exp1 = coef.get("exp1", [2]*len(nr3))
-        exp2 = coef.get("exp2", [2]*len(nr3))
-        for n, d, t, a, e, b, g, ex1, ex2 in zip(
-                nr3, d3, t3, a3, e3, b3, g3, exp1, exp2):
-            expr = exp(-a*(delta-e)**ex1-b*(tau-g)**ex2)
-            fird += expr * (n*d*delta**(d-1)*tau**t -
-                            n*a*delta**d*(delta-e)**(ex1-1)*ex1*tau**t)
-
-        # Non analitic terms
-        ni = coef.get("nr4", [])
-        ai = coef.get("a4", [])
-        bi = coef.get("b4", [])
-        Ai = coef.get("A", [])
-        Bi = coef.get("B", [])
-        Ci = coef.get("C", [])
-        Di = coef.get("D", [])
-        b_ = coef.get("beta4", [])
-
-        for n, a, b, A, B, C, D, bt in zip(ni, ai, bi, Ai, Bi, Ci, Di, b_):
-            Tita = (1-tau)+A*((delta-1)**2)**(0.5/bt)
-            F = exp(-C*(delta-1)**2-D*(tau-1)**2)
-            Fd = -2*C*F*(delta-1)
-            Delta = Tita**2+B*((delta-1)**2)**a
-            Deltad = (delta-1)*(A*Tita*2/bt*((delta-1)**2)**(0.5/bt-1) +
-                                2*B*a*((delta-1)**2)**(a-1))
-            DeltaBd = b*Delta**(b-1)*Deltad
-
-            fird += n*(Delta**b*(F+delta*Fd)+DeltaBd*delta*F)
-
-        # Associative term from Gao correlation for ammonia
-        if "nr_ass" in coef:
-            nr_ass = coef.get("nr_ass", [])
-            d5 = coef.get("d_ass", [])
-            t5 = coef.get("t_ass", [])
-            a5 = coef.get("alfa_ass", [])
-            e5 = coef.get("epsilon_ass", [])
-            bt5 = coef.get("beta_ass", [])
-            g5 = coef.get("gamma_ass", [])
-            b5 = coef.get("b_ass", [])
-            for n, d, t, a, e, bt, g, b in zip(
-                    nr_ass, d5, t5, a5, e5, bt5, g5, b5):
-                expr = exp(-a*(delta-e)**2+1/(bt*(tau-g)**2+b))
-                expr2 = d*delta**(d-1)-2*a*(delta-e)*delta**d
-                fird += n*tau**t * expr * expr2
-
-        # Associative term from Piazza correlations
-        if "type_ass" in coef:
-            m = coef.get("m_ass")
-            vn = coef.get("v_ass")
-            kappa = coef.get("k_ass")
-            epsilon = coef.get("e_ass")
-
-            nu = vn*delta
-            gnu = (2-nu)/2/(1-nu)**3
-            Delta = gnu*(exp(epsilon*tau)-1)*kappa
-            X = (-1 + (1+4*Delta*delta)**0.5)/2/Delta/delta
-
-            dgnu = 0.5*(5-2*nu)/(1-nu)**4
-
-            alfa = dgnu * (exp(epsilon*tau)-1)*kappa*vn            # Eq A35
-            Xd = -X**2/(2*Delta*delta*X+1)*(Delta+delta*alfa)      # Eq A36
-
-            fassd = (1/X-0.5)*Xd
-            if coef.get("type_ass") == "2B":
-                fassd *= 2
-            fird += m*fassd
-
-        # Special form from Saul-Wagner Water 58 coefficient equation
-        if "nr_saul" in coef:
-            if delta < 0.2:
-                factor = 1.6*delta**6*(1-1.2*delta**6)
-            else:
-                factor = exp(-0.4*delta**6)-exp(-2*delta**6)
-
-            nr5 = coef.get("nr_saul", [])
-            d5 = coef.get("d_saul", [])
-            t5 = coef.get("t_saul", [])
-            frd1, frd2 = 0, 0
-            for n, d, t in zip(nr5, d5, t5):
-                frd1 += n*delta**(d+5)*tau**t
-                frd2 += n*d*delta**(d-1)*tau**t
-
-            fird += (-2.4*exp(-0.4*delta**6)+12*exp(-2*delta**6))*frd1 + \
-                factor*frd2
-
-    return fird
+    return _Helmholtz_residual(tau, delta, terms, order=1)["fird"]
 
 
-def _Helmholtz_phirt(tau, delta, coef):
+def _Helmholtz_phirt(tau, delta, terms):
     r"""Residual contribution to the free Helmholtz energy, tau derivative
 
     Parameters
@@ -622,119 +941,15 @@ def _Helmholtz_phirt(tau, delta, coef):
         Inverse reduced temperature, Tc/T [-]
     delta : float
         Reduced density, rho/rhoc [-]
-    coef : dict
-        Parameters of multiparameter equation of state
+    terms : dict
+        Precompiled equation parameters, from :func:`_Helmholtz_terms`
 
     Returns
     -------
     firt : float
         :math:`\left.\frac{\partial \phi^r}{\partial \tau}\right|_{\delta}`
     """
-    firt = 0
-
-    if delta:
-        # Polinomial terms
-        nr1 = coef.get("nr1", [])
-        d1 = coef.get("d1", [])
-        t1 = coef.get("t1", [])
-        for n, d, t in zip(nr1, d1, t1):
-            firt += n*t*delta**d*tau**(t-1)
-
-        # Exponential terms
-        nr2 = coef.get("nr2", [])
-        d2 = coef.get("d2", [])
-        g2 = coef.get("gamma2", [])
-        t2 = coef.get("t2", [])
-        c2 = coef.get("c2", [])
-        for n, d, g, t, c in zip(nr2, d2, g2, t2, c2):
-            firt += n*t*delta**d*tau**(t-1)*exp(-g*delta**c)
-
-        # Gaussian terms
-        nr3 = coef.get("nr3", [])
-        d3 = coef.get("d3", [])
-        t3 = coef.get("t3", [])
-        a3 = coef.get("alfa3", [])
-        e3 = coef.get("epsilon3", [])
-        b3 = coef.get("beta3", [])
-        g3 = coef.get("gamma3", [])
-        exp1 = coef.get("exp1", [2]*len(nr3))
-        exp2 = coef.get("exp2", [2]*len(nr3))
-        for n, d, t, a, e, b, g, ex1, ex2 in zip(
-                nr3, d3, t3, a3, e3, b3, g3, exp1, exp2):
-            expr = exp(-a*(delta-e)**ex1-b*(tau-g)**ex2)
-            firt += expr * (n*delta**d*t*tau**(t-1) -
-                            n*b*delta**d*ex2*tau**t*(tau-g)**(ex2-1))
-
-        # Non analitic terms
-        ni = coef.get("nr4", [])
-        ai = coef.get("a4", [])
-        bi = coef.get("b4", [])
-        Ai = coef.get("A", [])
-        Bi = coef.get("B", [])
-        Ci = coef.get("C", [])
-        Di = coef.get("D", [])
-        b_ = coef.get("beta4", [])
-
-        for n, a, b, A, B, C, D, bt in zip(ni, ai, bi, Ai, Bi, Ci, Di, b_):
-            Tita = (1-tau)+A*((delta-1)**2)**(0.5/bt)
-            F = exp(-C*(delta-1)**2-D*(tau-1)**2)
-            Ft = -2*D*F*(tau-1)
-            Delta = Tita**2+B*((delta-1)**2)**a
-            DeltaBt = -2*Tita*b*Delta**(b-1)
-            firt += n*delta*(DeltaBt*F+Delta**b*Ft)
-
-        # Associative term from Gao correlation for ammonia
-        if "nr_ass" in coef:
-            nr_ass = coef.get("nr_ass", [])
-            d5 = coef.get("d_ass", [])
-            t5 = coef.get("t_ass", [])
-            a5 = coef.get("alfa_ass", [])
-            e5 = coef.get("epsilon_ass", [])
-            bt5 = coef.get("beta_ass", [])
-            g5 = coef.get("gamma_ass", [])
-            b5 = coef.get("b_ass", [])
-            for n, d, t, a, e, bt, g, b in zip(
-                    nr_ass, d5, t5, a5, e5, bt5, g5, b5):
-                expr = exp(-a*(delta-e)**2+1/(bt*(tau-g)**2+b))
-                expr2 = t/tau - 2*bt*(tau-g)/(bt*(tau-g)**2+b)**2
-                firt += n*delta**d*tau**t * expr * expr2
-
-        # Associative term from Piazza correlations
-        if "type_ass" in coef:
-            m = coef.get("m_ass")
-            vn = coef.get("v_ass")
-            kappa = coef.get("k_ass")
-            epsilon = coef.get("e_ass")
-
-            nu = vn*delta
-            gnu = (2-nu)/2/(1-nu)**3
-            Delta = gnu*(exp(epsilon*tau)-1)*kappa
-            X = (-1 + (1+4*Delta*delta)**0.5)/2/Delta/delta
-
-            beta = gnu*kappa*exp(epsilon*tau)*epsilon              # Eq A55
-            Xt = -delta*X**2/(2*Delta*delta*X+1)*beta              # Eq A56
-
-            fasst = (1/X-0.5)*Xt
-            if coef.get("type_ass") == "2B":
-                fasst *= 2
-            firt += m*fasst
-
-        # Special form from Saul-Wagner Water 58 coefficient equation
-        if "nr_saul" in coef:
-            if delta < 0.2:
-                factor = 1.6*delta**6*(1-1.2*delta**6)
-            else:
-                factor = exp(-0.4*delta**6)-exp(-2*delta**6)
-
-            nr5 = coef.get("nr_saul", [])
-            d5 = coef.get("d_saul", [])
-            t5 = coef.get("t_saul", [])
-            frt = 0
-            for n, d, t in zip(nr5, d5, t5):
-                frt += n*delta**d*t*tau**(t-1)
-            firt += factor*frt
-
-    return firt
+    return _Helmholtz_residual(tau, delta, terms, order=1)["firt"]
 
 
 def _MBWR_phir(T, rho, rhoc, M, coef):
@@ -1082,6 +1297,28 @@ def _instanceBuilder(p2val, *args):
     return cls(**{p1name: p1val, p2name: p2val})
 
 
+def _describeState(st, result, record):
+    """Fill the instrumentation record of a MEoS state calculation, the
+    calls without input pair are discarded"""
+    if not st._mode:
+        return False
+    record["mode"] = st._mode
+    record["status"] = st.status
+    record["converged"] = st.status in (1, 3)
+    if record["converged"]:
+        if 0 < st.x < 1:
+            record["region"] = "two phases"
+        elif st.T >= st.Tc and st.P >= st.Pc:
+            record["region"] = "supercritical"
+        elif st.x == 0:
+            record["region"] = "liquid"
+        else:
+            record["region"] = "vapor"
+    else:
+        record["msg"] = st.msg
+    return True
+
+
 class MEoS(ThermoAdvanced):
     r"""General class for implement multiparameter equation of state
     Each child class must define the parameters for the calculations
@@ -1211,6 +1448,136 @@ class MEoS(ThermoAdvanced):
             lst.append(state)
         return lst
 
+    @classmethod
+    def batch(cls, props=None, **kwargs):
+        """Calculate a set of states in a single call, returning the
+        properties as arrays
+
+        The values of input pair can be arrays or scalars, broadcasted
+        together. The T-P, T-x, P-h and P-s input pairs with Helmholtz
+        equations of state are solved simultaneously for all points. The
+        other input pairs and the points where that iteration fail are
+        calculated with normal instances using the solution of the
+        neighbour point as initial guess.
+
+        Parameters
+        ----------
+        props : list, optional
+            Name of properties to return, default T, P, rho, h, s, x. The
+            properties T, P, rho, v, x, h, s, u, a, g, cv, cp, w, Z, dpdT_rho
+            and dpdrho_T are calculated without instance definition, any
+            other property like mu or Liquido.rho need the complete instance
+            calculation
+        kwargs : dict
+            Input pair values and any other instance parameter as eq, visco,
+            thermal, ref or refvalues
+
+        Returns
+        -------
+        result : dict
+            Dictionary with the arrays of requested properties in SI units,
+            with the broadcasted shape of input, and a status array with the
+            calculation code of each state. The points without solution have
+            a NaN value
+
+        Examples
+        --------
+        >>> from lib.mEoS import H2O
+        >>> res = H2O.batch(T=[300, 400, 500], P=1e6, props=["rho", "h"])
+        >>> st = H2O(T=400, P=1e6)
+        >>> "%0.4f %0.4f" % (res["rho"][1], st.rho)
+        '937.8733 937.8733'
+        >>> "%0.2f %0.2f" % (res["h"][1], st.h)
+        '533469.46 533469.46'
+        >>> res = H2O.batch(P=1e6, h=[5e5, 2e6, 3e6], props=["T", "x"])
+        >>> " ".join("%0.4f" % x for x in res["x"])
+        '0.0000 0.6143 1.0000'
+        """
+        if props is None:
+            props = ["T", "P", "rho", "h", "s", "x"]
+
+        inputs = {}
+        options = {}
+        for key, value in kwargs.items():
+            if key in ("T", "P", "rho", "v", "h", "s", "u", "x"):
+                inputs[key] = value
+            else:
+                options[key] = value
+        if len(inputs) != 2:
+            raise ValueError("batch calculation need a input pair")
+
+        names = list(inputs)
+        values = broadcast_arrays(
+            *[asarray(inputs[key], dtype=float) for key in names])
+        shape = values[0].shape
+        inputs = {key: value.ravel() for key, value in zip(names, values)}
+        N = values[0].size
+
+        result = {prop: full(N, nan) for prop in props}
+        status = zeros(N, dtype=int)
+
+        # Simultaneous iteration of supported input pairs
+        st = cls(**options)
+        sol = None
+        if st._code != "PR" and st._constants["__type__"] == "Helmholtz":
+            st._ref(st.kwargs["ref"], st.kwargs["refvalues"])
+            mode = set(names)
+            if mode == {"T", "P"}:
+                sol = st._batchTP(inputs["T"], inputs["P"])
+            elif mode == {"T", "x"}:
+                sol = st._batchTx(inputs["T"], inputs["x"])
+            elif mode == {"P", "h"}:
+                sol = st._batchPX(inputs["P"], inputs["h"], "h")
+            elif mode == {"P", "s"}:
+                sol = st._batchPX(inputs["P"], inputs["s"], "s")
+
+        ok = zeros(N, dtype=bool)
+        slow = props
+        if sol is not None:
+            prop, status = st._batchFill(sol)
+            ok = status != 0
+            for key in props:
+                if key in prop:
+                    result[key][ok] = prop[key][ok]
+            slow = [key for key in props if key not in _batchProps]
+
+        # Complete instance for the remaining points or properties, the last
+        # solved point is used as initial guess
+        guess = {}
+        for i in range(N):
+            if status[i] in (1, 3):
+                guess = {"rho0": prop["rho"][i], "T0": prop["T"][i]}
+            if status[i] == 5 or ok[i] and not slow:
+                continue
+
+            kw = {key: inputs[key][i] for key in names}
+            kw.update(options)
+            kw.update(guess)
+            try:
+                fluid = cls(**kw)
+            except ValueError:
+                # Wrong input values, point without solution
+                continue
+            if not ok[i]:
+                status[i] = fluid.status
+            if fluid.status not in (1, 3):
+                continue
+
+            guess = {"rho0": fluid.rho._data, "T0": fluid.T._data}
+            for key in slow if ok[i] else props:
+                value = fluid
+                for attr in key.split("."):
+                    value = getattr(value, attr)
+                # Null phases have text values, kept as NaN
+                try:
+                    result[key][i] = getattr(value, "_data", value)
+                except (TypeError, ValueError):
+                    pass
+
+        result = {key: value.reshape(shape) for key, value in result.items()}
+        result["status"] = status.reshape(shape)
+        return result
+
     def __init__(self, **kwargs):
         """
         Constructor of instance, the definition can be done with any of this
@@ -1410,6 +1777,7 @@ class MEoS(ThermoAdvanced):
         if self._dielectric and "__doi__" not in self._dielectric:
             self._dielectric["__doi__"] = __doi__[24]
 
+    @instrument.instrumented("MEoS", _describeState, "calculo")
     def __call__(self, **kwargs):
         """Make instance callable to let definition one parameters for one"""
         # Let user refer to equation using the internal name of equation
@@ -1443,6 +1811,16 @@ class MEoS(ThermoAdvanced):
         if not self._code:
             self._code = str(eq)
 
+        # Precompiled residual terms, shared by all instances of fluid
+        if self._constants["__type__"] == "Helmholtz":
+            if self._code == "Generalised":
+                self._terms = _Helmholtz_terms(self._constants)
+            else:
+                key = (self.__class__, self._code)
+                if key not in _termTables:
+                    _termTables[key] = _Helmholtz_terms(self._constants)
+                self._terms = _termTables[key]
+
         visco = self.kwargs["visco"]
         thermal = self.kwargs["thermal"]
         if self._viscosity:
@@ -1648,8 +2026,7 @@ class MEoS(ThermoAdvanced):
             return ho - h
 
         if T < self.Tc:
-            rhov = self._Vapor_Density(T)
-            rhol = self._Liquid_Density(T)
+            rhol, rhov = self._satDensity(T)
             deltaL = rhol/self.rhoc
             deltaG = rhov/self.rhoc
 
@@ -1721,8 +2098,7 @@ class MEoS(ThermoAdvanced):
             return so-s
 
         if T < self.Tc:
-            rhov = self._Vapor_Density(T)
-            rhol = self._Liquid_Density(T)
+            rhol, rhov = self._satDensity(T)
             deltaL = rhol/self.rhoc
             deltaG = rhov/self.rhoc
 
@@ -1797,8 +2173,7 @@ class MEoS(ThermoAdvanced):
             return ho-Po*1e3/rho - u
 
         if T < self.Tc:
-            rhov = self._Vapor_Density(T)
-            rhol = self._Liquid_Density(T)
+            rhol, rhov = self._satDensity(T)
             deltaL = rhol/self.rhoc
             deltaG = rhov/self.rhoc
 
@@ -1996,8 +2371,7 @@ class MEoS(ThermoAdvanced):
 
         elif self._mode == "T-rho":
             # In this mode only check possible two phases region
-            rhol = self._Liquid_Density(T)
-            rhov = self._Vapor_Density(T)
+            rhol, rhov = self._satDensity(T)
 
             if T > self.Tc:
                 x = 1
@@ -2649,8 +3023,14 @@ class MEoS(ThermoAdvanced):
                 T = float(T)
                 rhol, rhov, Ps = self._saturation(T)
                 return Ps-P
+            To = None
+            table = self._satTable()
+            if table:
+                To = table.Tsat(P)
+            if To is None:
+                To = 0.99*self.Tc
             try:
-                T, rinput = newton(funcion, 0.99*self.Tc, full_output=True)
+                T, rinput = newton(funcion, To, full_output=True)
             except RuntimeError:
                 self.status = 0
                 return
@@ -2666,8 +3046,7 @@ class MEoS(ThermoAdvanced):
             if T > self.Tc:
                 x = 1
             else:
-                rhol = self._Liquid_Density(T)
-                rhov = self._Vapor_Density(T)
+                rhol, rhov = self._satDensity(T)
                 rhom = (rhol+rhov)/2
                 if rho > rhom:
                     x = 0
@@ -2869,77 +3248,100 @@ class MEoS(ThermoAdvanced):
                 else:
                     ro.insert(0, kwargs["rho0"])
 
+        # Count the residual evaluations if the instrumentation is enabled
+        f = instrument.counted(f)
+        f2 = instrument.counted(f2)
+        if instrument.enabled():
+            guesses = {}
+            if "T" not in kwargs:
+                guesses["T0"] = [float(t) for t in to]
+            if "rho" not in kwargs:
+                guesses["rho0"] = [float(r) for r in ro]
+            instrument.note(solver="fsolve", guesses=guesses)
+
         prop = {}
         rinput = None
         rho, T = 0, 0
         converge = False
 
-        if "T" in kwargs:
-            # Calculate only density
-            T = kwargs["T"]
-            for r in ro:
-                try:
-                    rho, rinput = newton(f, r, full_output=True)
-                except RuntimeError:
-                    pass
-                else:
-                    if self._liquid_Density and self._vapor_Density:
-                        rhol = self._Liquid_Density(T)
-                        rhov = self._Vapor_Density(T)
-                        if self._mode == "T-P":
-                            twophas = False
-                        else:
-                            twophas = self.Tt < T < self.Tc \
-                                and rhov < rho < rhol
+        # Use the saturation table to detect the two phases states with known
+        # pressure and enthalpy, skipping the single phase iteration
+        table = self._satTable() if f2 is not None else None
+        twophases = False
+        if table and "P" in kwargs and "h" in kwargs:
+            Ts = table.Tsat(kwargs["P"])
+            sat = table(Ts, self._satOffset()) if Ts is not None else None
+            if sat:
+                xo = (kwargs["h"]-sat["hL"])/(sat["hG"]-sat["hL"])
+                twophases = 1e-3 < xo < 1-1e-3
+
+        if not twophases:
+            if "T" in kwargs:
+                # Calculate only density
+                T = kwargs["T"]
+                for r in ro:
+                    try:
+                        rho, rinput = newton(f, r, full_output=True)
+                    except RuntimeError:
+                        pass
                     else:
-                        twophas = False
+                        if self._liquid_Density and self._vapor_Density:
+                            rhol, rhov = self._satDensity(T)
+                            if self._mode == "T-P":
+                                twophas = False
+                            else:
+                                twophas = self.Tt < T < self.Tc \
+                                    and rhov < rho < rhol
+                        else:
+                            twophas = False
 
-                    if 0 < rho < self._constants.get("rhomax", 1e5)*self.M \
-                            and abs(f(rho)) < 1e-3 and not twophas \
-                            and rinput.converged:
-                        converge = True
-                        break
-        elif "rho" in kwargs:
-            # Calculate only temperature
-            rho = kwargs["rho"]
-            for t in to:
-                try:
-                    T, rinput = newton(f, t, full_output=True)
-                except RuntimeError:
-                    pass
-                else:
-                    if self._liquid_Density and self._vapor_Density:
-                        rhol = self._Liquid_Density(T)
-                        rhov = self._Vapor_Density(T)
-                        twophas = self.Tt < T < self.Tc and rhov < rho < rhol
+                        rhomax = self._constants.get("rhomax", 1e5)*self.M
+                        if 0 < rho < rhomax and abs(f(rho)) < 1e-3 \
+                                and not twophas and rinput.converged:
+                            converge = True
+                            break
+            elif "rho" in kwargs:
+                # Calculate only temperature
+                rho = kwargs["rho"]
+                for t in to:
+                    try:
+                        T, rinput = newton(f, t, full_output=True)
+                    except RuntimeError:
+                        pass
                     else:
-                        twophas = False
-                    t = self._constants["Tmin"] <= T <= self._constants["Tmax"]
-                    if t and abs(f(T)) < 1e-3 and not twophas \
-                            and rinput.converged:
-                        converge = True
-                        break
-        else:
-            # Both density and temperature unknowns
-            for r, t in product(ro, to):
-                try:
-                    rinput = fsolve(f, [r, t], full_output=True)
-                    rho, T = rinput[0]
-                except:
-                    pass
-                else:
-                    f1 = sum(abs(rinput[1]["fvec"]))
-                    if self._liquid_Density and self._vapor_Density:
-                        rhol = self._Liquid_Density(T)
-                        rhov = self._Vapor_Density(T)
-                        twophas = self.Tt <= T <= self.Tc and rhov < rho < rhol
+                        if self._liquid_Density and self._vapor_Density:
+                            rhol, rhov = self._satDensity(T)
+                            twophas = self.Tt < T < self.Tc \
+                                and rhov < rho < rhol
+                        else:
+                            twophas = False
+                        t = self._constants["Tmin"] <= T \
+                            <= self._constants["Tmax"]
+                        if t and abs(f(T)) < 1e-3 and not twophas \
+                                and rinput.converged:
+                            converge = True
+                            break
+            else:
+                # Both density and temperature unknowns
+                for r, t in product(ro, to):
+                    try:
+                        rinput = fsolve(f, [r, t], full_output=True)
+                        rho, T = rinput[0]
+                    except:
+                        pass
                     else:
-                        twophas = False
-                    if 0 < rho and f1 < 1e-2 and not twophas:
-                        converge = True
-                        break
-                    elif (rho != r or T != t) and 0 < rho and f1 < 1e-5:
-                        converge = False
+                        f1 = sum(abs(rinput[1]["fvec"]))
+                        if self._liquid_Density and self._vapor_Density:
+                            rhol, rhov = self._satDensity(T)
+                            twophas = self.Tt <= T <= self.Tc \
+                                and rhov < rho < rhol
+                        else:
+                            twophas = False
+                        if 0 < rho and f1 < 1e-2 and not twophas:
+                            converge = True
+                            break
+                        elif (rho != r or T != t) and 0 < rho and f1 < 1e-5:
+                            converge = False
 
         # Two phase region calculation
         if f2 is not None and not converge:
@@ -2953,10 +3355,25 @@ class MEoS(ThermoAdvanced):
                 else:
                     to.insert(0, kwargs["T0"])
 
+            # Saturation temperature from table as first guess
+            if table and "P" in kwargs:
+                Ts = table.Tsat(kwargs["P"])
+                if Ts is not None:
+                    to.insert(0, Ts)
+
             for t in to:
                 # print("to", t)
-                rLo = self._Liquid_Density(t)
-                rGo = self._Vapor_Density(t)
+                rLo, rGo = self._satDensity(t)
+
+                # Quality initial guess from saturated properties
+                xo = 0.5
+                sat = table(t, self._satOffset()) if table else None
+                for key in ("h", "s"):
+                    if sat and key in kwargs:
+                        xo = (kwargs[key]-sat[key+"L"]) / \
+                            (sat[key+"G"]-sat[key+"L"])
+                        xo = min(max(xo, 0), 1)
+
                 if "rho" in kwargs:
                     rinput = fsolve(f2, [t, rLo, rGo], full_output=True)
                     T, rhoL, rhoG = rinput[0]
@@ -2969,13 +3386,13 @@ class MEoS(ThermoAdvanced):
 
                 else:
                     rinput = fsolve(
-                        f2, [t, rLo, rGo, 0.5], full_output=True)
+                        f2, [t, rLo, rGo, xo], full_output=True)
                     T, rhoL, rhoG, x = rinput[0]
 
                     # Same input pair are very inestable to converge, specially
                     # in region near the triple point, so check too the
                     # reported values as saturation coherent state
-                    rGo = self._Vapor_Density(T)
+                    rLo, rGo = self._satDensity(T)
                     if sum(abs(rinput[1]["fvec"])) < 1e-2 and 0 <= x <= 1 \
                             and rGo*0.95 < rhoG < rGo*1.05:
                         prop["T"] = T
@@ -3223,6 +3640,535 @@ class MEoS(ThermoAdvanced):
 #            self.derivative("P", "T", "rho", propiedades)))
 #        propiedades["cps"] = propiedades["cv"] Add cps from Argon pag.27
 
+    def _batchIdeal(self, tau, delta):
+        """Ideal gas contribution for arrays input, the density dependence is
+        added to the temperature function calculated in :func:`_phi0`"""
+        cp = self._constants["cp"]
+        prop = self._phi0(cp, tau, 1)
+        factor = cp.get("R", self._constants["R"])/self._constants["R"]
+        c = cp.get("tau*logdelta", 0)
+        ao = cp["ao_log"][0] if "ao_log" in cp else 1
+        logdelta = log(delta)
+        prop["fio"] = prop["fio"] + ao*logdelta + factor*c*tau*logdelta
+        prop["fiot"] = prop["fiot"] + factor*c*logdelta
+        prop["fiod"] = (1+c*tau)/delta
+        prop["fiodt"] = c/delta
+        return prop
+
+    def _batchPhase(self, T, delta, P=None):
+        """Single phase properties for arrays input in SI units, P is the
+        bulk pressure used in u and Z, default the phase pressure"""
+        R = float(self.R)
+        tau = self.Tc/T
+        fir = _Helmholtz_residual(tau, delta, self._terms)
+        fio = self._batchIdeal(tau, delta)
+
+        rho = delta*self.rhoc
+        fird = fir["fird"]
+        fiot = fio["fiot"]+fir["firt"]
+        tt = tau**2*(fio["fiott"]+fir["firtt"])
+        bt = 1+delta*fird-delta*tau*fir["firdt"]
+        dd = 1+2*delta*fird+delta**2*fir["firdd"]
+
+        prop = {}
+        prop["T"] = T
+        prop["rho"] = rho
+        prop["v"] = 1/rho
+        prop["P"] = (1+delta*fird)*R*T*rho
+        if P is None:
+            P = prop["P"]
+        prop["Z"] = P/rho/R/T
+        prop["h"] = R*T*(1+tau*fiot+delta*fird) \
+            + (self.href-self.hoffset)*1000
+        prop["s"] = R*(tau*fiot-fio["fio"]-fir["fir"]) \
+            + (self.sref-self.soffset)*1000
+        prop["u"] = prop["h"]-P/rho
+        prop["a"] = prop["u"]-T*prop["s"]
+        prop["g"] = prop["h"]-T*prop["s"]
+        prop["cv"] = -R*tt
+        prop["cp"] = R*(bt**2/dd-tt)
+        prop["w"] = (R*T*(dd-bt**2/tt))**0.5
+        prop["dpdT_rho"] = R*rho*bt
+        prop["dpdrho_T"] = R*T*dd
+        return prop
+
+    def _batchFill(self, sol):
+        """Calculate the properties of the solution of a batch iteration,
+        return the properties dict and the status array, 0 for the points
+        without solution"""
+        T = sol["T"]
+        P = sol["P"]
+        x = sol["x"].copy()
+        N = T.size
+        prop = {key: full(N, nan) for key in _batchProps}
+
+        # Points out of equation range are discarded
+        inrange = (T >= self._constants["Tmin"]) & \
+            (T <= self._constants["Tmax"])
+        ok = sol["ok"] & inrange
+        status = zeros(N, dtype=int)
+        status[sol["ok"] & ~inrange] = 5
+        status[ok] = 1
+        status[ok & (P > self._constants["Pmax"]*1000)] = 3
+
+        # Single phase states, with the phase defined as in calculo
+        single = ok & ~((x > 0) & (x < 1))
+        for i in nonzero(single & ~isfinite(x))[0]:
+            if T[i] > self.Tc:
+                x[i] = 1
+            else:
+                rhom = (self._Liquid_Density(T[i])+self._Vapor_Density(T[i]))/2
+                x[i] = 0 if sol["delta"][i]*self.rhoc > rhom else 1
+
+        idx = nonzero(single)[0]
+        if idx.size:
+            phase = self._batchPhase(T[idx], sol["delta"][idx], P[idx])
+            for key, value in phase.items():
+                prop[key][idx] = value
+
+        # Two phases states, only the mass averaged properties are defined
+        idx = nonzero(ok & (x > 0) & (x < 1))[0]
+        if idx.size:
+            liquid = self._batchPhase(T[idx], sol["deltaL"][idx], P[idx])
+            gas = self._batchPhase(T[idx], sol["deltaG"][idx], P[idx])
+            xi = x[idx]
+            for key in ("v", "h", "s", "u", "a", "g"):
+                prop[key][idx] = xi*gas[key]+(1-xi)*liquid[key]
+            prop["rho"][idx] = 1/prop["v"][idx]
+            prop["T"][idx] = T[idx]
+
+        prop["P"][ok] = P[ok]
+        prop["x"][ok] = x[ok]
+        return prop, status
+
+    def _batchDensity(self, T, P, delta):
+        """Newton iteration of reduced density for arrays of T-P input pair,
+        return the reduced density and the mask of converged points"""
+        tau = self.Tc/T
+        Pr = P/self.rhoc/float(self.R)/T
+        delta = delta.copy()
+        ok = zeros(delta.size, dtype=bool)
+        idx = nonzero(isfinite(delta) & (delta > 0))[0]
+        for i in range(50):
+            if not idx.size:
+                break
+            d = delta[idx]
+            res = _Helmholtz_residual(tau[idx], d, self._terms)
+            f = d*(1+d*res["fird"])-Pr[idx]
+            df = 1+2*d*res["fird"]+d**2*res["firdd"]
+            # The convergence is checked with the relative newton step,
+            # the roundoff of residual is high for liquid at low pressure
+            done = (abs(f) <= 1e-11*d*df) & (df > 0)
+            ok[idx[done]] = True
+
+            new = (d-f/df).clip(d/2, 2*d)
+            delta[idx] = where(done, d, new)
+            idx = idx[~done & isfinite(new)]
+        return delta, ok
+
+    def _batchTP(self, T, P):
+        """Batch iteration for T-P input pair"""
+        N = T.size
+        rhoo = full((4, N), nan)
+
+        # Phase of subcritical points defined by vapour pressure, 1 for
+        # liquid, -1 for vapour and 0 for supercritical points, the roots
+        # of the other phase are metastable states and are discarded
+        phase = zeros(N, dtype=int)
+        for i in range(N):
+            if T[i] < self.Tc:
+                if P[i] > self._Vapor_Pressure(T[i]):
+                    phase[i] = 1
+                    rhoo[0, i] = self._Liquid_Density(T[i])
+                else:
+                    phase[i] = -1
+                    rhoo[0, i] = self._Vapor_Density(T[i])
+            else:
+                rhoo[0, i] = self._Liquid_Density(self.Tc)
+        if "rhomax" in self._constants:
+            rhoo[1] = self._constants["rhomax"]*self.M
+        rhoo[2] = self.rhoc
+        rhoo[3] = P/T/float(self.R)
+
+        # Try the initial guess in order only for the unconverged points
+        delta = full(N, nan)
+        ok = zeros(N, dtype=bool)
+        for rho in rhoo:
+            idx = nonzero(~ok)[0]
+            if not idx.size:
+                break
+            d, conv = self._batchDensity(T[idx], P[idx], rho[idx]/self.rhoc)
+            conv &= phase[idx]*(d-1) >= 0
+            delta[idx[conv]] = d[conv]
+            ok[idx[conv]] = True
+
+        # Last option, the solution of neighbour point, the points without
+        # solution are calculated later with the scalar procedure
+        idx = nonzero(~ok)[0]
+        if idx.size and ok.any():
+            d, conv = self._batchDensity(
+                T[idx], P[idx], self._batchNeighbour(delta, ok)[idx])
+            conv &= phase[idx]*(d-1) >= 0
+            delta[idx[conv]] = d[conv]
+            ok[idx[conv]] = True
+
+        return {"T": T, "P": P, "delta": delta, "x": full(N, nan), "ok": ok}
+
+    def _batchNeighbour(self, value, ok):
+        """Return the array with the value of nearest solved point for each
+        point, in input order"""
+        guess = value.copy()
+        idx = nonzero(ok)[0]
+        for i in nonzero(~ok)[0]:
+            j = abs(idx-i).argmin()
+            guess[i] = value[idx[j]]
+        return guess
+
+    def _batchSaturation(self, T, deltaL=None, deltaG=None):
+        """Newton iteration of saturation state for arrays of temperature,
+        the reduced densities optional initial guess can be passed, default
+        calculated with ancillary equations
+
+        Returns
+        -------
+        sat : dict
+            deltaL, deltaG: Reduced density of saturated phases, [-]
+            P: Saturation pressure, [Pa]
+            dPdT: Slope of saturation curve, [Pa/K]
+            ok: Mask of converged points
+        """
+        N = T.size
+        R = float(self.R)
+        tau = self.Tc/T
+        dL = full(N, nan) if deltaL is None else deltaL.copy()
+        dG = full(N, nan) if deltaG is None else deltaG.copy()
+        table = self._satTable(build=False)
+        for i in nonzero((T < self.Tc) & ~(isfinite(dL) & isfinite(dG)))[0]:
+            sat = table(T[i]) if table else None
+            if sat:
+                dL[i] = sat["rhoL"]/self.rhoc
+                dG[i] = sat["rhoG"]/self.rhoc
+            else:
+                dL[i] = self._Liquid_Density(T[i])/self.rhoc
+                dG[i] = self._Vapor_Density(T[i])/self.rhoc
+
+        sat = {"P": full(N, nan), "dPdT": full(N, nan),
+               "ok": zeros(N, dtype=bool)}
+        idx = nonzero(T < self.Tc)[0]
+        for i in range(50):
+            if not idx.size:
+                break
+
+            # Evaluate the both phases in one pass
+            n = idx.size
+            d = concatenate((dL[idx], dG[idx]))
+            res = _Helmholtz_residual(
+                concatenate((tau[idx], tau[idx])), d, self._terms)
+            fir, fird, firt = res["fir"], res["fird"], res["firt"]
+            J = d*(1+d*fird)
+            dJ = 1+2*d*fird+d**2*res["firdd"]
+            K = d*fird+fir+log(d)
+
+            l, g = d[:n], d[n:]
+            F1 = J[n:]-J[:n]
+            F2 = K[n:]-K[:n]
+
+            # Newton step with the jacobian of (F1, F2) in (deltaL, deltaG),
+            # the convergence is checked with the step because the roundoff
+            # of J is high for liquid phase at low temperature
+            a, b = dJ[:n], dJ[n:]
+            det = a*b*(1/l-1/g)
+            with errstate(divide="ignore", invalid="ignore"):
+                stepL = (F1*b/g-b*F2)/det
+                stepG = (a/l*F1-a*F2)/det
+            done = (abs(stepL) <= 1e-11*l) & (abs(stepG) <= 1e-9*g) & \
+                (g < l*(1-1e-6)) & (a > 0) & (b > 0)
+
+            j = idx[done]
+            sat["ok"][j] = True
+            rhoL = l[done]*self.rhoc
+            rhoG = g[done]*self.rhoc
+            Dfir = fir[:n][done]-fir[n:][done]
+            Ps = R*T[j]*rhoL*rhoG/(rhoL-rhoG)*(Dfir+log(rhoL/rhoG))
+            ds = R*(tau[j]*(firt[n:][done]-firt[:n][done])
+                    - log(rhoG/rhoL)+Dfir)
+            sat["P"][j] = Ps
+            sat["dPdT"][j] = ds/(1/rhoG-1/rhoL)
+
+            newL = (l-stepL).clip(l/2, 2*l)
+            newG = (g-stepG).clip(g/2, 2*g)
+            dL[idx] = where(done, l, newL)
+            dG[idx] = where(done, g, newG)
+            idx = idx[~done & isfinite(newL) & isfinite(newG)]
+
+        sat["deltaL"] = dL
+        sat["deltaG"] = dG
+        return sat
+
+    def _batchTx(self, T, x):
+        """Batch iteration for T-x input pair"""
+        sat = self._batchSaturation(T)
+        delta = where(x == 0, sat["deltaL"], sat["deltaG"])
+        ok = sat["ok"] & (x >= 0) & (x <= 1)
+        return {"T": T, "P": sat["P"], "x": x, "delta": delta,
+                "deltaL": sat["deltaL"], "deltaG": sat["deltaG"], "ok": ok}
+
+    def _batchPX(self, P, value, prop):
+        r"""Batch iteration for P-h and P-s input pair
+
+        The saturation temperature is calculated first to check the two
+        phases region, the single phase points are iterated in temperature
+        solving the density for each T-P point, using the derivatives
+
+        .. math::
+            \left(\frac{\partial h}{\partial T}\right)_P = c_p \quad
+            \left(\frac{\partial s}{\partial T}\right)_P = \frac{c_p}{T}
+        """
+        N = P.size
+        T = full(N, nan)
+        x = full(N, nan)
+        delta = full(N, nan)
+        dL = full(N, nan)
+        dG = full(N, nan)
+        ok = zeros(N, dtype=bool)
+
+        # Limits to keep the single phase iteration in the correct branch
+        Tlo = full(N, 0.)
+        Thi = full(N, float("inf"))
+        Dlo = full(N, 0.)
+        Dhi = full(N, float("inf"))
+
+        # Saturation temperature for each different pressure, initial value
+        # from saturation table or Lee-Kesler correlation
+        sub = nonzero((P > 0) & (P < self.Pc))[0]
+        Pu, inv = unique(P[sub], return_inverse=True)
+        table = self._satTable()
+        Ts = table.Tsat(Pu) if table else None
+        if Ts is None:
+            Ts = self.Tc/(1-log10(Pu/self.Pc)*3/7/(1+self.f_acent))
+        sat = {"ok": zeros(Pu.size, dtype=bool)}
+        dl = dg = None
+        for i in range(50):
+            sat = self._batchSaturation(Ts, dl, dg)
+            if not sat["ok"].any():
+                break
+            dl, dg = sat["deltaL"], sat["deltaG"]
+            f = log(sat["P"]/Pu)
+            if (abs(f[sat["ok"]]) <= 1e-11).all():
+                break
+            step = where(sat["ok"], f*sat["P"]/sat["dPdT"], 0)
+            Ts = (Ts-step).clip(0.9*Ts, 1.1*Ts).clip(None, self.Tc*(1-1e-9))
+        s = (sat["ok"] & (abs(log(sat["P"]/Pu)) <= 1e-9))[inv]
+
+        j = sub[s]
+        if j.size:
+            Ts = Ts[inv][s]
+            dl = sat["deltaL"][inv][s]
+            dg = sat["deltaG"][inv][s]
+            liquid = self._batchPhase(Ts, dl, P[j])
+            gas = self._batchPhase(Ts, dg, P[j])
+            xj = (value[j]-liquid[prop])/(gas[prop]-liquid[prop])
+
+            two = (xj >= 0) & (xj <= 1)
+            k = j[two]
+            T[k] = Ts[two]
+            x[k] = xj[two]
+            dL[k] = dl[two]
+            dG[k] = dg[two]
+            ok[k] = True
+
+            # Single phase points start from the saturation state
+            k = j[xj < 0]
+            T[k] = Ts[xj < 0]
+            delta[k] = Dlo[k] = dl[xj < 0]
+            Thi[k] = T[k]
+            k = j[xj > 1]
+            T[k] = Ts[xj > 1]
+            delta[k] = Dhi[k] = dg[xj > 1]
+            Tlo[k] = T[k]
+
+        # Supercritical region or point without saturation state
+        k = nonzero(~ok & ~isfinite(T))[0]
+        T[k] = self.Tc
+
+        def iterate(idx):
+            """Newton iteration in temperature for single phase points, with
+            limited step to follow the density solution of previous step"""
+            for i in range(200):
+                if not idx.size:
+                    break
+                # Density from previous iteration, or the T-P procedure
+                d, conv = self._batchDensity(T[idx], P[idx], delta[idx])
+                if not conv.all():
+                    tp = self._batchTP(T[idx[~conv]], P[idx[~conv]])
+                    d[~conv] = tp["delta"]
+                    conv[~conv] = tp["ok"]
+                conv &= (d >= Dlo[idx]*(1-1e-9)) & (d <= Dhi[idx]*(1+1e-9))
+                delta[idx] = d
+                idx = idx[conv]
+                if not idx.size:
+                    break
+
+                phase = self._batchPhase(T[idx], delta[idx], P[idx])
+                f = phase[prop]-value[idx]
+                if prop == "h":
+                    df = phase["cp"]
+                    tol = 1e-10*(abs(value[idx])+self.R*self.Tc)
+                else:
+                    df = phase["cp"]/T[idx]
+                    tol = 1e-10*(abs(value[idx])+self.R)
+                done = abs(f) <= tol
+                ok[idx[done]] = True
+
+                Ti = T[idx]
+                new = (Ti-f/df).clip(0.95*Ti, 1.05*Ti)
+                T[idx] = where(done, Ti, new.clip(Tlo[idx], Thi[idx]))
+                idx = idx[~done & isfinite(new)]
+
+        single = ~ok & isfinite(T)
+        iterate(nonzero(single)[0])
+
+        # Second try from the solution of neighbour point
+        idx = nonzero(single & ~ok)[0]
+        if idx.size and (single & ok).any():
+            T[idx] = self._batchNeighbour(T, single & ok)[idx]
+            delta[idx] = self._batchNeighbour(delta, single & ok)[idx]
+            iterate(idx)
+
+        return {"T": T, "P": P, "x": x, "delta": delta, "deltaL": dL,
+                "deltaG": dG, "ok": ok}
+
+    def _satTable(self, build=True):
+        """Return the saturation table of fluid, None if it isn't available
+
+        The table is calculated only once for each fluid and equation, and
+        saved in configuration folder. The enthalpy and entropy values are
+        saved without reference state offset, see :func:`_satOffset`. Only
+        available for Helmholtz equations of state
+
+        Parameters
+        ----------
+        build : bool
+            Calculate the table if it isn't available
+
+        Examples
+        --------
+        >>> from lib.mEoS import H2O
+        >>> st = H2O(T=400, x=0.5)
+        >>> table = st._satTable()
+        >>> "%0.4f %0.2f" % (table.Tsat(st.P), table(400)["rhoL"])
+        '400.0000 937.49'
+        """
+        if self._code in ("PR", "Generalised") or \
+                self._constants["__type__"] != "Helmholtz" or \
+                not hasattr(self, "hoffset"):
+            return None
+
+        key = (self.__class__, self._code)
+        if key not in _satTables:
+            if not build:
+                return None
+            data = self._satLoad()
+            if data is None:
+                data = self._satBuild()
+                if data is not None:
+                    self._satSave(data)
+            if data is None:
+                _satTables[key] = None
+            else:
+                _satTables[key] = _SaturationTable(data)
+
+        return _satTables[key]
+
+    def _satOffset(self):
+        """Enthalpy and entropy offset of current reference state to add to
+        the values of saturation table, [J/kg], [J/kgK]"""
+        return ((self.href-self.hoffset)*1000, (self.sref-self.soffset)*1000)
+
+    def _satFile(self):
+        """Path of file with saturation table saved"""
+        name = "%s-%s.json" % (self.__class__.__name__, self._code)
+        return conf_dir + "MEoSsat" + os.sep + name
+
+    def _satHash(self):
+        """Hash of equation coefficients, to detect saved tables calculated
+        with a modified equation with the same name"""
+        txt = json.dumps(self._constants, sort_keys=True, default=repr)
+        return md5(txt.encode()).hexdigest()
+
+    def _satLoad(self):
+        """Load saturation table from disk, None if it isn't saved or it has
+        a different version, equation or coefficients"""
+        try:
+            with open(self._satFile(), "r") as archivo:
+                data = json.load(archivo)
+        except (OSError, ValueError):
+            return None
+
+        if data.get("version") != _satVersion or \
+                data.get("eq") != self._constants.get("__name__", "") or \
+                data.get("hash") != self._satHash():
+            return None
+        return data
+
+    def _satSave(self, data):
+        """Save saturation table to disk, writing first to a temporal file to
+        avoid corrupted files with concurrent processes"""
+        filename = self._satFile()
+        try:
+            os.makedirs(os.path.dirname(filename), exist_ok=True)
+            tmp = "%s.%i" % (filename, os.getpid())
+            with open(tmp, "w") as archivo:
+                json.dump(data, archivo)
+            os.replace(tmp, filename)
+        except OSError:
+            # Not writable configuration folder, the table is used only in
+            # memory
+            pass
+
+    def _satBuild(self):
+        """Calculate the saturation table of fluid, with points concentrated
+        near the critical point"""
+        Tmin = max(self.Tt, self._constants["Tmin"])
+        tita = concatenate((linspace(1-Tmin/self.Tc, 0.02, 150,
+                                     endpoint=False),
+                            geomspace(0.02, 1e-5, 50)))
+        T = self.Tc*(1-tita)
+        sat = self._batchSaturation(T)
+
+        # Discard unconverged points, the pressure must be monotonic
+        ok = nonzero(sat["ok"])[0]
+        if ok.size < 10:
+            return None
+        ok = ok[concatenate(([True], sat["P"][ok][1:] > sat["P"][ok][:-1]))]
+
+        data = {"version": _satVersion,
+                "eq": self._constants.get("__name__", ""),
+                "hash": self._satHash(),
+                "T": T[ok].tolist(),
+                "P": sat["P"][ok].tolist(),
+                "rhoL": (sat["deltaL"][ok]*self.rhoc).tolist(),
+                "rhoG": (sat["deltaG"][ok]*self.rhoc).tolist()}
+
+        # Saturated enthalpy and entropy without reference state offset
+        href, sref = self._satOffset()
+        liquid = self._batchPhase(T[ok], sat["deltaL"][ok], sat["P"][ok])
+        gas = self._batchPhase(T[ok], sat["deltaG"][ok], sat["P"][ok])
+        data["hL"] = (liquid["h"]-href).tolist()
+        data["hG"] = (gas["h"]-href).tolist()
+        data["sL"] = (liquid["s"]-sref).tolist()
+        data["sG"] = (gas["s"]-sref).tolist()
+        return data
+
+    def _satDensity(self, T):
+        """Saturated densities at T from saturation table if it's available,
+        else from ancillary equations"""
+        table = self._satTable()
+        sat = table(T) if table else None
+        if sat:
+            return sat["rhoL"], sat["rhoG"]
+        return self._Liquid_Density(T), self._Vapor_Density(T)
+
     @refDoc(__doi__, [9], tab=8)
     def _saturation(self, T=None):
         """
@@ -3233,17 +4179,24 @@ class MEoS(ThermoAdvanced):
         if T > self.Tc:
             T = self.Tc
         T = float(T)
-        rhoLo = self._Liquid_Density(T)
-        rhoGo = self._Vapor_Density(T)
+        rhoLo, rhoGo = self._satDensity(T)
 
         def f(parr):
             rhol, rhog = parr
             deltaL = rhol/self.rhoc
             deltaG = rhog/self.rhoc
-            liquidofird = self._phird(self.Tc/T, deltaL)
-            liquidofir = self._phir(self.Tc/T, deltaL)
-            vaporfird = self._phird(self.Tc/T, deltaG)
-            vaporfir = self._phir(self.Tc/T, deltaG)
+            if self._code != "PR" and \
+                    self._constants["__type__"] == "Helmholtz":
+                # Evaluate both phases in one pass
+                res = _Helmholtz_residual(
+                    self.Tc/T, [deltaL, deltaG], self._terms, order=1)
+                liquidofir, vaporfir = res["fir"]
+                liquidofird, vaporfird = res["fird"]
+            else:
+                liquidofird = self._phird(self.Tc/T, deltaL)
+                liquidofir = self._phir(self.Tc/T, deltaL)
+                vaporfird = self._phird(self.Tc/T, deltaG)
+                vaporfir = self._phir(self.Tc/T, deltaG)
             Jl = deltaL*(1+deltaL*liquidofird)
             Jv = deltaG*(1+deltaG*vaporfird)
             Kl = deltaL*liquidofird+liquidofir+log(deltaL)
@@ -3317,7 +4270,7 @@ class MEoS(ThermoAdvanced):
             fir = _PR_phir(tau, delta, **kw)
 
         elif self._constants["__type__"] == "Helmholtz":
-            fir = _Helmholtz_phir(tau, delta, self._constants)
+            fir = _Helmholtz_phir(tau, delta, self._terms)
 
         elif self._constants["__type__"] == "MBWR":
             T = self.Tc/tau
@@ -3353,7 +4306,7 @@ class MEoS(ThermoAdvanced):
             fir = _PR_phird(tau, delta, **kw)
 
         elif self._constants["__type__"] == "Helmholtz":
-            fir = _Helmholtz_phird(tau, delta, self._constants)
+            fir = _Helmholtz_phird(tau, delta, self._terms)
 
         elif self._constants["__type__"] == "MBWR":
             T = self.Tc/tau
@@ -3389,7 +4342,7 @@ class MEoS(ThermoAdvanced):
             fir = _PR_phirt(tau, delta, **kw)
 
         elif self._constants["__type__"] == "Helmholtz":
-            fir = _Helmholtz_phirt(tau, delta, self._constants)
+            fir = _Helmholtz_phirt(tau, delta, self._terms)
 
         elif self._constants["__type__"] == "MBWR":
             T = self.Tc/tau
@@ -3515,8 +4468,8 @@ class MEoS(ThermoAdvanced):
         name = "%s-%s" % (self.__class__.__name__, self._code)
         if ref == "CUSTOM":
             if refvalues is None:
-                refvalues = [298.15, 101325., 0., 0.]
-            ref = "CUSTOM-%s-%s-%s-%s" % refvalues
+                refvalues = (298.15, 101325., 0., 0.)
+            ref = "CUSTOM-%s-%s-%s-%s" % tuple(refvalues)
 
         # Skip reference state checking to avoid recursion
         if ref is False:
@@ -3524,20 +4477,14 @@ class MEoS(ThermoAdvanced):
             self.soffset = 0
             return
 
-        filename = conf_dir+"MEoSref.json"
-        if os.path.isfile(filename):
-            with open(filename, "r") as archivo:
-                dat = json.load(archivo)
-        else:
-            dat = {}
+        offset = _refOffsets.get(name, ref)
+        if offset is None:
+            # Check the offsets saved meanwhile by other processes
+            offset = _refOffsets.get(name, ref, reload=True)
 
-        if name in dat and ref in dat[name]:
-            self.hoffset = dat[name][ref]["h"]
-            self.soffset = dat[name][ref]["s"]
+        if offset is not None:
+            self.hoffset, self.soffset = offset
         else:
-            if name not in dat:
-                dat[name] = {}
-
             kw = {"ref": False}
             kw["eq"] = self.kwargs["eq"]
             kw["visco"] = self.kwargs["visco"]
@@ -3563,18 +4510,13 @@ class MEoS(ThermoAdvanced):
                 self.hoffset = st.h.kJkg
                 self.soffset = st.s.kJkgK
             elif ref[:6] == "CUSTOM":
-                # First check if the custum state is in database
-                code = "%s-%s-%s-%s" % refvalues
-                if code not in dat[name]:
-                    T = refvalues[0]
-                    P = refvalues[1]*1e3
-                    st = self.__class__(T=T, P=P, **kw)
-                    self.hoffset = st.h.kJkg
-                    self.soffset = st.s.kJkgK
-
-            dat[name][ref] = {"h": self.hoffset, "s": self.soffset}
-            with open(filename, "w") as archivo:
-                json.dump(dat, archivo)
+                T = refvalues[0]
+                P = refvalues[1]*1e3
+                st = self.__class__(T=T, P=P, **kw)
+                self.hoffset = st.h.kJkg
+                self.soffset = st.s.kJkgK
+
+            _refOffsets.set(name, ref, self.hoffset, self.soffset)
 
     def _prop0(self, rho, T):
         """Ideal gas properties"""
@@ -6881,6 +7823,11 @@ class MEoSBlend(MEoS):
         Pv = unidades.Pressure((dew+bubble)/2)
         return Pv
 
+    def _satTable(self, build=True):
+        """The phase equilibrium of blend isn't a pure fluid saturation, so
+        saturation table isn't available"""
+        return None
+
 
 data = MEoS.properties()
 propiedades = [p[0] for p in data]
@@ -0,0 +1,469 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+
+'''Pychemqt, Chemical Engineering Process simulator
+Copyright (C) 2009-2025, Juan José Gómez Romera <jjgomera@gmail.com>
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+
+Pipe network calculation, distribution headers, loops and branches of pipes
+solved simultaneously.
+
+The pipes are defined with the same material and fittings lists that
+:class:`equipment.pipe.Pipe`, so they can be get from the pipe database:
+
+    * :func:`material`: Pipe material list from pipe database catalog
+    * :func:`fitting`: Fitting list from pipe database with its K value
+    * :class:`PipeNetwork`: Network definition and solver
+
+API reference
+-------------
+
+'''
+
+
+from math import log as ln
+import os
+
+from numpy import (abs as np_abs, arange, array, concatenate, full, log,
+                   ones, pi, unique, where, zeros)
+from scipy.constants import g
+from scipy.sparse import csr_matrix
+from scipy.sparse.linalg import spsolve
+
+from lib import unidades
+from lib.friction import f_list
+from lib.pipeDatabase import CATALOG, FITTING, FITTING_DESC
+from lib.utilities import refDoc
+
+
+__doi__ = {
+    1:
+        {"autor": "Todini, E., Pilati, S.",
+         "title": "A gradient algorithm for the analysis of pipe networks",
+         "ref": "Computer Applications in Water Supply, Vol. 1, 1-20, "
+                "Research Studies Press, 1988",
+         "doi": ""},
+    2:
+        {"autor": "Darby, R., Chhabra, R.P.",
+         "title": "Chemical Engineering Fluid Mechanics, 3rd Edition",
+         "ref": "CRC Press, 2017",
+         "doi": ""},
+}
+
+
+def material(name, clase, size):
+    """Return the material list of a pipe from pipe database, with the
+    format used in :class:`equipment.pipe.Pipe`
+
+    Parameters
+    ----------
+    name : str
+        Material name, as "Steel (ANSI)"
+    clase : str
+        Material class, as "Sch.  40"
+    size : str
+        Nominal diameter, as '2"'
+
+    Returns
+    -------
+    material : list
+        Name, class, roughness [mm], nominal diameter, Dn [mm], thickness
+        [mm], external diameter [mm], weight [kg/m], volume [m³/100m],
+        external surface [m²/100m]
+
+    Examples
+    --------
+    >>> material("Cast Iron", "Class A", '6"')[:7]
+    ['Cast Iron', 'Class A', 0.3999992, '6"', 150.0, 11.176, 175.26]
+    """
+    for row in CATALOG:
+        if row[1:3] == (name, clase) and row[5] == size:
+            break
+    else:
+        raise ValueError("%s %s %s not found in pipe database" % (
+            name, clase, size))
+
+    rough, Dn, size, w, De, weight = row[3:]
+    Di = (De-2*w)/1000
+    volume = pi/4*Di**2*100
+    area = pi*De/1000*100
+    return [name, clase, rough, size, Dn, w, De, weight, volume, area]
+
+
+def fitting(key, size, count=1):
+    """Return a fitting list from pipe database, with the format used in
+    :class:`equipment.pipe.Pipe`
+
+    Parameters
+    ----------
+    key : str
+        Fitting type key, as "SB" for standard bend, see
+        :data:`lib.pipeDatabase.FITTING_DESC`
+    size : str
+        Nominal diameter, as '2"'
+    count : int
+        Number of fittings
+
+    Returns
+    -------
+    fitting : list
+        Index of type, index of size, K, count, type, diameter [mm], nominal
+        diameter, description
+
+    Examples
+    --------
+    >>> fitting("SB", '60"')[2:5]
+    [0.36, 1, 'SB']
+    """
+    keys = []
+    for row in FITTING:
+        if row[2] not in keys:
+            keys.append(row[2])
+        if row[2] == key and row[3] == size:
+            break
+    else:
+        raise ValueError("%s %s not found in pipe database" % (key, size))
+
+    i, D, key, size, K = row
+    sizes = [fit[3] for fit in FITTING if fit[2] == key]
+    return [keys.index(key), sizes.index(size), K, count, key, D, size,
+            FITTING_DESC[key]]
+
+
+def _colebrook_dlnf(Re, eD, f):
+    """Analytic derivative of ln(f) respect to ln(Re) for the Colebrook
+    equation, by implicit differentiation in x=1/√f"""
+    x = 1/f**0.5
+    A = eD/3.7
+    B = where(eD == 0, 1/Re, 2.51/Re)
+    c = 2/ln(10)*B/(A+B*x)
+    return -2*c/(1+c)
+
+
+class PipeNetwork():
+    """Network of pipes with fixed pressure nodes, inlet and outlet of the
+    network, and nodes with a flow demand. The flows of all pipes and the
+    pressure of free nodes are solved simultaneously with the gradient
+    method of Todini-Pilati, the Newton-Raphson iteration over the node and
+    pipes equations with an analytic jacobian, solving in each iteration a
+    sparse linear system with only the node pressures as unknown.
+
+    Parameters
+    ----------
+    fluid : Corriente or function
+        Stream with the fluid, only used its composition and temperature,
+        the network is isothermal. Can be too a function returning the
+        density [kg/m³] and viscosity [Pa·s] of fluid at a pressure [Pa]
+    method : int
+        Index of friction factor correlation for turbulent flow, see
+        :func:`lib.friction.f_friccion`
+    tolP : float
+        Relative width of pressure levels where the fluid properties are
+        calculated, the pipes with a mean pressure in the same level use the
+        same properties
+
+    Notes
+    -----
+    The fluid properties are calculated only once for each pressure level,
+    not for each pipe in each iteration, and are updated between
+    iterations, so the jacobian don't include its dependence with pressure.
+    For gases the density is calculated at the mean pressure of each pipe,
+    valid for pressure drops small compared with pressure.
+
+    Examples
+    --------
+    Water loop with a header feeding two consumers:
+
+    >>> net = PipeNetwork(lambda P: (997, 8.9e-4))
+    >>> pipe = material("Steel (ANSI)", "Sch.  40", '2"')
+    >>> net.addNode("in", P=3e5)
+    >>> net.addNode("a")
+    >>> net.addNode("b", caudalmasico=2)
+    >>> net.addNode("c", caudalmasico=1, z=5)
+    >>> net.addPipe("1", "in", "a", l=50, material=pipe)
+    >>> net.addPipe("2", "a", "b", l=100, material=pipe)
+    >>> net.addPipe("3", "a", "c", l=80, material=pipe)
+    >>> net.addPipe("4", "b", "c", l=60, material=pipe,
+    ...             accesorios=[fitting("SB", '2"', 2)])
+    >>> net.solve()
+    >>> print("%0.4f %0.4f" % (net.caudalmasico["2"], net.caudalmasico["4"]))
+    1.4543 -0.5457
+    >>> print("%0.0f %0.0f" % (net.P["b"], net.P["c"]))
+    269045 221268
+
+    A demand too high for the pressure of inlet isn't converged:
+
+    >>> net = PipeNetwork(lambda P: (997, 8.9e-4))
+    >>> net.addNode("in", P=2e5)
+    >>> net.addNode("out", caudalmasico=30)
+    >>> net.addPipe("1", "in", "out", l=500, material=pipe)
+    >>> net.solve()
+    >>> net.converged, net.msg
+    (False, 'Negative pressure in nodes out, the demand is infeasible')
+    """
+
+    def __init__(self, fluid, method=0, tolP=0.01):
+        self.fluid = fluid
+        self.method = method
+        self.tolP = tolP
+
+        self.nodes = {}
+        self.pipes = {}
+        self._properties = {}
+
+        self.P = {}
+        self.caudalmasico = {}
+        self.V = {}
+        self.Re = {}
+        self.f = {}
+        self.DeltaP = {}
+        self.converged = False
+        self.iterations = 0
+        self.msg = ""
+
+    def addNode(self, name, P=None, caudalmasico=0, z=0):
+        """Add a node to network
+
+        Parameters
+        ----------
+        name : str
+            Name of node
+        P : float, optional
+            Fixed pressure of node, [Pa]
+        caudalmasico : float, optional
+            Mass flow leaving the network in node, negative for inputs,
+            [kg/s]
+        z : float, optional
+            Elevation of node, [m]
+        """
+        self.nodes[name] = {"P": P, "caudalmasico": caudalmasico, "z": z}
+
+    def addPipe(self, name, inlet, outlet, l, material, accesorios=(), K=0):
+        """Add a pipe to network, the positive flow is from inlet to outlet
+
+        Parameters
+        ----------
+        name : str
+            Name of pipe
+        inlet : str
+            Name of inlet node
+        outlet : str
+            Name of outlet node
+        l : float
+            Length of pipe, [m]
+        material : list
+            Material list of pipe, see :func:`material`
+        accesorios : list, optional
+            List of fittings, see :func:`fitting`
+        K : float, optional
+            Additional fittings total coefficient, [-]
+        """
+        for node in (inlet, outlet):
+            if node not in self.nodes:
+                raise ValueError("Undefined node %s" % node)
+
+        for accesorio in accesorios:
+            K += accesorio[2]*accesorio[3]
+
+        De = material[6]/1000
+        w = material[5]/1000
+        Di = De-2*w
+        self.pipes[name] = {
+            "inlet": inlet, "outlet": outlet, "l": l, "Di": Di,
+            "eD": material[2]/1000/Di, "K": K}
+
+    def properties(self, P):
+        """Return the density and viscosity of fluid at a pressure, evaluated
+        once for each pressure level"""
+        level = round(ln(P)/ln(1+self.tolP))
+        if level not in self._properties:
+            P = (1+self.tolP)**level
+            if hasattr(self.fluid, "clone"):
+                stream = self.fluid.clone(P=P)
+                if stream.x == 0:
+                    phase = stream.Liquido
+                else:
+                    phase = stream.Gas
+                self._properties[level] = (phase.rho, phase.mu)
+            else:
+                self._properties[level] = self.fluid(P)
+        return self._properties[level]
+
+    def _headloss(self, m, rho, mu):
+        """Pressure drop in pipes and its derivative respect to mass flow"""
+        Di, L, eD, K = self._Di, self._L, self._eD, self._K
+        A = pi/4*Di**2
+        am = np_abs(m)
+        Re = am*Di/A/mu
+        laminar = Re < 2100
+
+        # Laminar flow, Hagen-Poiseuille, linear in mass flow
+        c_lam = 32*mu*L/rho/A/Di**2
+
+        # Turbulent flow, Darcy-Weisbach
+        Ret = where(Re < 4000, 4000, Re)
+        f = f_list[self.method](Ret, eD)
+        if self.method == 0:
+            dlnf = _colebrook_dlnf(Ret, eD, f)
+        else:
+            dlnf = (log(f_list[self.method](Ret*1.001, eD)) -
+                    log(f_list[self.method](Ret/1.001, eD)))/2/log(1.001)
+
+        # Transition region interpolated linearly between laminar and
+        # turbulent values to avoid the discontinuity in pressure drop, else
+        # the newton iteration can cycle when a pipe is near the transition
+        transition = ~laminar & (Re < 4000)
+        slope = (f-64/2100)/1900
+        f = where(transition, 64/2100+slope*(Re-2100), f)
+        dlnf = where(transition, Re*slope/f, dlnf)
+        c_turb = f*L/Di*am/2/rho/A**2
+
+        c_fit = K*am/2/rho/A**2
+        c = where(laminar, c_lam, c_turb) + c_fit
+        dc = where(laminar, c_lam, c_turb*(2+dlnf)) + 2*c_fit
+
+        f = where(laminar, 64/where(laminar, Re, 1), f)
+        return c*m, dc, Re, f
+
+    @refDoc(__doi__, [1, 2])
+    def solve(self, tol=1e-8, maxiter=50):
+        """Solve the network, the results are saved as dict by name of node
+        or pipe in attributes P, caudalmasico, V, Re, f and DeltaP. The
+        convergence status is saved in converged attribute, with the reason
+        of failure in msg, i.e. a demand too high for the pressure of fixed
+        nodes, with negative pressure in free nodes
+
+        Parameters
+        ----------
+        tol : float
+            Tolerance in mass flow relative to the maximum flow
+        maxiter : int
+            Maximum number of iterations
+        """
+        nodes = list(self.nodes)
+        index = {node: i for i, node in enumerate(nodes)}
+        pipes = list(self.pipes)
+        n = len(nodes)
+        npipe = len(pipes)
+
+        fixed = array([self.nodes[nd]["P"] is not None for nd in nodes])
+        if not fixed.any():
+            raise ValueError("Network without fixed pressure nodes")
+        free = ~fixed
+
+        a = array([index[self.pipes[p]["inlet"]] for p in pipes], dtype=int)
+        b = array([index[self.pipes[p]["outlet"]] for p in pipes], dtype=int)
+        self._Di = array([self.pipes[p]["Di"] for p in pipes])
+        self._L = array([self.pipes[p]["l"] for p in pipes], dtype=float)
+        self._eD = array([self.pipes[p]["eD"] for p in pipes])
+        self._K = array([self.pipes[p]["K"] for p in pipes], dtype=float)
+        z = array([self.nodes[nd]["z"] for nd in nodes], dtype=float)
+        demand = array([self.nodes[nd]["caudalmasico"] for nd in nodes],
+                       dtype=float)
+
+        # Incidence matrix, the pipe leave the inlet node and enter the outlet
+        # node, only the rows of free nodes are necessary
+        cols = arange(npipe)
+        Ainc = csr_matrix(
+            (concatenate((-ones(npipe), ones(npipe))),
+             (concatenate((a, b)), concatenate((cols, cols)))),
+            shape=(n, npipe))
+        Af = Ainc[free]
+        Ax = Ainc[fixed]
+
+        # Initial pressure in free nodes, the mean of fixed pressures
+        P = zeros(n)
+        P[fixed] = [self.nodes[nd]["P"] for nd, fix in zip(nodes, fixed)
+                    if fix]
+        P[free] = P[fixed].mean()
+        m = full(npipe, 1e-3)
+
+        # Scale of convergence criteria
+        scale = max(np_abs(demand).sum(), 1e-3)
+
+        self.converged = False
+        self.msg = ""
+        for self.iterations in range(1, maxiter+1):
+            # Fluid properties at the mean pressure of pipes
+            Pm = (P[a]+P[b])/2
+            levels, inverse = unique(Pm.round(-1), return_inverse=True)
+            props = array([self.properties(Pi) for Pi in levels])
+            rho = props[inverse, 0]
+            mu = props[inverse, 1]
+
+            h, D, Re, f = self._headloss(m, rho, mu)
+            G = rho*g*(z[a]-z[b])
+
+            # Flows as function of pressures in the linearized pipe
+            # equations, m = m + (Pa - Pb + G - h)/D, substituted in the mass
+            # balance of free nodes give the symmetric system in pressures
+            Dinv = 1/D
+            M = Af.multiply(Dinv).tocsr() @ Af.T
+            rhs = Af @ m - demand[free] + Af @ (Dinv*(G-h-Ax.T @ P[fixed]))
+            P[free] = spsolve(M.tocsc(), rhs)
+
+            # The pressure in fixed nodes can't supply the demand
+            if (P[free] <= 0).any():
+                self.msg = "Negative pressure in nodes %s, the demand is " \
+                    "infeasible" % ", ".join(
+                        nd for nd, Pi in zip(nodes, P) if Pi <= 0)
+                break
+
+            dm = Dinv*(P[a]-P[b]+G-h)
+            m = m + dm
+
+            imbalance = np_abs(Af @ m - demand[free]).max(initial=0)
+            if np_abs(dm).max() < tol*scale and imbalance < tol*scale:
+                self.converged = True
+                break
+        else:
+            self.msg = "Maximum number of iterations reached"
+
+        h, D, Re, f = self._headloss(m, rho, mu)
+        A = pi/4*self._Di**2
+        self.P = {nd: unidades.Pressure(Pi) for nd, Pi in zip(nodes, P)}
+        for i, p in enumerate(pipes):
+            self.caudalmasico[p] = unidades.MassFlow(m[i])
+            self.V[p] = unidades.Speed(m[i]/rho[i]/A[i])
+            self.Re[p] = unidades.Dimensionless(Re[i])
+            self.f[p] = unidades.Dimensionless(f[i])
+            self.DeltaP[p] = unidades.DeltaP(P[a[i]]-P[b[i]])
+
+    def balance(self):
+        """Return the mass balance error in each free pressure node, [kg/s]"""
+        error = {nd: -node["caudalmasico"] for nd, node in self.nodes.items()
+                 if node["P"] is None}
+        for p, pipe in self.pipes.items():
+            if pipe["inlet"] in error:
+                error[pipe["inlet"]] -= self.caudalmasico[p]
+            if pipe["outlet"] in error:
+                error[pipe["outlet"]] += self.caudalmasico[p]
+        return error
+
+    def __repr__(self):
+        return "%s: %i nodes, %i pipes" % (
+            self.__class__.__name__, len(self.nodes), len(self.pipes))
+
+    def txt(self):
+        """Text summary of results"""
+        lines = []
+        for nd in self.nodes:
+            lines.append("%-12s P: %s" % (nd, self.P[nd].str))
+        for p in self.pipes:
+            lines.append("%-12s m: %s  V: %s  ΔP: %s" % (
+                p, self.caudalmasico[p].str, self.V[p].str,
+                self.DeltaP[p].str))
+        return os.linesep.join(lines)
@@ -22,20 +22,175 @@ along with this program.  If not, see <http://www.gnu.org/licenses/>.'''
 # Module for project definition (pfd of equipment, configuration and many more)
 ###############################################################################
 
-import os
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
 from configparser import ConfigParser
+import logging
+import multiprocessing
+import os
+from time import perf_counter
+from unittest import TestCase
 
-# from pygraph.classes.graph import graph
-# from pygraph.algorithms.cycles import find_cycle
-# try:
-   # from pygraph.readwrite.dot import write
-# except:
-   # from pygraph.readwrite.markup import write
+from numpy import abs as np_abs
+from numpy import array, concatenate, dot, eye, maximum, outer, where
 
 from lib.config import conf_dir, currentConfig
 from lib.corriente import Corriente
 from equipment import equipments
-from equipment.flux import Mixer
+from equipment.flux import Divider, Mixer, Valve
+from equipment.heatExchanger import Heat_Exchanger
+
+
+def strongComponents(nodes, edges):
+    """Strongly connected components of a directed graph with the Tarjan
+    algorithm
+
+    Parameters
+    ----------
+    nodes : list
+        List of nodes of graph
+    edges : dict
+        Dict with the list of successors of each node
+
+    Returns
+    -------
+    components : list
+        List of strongly connected components, as list of nodes, in
+        topological order
+
+    Examples
+    --------
+    >>> edges = {1: [2], 2: [3], 3: [2, 4], 4: []}
+    >>> strongComponents([1, 2, 3, 4], edges)
+    [[1], [2, 3], [4]]
+    """
+    index = {}
+    low = {}
+    stack = []
+    onStack = set()
+    components = []
+
+    def connect(node):
+        index[node] = low[node] = len(index)
+        stack.append(node)
+        onStack.add(node)
+        for succ in edges.get(node, []):
+            if succ not in index:
+                connect(succ)
+                low[node] = min(low[node], low[succ])
+            elif succ in onStack:
+                low[node] = min(low[node], index[succ])
+
+        if low[node] == index[node]:
+            component = []
+            while True:
+                succ = stack.pop()
+                onStack.discard(succ)
+                component.append(succ)
+                if succ == node:
+                    break
+            components.append(sorted(component, key=nodes.index))
+
+    for node in nodes:
+        if node not in index:
+            connect(node)
+
+    # Tarjan algorithm return the components in reverse topological order
+    return components[::-1]
+
+
+def _pool(workers):
+    """Pool of worker process to calculate equipment, None if the platform
+    don't support fork. The workers are forked to have available the
+    equipment classes and the configuration loaded without imports"""
+    if "fork" not in multiprocessing.get_all_start_methods():
+        return None
+    context = multiprocessing.get_context("fork")
+    return ProcessPoolExecutor(workers, context)
+
+
+def _calculateEquipment(obj, kwargs):
+    """Calculate an equipment in a worker process, the equipment instance is
+    returned with its output streams"""
+    obj(**kwargs)
+    return obj
+
+
+class Wegstein(object):
+    """Wegstein acceleration of successive substitution x = g(x), applied
+    independently to each variable, with the acceleration factor q bounded
+    to [qmin, qmax] to avoid divergence
+
+    Examples
+    --------
+    >>> from numpy import array
+    >>> g = lambda x: 0.5*x + 1
+    >>> accel = Wegstein()
+    >>> x = array([0.])
+    >>> for i in range(3):
+    ...     x = accel(x, g(x))
+    >>> "%0.6f" % x[0]
+    '2.000000'
+    """
+
+    def __init__(self, qmin=-5, qmax=0):
+        self.qmin = qmin
+        self.qmax = qmax
+        self.x = None
+        self.g = None
+
+    def __call__(self, x, g):
+        """Return the next estimation from the last value x and g(x)"""
+        if self.x is None:
+            xn = g
+        else:
+            dx = x-self.x
+            dg = g-self.g
+            s = where(dx != 0, dg/where(dx != 0, dx, 1), 0)
+            q = where(s != 1, s/where(s != 1, s-1, 1), self.qmin)
+            q = q.clip(self.qmin, self.qmax)
+            xn = q*x + (1-q)*g
+        self.x = x
+        self.g = g
+        return xn
+
+
+class Broyden(object):
+    """Broyden quasi-Newton method for the residual F(x) = g(x) - x, with
+    update of the inverse jacobian. The first step is a successive
+    substitution
+
+    Examples
+    --------
+    >>> from numpy import array
+    >>> g = lambda x: array([0.5*x[1] + 1, 0.2*x[0] + 2])
+    >>> accel = Broyden()
+    >>> x = array([0., 0.])
+    >>> for i in range(6):
+    ...     x = accel(x, g(x))
+    >>> "%0.6f %0.6f" % tuple(x)
+    '2.222222 2.444444'
+    """
+
+    def __init__(self):
+        self.H = None
+        self.x = None
+        self.F = None
+
+    def __call__(self, x, g):
+        """Return the next estimation from the last value x and g(x)"""
+        F = g-x
+        if self.H is None:
+            self.H = -eye(len(x))
+        else:
+            dx = x-self.x
+            dF = F-self.F
+            HdF = dot(self.H, dF)
+            den = dot(dx, HdF)
+            if den:
+                self.H += outer(dx-HdF, dot(dx, self.H))/den
+        self.x = x
+        self.F = F
+        return x-dot(self.H, F)
 
 
 class Project(object):
@@ -58,12 +213,14 @@ class Project(object):
             config.read(conf_dir+"pychemqtrc")
         self.config = config
         self.streams = streams
-        # self.graph = self.calGraph()
+        self.report = {}
+
+        # Memo of equipment calculated, with the instance and its input
+        # fingerprint, and counters of calculation for all the session
+        self._memo = {}
+        self.counters = {"hits": 0, "skips": 0, "recomputes": 0}
 
         self.downToStream = {}
-#        import gv
-#        for item in items:
-#           print gv.tailof(item)
 
     def __bool__(self):
         return True
@@ -76,14 +233,6 @@ class Project(object):
     def streamCount(self):
         return len(self.streams)
 
-    # def calGraph(self):
-        # grafo = graph()
-        # for item in self.items:
-            # grafo.add_node(item, attrs=[("splines",  "")])
-        # for key, stream in self.streams.items():
-            # grafo.add_edge((stream[0], stream[1]), attrs=[("splines",  "")])
-        # return grafo
-
     def getObject(self, id):
         """Return object of project, id define the object to return, i1 for
         first input stream, o3 for third stream output, e2 for the second
@@ -114,7 +263,6 @@ class Project(object):
     def addItem(self, id, obj):
         if id not in self.items:
             self.items[id] = obj
-            # self.graph.add_node(id)
 
     def setItem(self, id, obj):
         self.items["e%i" % id] = obj
@@ -155,7 +303,6 @@ class Project(object):
         stream = (up, down, ind_up, ind_down, obj)
         if id not in list(self.streams.keys()):
             self.streams[id] = stream
-            # self.graph.add_edge((up, down))
 
         if down[0] == "e":
             eq = self.items[down]
@@ -188,37 +335,479 @@ class Project(object):
         return lista
 
     def run(self, idx):
-        """Run project starting for the item set with idx and recursively"""
-        tipo = idx[0]
-        ind = int(idx[1])
-
-        if tipo == "i":
-            obj = self.getInput(ind)
-            if obj.status:
-                key, (up, down, ind_up, ind_down, oldobj) = self.getDownToEquip(idx)[0]
-                self.setStream(key, obj)
-                self.run("s%i" % key)
-
-        elif tipo == "e":
-            obj = self.getItem(ind)
-            if obj.status:
-                for key, (up, down, ind_up, ind_down, oldobj) in self.getDownToEquip(idx):
-                    self.setStream(key, obj.salida[ind_up])
-                    self.run("s%i" % key)
-
-        elif tipo == "s":
-            up, down, ind_up, ind_down, stream = self.streams[ind]
-            if stream.status:
-                if down[0] == "e":
-                    equip = self.items[down]
-                    if isinstance(equip, Mixer):
-                        kwargs = {"entrada": stream, "id_entrada": ind_down}
-                    else:
-                        kwargs = {equip.kwargsInput[ind_down]: stream}
-                    equip(**kwargs)
-                    self.run(down)
-                elif down[0] == "o":
-                    self.setOutput(int(down[1]), stream)
+        """Run project starting for the item set with idx, calculating only
+        the items downstream of it, see :meth:`solve`"""
+        return self.solve(idx)
+
+    def calGraph(self):
+        """Return the directed graph of flowsheet, a dict with the list of
+        (downstream item, stream id) tuples of each item"""
+        graph = {item: [] for item in self.items}
+        for key, (up, down, ind_up, ind_down, obj) in \
+                sorted(self.streams.items()):
+            graph.setdefault(up, []).append((down, key))
+            graph.setdefault(down, [])
+        return graph
+
+    def sequence(self, start=None):
+        """Calculation sequence of flowsheet. The items are grouped in
+        strongly connected components in topological order, each recycle
+        loop is a component with more than one item, and the recycles are
+        broken with tear streams, the back edges found in a depth first search
+        from the items fed from outside the loop.
+
+        Parameters
+        ----------
+        start : str, optional
+            Id of object, item or stream, changed. Only the components with
+            items downstream of it are returned
+
+        Returns
+        -------
+        sequence : list
+            List of (items, tears) tuples, with the items of component in
+            calculation order and the list of id of tear streams, empty for
+            components without recycle
+        """
+        graph = self.calGraph()
+        nodes = list(graph)
+        edges = {node: [down for down, key in graph[node]] for node in nodes}
+        inputs = {node: [] for node in nodes}
+        for node in nodes:
+            for down, key in graph[node]:
+                inputs[down].append((node, key))
+
+        # Items downstream of the start object
+        reachable = None
+        if start is not None:
+            if start[0] == "s":
+                start = self.streams[int(start[1:])][1]
+            reachable = set()
+            pending = [start]
+            while pending:
+                node = pending.pop()
+                if node not in reachable:
+                    reachable.add(node)
+                    pending.extend(edges[node])
+
+        sequence = []
+        for component in strongComponents(nodes, edges):
+            if reachable is not None and reachable.isdisjoint(component):
+                continue
+
+            members = set(component)
+            tears = []
+            visited = set()
+            active = set()
+
+            def visit(node):
+                visited.add(node)
+                active.add(node)
+                for down, key in graph[node]:
+                    if down not in members:
+                        continue
+                    if down in active:
+                        tears.append(key)
+                    elif down not in visited:
+                        visit(down)
+                active.discard(node)
+
+            # Search first from the items with input streams from outside
+            entries = [node for node in component if any(
+                up not in members for up, key in inputs[node])]
+            for node in entries+component:
+                if node not in visited:
+                    visit(node)
+
+            # Topological order of items with the tear streams removed
+            indegree = {node: 0 for node in component}
+            for node in component:
+                for down, key in graph[node]:
+                    if down in members and key not in tears:
+                        indegree[down] += 1
+            ready = [node for node in component if not indegree[node]]
+            order = []
+            while ready:
+                node = ready.pop(0)
+                order.append(node)
+                for down, key in graph[node]:
+                    if down in members and key not in tears:
+                        indegree[down] -= 1
+                        if not indegree[down]:
+                            ready.append(down)
+
+            sequence.append((order, sorted(tears)))
+        return sequence
+
+    def cycle(self):
+        """Return the items of the first recycle loop of project, None if
+        there isn't any recycle"""
+        for items, tears in self.sequence():
+            if tears:
+                return items
+        return None
+
+    def hasCycle(self):
+        """Detect cycle in project"""
+        return self.cycle() is not None
+
+    def solve(self, start=None, method="wegstein", tol=1e-6, maxiter=50,
+              workers=None):
+        """Sequential modular solution of flowsheet. Each item is calculated
+        once in topological order, and the recycle loops are converged
+        iterating over its tear streams, with the molar flow of components,
+        temperature and pressure as variables.
+
+        The calculation is incremental, the items without any changed input
+        stream are skipped, and the equipment whose input fingerprint, its
+        kwargs and the state of input streams, is the same than in the last
+        calculation are not calculated again, so the propagation stop as
+        soon as an outlet stream is unchanged.
+
+        With workers the equipment of independent branches of flowsheet are
+        calculated in parallel in a pool of process, each one as soon as its
+        input streams are calculated. The recycle loops, the equipment with
+        inputs unchanged and the input and output items are calculated in
+        the main process. The results are merged in the order of calculation
+        sequence so they are the same than in serial mode. The data
+        interchange between process has a cost, so it's only useful with
+        equipment with expensive calculations.
+
+        Parameters
+        ----------
+        start : str, optional
+            Id of object changed, only the items downstream are calculated,
+            default calculate all the flowsheet
+        method : str, optional
+            Acceleration method of recycle convergence, wegstein, broyden or
+            substitution, the successive substitution without acceleration
+        tol : float, optional
+            Tolerance in relative change of tear stream variables
+        maxiter : int, optional
+            Maximum number of iterations of recycle loops
+        workers : int, optional
+            Number of worker process, default calculate in serial mode
+
+        Returns
+        -------
+        report : dict
+            Report of calculation, saved too as report attribute, with keys:
+
+                * sequence: calculation sequence, see :meth:`sequence`
+                * iterations: list of dict with tears, iteration, residual
+                  and time of each iteration of recycle loops
+                * converged: boolean with the convergence status
+                * stats: dict with the count of hits, equipment with inputs
+                  unchanged, skips, items without changed inputs, and
+                  recomputes, equipment calculated. The accumulated values of
+                  all calculations are in counters attribute
+                * time: total calculation time, [s]
+        """
+        t0 = perf_counter()
+        report = {"sequence": self.sequence(start),
+                  "iterations": [],
+                  "converged": True,
+                  "stats": {"hits": 0, "skips": 0, "recomputes": 0}}
+        self.report = report
+        failed = set()
+
+        # Streams changed in calculation, None to check all items, and the
+        # item changed by user, always calculated
+        changed = None
+        forced = None
+        if start is not None:
+            changed = set()
+            if start[0] == "s":
+                changed.add(int(start[1:]))
+            else:
+                forced = start
+
+        if workers is not None and workers > 1:
+            pool = _pool(workers)
+        else:
+            pool = None
+
+        if pool is None:
+            for items, tears in report["sequence"]:
+                if tears:
+                    self._solveLoop(items, tears, failed, changed, forced,
+                                    method, tol, maxiter)
+                else:
+                    for item in items:
+                        force = changed is None or item == forced
+                        self._calculate(item, failed, changed, force)
+        else:
+            with pool:
+                self._solveParallel(pool, failed, changed, forced, method,
+                                    tol, maxiter)
+
+        report["time"] = perf_counter()-t0
+        self.report = report
+        return report
+
+    def _solveParallel(self, pool, failed, changed, forced, *args):
+        """Calculate the calculation sequence of :meth:`solve` dispatching
+        the equipment ready to calculate to pool"""
+        sequence = self.report["sequence"]
+
+        # Components of sequence with streams to each component
+        owner = {item: n for n, (items, tears) in enumerate(sequence)
+                 for item in items}
+        depends = [set() for component in sequence]
+        for up, down, ind_up, ind_down, obj in self.streams.values():
+            if up in owner and down in owner and owner[up] != owner[down]:
+                depends[owner[down]].add(owner[up])
+
+        pending = list(range(len(sequence)))
+        done = set()
+        running = {}
+        while pending or running:
+            # Since sequence is in topological order, the components are
+            # ready in a single pass as soon as its dependencies are done
+            for n in pending[:]:
+                if not depends[n] <= done:
+                    continue
+                pending.remove(n)
+                items, tears = sequence[n]
+                if tears:
+                    self._solveLoop(items, tears, failed, changed, forced,
+                                    *args)
+                else:
+                    item = items[0]
+                    force = changed is None or item == forced
+                    kwargs = self._prepare(item, failed, changed, force)
+                    if kwargs is not None:
+                        future = pool.submit(
+                            _calculateEquipment, self.items[item], kwargs)
+                        running[future] = n
+                        continue
+                done.add(n)
+
+            if running:
+                finished, unfinished = wait(
+                    running, return_when=FIRST_COMPLETED)
+                for future in sorted(finished, key=running.get):
+                    n = running.pop(future)
+                    self._finish(sequence[n][0][0], failed, changed,
+                                 future.result())
+                    done.add(n)
+
+    def _solveLoop(self, items, tears, failed, changed, forced, method,
+                   tol, maxiter):
+        """Converge a recycle loop of :meth:`solve`"""
+        # Input and output streams of recycle loop
+        inputs = [key for key, (up, down, ind_up, ind_down, obj) in
+                  self.streams.items() if down in items]
+        outputs = {key: obj.fingerprint() for key, (
+            up, down, ind_up, ind_down, obj) in self.streams.items()
+            if up in items and down not in items}
+        if changed is not None and forced not in items and \
+                changed.isdisjoint(inputs):
+            self._count("skips", len(items))
+            return
+
+        if method == "broyden":
+            accel = Broyden()
+        elif method == "substitution":
+            accel = Wegstein(qmin=0, qmax=0)
+        else:
+            accel = Wegstein()
+        x = self._tearGuess(items, tears)
+        if x is None:
+            logging.warning(
+                "Recycle %s without initial estimation" % tears)
+            self.report["converged"] = False
+            failed.update(items)
+            return
+
+        # Scale of variables, with a lower bound for trace components
+        flows = x[self._tearIndex(tears)].sum()
+        scale = maximum(np_abs(x), 1e-6*flows+1e-12)
+
+        converged = False
+        for iteration in range(1, maxiter+1):
+            t = perf_counter()
+            self._setTears(tears, x)
+            loop = set(failed)
+            for item in items:
+                self._calculate(item, loop)
+            if loop.difference(failed):
+                break
+
+            g = concatenate([self._streamVector(self.getStream(key))
+                             for key in tears])
+            residual = (np_abs(g-x)/scale).max()
+            self.report["iterations"].append({
+                "tears": tears,
+                "iteration": iteration,
+                "residual": residual,
+                "time": perf_counter()-t})
+            logging.info("Recycle %s, iteration %i, residual %g" % (
+                tears, iteration, residual))
+            if residual < tol:
+                converged = True
+                break
+
+            xn = accel(x/scale, g/scale)*scale
+            x = where(xn > 0, xn, x/2)
+
+        if not converged:
+            logging.warning("Recycle %s not converged" % tears)
+            self.report["converged"] = False
+            failed.update(items)
+        elif changed is not None:
+            for key, fingerprint in outputs.items():
+                if self.getStream(key).fingerprint() != fingerprint:
+                    changed.add(key)
+
+    def _count(self, counter, n=1):
+        """Increase a calculation counter"""
+        self.report["stats"][counter] += n
+        self.counters[counter] += n
+
+    def _calculate(self, item, failed, changed=None, force=True):
+        """Calculate an item with its input streams and update its output
+        streams. The items with any upstream item failed are skipped and
+        added to failed set. Without force the item is calculated only if
+        any input stream is in changed set, and the output streams changed
+        are added to it"""
+        kwargs = self._prepare(item, failed, changed, force)
+        if kwargs is not None:
+            self.items[item](**kwargs)
+            self._finish(item, failed, changed)
+
+    def _prepare(self, item, failed, changed=None, force=True):
+        """First step of :meth:`_calculate`, return the kwargs with the input
+        streams of the equipment to calculate, or None if the item is done,
+        skipped, failed or with inputs unchanged"""
+        inputs = [(ind_down, up, key, obj) for key, (
+            up, down, ind_up, ind_down, obj) in self.streams.items()
+            if down == item]
+        if any(up in failed for ind_down, up, key, obj in inputs):
+            failed.add(item)
+            return
+        if not force and changed.isdisjoint(
+                key for ind_down, up, key, obj in inputs):
+            self._count("skips")
+            return
+
+        if item[0] == "i":
+            obj = self.items.get(item)
+            if obj is None:
+                # Project loaded from file, the input is saved in its stream
+                streams = self.getDownToEquip(item)
+                if not streams or not streams[0][1][4].status:
+                    failed.add(item)
+                return
+        elif item[0] == "o":
+            for ind_down, up, key, obj in inputs:
+                self.items[item] = obj
+            return
+        else:
+            obj = self.items[item]
+            inputs.sort(key=lambda i: i[0])
+            if isinstance(obj, Mixer):
+                entrada = [Corriente()]*(inputs[-1][0]+1) if inputs else []
+                for ind_down, up, key, stream in inputs:
+                    entrada[ind_down] = stream
+                kwargs = {"entrada": entrada}
+            else:
+                kwargs = {obj.kwargsInput[ind_down]: stream
+                          for ind_down, up, key, stream in inputs}
+
+            memo = self._memo.get(item)
+            if memo is None or memo[0] is not obj or not obj.status or \
+                    memo[1] != obj.fingerprint(**kwargs):
+                return kwargs
+            self._count("hits")
+
+        self._propagate(item, obj, failed, changed)
+
+    def _finish(self, item, failed, changed=None, result=None):
+        """Last step of :meth:`_calculate`, save the equipment calculated and
+        update its output streams. The result is the equipment instance
+        calculated in a worker process, its state is copied to the instance
+        of project to keep its identity"""
+        obj = self.items[item]
+        if result is not None and result is not obj:
+            obj.__dict__.update(result.__dict__)
+        self._memo[item] = (obj, obj.fingerprint())
+        self._count("recomputes")
+        self._propagate(item, obj, failed, changed)
+
+    def _propagate(self, item, obj, failed, changed=None):
+        """Update the output streams of a calculated item"""
+        if not obj.status:
+            failed.add(item)
+            return
+
+        for key, (up, down, ind_up, ind_down, old) in \
+                self.getDownToEquip(item):
+            if item[0] == "i":
+                stream = obj
+            else:
+                stream = obj.salida[ind_up]
+            if changed is not None and stream is not old and \
+                    stream.fingerprint() != old.fingerprint():
+                changed.add(key)
+            self.streams[key] = (up, down, ind_up, ind_down, stream)
+
+    @staticmethod
+    def _streamVector(stream):
+        """Variables of a stream in recycle convergence, temperature,
+        pressure and molar flow of components"""
+        return array([stream.T, stream.P]+list(stream.caudalunitariomolar),
+                     dtype=float)
+
+    def _tearIndex(self, tears):
+        """Index of molar flow variables of tear streams in vector"""
+        index = []
+        n = 0
+        for key in tears:
+            size = len(self.getStream(key).caudalunitariomolar)+2
+            index.extend(range(n+2, n+size))
+            n += size
+        return index
+
+    def _tearGuess(self, items, tears):
+        """Initial estimation of tear streams, the current value of stream if
+        it's defined, otherwise a copy of a defined stream feeding the
+        recycle loop"""
+        template = None
+        for up, down, ind_up, ind_down, obj in self.streams.values():
+            if down in items and up not in items and obj.status:
+                template = obj
+                break
+
+        x = []
+        for key in tears:
+            stream = self.getStream(key)
+            if not stream.status:
+                if template is None:
+                    return None
+                stream = template
+                self.streams[key] = self.streams[key][:4]+(stream, )
+            x.append(self._streamVector(stream))
+        return concatenate(x)
+
+    def _setTears(self, tears, x):
+        """Set the tear streams from the variables in vector x"""
+        n = 0
+        for key in tears:
+            stream = self.getStream(key)
+            size = len(stream.caudalunitariomolar)+2
+            T, P, *flows = x[n:n+size]
+
+            # Remove any other flow definition of stream
+            kwargs = stream.kwargs.copy()
+            for kw in ("x", "mezcla", "caudalMasico", "caudalMolar",
+                       "caudalVolumetrico", "caudalUnitarioMasico",
+                       "fraccionMolar", "fraccionMasica"):
+                kwargs[kw] = Corriente.kwargs[kw]
+            kwargs.update(T=T, P=P, caudalUnitarioMolar=flows)
+            new = Corriente(**kwargs)
+            self.streams[key] = self.streams[key][:4]+(new, )
+            n += size
 
     def writeToJSON(self, data):
         """Write the project to a dictionary to save to file in json format"""
@@ -322,24 +911,89 @@ class Project(object):
             os.rename(conf_dir+"pychemqtrc_temporal_bak",
                       conf_dir+"pychemqtrc_temporal")
 
-    # def printer(self):
-        # # Draw as PNG
-        # dot = write(self.graph)
-        # gvv = gv.readstring(dot)
-        # gv.layout(gvv, 'dot')
-        # gv.render(gvv, 'png', 'project.png')
-
-    # def cycle(self):
-        # cicle = find_cycle(self.graph)
-        # if cicle:
-            # return cicle
-        # else:
-            # return None
-
-    # def hasCycle(self):
-        # """Detect cycle in project"""
-        # cicle = self.cycle()
-        # return bool(cicle)
+
+
+class Test(TestCase):
+    """Solution of a flowsheet with a recycle loop, a mixer, a heater and a
+    divider, and an independent branch with a valve"""
+
+    @staticmethod
+    def build(flow=1):
+        """Return the project of flowsheet with the mass flow of feed to
+        recycle loop"""
+        feed = Corriente(T=300, P=101325, caudalMasico=flow, ids=[62],
+                         fraccionMasica=[1])
+        feed2 = Corriente(T=300, P=2e5, caudalMasico=1, ids=[62],
+                          fraccionMasica=[1])
+        items = {"i1": feed, "i2": feed2,
+                 "e1": Mixer(entradas=2),
+                 "e2": Heat_Exchanger(Tout=350),
+                 "e3": Divider(salidas=2, split=[0.4, 0.6]),
+                 "e4": Valve(off=1, Pout=101325),
+                 "o1": Corriente(), "o2": Corriente()}
+        streams = {1: ("i1", "e1", 0, 0, feed),
+                   2: ("e1", "e2", 0, 0, Corriente()),
+                   3: ("e2", "e3", 0, 0, Corriente()),
+                   4: ("e3", "o1", 0, 0, Corriente()),
+                   5: ("e3", "e1", 1, 1, Corriente()),
+                   6: ("i2", "e4", 0, 0, feed2),
+                   7: ("e4", "o2", 0, 0, Corriente())}
+        return Project(items=items, streams=streams)
+
+    def assertStreams(self, project, ref, places=6):
+        """Check the temperature, pressure and mass flow of all streams"""
+        for key in ref.streams:
+            stream = project.getStream(key)
+            refStream = ref.getStream(key)
+            for prop in ("T", "P", "caudalmasico"):
+                self.assertAlmostEqual(
+                    stream.__getattribute__(prop) /
+                    refStream.__getattribute__(prop), 1, places)
+
+    def test_recycle(self):
+        """The accelerated methods converge to the same solution than the
+        successive substitution with less iterations"""
+        ref = self.build()
+        report = ref.solve(method="substitution", maxiter=100)
+        self.assertTrue(report["converged"])
+        iterations = len(report["iterations"])
+
+        # Recycle r of divider with r = 0.6(1+r)
+        self.assertEqual(round(ref.getStream(5).caudalmasico, 5), 1.5)
+
+        for method in ("wegstein", "broyden"):
+            project = self.build()
+            report = project.solve(method=method)
+            self.assertTrue(report["converged"])
+            self.assertLess(len(report["iterations"]), iterations)
+            self.assertStreams(project, ref, 5)
+
+    def test_incremental(self):
+        """The incremental solution after a change in feed is the same than
+        the full solution, without the independent branch"""
+        project = self.build()
+        project.solve()
+        feed = Corriente(T=300, P=101325, caudalMasico=2, ids=[62],
+                         fraccionMasica=[1])
+        project.setInput(1, feed)
+        report = project.report
+        self.assertTrue(report["converged"])
+        items = [item for items, tears in report["sequence"]
+                 for item in items]
+        self.assertNotIn("e4", items)
+
+        ref = self.build(2)
+        ref.solve()
+        self.assertStreams(project, ref, 5)
+
+    def test_parallel(self):
+        """The solution with worker process is the same than serial"""
+        ref = self.build()
+        ref.solve()
+        project = self.build()
+        report = project.solve(workers=2)
+        self.assertTrue(report["converged"])
+        self.assertStreams(project, ref)
 
 
 if __name__ == '__main__':
@@ -0,0 +1,323 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+
+'''Pychemqt, Chemical Engineering Process simulator
+Copyright (C) 2009-2025, Juan José Gómez Romera <jjgomera@gmail.com>
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <http://www.gnu.org/licenses/>.'''
+
+
+###############################################################################
+# Binary project file format, alternative to the json .pcq file
+#
+# The project is saved in a sqlite database with a small index, the project
+# dict without streams and equipment, and a row for each stream and
+# equipment, with its state saved as a packed float array and a json
+# skeleton with the remaining values.
+#
+#   - pack: Split a state in skeleton and float values
+#   - unpack: Rebuild a state from skeleton and float values
+#   - State: State saved in file, loaded on demand
+#   - isBinary: Check if a file name is a binary project file
+#   - write: Save a project dict to file, only the changed entities
+#   - read: Load a project dict from file
+#   - load: Load a project dict from a file in any format
+#   - default: json encoder hook for states not loaded
+###############################################################################
+
+
+from contextlib import closing
+import hashlib
+import json
+import os
+import sqlite3
+
+from numpy import asarray, frombuffer
+
+
+EXTENSION = ".pcqdb"
+VERSION = 1
+
+# Mark of float values in skeleton, the strings starting with it are escaped
+_FLOAT = "\x00"
+
+# Format of packed float values, little endian double
+_DTYPE = "<f8"
+
+
+def pack(state):
+    """Split a state, a json serializable object, in a skeleton with the
+    structure and the not float values, and the list of float values
+
+    Parameters
+    ----------
+    state : object
+        json serializable object
+
+    Returns
+    -------
+    skeleton : object
+        json serializable object with a mark in place of float values
+    values : list
+        List of float values in order of appearance
+
+    Examples
+    --------
+    >>> skeleton, values = pack({"T": 300., "x": [0.5, 0.5], "n": 1})
+    >>> values
+    [300.0, 0.5, 0.5]
+    >>> unpack(skeleton, values)
+    {'T': 300.0, 'x': [0.5, 0.5], 'n': 1}
+    """
+    values = []
+
+    def walk(value):
+        if isinstance(value, float):
+            values.append(float(value))
+            return _FLOAT
+        if isinstance(value, str) and value.startswith(_FLOAT):
+            return _FLOAT + value
+        if isinstance(value, dict):
+            return {key: walk(v) for key, v in value.items()}
+        if isinstance(value, (list, tuple)):
+            return [walk(v) for v in value]
+        return value
+
+    return walk(state), values
+
+
+def unpack(skeleton, values):
+    """Rebuild a state from its skeleton and float values, the inverse of
+    :func:`pack`"""
+    values = iter(values)
+
+    def walk(value):
+        if isinstance(value, str) and value.startswith(_FLOAT):
+            if value == _FLOAT:
+                return next(values)
+            return value[1:]
+        if isinstance(value, dict):
+            return {key: walk(v) for key, v in value.items()}
+        if isinstance(value, list):
+            return [walk(v) for v in value]
+        return value
+
+    return walk(skeleton)
+
+
+def _packBytes(state):
+    """Return the skeleton in json format and the float values packed"""
+    skeleton, values = pack(state)
+    return json.dumps(skeleton), asarray(values, dtype=_DTYPE).tobytes()
+
+
+def _unpackBytes(skeleton, blob):
+    """Return the state from the skeleton in json format and the float
+    values packed"""
+    return unpack(json.loads(skeleton), frombuffer(blob, _DTYPE).tolist())
+
+
+class State():
+    """State of an entity saved in a binary project file, loaded when it's
+    needed. The entities with a State instance in place of state dict in
+    readFromJSON keep it and load the state when any state property is
+    accessed, see :class:`lib.config.Entity`"""
+
+    def __init__(self, fname, key):
+        self.fname = os.path.abspath(fname)
+        self.key = key
+
+    def load(self):
+        """Read the state from file"""
+        with closing(sqlite3.connect(self.fname)) as db:
+            row = db.execute("SELECT skeleton, state FROM entity WHERE key=?",
+                             (self.key, )).fetchone()
+        if row is None:
+            raise KeyError("%s not found in %s" % (self.key, self.fname))
+        return _unpackBytes(*row)
+
+
+def default(obj):
+    """Hook for json encoder to save the states not loaded, use as
+    json.dump(data, file, default=default)"""
+    if isinstance(obj, State):
+        return obj.load()
+    raise TypeError("Object of type %s is not JSON serializable" %
+                    obj.__class__.__name__)
+
+
+def isBinary(fname):
+    """Check if fname is a binary project file by its extension"""
+    return os.path.splitext(fname)[1].lower() == EXTENSION
+
+
+def _digest(value):
+    """Digest of a json serializable object, independent of keys order"""
+    text = json.dumps(value, sort_keys=True)
+    return hashlib.sha1(text.encode()).hexdigest()
+
+
+def _create(db):
+    """Create the tables of a new file"""
+    db.execute("CREATE TABLE IF NOT EXISTS meta "
+               "(key TEXT PRIMARY KEY, value TEXT)")
+    db.execute("CREATE TABLE IF NOT EXISTS entity "
+               "(key TEXT PRIMARY KEY, kind TEXT, position INTEGER, "
+               "data TEXT, skeleton TEXT, state BLOB, digest TEXT)")
+    version = db.execute(
+        "SELECT value FROM meta WHERE key='version'").fetchone()
+    if version is None:
+        db.execute("INSERT INTO meta VALUES ('version', ?)", (str(VERSION), ))
+    elif int(version[0]) > VERSION:
+        raise ValueError("Unsupported project file version %s" % version[0])
+
+
+def write(fname, data):
+    """Save a project to a binary file. In a file already saved only the
+    streams and equipment changed are written, the states not loaded from
+    the same file are not changed
+
+    Parameters
+    ----------
+    fname : str
+        Path of file
+    data : dict
+        Project in the same format that the json file
+
+    Returns
+    -------
+    written : int
+        Count of streams and equipment written to file
+
+    Examples
+    --------
+    >>> import tempfile
+    >>> fname = os.path.join(tempfile.mkdtemp(), "test" + EXTENSION)
+    >>> stream = {"kwarg": {"T": 300.}, "status": 1, "state": {"T": 300.}}
+    >>> data = {"config": {}, "stream": {"1": stream}, "equipment": {}}
+    >>> write(fname, data)
+    1
+    >>> write(fname, read(fname))
+    0
+    >>> read(fname, lazy=False) == data
+    True
+    """
+    fname = os.path.abspath(fname)
+    with closing(sqlite3.connect(fname)) as db:
+        _create(db)
+        stored = {key: (position, digest.split(":")) for key, position,
+                  digest in db.execute(
+                      "SELECT key, position, digest FROM entity")}
+
+        # Prepare all the rows before any change in file, the states not
+        # loaded could be read from a row to be changed
+        rows = []
+        keys = set()
+        for kind in ("stream", "equipment"):
+            for position, (idx, entity) in enumerate(data[kind].items()):
+                key = "%s/%s" % (kind, idx)
+                keys.add(key)
+                state = entity.get("state", {})
+                text = json.dumps(dict(entity, state=None))
+                dataDigest = _digest(dict(entity, state=None))
+                if isinstance(state, State) and state.fname == fname and \
+                        state.key == key and key in stored:
+                    old, (oldData, stateDigest) = stored[key]
+                    if (old, oldData) != (position, dataDigest):
+                        digest = "%s:%s" % (dataDigest, stateDigest)
+                        rows.append((key, kind, position, text, None, None,
+                                     digest))
+                    continue
+
+                if isinstance(state, State):
+                    state = state.load()
+                digest = "%s:%s" % (dataDigest, _digest(state))
+                if key not in stored or \
+                        stored[key] != (position, digest.split(":")):
+                    skeleton, blob = _packBytes(state)
+                    rows.append((key, kind, position, text, skeleton, blob,
+                                 digest))
+
+        index = dict(data)
+        index["stream"] = None
+        index["equipment"] = None
+
+        with db:
+            db.execute("INSERT OR REPLACE INTO meta VALUES ('index', ?)",
+                       (json.dumps(index), ))
+            for key in set(stored).difference(keys):
+                db.execute("DELETE FROM entity WHERE key=?", (key, ))
+            for key, kind, position, text, skeleton, blob, digest in rows:
+                if skeleton is None:
+                    db.execute(
+                        "UPDATE entity SET position=?, data=?, digest=? "
+                        "WHERE key=?", (position, text, digest, key))
+                else:
+                    db.execute(
+                        "INSERT OR REPLACE INTO entity VALUES "
+                        "(?, ?, ?, ?, ?, ?, ?)",
+                        (key, kind, position, text, skeleton, blob, digest))
+    return len(rows)
+
+
+def read(fname, lazy=True):
+    """Load a project from a binary file
+
+    Parameters
+    ----------
+    fname : str
+        Path of file
+    lazy : bool, optional
+        Return the states of streams as :class:`State` instances, to load
+        only when are needed, the equipment states are always loaded
+
+    Returns
+    -------
+    data : dict
+        Project in the same format that the json file
+    """
+    with closing(sqlite3.connect(fname)) as db:
+        version = db.execute(
+            "SELECT value FROM meta WHERE key='version'").fetchone()
+        if version is None or int(version[0]) > VERSION:
+            raise ValueError("Unsupported project file %s" % fname)
+
+        data = json.loads(db.execute(
+            "SELECT value FROM meta WHERE key='index'").fetchone()[0])
+        data["stream"] = {}
+        data["equipment"] = {}
+        for key, kind, text in db.execute(
+                "SELECT key, kind, data FROM entity ORDER BY position"):
+            entity = json.loads(text)
+            if lazy and kind == "stream":
+                entity["state"] = State(fname, key)
+            else:
+                entity["state"] = None
+            data[kind][key.split("/", 1)[1]] = entity
+
+        query = "SELECT key, kind, skeleton, state FROM entity"
+        if lazy:
+            query += " WHERE kind='equipment'"
+        for key, kind, skeleton, blob in db.execute(query):
+            entity = data[kind][key.split("/", 1)[1]]
+            entity["state"] = _unpackBytes(skeleton, blob)
+    return data
+
+
+def load(fname):
+    """Load a project dict from a file, binary or json format"""
+    if isBinary(fname):
+        return read(fname)
+    with open(fname, "r") as file:
+        return json.load(file)
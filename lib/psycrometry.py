@@ -48,6 +48,9 @@ Calculation procedure used in the plot procedure:
     * :func:`_Tdb_V`: Tdb calculation procedure from specified volume
     * :func:`_W_V`: Humidity ratio calculation procedure from specified volume
 
+The functions accept numpy arrays, returning arrays, so many states can be
+calculated at once, as the hourly records of a year in load calculations.
+
 Finally for grouping all functionality and integrate in main program with a
 OOP scheme it's define the class:
     * :class:`PsyState`: Psychrometric state general class with common
@@ -69,7 +72,9 @@ from iapws._iapws import _Henry
 from iapws.humidAir import _virial
 from iapws.iapws97 import _PSat_T, _Region1, prop0
 
-from numpy import exp, roots, linspace, arange, concatenate
+from numpy import (arange, asarray, broadcast_arrays, clip, concatenate,
+                   empty, errstate, exp, isnan, linspace, nan, ndim, ndindex,
+                   roots, where)
 from numpy.lib.scimath import log
 from tools.qt import translate
 from scipy.optimize import fsolve
@@ -116,6 +121,37 @@ Ma = 28.966
 Mw = 18.015268
 e = Mw/Ma
 
+# Coefficients of saturation pressure correlation over ice and liquid water
+C_ice = [-5674.5359, 6.3925247, -0.009677843, 0.00000062215701,
+         2.0747825E-09, -9.484024E-13, 4.1635019]
+C_liq = [-5800.2206, 1.3914993, -0.048640239, 0.000041764768,
+         -0.000000014452093, 6.5459673]
+
+
+def _result(value, unit=None, *args):
+    """Return the value as unidades instance for a single point, the array
+    input return an array"""
+    if ndim(value):
+        return value
+    if unit is None:
+        return float(value)
+    return unit(value, *args)
+
+
+def _lnPsat(T):
+    """Logarithm of saturation pressure and its temperature derivative, over
+    ice below the triple point and over liquid water above"""
+    ice = T < 273.15
+    C = C_ice
+    lnP_ice = C[0]/T + C[1] + C[2]*T + C[3]*T**2 + C[4]*T**3 + C[5]*T**4 \
+        + C[6]*log(T)
+    dlnP_ice = -C[0]/T**2 + C[2] + 2*C[3]*T + 3*C[4]*T**2 + 4*C[5]*T**3 \
+        + C[6]/T
+    C = C_liq
+    lnP_liq = C[0]/T + C[1] + C[2]*T + C[3]*T**2 + C[4]*T**3 + C[5]*log(T)
+    dlnP_liq = -C[0]/T**2 + C[2] + 2*C[3]*T + 3*C[4]*T**2 + C[5]/T
+    return where(ice, lnP_ice, lnP_liq), where(ice, dlnP_ice, dlnP_liq)
+
 
 @refDoc(__doi__, [1])
 def _Pbar(Z):
@@ -142,8 +178,8 @@ def _Pbar(Z):
     >>> "%0.3f" % _Pbar(8000).kPa
     '35.600'
     """
-    P = (1-2.25577e-5*Z) ** 5.2559
-    return unidades.Pressure(P, "atm")
+    P = (1-2.25577e-5*asarray(Z, dtype=float)) ** 5.2559
+    return _result(P*101325, unidades.Pressure)
 
 
 @refDoc(__doi__, [1])
@@ -168,9 +204,9 @@ def _height(P):
     >>> "%0.0f" % _height(107478)
     '-500'
     """
-    P_atm = P/101325.
+    P_atm = asarray(P, dtype=float)/101325.
     Z = 1/2.25577e-5*(1-exp(log(P_atm)/5.2559))
-    return unidades.Length(Z)
+    return _result(Z, unidades.Length)
 
 
 @refDoc(__doi__, [1])
@@ -198,8 +234,8 @@ def _Tbar(Z):
     >>> "%0.1f" % _Tbar(8000).C
     '-37.0'
     """
-    t = 15-0.0065*Z
-    return unidades.Temperature(t, "C")
+    t = 15-0.0065*asarray(Z, dtype=float)
+    return _result(t+273.15, unidades.Temperature)
 
 
 @refDoc(__doi__, [1])
@@ -217,22 +253,28 @@ def _Psat(T):
     -------
     P : float
         Saturation pressure, [Pa]
+
+    Notes
+    -----
+    With arrays input the temperatures out of range return NaN, a single
+    point raise NotImplementedError
+
+    Examples
+    --------
+    >>> "%0.2f" % _Psat(293.15)
+    '2338.80'
+    >>> _Psat([263.15, 293.15, 500]).round(2)
+    array([ 259.9, 2338.8,    nan])
     """
-    if 173.15 <= T < 273.15:
-        # Saturation pressure over ice, Eq 5
-        C = [-5674.5359, 6.3925247, -0.009677843, 0.00000062215701,
-             2.0747825E-09, -9.484024E-13, 4.1635019]
-        pws = exp(C[0]/T + C[1] + C[2]*T + C[3]*T**2 + C[4]*T**3 + C[5]*T**4
-                  + C[6]*log(T))
-    elif 273.15 <= T <= 473.15:
-        # Saturation pressure over liquid water, Eq 6
-        C = [-5800.2206, 1.3914993, -0.048640239, 0.000041764768,
-             -0.000000014452093, 6.5459673]
-        pws = exp(C[0]/T + C[1] + C[2]*T + C[3]*T**2 + C[4]*T**3 + C[5]*log(T))
-    else:
+    T = asarray(T, dtype=float)
+    valid = (T >= 173.15) & (T <= 473.15)
+    if not ndim(T) and not valid:
         raise NotImplementedError("Incoming out of bound")
 
-    return unidades.Pressure(pws)
+    # Eq 5 for saturation over ice, Eq 6 over liquid water
+    lnP = _lnPsat(where(valid, T, 273.15))[0]
+    pws = where(valid, exp(lnP), nan)
+    return _result(pws, unidades.Pressure)
 
 
 @refDoc(__doi__, [1])
@@ -250,36 +292,31 @@ def _Tsat(Pv):
     -------
     T : float
         Temperature, [K]
-    """
-    Pv_min = _Psat(173.15)
-    Pv_lim = _Psat(273.15)
-    Pv_max = _Psat(473.15)
-    if Pv_min <= Pv < Pv_lim:
-
-        C = [-5674.5359, 6.3925247, -0.009677843, 0.00000062215701,
-             2.0747825E-09, -9.484024E-13, 4.1635019]
-
-        def f(T):
-            pws = exp(C[0]/T + C[1] + C[2]*T + C[3]*T**2 + C[4]*T**3 +
-                      C[5]*T**4 + C[6]*log(T))
-            return Pv - pws
-        T = fsolve(f, 250)[0]
-
-    elif Pv_lim <= Pv <= Pv_max:
 
-        C = [-5800.2206, 1.3914993, -0.048640239, 0.000041764768,
-             -0.000000014452093, 6.5459673]
+    Notes
+    -----
+    Solved with Newton iterations in the logarithm of pressure for all points
+    at once, the pressures out of range return NaN with arrays input
 
-        def f(T):
-            pws = exp(C[0]/T + C[1] + C[2]*T + C[3]*T**2 + C[4]*T**3 +
-                      C[5]*log(T))
-            return Pv - pws
-        T = fsolve(f, 300)[0]
-
-    else:
+    Examples
+    --------
+    >>> "%0.4f" % _Tsat(2338.8)
+    '293.1500'
+    """
+    Pv = asarray(Pv, dtype=float)
+    valid = (Pv >= _Psat(173.15)) & (Pv <= _Psat(473.15))
+    if not ndim(Pv) and not valid:
         raise NotImplementedError("Incoming out of bound")
 
-    return unidades.Temperature(T)
+    lnPv = log(where(valid, Pv, 1000))
+    T = where(Pv < _Psat(273.15), 250., 300.)
+    for i in range(50):
+        lnP, dlnP = _lnPsat(T)
+        dT = (lnP-lnPv)/dlnP
+        T = T-dT
+        if (abs(dT) < 1e-10).all():
+            break
+    return _result(where(valid, T, nan), unidades.Temperature)
 
 
 @refDoc(__doi__, [1])
@@ -301,7 +338,7 @@ def _Ws(P, Tdb):
        Saturated Humidity ratio, [kgw/kgda]
     """
     pv = _Psat(Tdb)
-    return 0.621945*pv/(P-pv)
+    return _result(0.621945*pv/(P-pv))
 
 
 # Humid air as a perfect gas correlations
@@ -324,9 +361,9 @@ def _h(Tdb, W):
        Enthalpy of humid air, [kJ/kgda]
     """
     # Temperature en celsius
-    tc = Tdb-273.15
+    tc = asarray(Tdb, dtype=float)-273.15
     h = 1.006*tc + W*(2501 + 1.86*tc)
-    return unidades.Enthalpy(h)
+    return _result(h, unidades.Enthalpy)
 
 
 @refDoc(__doi__, [1])
@@ -350,9 +387,9 @@ def _v(P, Tdb, W):
        Specific volume, [m³/kgda]
     """
     # Pressure in kPa
-    P_kpa = P/1000
-    v = 0.287042*Tdb*(1+1.607858*W)/P_kpa
-    return unidades.SpecificVolume(v)
+    P_kpa = asarray(P, dtype=float)/1000
+    v = 0.287042*Tdb*(1+1.607858*asarray(W, dtype=float))/P_kpa
+    return _result(v, unidades.SpecificVolume)
 
 
 @refDoc(__doi__, [1])
@@ -375,17 +412,18 @@ def _W_twb(tdb, twb, P):
     W : float
        Humidity ratio, [kgw/kgda]
     """
-    tdb_C = tdb - 273.15
-    twb_C = twb - 273.15
+    tdb_C = asarray(tdb, dtype=float) - 273.15
+    twb_C = asarray(twb, dtype=float) - 273.15
     Ws = _Ws(P, tdb)
-    if tdb_C >= 0:
-        # Eq 35 for liquid water
-        w = ((2501-2.326*twb_C)*Ws-1.006*(tdb-twb)) / \
-            (2501+1.86*tdb_C-4.186*twb_C)
-    else:
-        # Eq 37 for ice water
-        w = ((2830-0.24*twb_C)*Ws-1.006*(tdb-twb))/(2830+1.86*tdb_C-2.1*twb_C)
-    return w
+
+    # Eq 35 for liquid water
+    w_liq = ((2501-2.326*twb_C)*Ws-1.006*(tdb_C-twb_C)) / \
+        (2501+1.86*tdb_C-4.186*twb_C)
+
+    # Eq 37 for ice water
+    w_ice = ((2830-0.24*twb_C)*Ws-1.006*(tdb_C-twb_C)) / \
+        (2830+1.86*tdb_C-2.1*twb_C)
+    return _result(where(tdb_C >= 0, w_liq, w_ice))
 
 
 @refDoc(__doi__, [1])
@@ -408,19 +446,17 @@ def _tdp(Pw):
     D = [6.09, 12.608, 0.4959]
 
     # Pw used in kPa
-    a = log(Pw/1000.)
-
-    Tdp1 = C[0] + C[1]*a + C[2]*a**2 + C[3]*a**3 + C[4]*(Pw/1000.)**C[5]
-    Tdp2 = D[0] + D[1]*a + D[2]*a**2
-
-    if 0 <= Tdp1 <= 93:
-        t = Tdp1
-    elif Tdp2 < 0:
-        t = Tdp2
-    else:
+    Pw = asarray(Pw, dtype=float)
+    with errstate(divide="ignore", invalid="ignore"):
+        a = log(Pw/1000.)
+        Tdp1 = C[0] + C[1]*a + C[2]*a**2 + C[3]*a**3 + C[4]*(Pw/1000.)**C[5]
+        Tdp2 = D[0] + D[1]*a + D[2]*a**2
+
+    t = where((Tdp1 >= 0) & (Tdp1 <= 93), Tdp1, where(Tdp2 < 0, Tdp2, nan))
+    if not ndim(t) and isnan(t):
         raise NotImplementedError("Incoming out of bound")
 
-    return unidades.Temperature(t, "C")
+    return _result(t+273.15, unidades.Temperature)
 
 
 @refDoc(__doi__, [1])
@@ -442,23 +478,34 @@ def _twb(tdb, W, P):
     -------
     Twb: float
         Wet bulb temperature, [K]
+
+    Notes
+    -----
+    Solved with Newton iterations for all points at once, starting from the
+    dry bulb temperature
+
+    Examples
+    --------
+    >>> "%0.2f" % _twb(303.15, 0.01, 101325)
+    '292.76'
     """
-    tdb_C = tdb - 273.15
+    tdb_C = asarray(tdb, dtype=float) - 273.15
+    W = asarray(W, dtype=float)
 
-    def f(twb):
-        Pvs = _Psat(twb)
+    def f(twb_C):
+        Pvs = exp(_lnPsat(twb_C+273.15)[0])
         Ws = 0.62198*Pvs/(P-Pvs)
-        twb_C = twb - 273.15
-        if tdb >= 0:
-            w = ((2501.-2.326*twb_C)*Ws-1.006*(tdb_C-twb_C)) / \
-                (2501.+1.86*tdb_C-4.186*twb_C)-W
-        else:
-            w = ((2830-0.24*twb_C)*Ws-1.006*(tdb-twb)) / \
-                (2830+1.86*tdb_C-2.1*twb_C)
-        return w
+        return ((2501.-2.326*twb_C)*Ws-1.006*(tdb_C-twb_C)) / \
+            (2501.+1.86*tdb_C-4.186*twb_C)-W
 
-    twb = fsolve(f, tdb)[0]
-    return twb
+    twb_C = tdb_C+0*W
+    for i in range(50):
+        fx = f(twb_C)
+        dx = fx*1e-3/(f(twb_C+1e-3)-fx)
+        twb_C = twb_C-dx
+        if (abs(dx) < 1e-9).all():
+            break
+    return _result(twb_C+273.15)
 
 
 # Procedures only used in plot
@@ -508,12 +555,21 @@ def _Tdb_V(v, P):
        Dry bulb temperature, [K]
     """
     P_kpa = P/1000
+    v = asarray(v, dtype=float)
 
     def f(Tdb):
-        w = _Ws(P, Tdb)
+        w = 0.621945/(P/exp(_lnPsat(Tdb)[0])-1)
         return v-0.287042*Tdb*(1+1.607858*w)/P_kpa
-    ts = fsolve(f, 300)[0]
-    return ts
+
+    Tdb = 300+0*v
+    for i in range(50):
+        fx = f(Tdb)
+        # Step limited to avoid jump over the boiling point
+        dT = clip(fx*1e-3/(f(Tdb+1e-3)-fx), -5, 5)
+        Tdb = Tdb-dT
+        if (abs(dT) < 1e-9).all():
+            break
+    return _result(Tdb)
 
 
 def _W_V(Tdb, P, v):
@@ -546,6 +602,87 @@ def _W_V(Tdb, P, v):
     return (v*P_kpa-0.287042*Tdb)/(0.287042*1.607858*Tdb)
 
 
+def _ideal(mode, P, x, y):
+    """
+    Calculate the psychrometric properties using the ideal gas equations,
+    with any input pair defined by mode, as scalar or arrays
+
+    Parameters
+    ----------
+    mode : int
+        Index of input pair in PsyState.VAR_NAME
+    P : float
+        Pressure, [Pa]
+    x : float
+        First variable of input pair
+    y : float
+        Second variable of input pair
+
+    Returns
+    -------
+    prop : tuple
+        tdp, tdb, twb, P, Pvs, Pv, ws, w, HR, v, h, with h in [kJ/kg]
+    """
+    tdp = tdb = twb = w = HR = None
+    if mode == 0:
+        # Tdb and w
+        tdb, w = x, y
+        Pvs = _Psat(tdb)
+        ws = 0.621945*Pvs/(P-Pvs)
+        Pv = w*P/(0.621945+w)
+        HR = Pv/Pvs*100
+        tdp = _tdp(Pv)
+        twb = _twb(tdb, w, P)
+
+    elif mode == 1:
+        # Tdb and HR
+        tdb, HR = x, y
+        Pvs = _Psat(tdb)
+        ws = 0.621945*Pvs/(P-Pvs)
+        Pv = Pvs*HR/100
+        w = 0.621945*Pv/(P-Pv)
+        tdp = _tdp(Pv)
+        twb = _twb(tdb, w, P)
+
+    elif mode == 2:
+        # Tdb and Twb
+        tdb, twb = x, y
+        Pvs = _Psat(tdb)
+        ws = 0.621945*Pvs/(P-Pvs)
+        w = _W_twb(tdb, twb, P)
+        Pv = w*P/(0.621945+w)
+        HR = Pv/Pvs*100
+        tdp = _tdp(Pv)
+
+    elif mode == 3:
+        # Tdb and Tdp
+        tdb, tdp = x, y
+        Pv = _Psat(tdp)
+        w = 0.621945*Pv/(P-Pv)
+        Pvs = _Psat(tdb)
+        ws = 0.621945*Pvs/(P-Pvs)
+        HR = Pv/Pvs*100
+        twb = _twb(tdb, w, P)
+
+    elif mode == 4:
+        # Tdp and HR, dry air with HR=0 has the dew point as saturation
+        tdp, HR = x, asarray(y, dtype=float)
+        Pv = _Psat(tdp)
+        with errstate(divide="ignore", invalid="ignore"):
+            w = where(HR != 0, 0.621945*Pv/(P-Pv), 0)
+            Pvs = where(HR != 0, Pv/HR*100, Pv)
+        ws = 0.621945*Pvs/(P-Pvs)
+        tdb = _Tsat(Pvs)
+        twb = _twb(tdb, w, P)
+
+    else:
+        raise NotImplementedError("Input pair not supported")
+
+    v = _v(P, tdb, w)
+    h = _h(tdb, w)
+    return tdp, tdb, twb, P, Pvs, Pv, ws, w, HR, v, h
+
+
 class PsyState():
     """
     Class to model a psychrometric state with properties
@@ -630,28 +767,34 @@ class PsyState():
 
     @property
     def calculable(self):
-        tdp = self.kwargs.get("tdp", 0)
-        tdb = self.kwargs.get("tdb", 0)
-        twb = self.kwargs.get("twb", 0)
-        w = self.kwargs.get("w", None)
-        HR = self.kwargs.get("HR", None)
-        # h = self.kwargs.get("h", None)
-        # v = self.kwargs.get("v", 0)
-
-        self.mode = -1
-        if tdb and w is not None:
-            self.mode = 0
-        elif tdb and HR is not None:
-            self.mode = 1
-        elif tdb and twb:
-            self.mode = 2
-        elif tdb and tdp:
-            self.mode = 3
-        elif tdp and HR is not None:
-            self.mode = 4
-
+        self.mode = self._mode(self.kwargs)
         return bool(self.mode+1)
 
+    @staticmethod
+    def _mode(kwargs):
+        """Return the index of input pair defined in kwargs, -1 if there
+        aren't enough input"""
+        def defined(key):
+            value = kwargs.get(key, None)
+            if value is None:
+                return False
+            if key in ("w", "HR") or ndim(value):
+                return True
+            return bool(value)
+
+        mode = -1
+        if defined("tdb") and defined("w"):
+            mode = 0
+        elif defined("tdb") and defined("HR"):
+            mode = 1
+        elif defined("tdb") and defined("twb"):
+            mode = 2
+        elif defined("tdb") and defined("tdp"):
+            mode = 3
+        elif defined("tdp") and defined("HR"):
+            mode = 4
+        return mode
+
     def _P(self):
         """Barometric pressure calculation, Pa"""
         if self.kwargs["P"]:
@@ -683,6 +826,83 @@ class PsyState():
         self.Xa = 1/(1+self.w/0.62198)
         self.Xw = 1-self.Xa
 
+    @classmethod
+    def batch(cls, **kwargs):
+        """Calculate a set of psychrometric states in a single call,
+        returning the properties as arrays
+
+        The values of input pair and pressure or altitude can be arrays or
+        scalars, broadcasted together, so for example the hourly records of a
+        year can be calculated at once
+
+        Parameters
+        ----------
+        kwargs : dict
+            Input pair values and pressure P or altitude z, with the same
+            names as instance definition
+
+        Returns
+        -------
+        result : dict
+            Dictionary with the arrays of properties in SI units, tdp, tdb,
+            twb, P, Pvs, Pv, ws, w, HR, mu, v, rho, h, Xa, Xw. The points out
+            of range of correlations have a NaN value
+
+        Examples
+        --------
+        >>> res = PsyIdeal.batch(tdb=[283.15, 303.15], HR=50, P=101325)
+        >>> st = PsyIdeal(tdb=303.15, HR=50, P=101325)
+        >>> "%0.4f %0.4f" % (res["twb"][1], st.twb)
+        '295.1543 295.1543'
+        >>> "%0.2f %0.2f" % (res["h"][1], st.h)
+        '64211.53 64211.53'
+        """
+        mode = cls._mode(kwargs)
+        if mode < 0:
+            raise ValueError("batch calculation need a input pair")
+
+        P = kwargs.get("P", None)
+        if P is None or not ndim(P) and not P:
+            if kwargs.get("z", None) is not None:
+                P = _Pbar(kwargs["z"])
+            else:
+                P = 101325.
+        x, y = [kwargs[key] for key in cls.VAR_NAME[mode]]
+        P, x, y = broadcast_arrays(*[asarray(value, dtype=float)
+                                     for value in (P, x, y)])
+
+        names = ("tdp", "tdb", "twb", "P", "Pvs", "Pv", "ws", "w", "HR",
+                 "v", "h")
+        values = cls._batch(mode, P, x, y)
+        result = {}
+        for name, value in zip(names, values):
+            result[name] = asarray(value, dtype=float)+0*P
+        result["h"] = result["h"]*1000
+        result["mu"] = result["w"]/result["ws"]*100
+        result["rho"] = 1/result["v"]
+        result["Xa"] = 1/(1+result["w"]/0.62198)
+        result["Xw"] = 1-result["Xa"]
+        return result
+
+    @classmethod
+    def _batch(cls, mode, P, x, y):
+        """Properties calculation of batch procedure, as default with a
+        instance for each point, the subclasses with array capable library
+        can overwrite it"""
+        names = ("tdp", "tdb", "twb", "P", "Pvs", "Pv", "ws", "w", "HR",
+                 "v", "h")
+        values = [empty(P.shape) for name in names]
+        kw = cls.VAR_NAME[mode]
+        for index in ndindex(P.shape):
+            state = cls(P=P[index], **{kw[0]: x[index], kw[1]: y[index]})
+            for value, name in zip(values, names):
+                if state.status:
+                    value[index] = getattr(state, name)
+                else:
+                    value[index] = nan
+            values[-1][index] = state.h.kJkg if state.status else nan
+        return values
+
     @classmethod
     def calculatePlot(cls):
         """Funtion to calculate point in chart, each child class must define
@@ -709,95 +929,13 @@ class PsyIdeal(PsyState):
     """Psychrometric state using ideal gas equation"""
     def _lib(self):
         """Properties calculate library"""
-        P = self._P()
-        tdp = self.kwargs.get("tdp", 0)
-        tdb = self.kwargs.get("tdb", 0)
-        twb = self.kwargs.get("twb", 0)
-        w = self.kwargs.get("w", None)
-        HR = self.kwargs.get("HR", None)
-        h = self.kwargs.get("h", None)
-        v = self.kwargs.get("v", 0)
+        x, y = [self.kwargs[key] for key in self.VAR_NAME[self.mode]]
+        return _ideal(self.mode, self._P(), x, y)
 
-        if self.mode == 0:
-            # Tdb and w
-            Pvs = _Psat(tdb)
-            ws = 0.621945*Pvs/(P-Pvs)
-            Pv = w*P/(0.621945+w)
-            HR = Pv/Pvs*100
-            v = _v(P, tdb, w)
-            h = _h(tdb, w)
-            tdp = _tdp(Pv)
-            twb = _twb(tdb, w, P)
-
-        elif self.mode == 1:
-            # Tdb and HR
-            Pvs = _Psat(tdb)
-            ws = 0.621945*Pvs/(P-Pvs)
-            Pv = Pvs*HR/100
-            w = 0.621945*Pv/(P-Pv)
-            v = _v(P, tdb, w)
-            h = _h(tdb, w)
-            tdp = _tdp(Pv)
-            twb = _twb(tdb, w, P)
-
-        elif self.mode == 2:
-            # Tdb and Twb
-            Pvs = _Psat(tdb)
-            ws = 0.621945*Pvs/(P-Pvs)
-            w = _W_twb(tdb, twb, P)
-            Pv = w*P/(0.621945+w)
-            HR = Pv/Pvs*100
-            v = _v(P, tdb, w)
-            h = _h(tdb, w)
-            tdp = _tdp(Pv)
-
-        elif self.mode == 3:
-            # Tdb and Tdp
-            Pv = _Psat(tdp)
-            w = 0.621945*Pv/(P-Pv)
-            Pvs = _Psat(tdb)
-            ws = 0.621945*Pvs/(P-Pvs)
-            HR = Pv/Pvs*100
-            v = _v(P, tdb, w)
-            h = _h(tdb, w)
-            twb = _twb(tdb, w, P)
-
-        elif self.mode == 4:
-            # Tdp and HR
-            Pv = _Psat(tdp)
-            if HR:
-                w = 0.621945*Pv/(P-Pv)
-                Pvs = Pv/HR*100
-            else:
-                w = 0
-                Pvs = Pv
-            ws = 0.621945*Pvs/(P-Pvs)
-            tdb = _Tsat(Pvs)
-            v = _v(P, tdb, w)
-            h = _h(tdb, w)
-            twb = _twb(tdb, w, P)
-
-        elif self.mode == 5:
-            # Tdp and Twb
-            # Pv = _Psat(tdp)
-            pass
-
-        elif self.mode == 6:
-            # Tdb and h
-            pass
-#            self.Tdb = tdb
-#            self.h = unidades.Enthalpy(h, "kJkg")
-#            f = lambda w: self.Entalpia(self.Tdb, w).kJkg-h
-#            self.w = fsolve(f, 0.001)
-#            self.Hs = self.Humedad_Absoluta(tdb)
-#            self.twb = self.Tw(tdb, self.w)
-#            self.HR = self.w/self.Hs*100
-#            self.Xa = 1/(1+self.w*self.aire.M/self.agua.M)
-#            self.Xw = 1-self.Xa
-#            self.V = self.Volumen(tdb, self.Xa)
-#            self.rho = unidades.Density(1/self.V)
-
-        return tdp, tdb, twb, P, Pvs, Pv, ws, w, HR, v, h
+    @classmethod
+    def _batch(cls, mode, P, x, y):
+        """Properties calculation of batch procedure, all points at once"""
+        return _ideal(mode, P, x, y)
 
     @classmethod
     def calculatePlot(cls, parent):
@@ -811,66 +949,49 @@ class PsyIdeal(PsyState):
         t = cls.LineList("isotdb", Preferences)
 
         # Saturation line
-        Hs = []
-        Pvs = []
-        for ti in t:
-            Pv = _Psat(ti)
-            Pvs.append(Pv)
-            Hs.append(0.62198*Pv/(P-Pv))
-            parent.setProgressValue(5*len(Hs)/len(t))
+        Pvs = _Psat(asarray(t, dtype=float))
+        Hs = 0.62198*Pvs/(P-Pvs)
         data["t"] = t
-        data["Hs"] = Hs
+        data["Hs"] = Hs.tolist()
+        parent.setProgressValue(5)
 
         # left limit of isow lines
         H = cls.LineList("isow", Preferences)
-        th = []
-        for w in H:
-            if w:
-                Pv = w*P/(0.62198+w)
-                th.append(unidades.Temperature(_tdp(Pv)))
-            else:
-                tmin = Preferences.getfloat("Psychr", "isotdbStart")
-                th.append(unidades.Temperature(tmin))
+        tmin = Preferences.getfloat("Psychr", "isotdbStart")
+        w = asarray(H, dtype=float)
+        with errstate(divide="ignore"):
+            th = where(w != 0, _tdp(w*P/(0.62198+w)), tmin)
         data["H"] = H
-        data["th"] = th
+        data["th"] = th.tolist()
 
         # Humidity ratio lines
         hr = cls.LineList("isohr", Preferences)
         Hr = {}
-        cont = 0
         for i in hr:
-            Hr[i] = []
-            for pvs in Pvs:
-                pv = pvs*i/100
-                Hr[i].append(0.62198*pv/(P-pv))
-                cont += 1
-                parent.setProgressValue(5+10*cont/len(hr)/len(Hs))
+            pv = Pvs*i/100
+            Hr[i] = (0.62198*pv/(P-pv)).tolist()
         data["Hr"] = Hr
+        parent.setProgressValue(15)
 
         # Twb
         lines = cls.LineList("isotwb", Preferences)
         Twb = {}
-        cont = 0
-        for T in lines:
+        for cont, T in enumerate(lines):
             H = concatenate((arange(_Ws(P, T), 0, -0.001), [0.]))
-            Tw = []
-            for h in H:
-                Tw.append(unidades.Temperature(_Tdb(T, h, P)))
-            cont += 1
-            parent.setProgressValue(15+75*cont/len(lines))
-            Twb[T] = (list(H), Tw)
+            Tw = _Tdb(T, H, P)
+            parent.setProgressValue(15+75*(cont+1)/len(lines))
+            Twb[T] = (H.tolist(), Tw.tolist())
         data["Twb"] = Twb
 
         # v
         lines = cls.LineList("isochor", Preferences)
         V = {}
+        ts = _Tdb_V(asarray(lines, dtype=float), P)
         for cont, v in enumerate(lines):
-            ts = _Tdb_V(v, P)
-            T = linspace(ts, v*P/287.055, 50)
-            Td = [unidades.Temperature(ti) for ti in T]
-            H = [_W_V(ti, P, v) for ti in T]
+            T = linspace(ts[cont], v*P/287.055, 50)
+            H = _W_V(T, P, v)
             parent.setProgressValue(90+10*cont/len(lines))
-            V[v] = (Td, H)
+            V[v] = (T.tolist(), H.tolist())
         data["v"] = V
 
         return data
@@ -75,14 +75,15 @@ __doi__ = {
          "doi": "10.1021/acs.iecr.2c01427"}}
 
 
-# Automatic loading of refprop name from meos subclass _refPropName property
+# Automatic loading of refprop name from meos subclass _refPropName property,
+# using the mEoS registry to avoid import all fluid modules
 all__ = {}
 noIds = []
-for cmp in mEoS.__all__:
-    if cmp.id and cmp._refPropName:
-        all__[cmp.id] = cmp._refPropName
-    elif cmp._refPropName:
-        noIds.append(cmp._refPropName)
+for cmp in mEoS.registry.values():
+    if cmp["id"] and cmp["refprop"]:
+        all__[cmp["id"]] = cmp["refprop"]
+    elif cmp["refprop"]:
+        noIds.append(cmp["refprop"])
 
 
 class RefProp(ThermoRefProp):
@@ -25,33 +25,157 @@ save in databank
     * :func:`updateElement`: Update element with indice in database
     * :func:`deleteElement`: Delete Element with indice from custom Database
     * :func:`getElement`: Get element from database
+    * :func:`getElements`: Get several elements from database in a query
+    * :func:`clearCache`: Invalidate the in-memory cache of databank records
     * :func:`copyElement`: Create a copy of element of indice in custom Database
 
+The read access to databases is done with read only connections, one for
+each thread, so the queries can be run from worker threads
+
+    * :func:`connection`: Read only connection to database for current thread
+    * :func:`query`: Run a query in database and return the rows
+    * :func:`inMemory`: Use a copy in memory of databank for read queries
+
+The databank and databank_Custom cursors are kept for the queries run from
+the main thread, in graphical interface
+
 API reference
 -------------
 
 '''
 
 
+from collections import OrderedDict
 import os
 import sqlite3
+from threading import Lock, local
+from urllib.request import pathname2url
 
 
 databank_name = os.path.join(os.environ["pychemqt"], 'dat', 'databank.db')
-databank = sqlite3.connect(databank_name).cursor()
-databank.execute("SELECT COUNT(*) AS Total FROM compuestos")
-N_comp = databank.fetchone()[0]
-
 conf_dir = os.path.join(os.path.expanduser('~'), ".pychemqt")
 databank_Custom_name = conf_dir + os.sep + 'databank.db'
+
+
+# Read only connections of each thread, with format {name: (uri, connection)}
+_local = local()
+
+# Databases loaded in memory, with format {name: (uri, connection)}, the
+# connection is kept open to keep the database in memory
+_memory = {}
+_memoryLock = Lock()
+
+# Number of prepared statements cached by each connection
+_statements = 256
+
+# Connections inherited from parent in a forked process, referenced only to
+# avoid to close them in child
+_inherited = []
+
+
+def _afterFork():
+    """Discard in a forked child process the connections and the databases in
+    memory inherited from parent, the sqlite connections can't be used across
+    a fork, so the child open its own connections"""
+    global _local, _memory, _memoryLock
+    _inherited.append((_local, _memory))
+    _local = local()
+    _memory = {}
+    _memoryLock = Lock()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_afterFork)
+
+
+def _uri(name):
+    """Return the uri to open the database in read only mode, the shipped
+    databank is flagged as immutable so sqlite skip the file locking"""
+    uri = "file:%s?mode=ro" % pathname2url(name)
+    if name == databank_name:
+        uri += "&immutable=1"
+    return uri
+
+
+def connection(name=databank_name):
+    """Return the read only connection to database name for current thread,
+    opened the first time it's used in the thread
+
+    >>> connection() is connection()
+    True
+    """
+    if name in _memory:
+        uri = _memory[name][0]
+    else:
+        uri = _uri(name)
+
+    connections = _local.__dict__.setdefault("connections", {})
+    if name in connections and connections[name][0] == uri:
+        return connections[name][1]
+
+    conn = sqlite3.connect(uri, uri=True, cached_statements=_statements)
+    connections[name] = (uri, conn)
+    return conn
+
+
+def query(sql, parameters=(), name=databank_name):
+    """Run a read query in database name, using the connection of current
+    thread, and return the list of rows. The query must use placeholders for
+    values so its prepared statement is reused by sqlite
+
+    >>> query("SELECT name FROM compuestos WHERE id==?", (2, ))
+    [('Methane',)]
+    """
+    return connection(name).execute(sql, parameters).fetchall()
+
+
+def inMemory(enable=True):
+    """Use a copy in memory of the shipped databank for the read queries of
+    all threads, to avoid the disk access in compute workers. Each process
+    must call it to have its own copy
+
+    >>> inMemory()
+    >>> query("SELECT name FROM compuestos WHERE id==?", (1, ))
+    [('Hydrogen',)]
+    >>> inMemory(False)
+    """
+    with _memoryLock:
+        if not enable:
+            if databank_name in _memory:
+                _memory.pop(databank_name)[1].close()
+            return
+        if databank_name in _memory:
+            return
+
+        # The name is unique for each process so a forked child don't share
+        # the inherited database of parent
+        uri = "file:pychemqt_databank_%i?mode=memory&cache=shared" % (
+            os.getpid())
+        conn = sqlite3.connect(uri, uri=True, check_same_thread=False)
+        source = sqlite3.connect(_uri(databank_name), uri=True)
+        source.backup(conn)
+        source.close()
+        _memory[databank_name] = (uri, conn)
+
+
+databank = connection().cursor()
+N_comp = query("SELECT COUNT(*) AS Total FROM compuestos")[0][0]
+
 if os.path.isfile(databank_Custom_name):
-    databank_Custom = sqlite3.connect(databank_Custom_name).cursor()
-    databank_Custom.execute("SELECT COUNT(*) AS Total FROM compuestos")
-    N_comp_Custom = databank_Custom.fetchone()[0]
+    databank_Custom = connection(databank_Custom_name).cursor()
+    N_comp_Custom = query("SELECT COUNT(*) AS Total FROM compuestos",
+                          name=databank_Custom_name)[0][0]
 else:
     N_comp_Custom = 0
 
 
+# In-memory LRU cache of databank records, keyed by (databank, id), to avoid
+# a query each time a compound is instanced
+_cache = OrderedDict()
+_cacheLock = Lock()
+_cacheSize = 256
+
+
 def transformElement(elemento):
     """Transform list generated in dialog in valid list to save in database"""
     vals = []
@@ -213,6 +337,7 @@ def inserElementsFromArray(name, lista):
         curs.execute(query+str(tuple(vals)))
     conn.commit()
     conn.close()
+    clearCache()
 
 
 def updateElement(elemento, indice):
@@ -277,6 +402,7 @@ def updateElement(elemento, indice):
                 f'UPDATE compuestos SET {variable}={valor} WHERE id=={indice}')
     conn.commit()
     conn.close()
+    clearCache(indice)
 
 
 def deleteElement(indice):
@@ -286,26 +412,94 @@ def deleteElement(indice):
     curs.execute(f"DELETE FROM compuestos WHERE id={indice}")
     conn.commit()
     conn.close()
+    clearCache(indice)
 
 
-def getElement(indice):
-    """Get element from database
-    indice: index in databank of element"""
+def clearCache(indice=None):
+    """Invalidate the cached records of databank
+    indice: index of element to remove from cache, default all elements"""
+    with _cacheLock:
+        if indice is None:
+            _cache.clear()
+        else:
+            for key in [key for key in _cache if key[1] == indice]:
+                del _cache[key]
+
+
+def _name(indice):
+    """Return the name of database with the element indice"""
     if indice > 10000:
-        db_Custom = sqlite3.connect(databank_Custom_name).cursor()
-        db_Custom.execute(f"select * from compuestos where id=={indice}")
-        componente = db_Custom.fetchone()
-    else:
-        db = sqlite3.connect(databank_name).cursor()
-        db.execute(f"select * from compuestos where id=={indice}")
-        componente = db.fetchone()
+        return databank_Custom_name
+    return databank_name
+
 
-    # Change none values for 0s
-    componente = list(componente)
-    while None in componente:
-        componente[componente.index(None)] = 0
+def _record(row):
+    """Return the databank row as a tuple with the none values changed by 0"""
+    return tuple(0 if value is None else value for value in row)
 
-    return tuple(componente)
+
+def getElement(indice):
+    """Get element from database
+    indice: index in databank of element
+
+    The records are cached in memory, so repeated calls for the same element
+    don't query the databank again and return the same immutable tuple
+
+    >>> getElement(2)[1:3]
+    ('CH4', 'Methane')
+    >>> getElement(2) is getElement(2)
+    True
+    """
+    key = (_name(indice), indice)
+    with _cacheLock:
+        if key in _cache:
+            _cache.move_to_end(key)
+            return _cache[key]
+
+    componente = _record(query(
+        "SELECT * FROM compuestos WHERE id==?", (indice, ), key[0])[0])
+
+    with _cacheLock:
+        _cache[key] = componente
+        while len(_cache) > _cacheSize:
+            _cache.popitem(last=False)
+
+    return componente
+
+
+def getElements(indices):
+    """Get several elements from database, with a single query for the
+    elements not cached yet
+    indices: list with the index in databank of elements
+
+    >>> [cmp[2] for cmp in getElements([5, 1, 2])]
+    ['I-Butane', 'Hydrogen', 'Methane']
+    """
+    records = {}
+    missing = {}
+    with _cacheLock:
+        for indice in indices:
+            key = (_name(indice), indice)
+            if key in _cache:
+                _cache.move_to_end(key)
+                records[indice] = _cache[key]
+            else:
+                missing.setdefault(key[0], set()).add(indice)
+
+    for name, ids in missing.items():
+        ids = sorted(ids)
+        sql = "SELECT * FROM compuestos WHERE id IN (%s)" % \
+            ",".join("?"*len(ids))
+        rows = query(sql, ids, name)
+        with _cacheLock:
+            for row in rows:
+                componente = _record(row)
+                records[componente[0]] = componente
+                _cache[(name, componente[0])] = componente
+            while len(_cache) > _cacheSize:
+                _cache.popitem(last=False)
+
+    return [records[indice] for indice in indices]
 
 
 def copyElement(indice):
@@ -318,3 +512,4 @@ def copyElement(indice):
                  + str((10001+N_comp_Custom, ) + vals))
     conn.commit()
     conn.close()
+    clearCache()
@@ -0,0 +1,987 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+
+"""Pychemqt, Chemical Engineering Process simulator
+Copyright (C) 2009-2025, Juan José Gómez Romera <jjgomera@gmail.com>
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+
+Tabular property backend for the multiparameter equations of state in
+:mod:`lib.mEoS`, a fast approximate alternative to the complete equation for
+flowsheets calculating the same pure fluid many times.
+
+The properties are calculated one time for each fluid and reference state
+in grids of pressure-temperature and pressure-enthalpy, saved in the user
+configuration folder as numpy files loaded as memory-mapped arrays. The
+states are then interpolated with the tabular Taylor series expansion
+(TTSE) method or with bicubic interpolation, using the saturation curve to
+avoid mix nodes of different phases.
+
+With the default grids the median deviation from the equation of state is
+below 1e-4 %. The maximum deviations found for carbon dioxide and water are
+0.1% in density, 0.02% in enthalpy and entropy, 0.4% in heat capacities and
+speed of sound and 0.5% in transport properties, growing near the
+saturation curve to 0.25% in density and 1% in heat capacities. The
+saturation states are interpolated in the saturation table with deviations
+below 1e-6 %. The states out of tables range and in the near critical
+region, reduced temperature from 0.9 to 1.1 and reduced pressure from 0.4
+to 1.5, are calculated with the complete equation of state.
+
+  * :class:`Table`: Gridded properties of a fluid
+  * :func:`getTable`: Shared table instance for a fluid and reference state
+  * :class:`Tabular`: Stream definition using the interpolated tables
+
+API reference
+-------------
+
+"""
+
+
+from hashlib import md5
+import os
+
+from numpy import (array, asarray, broadcast_arrays, empty, errstate, exp,
+                   floor, full, full_like, int8, interp, isfinite, linspace,
+                   load, log, logspace, log10, moveaxis, nan, rint, save,
+                   stack, where, zeros)
+from scipy.interpolate import CubicSpline
+
+from lib import unidades
+from lib.config import conf_dir
+from lib.thermo import ThermoAdvanced
+from lib.utilities import refDoc
+
+
+__doi__ = {
+    1:
+        {"autor": "Miyagawa, K., Hill, P.G.",
+         "title": "Rapid and Accurate Calculation of Water and Steam "
+                  "Properties Using the Tabular Taylor Series Expansion "
+                  "Method",
+         "ref": "J. Eng. Gas Turbines Power 123(3) (2001) 707-712",
+         "doi": "10.1115/1.1364520"},
+    2:
+        {"autor": "Bell, I.H., Wronski, J., Quoilin, S., Lemort, V.",
+         "title": "Pure and Pseudo-pure Fluid Thermophysical Property "
+                  "Evaluation and the Open-Source Thermophysical Property "
+                  "Library CoolProp",
+         "ref": "Ind. Eng. Chem. Res. 53(6) (2014) 2498-2508",
+         "doi": "10.1021/ie4033999"}}
+
+
+# Tabulated properties, in SI units
+PROPS = ("T", "rho", "h", "s", "cp", "cv", "w", "dpdT_rho", "dpdrho_T", "mu",
+         "k")
+
+# Near critical region, in reduced temperature and pressure, calculated with
+# the complete equation of state
+Tr_critical = (0.9, 1.1)
+Pr_critical = (0.4, 1.5)
+
+# Version of table files format, the tables saved with other format are
+# calculated again
+_FORMAT = 2
+
+_tables = {}
+
+
+def _shift(a, k, fill):
+    """Return the array shifted k positions in the last axis, a[..., j+k]"""
+    out = full_like(a, fill)
+    if k > 0:
+        out[..., :-k] = a[..., k:]
+    else:
+        out[..., -k:] = a[..., :k]
+    return out
+
+
+def _diff(Z, phase, axis):
+    """Finite differences derivatives of tabulated values in grid index
+    units, using only neighbour nodes of the same phase
+
+    Parameters
+    ----------
+    Z : array
+        Tabulated values, with shape (nprop, nx, ny)
+    phase : array
+        Phase of nodes, with shape (nx, ny), -1 for nodes without values
+    axis : int
+        Axis of node grid to derivate, 0 for x, 1 for y
+
+    Returns
+    -------
+    d1, d2 : array
+        First and second derivatives
+    """
+    Z = moveaxis(Z, axis+1, -1)
+    phase = moveaxis(phase, axis, -1)
+
+    Zp1 = _shift(Z, 1, nan)
+    Zp2 = _shift(Z, 2, nan)
+    Zm1 = _shift(Z, -1, nan)
+    Zm2 = _shift(Z, -2, nan)
+    f1 = _shift(phase, 1, -1) == phase
+    f2 = f1 & (_shift(phase, 2, -1) == phase)
+    b1 = _shift(phase, -1, -1) == phase
+    b2 = b1 & (_shift(phase, -2, -1) == phase)
+
+    # Central differences, second order one sided differences near the
+    # saturation line or the grid limits
+    d1 = where(f1 & b1, (Zp1-Zm1)/2,
+               where(f2, (-3*Z+4*Zp1-Zp2)/2,
+                     where(b2, (3*Z-4*Zm1+Zm2)/2,
+                           where(f1, Zp1-Z, where(b1, Z-Zm1, 0)))))
+    d2 = where(f1 & b1, Zp1-2*Z+Zm1,
+               where(f2, Z-2*Zp1+Zp2, where(b2, Z-2*Zm1+Zm2, 0)))
+    return moveaxis(d1, -1, axis+1), moveaxis(d2, -1, axis+1)
+
+
+def _solved(res):
+    """Mask of solved states in a batch calculation"""
+    return ((res["status"] == 1) | (res["status"] == 3)) & \
+        isfinite(res["rho"])
+
+
+def _hermite(t):
+    """Cubic Hermite basis functions for values and derivatives at both
+    extremes of unit interval"""
+    t2 = t*t
+    t3 = t2*t
+    return 2*t3-3*t2+1, -2*t3+3*t2, t3-2*t2+t, t3-t2
+
+
+class _Grid():
+    """Tabulated values with derivatives in a regular grid
+
+    The data array has shape (6, nprop, nx, ny) with the values and the
+    derivatives Zx, Zy, Zxx, Zyy, Zxy in grid index units
+    """
+
+    def __init__(self, x, y, data, phase):
+        self.x0 = x[0]
+        self.dx = x[1]-x[0]
+        self.y0 = y[0]
+        self.dy = y[1]-y[0]
+        self.nx = len(x)
+        self.ny = len(y)
+        self.data = data
+        self.phase = phase
+
+    @classmethod
+    def build(cls, x, y, Z, phase):
+        """Calculate the derivatives of tabulated values"""
+        Zx, Zxx = _diff(Z, phase, 0)
+        Zy, Zyy = _diff(Z, phase, 1)
+        Zxy = _diff(Zy, phase, 0)[0]
+        return stack((Z, Zx, Zy, Zxx, Zyy, Zxy))
+
+    def _taylor(self, i, j, du, dv):
+        """Second order Taylor series expansion from nodes i, j"""
+        D = self.data[:, :, i, j]
+        return D[0] + D[1]*du + D[2]*dv + D[3]*du**2/2 + D[4]*dv**2/2 + \
+            D[5]*du*dv
+
+    def __call__(self, x, y, phase, interpolation="bicubic", ysat=None,
+                 Zsat=None):
+        """Interpolate the properties at x, y of the requested phase
+
+        Parameters
+        ----------
+        x, y : array
+            Coordinates of states
+        phase : array
+            Phase of states, 0 for liquid, 1 for vapor or supercritical
+        interpolation : str
+            Interpolation method, TTSE or bicubic
+        ysat : array, optional
+            Coordinate y of saturation at x, NaN if x is supercritical
+        Zsat : array, optional
+            Properties of saturated phase at x, with shape (nprop, N)
+
+        Returns
+        -------
+        Z : array
+            Properties with shape (nprop, N), NaN for the states without
+            nodes of the same phase near
+
+        Notes
+        -----
+        The cells crossed by the saturation line are calculated with the
+        expansion from the nearest node of the same phase, corrected with
+        the deviation of that expansion at the saturation state, linearly
+        reduced to zero at the node.
+        """
+        u = (x-self.x0)/self.dx
+        v = (y-self.y0)/self.dy
+        N = u.size
+        inside = (u >= 0) & (u <= self.nx-1) & (v >= 0) & (v <= self.ny-1)
+        u = where(inside, u, 0)
+        v = where(inside, v, 0)
+
+        # TTSE, expansion from the nearest node of the same phase
+        i0 = rint(u).astype(int)
+        j0 = rint(v).astype(int)
+        su = where(u >= i0, 1, -1)
+        sv = where(v >= j0, 1, -1)
+        i = full(N, -1)
+        j = full(N, -1)
+        for di, dj in ((0, 0), (0, sv), (su, 0), (su, sv), (0, -sv),
+                       (-su, 0)):
+            ic = (i0+di).clip(0, self.nx-1)
+            jc = (j0+dj).clip(0, self.ny-1)
+            new = (i < 0) & (self.phase[ic, jc] == phase)
+            i = where(new, ic, i)
+            j = where(new, jc, j)
+
+        found = inside & (i >= 0)
+        i = where(found, i, 0)
+        j = where(found, j, 0)
+        Z = self._taylor(i, j, u-i, v-j)
+
+        # Cells with all nodes in the same phase of state
+        ic = floor(u).astype(int).clip(0, self.nx-2)
+        jc = floor(v).astype(int).clip(0, self.ny-2)
+        cell = (self.phase[ic, jc] == phase) & \
+            (self.phase[ic+1, jc] == phase) & \
+            (self.phase[ic, jc+1] == phase) & \
+            (self.phase[ic+1, jc+1] == phase)
+
+        if interpolation == "bicubic" and cell.any():
+            hu = _hermite(u-ic)
+            hv = _hermite(v-jc)
+            B = zeros(Z.shape)
+            for a in (0, 1):
+                for b in (0, 1):
+                    D = self.data[:, :, ic+a, jc+b]
+                    B += D[0]*hu[a]*hv[b] + D[1]*hu[2+a]*hv[b] + \
+                        D[2]*hu[a]*hv[2+b] + D[5]*hu[2+a]*hv[2+b]
+            Z = where(cell, B, Z)
+
+        if ysat is not None:
+            vsat = (ysat-self.y0)/self.dy
+            near = ~cell & isfinite(vsat)
+            if near.any():
+                vsat = where(near, vsat, v)
+                error = Zsat - self._taylor(i, j, u-i, vsat-j)
+                with errstate(invalid="ignore", divide="ignore"):
+                    w = ((v-j)/(vsat-j)).clip(0, 1)
+                Z = where(near & isfinite(w) & isfinite(error), Z+w*error, Z)
+
+        return where(found, Z, nan)
+
+
+class Table():
+    """Gridded properties of a pure fluid calculated with its multiparameter
+    equation of state
+
+    Parameters
+    ----------
+    fluid : MEoS subclass
+        Fluid class of :mod:`lib.mEoS`
+    eq : int
+        Index of equation of state
+    visco : int
+        Index of viscosity correlation
+    thermal : int
+        Index of thermal conductivity correlation
+    ref : str
+        Code of enthalpy-entropy reference state, see :class:`lib.meos.MEoS`
+    refvalues : list
+        Custom values of reference state
+    nP : int
+        Number of pressure nodes, in logarithmic scale
+    nT : int
+        Number of temperature nodes in pressure-temperature table
+    nh : int
+        Number of enthalpy nodes in pressure-enthalpy table
+    nsat : int
+        Number of temperature nodes in saturation curve
+    Tmin, Tmax : float, optional
+        Temperature range of tables, default the equation range limited to
+        twice the critical temperature, [K]
+    Pmin, Pmax : float, optional
+        Pressure range of tables, default from the lower of triple point
+        pressure and 1e-3·Pc, at least 1e-5·Pc, to the equation limit limited
+        to ten times the critical pressure, [Pa]
+
+    Notes
+    -----
+    The calculation of tables take from several seconds to a few minutes,
+    most of time used in transport properties, so the tables are saved in
+    the user configuration folder and only calculated the first time.
+    """
+
+    def __init__(self, fluid, eq=0, visco=0, thermal=0, ref=None,
+                 refvalues=None, nP=100, nT=100, nh=100, nsat=400, Tmin=None,
+                 Tmax=None, Pmin=None, Pmax=None):
+        self.fluid = fluid
+        self.options = {"eq": eq, "visco": visco, "thermal": thermal,
+                        "ref": ref, "refvalues": refvalues}
+        self.meos = fluid(**self.options)
+        self.meos._ref(ref, refvalues)
+
+        cte = self.meos._constants
+        if Tmin is None:
+            Tmin = cte["Tmin"]
+        if Tmax is None:
+            Tmax = min(cte["Tmax"], 2*self.meos.Tc)
+        if Pmin is None:
+            Pmin = min(self.meos._Vapor_Pressure(Tmin), 1e-3*self.meos.Pc)
+            Pmin = max(Pmin, 1e-5*self.meos.Pc)
+        if Pmax is None:
+            Pmax = min(cte["Pmax"]*1000, 10*self.meos.Pc)
+        self.size = (nP, nT, nh, nsat)
+        self.range = (Tmin, Tmax, Pmin, Pmax)
+
+        txt = repr((_FORMAT, fluid.__name__, sorted(self.options.items()),
+                    self.size, self.range))
+        key = "%s-%s" % (fluid.__name__, md5(txt.encode()).hexdigest()[:10])
+        self.path = os.path.join(conf_dir, "tables", key)
+
+        if not os.path.isfile(os.path.join(self.path, "axes.npy")):
+            with errstate(all="ignore"):
+                self.build()
+        self.load()
+
+    def _files(self):
+        return ("axes", "sat", "PT", "PT_phase", "Ph", "Ph_phase")
+
+    def build(self):
+        """Calculate the tables and save to files"""
+        nP, nT, nh, nsat = self.size
+        Tmin, Tmax, Pmin, Pmax = self.range
+        Tc = self.meos.Tc
+        Pc = self.meos.Pc
+        props = [p for p in PROPS if p not in ("mu", "k")]
+
+        # Saturation curve, liquid and vapor properties
+        Tsat = linspace(Tmin, Tc*Tr_critical[0], nsat)
+        sat = empty((2*len(PROPS)+1, nsat))
+        for x, start in ((0, 1), (1, 1+len(PROPS))):
+            res = self.fluid.batch(T=Tsat, x=x, props=props+["P"],
+                                   **self.options)
+            sat[0] = res["P"]
+            self._transport(res)
+            for n, prop in enumerate(PROPS):
+                sat[start+n] = res[prop]
+
+        # Pressure-temperature table
+        P = logspace(log10(Pmin), log10(Pmax), nP)
+        T = linspace(Tmin, Tmax, nT)
+        res = self.fluid.batch(T=T[None, :], P=P[:, None],
+                               props=props+["P", "x"], **self.options)
+        self._checkPhase(res, Tsat, sat[0], props+["P", "x"])
+        self._transport(res)
+        ok = _solved(res)
+        liquid = (P[:, None] < Pc) & (res["x"] == 0)
+        phasePT = where(ok, where(liquid, 0, 1), -1).astype(int8)
+        PT = _Grid.build(log(P), T, stack([res[p] for p in PROPS]), phasePT)
+
+        # Pressure-enthalpy table, with enthalpy range of previous table
+        hmin = res["h"][ok].min()
+        hmax = res["h"][ok].max()
+        h = linspace(hmin, hmax, nh)
+        res = self.fluid.batch(P=P[:, None], h=h[None, :],
+                               props=props+["P", "x"], **self.options)
+        single = (res["x"] <= 0) | (res["x"] >= 1) | (P[:, None] >= Pc)
+        for prop in PROPS:
+            if prop in res:
+                res[prop] = where(single, res[prop], nan)
+        self._transport(res)
+        ok = _solved(res)
+        liquid = (P[:, None] < Pc) & (res["x"] <= 0)
+        phasePh = where(ok, where(single, where(liquid, 0, 1), 2), -1)
+        phasePh = phasePh.astype(int8)
+        Ph = _Grid.build(log(P), h, stack([res[p] for p in PROPS]), phasePh)
+
+        axes = array([(log(Pmin), log(Pmax), nP), (Tmin, Tmax, nT),
+                      (hmin, hmax, nh)])
+        os.makedirs(self.path, exist_ok=True)
+        for name, data in zip(self._files(),
+                              (axes, sat, PT, phasePT, Ph, phasePh)):
+            # Write to temporal file to avoid load incomplete tables
+            fname = os.path.join(self.path, name+".npy")
+            with open(fname+".tmp", "wb") as stream:
+                save(stream, data)
+            os.replace(fname+".tmp", fname)
+
+    def _checkPhase(self, res, Tsat, Psat, props):
+        """Check the phase of subcritical states of a pressure-temperature
+        batch calculation with the saturation curve, liquid at pressure over
+        the vapor pressure, the wrong states are calculated again with the
+        complete equation of state and discarded if they are still wrong"""
+        Tc = self.meos.Tc
+        T = res["T"]
+        P = res["P"]
+
+        def wrong():
+            """Mask of states with root in the wrong phase"""
+            Ps = exp(interp(T, Tsat, log(Psat)))
+            for idx in zip(*((T > Tsat[-1]) & (T < Tc)).nonzero()):
+                Ps[idx] = self.meos._Vapor_Pressure(T[idx])
+            dense = res["rho"] > self.meos.rhoc
+            return _solved(res) & (T < Tc) & ((P > Ps) != dense)
+
+        for idx in zip(*wrong().nonzero()):
+            try:
+                fluid = self.fluid(T=T[idx], P=P[idx], **self.options)
+            except ValueError:
+                res["status"][idx] = 0
+                continue
+            res["status"][idx] = fluid.status
+            for prop in props:
+                res[prop][idx] = getattr(fluid, prop)
+        res["status"][wrong()] = 0
+
+    def _transport(self, res):
+        """Calculate the transport properties in the states of a batch
+        calculation, only single phase states"""
+        mu = full(res["rho"].shape, nan)
+        k = full(res["rho"].shape, nan)
+        fluid = self.fluid(**self.options)
+        fase = ThermoAdvanced()
+        for idx in zip(*isfinite(res["rho"]*res["cp"]).nonzero()):
+            rho = res["rho"][idx]
+            T = res["T"][idx]
+            fluid.T = unidades.Temperature(T)
+            fluid.rho = unidades.Density(rho)
+            fluid.P = unidades.Pressure(res["P"][idx])
+            fase.rho = fluid.rho
+            fase.cp = unidades.SpecificHeat(res["cp"][idx])
+            fase.cv = unidades.SpecificHeat(res["cv"][idx])
+            fase.cp_cv = unidades.Dimensionless(fase.cp/fase.cv)
+            fase.dpdT_rho = unidades.PressureTemperature(res["dpdT_rho"][idx])
+            fase.dpdrho_T = unidades.PressureDensity(res["dpdrho_T"][idx])
+            fase.drhodP_T = unidades.DensityPressure(1/fase.dpdrho_T)
+            fase.kappa = unidades.InvPressure(1/rho/fase.dpdrho_T)
+            fase.IntP = unidades.Pressure(T*fase.dpdT_rho-fluid.P)
+            try:
+                fase.mu = fluid._Viscosity(rho, T, fase)
+                mu[idx] = fase.mu
+                k[idx] = fluid._ThCond(rho, T, fase)
+            except (ArithmeticError, TypeError, ValueError):
+                pass
+        res["mu"] = mu
+        res["k"] = k
+
+    def load(self):
+        """Load the tables from files as memory-mapped arrays"""
+        data = {}
+        for name in self._files():
+            data[name] = load(os.path.join(self.path, name+".npy"),
+                              mmap_mode="r")
+        lnP, T, h = [linspace(start, stop, int(n))
+                     for start, stop, n in data["axes"]]
+        self.PT = _Grid(lnP, T, data["PT"], data["PT_phase"])
+        self.Ph = _Grid(lnP, h, data["Ph"], data["Ph_phase"])
+
+        # Saturation curve interpolated with cubic splines
+        sat = asarray(data["sat"])
+        n = len(PROPS)
+        Tsat = sat[1]
+        self.Tsat = (Tsat[0], Tsat[-1])
+        self.Psat = (sat[0][0], sat[0][-1])
+        self._lnPsat = CubicSpline(Tsat, log(sat[0]))
+        self._invTsat = CubicSpline(log(sat[0]), 1/Tsat)
+        self._satL = CubicSpline(Tsat, sat[1:1+n], axis=1)
+        self._satG = CubicSpline(Tsat, sat[1+n:], axis=1)
+
+    def saturation(self, T=None, P=None):
+        """Saturated liquid and vapor properties at temperature or pressure,
+        inside the saturation table range
+
+        Returns
+        -------
+        T : array
+            Saturation temperature, [K]
+        P : array
+            Saturation pressure, [Pa]
+        liquid, vapor : array
+            Properties of saturated phases, with shape (nprop, N)
+        """
+        if T is None:
+            T = 1/self._invTsat(log(P))
+        else:
+            P = exp(self._lnPsat(T))
+        return T, P, self._satL(T), self._satG(T)
+
+    @refDoc(__doi__, [1, 2])
+    def __call__(self, P=None, T=None, h=None, x=None,
+                 interpolation="bicubic"):
+        """Calculate the properties of states defined by pressure and
+        temperature, pressure and enthalpy, pressure and quality or
+        temperature and quality
+
+        Parameters
+        ----------
+        P : float or array
+            Pressure, [Pa]
+        T : float or array
+            Temperature, [K]
+        h : float or array
+            Enthalpy, [J/kg]
+        x : float or array
+            Quality, [-]
+        interpolation : str
+            Interpolation method, TTSE or bicubic
+
+        Returns
+        -------
+        result : dict
+            Arrays with the T, P and x values and the properties of liquid
+            and vapor phases in the keys liquid and vapor, with shape (nprop,
+            N), NaN for the states that must be calculated with the complete
+            equation of state, out of tables range or in the near critical
+            region
+        """
+        inputs = {"P": P, "T": T, "h": h, "x": x}
+        names = [key for key, value in inputs.items() if value is not None]
+        if len(names) != 2 or "h" in names and "P" not in names or \
+                names == ["T", "h"]:
+            raise ValueError("Unsupported input pair")
+        values = broadcast_arrays(
+            *[asarray(inputs[key], dtype=float).ravel() for key in names])
+        inputs.update(zip(names, values))
+        P, T, h, x = inputs["P"], inputs["T"], inputs["h"], inputs["x"]
+        N = values[0].size
+        n = len(PROPS)
+        Tc = self.meos.Tc
+        Pc = self.meos.Pc
+
+        liquid = full((n, N), nan)
+        vapor = full((n, N), nan)
+        if x is not None:
+            # Saturation states
+            if T is None:
+                valid = (P >= self.Psat[0]) & (P <= self.Psat[1])
+                P = where(valid, P, self.Psat[0])
+                T, Psat, liq, gas = self.saturation(P=P)
+            else:
+                valid = (T >= self.Tsat[0]) & (T <= self.Tsat[1])
+                T = where(valid, T, self.Tsat[0])
+                T, P, liq, gas = self.saturation(T=T)
+            valid &= (x >= 0) & (x <= 1)
+            liquid = where(valid & (x < 1), liq, nan)
+            vapor = where(valid & (x > 0), gas, nan)
+            T = where(valid, T, nan)
+            P = where(valid, P, nan)
+            x = where(valid, x, nan)
+
+        else:
+            # Single phase states, with the phase defined by the saturation
+            # temperature or the saturated enthalpies
+            sub = P < Pc
+            insat = (P >= self.Psat[0]) & (P <= self.Psat[1])
+            Ts, Ps, liq, gas = self.saturation(
+                P=where(insat, P, self.Psat[1]))
+            lnP = log(P)
+            if h is None:
+                Ts = where(P < self.Psat[0], 0, Ts)
+                phase = where(sub & (T < Ts), 0, 1)
+                Z = self.PT(lnP, T, phase, interpolation,
+                            where(insat, Ts, nan), where(phase, gas, liq))
+                two = zeros(N, dtype=bool)
+            else:
+                hl = liq[PROPS.index("h")]
+                hv = gas[PROPS.index("h")]
+                hl = where(P < self.Psat[0], -float("inf"), hl)
+                hv = where(P < self.Psat[0], -float("inf"), hv)
+                phase = where(sub & (h < hl), 0, 1)
+                two = sub & (h >= hl) & (h <= hv)
+                Z = self.Ph(lnP, h, phase, interpolation,
+                            where(insat, where(phase, hv, hl), nan),
+                            where(phase, gas, liq))
+
+                # Two phases states, the saturation states near critical
+                # point are out of saturation table
+                with errstate(invalid="ignore", divide="ignore"):
+                    xs = (h-hl)/(hv-hl)
+                mix = two & insat
+                liquid = where(mix, liq, nan)
+                vapor = where(mix, gas, nan)
+                T = where(two, where(insat, Ts, nan), Z[0])
+                x = where(mix, xs, nan)
+
+            # The supercritical states at temperature below critical are
+            # defined as liquid like the equation of state
+            T = where(two | isfinite(Z[0]), T, nan)
+            single = where((phase == 0) | ~sub & (T < Tc), 0, 1)
+            liquid = where(~two & (single == 0), Z, liquid)
+            vapor = where(~two & (single == 1), Z, vapor)
+            x = where(two, x, single)
+
+            # Near critical region, the saturation table is valid to the
+            # upper temperature limit
+            critical = ~two & (T > Tr_critical[0]*Tc) & \
+                (T < Tr_critical[1]*Tc) & (P > Pr_critical[0]*Pc) & \
+                (P < Pr_critical[1]*Pc)
+            liquid[:, critical] = nan
+            vapor[:, critical] = nan
+            T = where(critical, nan, T)
+            x = where(isfinite(T), x, nan)
+
+        return {"T": T, "P": P, "x": x, "liquid": liquid, "vapor": vapor}
+
+
+def getTable(fluid, **kwargs):
+    """Return the table of a fluid, shared by all states of the same fluid
+    and reference state
+
+    Parameters
+    ----------
+    fluid : MEoS subclass
+        Fluid class of :mod:`lib.mEoS`
+    kwargs : dict
+        Any other parameter of :class:`Table`
+    """
+    key = (fluid, repr(sorted(kwargs.items())))
+    if key not in _tables:
+        _tables[key] = Table(fluid, **kwargs)
+    return _tables[key]
+
+
+class Tabular(ThermoAdvanced):
+    """Stream definition of a pure fluid with the properties interpolated in
+    the tables of its multiparameter equation of state
+
+    The state can be defined with the input pairs:
+
+        * T, P
+        * P, h
+        * T, x
+        * P, x
+
+    Parameters
+    ----------
+    fluid : MEoS subclass
+        Fluid class of :mod:`lib.mEoS`
+    T : float
+        Temperature, [K]
+    P : float
+        Pressure, [Pa]
+    x : float
+        Quality, [-]
+    h : float
+        Enthalpy, [J/kg]
+    eq, visco, thermal, ref, refvalues
+        Options of the equation of state, see :class:`lib.meos.MEoS`
+    interpolation : str
+        Interpolation method, TTSE or bicubic
+    table : Table, optional
+        Table to use instead of the shared table of fluid
+
+    Notes
+    -----
+    The states out of tables range or in the near critical region are
+    calculated with the complete equation of state, the tabular attribute
+    show when the state has been interpolated.
+
+    Examples
+    --------
+    A coarse table of carbon dioxide is enough for a few significant digits
+
+    >>> from lib.mEoS import CO2
+    >>> table = Table(CO2, nP=40, nT=40, nh=40, nsat=100)
+    >>> st = Tabular(table=table, T=300, P=1e6)
+    >>> ref = CO2(T=300, P=1e6)
+    >>> st.tabular
+    True
+    >>> "%0.1f %0.1f" % (st.rho, ref.rho)
+    '18.6 18.6'
+    >>> "%0.3f %0.3f" % (st.cp.kJkgK, ref.cp.kJkgK)
+    '0.921 0.921'
+    >>> st2 = Tabular(table=table, P=1e6, h=st.h)
+    >>> "%0.2f" % st2.T
+    '300.00'
+    >>> st = Tabular(table=table, T=250, x=0.5)
+    >>> "%0.1f %0.2f" % (st.Liquido.rho, st.Gas.rho)
+    '1046.0 46.64'
+
+    The states in the near critical region use the equation of state
+
+    >>> st = Tabular(table=table, T=305, P=7.5e6)
+    >>> st.tabular
+    False
+
+    The compressed liquid at low pressure is near the vapor spinodal, the
+    nodes of table must be in the liquid root
+
+    >>> from numpy.random import default_rng
+    >>> from lib.mEoS import H2O
+    >>> table = Table(H2O, nP=20, nT=20, nh=20, nsat=50, Tmin=275, Tmax=360,
+    ...               Pmin=1e3, Pmax=2e5)
+    >>> rng = default_rng(1)
+    >>> error = []
+    >>> for T, r in zip(rng.uniform(275, 355, 20), rng.uniform(1.2, 4, 20)):
+    ...     P = r*H2O(T=T, x=0).P
+    ...     st = Tabular(table=table, T=T, P=P)
+    ...     ref = H2O(T=T, P=P)
+    ...     error.append(abs(st.h/ref.h-1))
+    >>> max(error) < 1e-4
+    True
+    """
+
+    kwargs = {"fluid": None,
+              "table": None,
+              "T": 0.0,
+              "P": 0.0,
+              "x": None,
+              "h": None,
+
+              "eq": 0,
+              "visco": 0,
+              "thermal": 0,
+              "ref": None,
+              "refvalues": None,
+              "interpolation": "bicubic"}
+
+    _options = ("eq", "visco", "thermal", "ref", "refvalues")
+    tabular = False
+
+    def __init__(self, **kwargs):
+        kw = self.__class__.kwargs.copy()
+        kw.update(kwargs)
+        if kw["table"] is not None:
+            self.table = kw["table"]
+        else:
+            options = {key: kw[key] for key in self._options}
+            self.table = getTable(kw["fluid"], **options)
+        ThermoAdvanced.__init__(self, **kwargs)
+
+    def __getattr__(self, name):
+        # Fluid constants are defined in the equation of state instance
+        if name.startswith("__") or name in ("table", "kwargs"):
+            raise AttributeError(name)
+        return getattr(self.table.meos, name)
+
+    def _new(self, **kw):
+        """Create a new instance, using the same table when possible"""
+        options = self.table.options.copy()
+        options.update({key: kw[key] for key in self._options if key in kw})
+        kw.update(options)
+        kw["interpolation"] = self.kwargs["interpolation"]
+        if options == self.table.options:
+            kw["table"] = self.table
+        else:
+            kw["fluid"] = self.table.fluid
+        return self.__class__(**kw)
+
+    def cleanOldValues(self, **kwargs):
+        """Convert alternative input parameters"""
+        self.kwargs.update(kwargs)
+
+    @property
+    def calculable(self):
+        """Check if instance has enough input to be calculated"""
+        self._inputs = {}
+        if self.kwargs["T"] and self.kwargs["P"]:
+            self._inputs = {"T": self.kwargs["T"], "P": self.kwargs["P"]}
+        elif self.kwargs["P"] and self.kwargs["h"] is not None:
+            self._inputs = {"P": self.kwargs["P"], "h": self.kwargs["h"]}
+        elif self.kwargs["T"] and self.kwargs["x"] is not None:
+            self._inputs = {"T": self.kwargs["T"], "x": self.kwargs["x"]}
+        elif self.kwargs["P"] and self.kwargs["x"] is not None:
+            self._inputs = {"P": self.kwargs["P"], "x": self.kwargs["x"]}
+        return bool(self._inputs)
+
+    def calculo(self):
+        res = self.table(interpolation=self.kwargs["interpolation"],
+                         **self._inputs)
+        if not isfinite(res["T"][0]):
+            self._complete()
+            return
+
+        self.tabular = True
+        self.T = unidades.Temperature(res["T"][0])
+        self.P = unidades.Pressure(res["P"][0])
+        self.x = unidades.Dimensionless(res["x"][0])
+        self.Tr = unidades.Dimensionless(self.T/self.Tc)
+        self.Pr = unidades.Dimensionless(self.P/self.Pc)
+        if 0 < self.x < 1 or "x" in self._inputs:
+            region = 4
+        else:
+            region = 0
+        self.phase = self.getphase(Tc=self.Tc, Pc=self.Pc, T=self.T, P=self.P,
+                                   x=self.x, region=region)
+
+        self.Liquido = ThermoAdvanced()
+        self.Gas = ThermoAdvanced()
+        liquid = res["liquid"][:, 0]
+        vapor = res["vapor"][:, 0]
+        if self.x == 0:
+            self.fill(self.Liquido, liquid)
+            self.fill(self, liquid)
+            self.fillNone(self.Gas)
+        elif self.x == 1:
+            self.fill(self.Gas, vapor)
+            self.fill(self, vapor)
+            self.fillNone(self.Liquido)
+        else:
+            self.fill(self.Liquido, liquid)
+            self.fill(self.Gas, vapor)
+            self.fillNone(self)
+
+            x = self.x
+            self.v = unidades.SpecificVolume(x*self.Gas.v+(1-x)*self.Liquido.v)
+            self.rho = unidades.Density(1/self.v)
+            self.h = unidades.Enthalpy(x*self.Gas.h+(1-x)*self.Liquido.h)
+            self.s = unidades.SpecificHeat(x*self.Gas.s+(1-x)*self.Liquido.s)
+            self.u = unidades.Enthalpy(x*self.Gas.u+(1-x)*self.Liquido.u)
+            self.a = unidades.Enthalpy(x*self.Gas.a+(1-x)*self.Liquido.a)
+            self.g = unidades.Enthalpy(x*self.Gas.g+(1-x)*self.Liquido.g)
+            self.rhoM = unidades.MolarDensity(self.rho/self.M)
+            self.hM = unidades.MolarEnthalpy(self.h*self.M)
+            self.sM = unidades.MolarSpecificHeat(self.s*self.M)
+            self.uM = unidades.MolarEnthalpy(self.u*self.M)
+            self.aM = unidades.MolarEnthalpy(self.a*self.M)
+            self.gM = unidades.MolarEnthalpy(self.g*self.M)
+
+        # Ideal gas properties
+        cp0 = self.table.fluid._prop0(self, self.rho, self.T)
+        cp0["w"] = (cp0["cp"]/cp0["cv"]*self.R*self.T)**0.5
+        self._cp0(cp0)
+
+        if self.x < 1 and self.Tt <= self.T <= self.Tc:
+            self.sigma = unidades.Tension(
+                self.table.fluid._Surface(self, self.T))
+        else:
+            self.sigma = unidades.Tension(None)
+
+        if 0 < self.x < 1:
+            self.Hvap = unidades.Enthalpy(self.Gas.h-self.Liquido.h)
+            self.Svap = unidades.SpecificHeat(self.Gas.s-self.Liquido.s)
+        else:
+            self.Hvap = unidades.Enthalpy(None)
+            self.Svap = unidades.SpecificHeat(None)
+        self.invT = unidades.InvTemperature(-1/self.T)
+
+    def _complete(self):
+        """Calculate the state with the complete equation of state"""
+        kw = self.table.options.copy()
+        kw.update(self._inputs)
+        state = self.table.fluid(**kw)
+        if state.status not in (1, 3):
+            raise ValueError(state.msg)
+        for key, value in state.__dict__.items():
+            if key != "kwargs":
+                self.__dict__[key] = value
+        self.tabular = False
+
+    def fill(self, fase, values):
+        """Fill phase properties from the interpolated values"""
+        prop = dict(zip(PROPS, values))
+        T = self.T
+        P = self.P
+
+        fase._bool = True
+        fase.M = unidades.Dimensionless(self.M)
+        fase.rho = unidades.Density(prop["rho"])
+        fase.v = unidades.SpecificVolume(1/fase.rho)
+        fase.Z = unidades.Dimensionless(P*fase.v/T/self.R)
+
+        fase.h = unidades.Enthalpy(prop["h"])
+        fase.s = unidades.SpecificHeat(prop["s"])
+        fase.u = unidades.Enthalpy(fase.h-P*fase.v)
+        fase.a = unidades.Enthalpy(fase.u-T*fase.s)
+        fase.g = unidades.Enthalpy(fase.h-T*fase.s)
+
+        # The fugacity isn't tabulated
+        fase.fi = [unidades.Dimensionless(None)]
+        fase.f = [unidades.Pressure(None)]
+
+        fase.cp = unidades.SpecificHeat(prop["cp"])
+        fase.cv = unidades.SpecificHeat(prop["cv"])
+        fase.cp_cv = unidades.Dimensionless(fase.cp/fase.cv)
+        fase.w = unidades.Speed(prop["w"])
+
+        fase.rhoM = unidades.MolarDensity(fase.rho/self.M)
+        fase.hM = unidades.MolarEnthalpy(fase.h*self.M)
+        fase.sM = unidades.MolarSpecificHeat(fase.s*self.M)
+        fase.uM = unidades.MolarEnthalpy(fase.u*self.M)
+        fase.aM = unidades.MolarEnthalpy(fase.a*self.M)
+        fase.gM = unidades.MolarEnthalpy(fase.g*self.M)
+        fase.cvM = unidades.MolarSpecificHeat(fase.cv*self.M)
+        fase.cpM = unidades.MolarSpecificHeat(fase.cp*self.M)
+
+        # Volumetric derivatives from the tabulated pressure derivatives
+        dpdT = prop["dpdT_rho"]
+        dpdrho = prop["dpdrho_T"]
+        fase.dpdT_rho = unidades.PressureTemperature(dpdT)
+        fase.dpdrho_T = unidades.PressureDensity(dpdrho)
+        fase.drhodP_T = unidades.DensityPressure(1/dpdrho)
+        fase.drhodT_P = unidades.DensityTemperature(-dpdT/dpdrho)
+        fase.alfav = unidades.InvTemperature(dpdT/dpdrho/fase.rho)
+        fase.kappa = unidades.InvPressure(1/dpdrho/fase.rho)
+        fase.alfap = unidades.InvTemperature(dpdT/P)
+        fase.betap = unidades.Density(fase.rho**2*dpdrho/P)
+
+        fase.gamma = unidades.Dimensionless(
+            -fase.v/P*self.derivative("P", "v", "s", fase))
+        fase.joule = unidades.TemperaturePressure(
+            self.derivative("T", "P", "h", fase))
+        fase.Gruneisen = unidades.Dimensionless(fase.v/fase.cv*dpdT)
+        fase.IntP = unidades.Pressure(self.derivative("u", "v", "T", fase))
+        fase.kappas = unidades.InvPressure(
+            -1/fase.v*self.derivative("v", "P", "s", fase))
+        fase.betas = unidades.TemperaturePressure(
+            self.derivative("T", "P", "s", fase))
+        fase.kt = unidades.Dimensionless(
+            -fase.v/P*self.derivative("P", "v", "T", fase))
+        fase.ks = unidades.Dimensionless(
+            -fase.v/P*self.derivative("P", "v", "s", fase))
+        fase.Ks = unidades.Pressure(
+            -fase.v*self.derivative("P", "v", "s", fase))
+        fase.Kt = unidades.Pressure(
+            -fase.v*self.derivative("P", "v", "T", fase))
+        fase.dhdT_rho = unidades.SpecificHeat(
+            self.derivative("h", "T", "v", fase))
+        fase.dhdT_P = unidades.SpecificHeat(
+            self.derivative("h", "T", "P", fase))
+        fase.dhdP_T = unidades.EnthalpyPressure(
+            self.derivative("h", "P", "T", fase))
+        fase.deltat = fase.dhdP_T
+        fase.dhdP_rho = unidades.EnthalpyPressure(
+            self.derivative("h", "P", "v", fase))
+        fase.dhdrho_T = unidades.EnthalpyDensity(
+            -fase.v**2*self.derivative("h", "v", "T", fase))
+        fase.dhdrho_P = unidades.EnthalpyDensity(
+            -fase.v**2*self.derivative("h", "v", "P", fase))
+        fase.Z_rho = unidades.SpecificVolume((fase.Z-1)/fase.rho)
+        fase.hInput = unidades.Enthalpy(
+            fase.v*self.derivative("h", "v", "P", fase))
+
+        # The virial coefficients aren't tabulated
+        fase.virialB = unidades.SpecificVolume(None)
+        fase.virialC = unidades.SpecificVolume_square(None)
+        fase.invT = unidades.InvTemperature(-1/T)
+
+        fase.mu = unidades.Viscosity(prop["mu"])
+        fase.k = unidades.ThermalConductivity(prop["k"])
+        if isfinite(prop["mu"]):
+            fase.nu = unidades.Diffusivity(fase.mu/fase.rho)
+        else:
+            fase.nu = unidades.Diffusivity(None)
+        if isfinite(prop["k"]):
+            fase.alfa = unidades.Diffusivity(fase.k/fase.rho/fase.cp)
+        else:
+            fase.alfa = unidades.Diffusivity(None)
+        if isfinite(prop["mu"]) and isfinite(prop["k"]):
+            fase.Prandt = unidades.Dimensionless(fase.mu*fase.cp/fase.k)
+        else:
+            fase.Prandt = unidades.Dimensionless(None)
+        fase.epsilon = unidades.Dimensionless(
+            self.table.fluid._Dielectric(self, fase.rho, T))
+        fase.fraccion = [1]
+        fase.fraccion_masica = [1]
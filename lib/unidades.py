@@ -106,7 +106,16 @@ import logging
 import os
 
 import scipy.constants as k
-from tools.qt import QtCore, translate
+
+try:
+    from tools.qt import QtCore, translate
+except ImportError:
+    # Headless use without qt, see run.py, the texts aren't translated
+    QtCore = None
+
+    def translate(context, text):
+        """Replacement of qt translate function without translation"""
+        return text
 
 from lib.config import conf_dir, getMainWindowConfig
 from lib.utilities import representacion
@@ -179,6 +188,20 @@ def K2Re(K):
     return (K - 273.15) / 1.25
 
 
+class _Rate(object):
+    """Descriptor to calculate on demand the value of instance in a unit from
+    the conversion rate, avoid the calculation of unused units"""
+    __slots__ = ("rate", )
+
+    def __init__(self, rate):
+        self.rate = rate
+
+    def __get__(self, instance, owner):
+        if instance is None:
+            return self
+        return instance._data / self.rate
+
+
 class unidad(float):
     """
     Generic class to model units.
@@ -194,7 +217,16 @@ class unidad(float):
         * __units_set__: Dict with standart unit for units system (*altsi*,
         *si*, *metric*, *cgs*, *english*)
 
+    The units values are calculated only when are requested, each child class
+    must define a empty __slots__ to keep the instances lightweight
+
+    >>> P = Pressure(1, "atm")
+    >>> "%0.4f %0.4f %0.4f" % (P.bar, P.psi, P.kgcm2)
+    '1.0132 14.6959 1.0332'
+    >>> P.psi == P._data/Pressure.rates["psi"]
+    True
     """
+    __slots__ = ("_data", "code", "magnitud")
     __title__ = ""
     rates = {}
     __text__ = []
@@ -203,6 +235,16 @@ class unidad(float):
     _magnitudes = []
     __units_set__ = []
 
+    def __init_subclass__(cls, **kwargs):
+        """Define the units of child class as descriptors"""
+        super().__init_subclass__(**kwargs)
+        for key, rate in cls.rates.items():
+            # Reject unused currencies
+            if cls.__name__ == "Currency" and \
+                    key not in cls.__units__ and key not in cls._uUnused:
+                continue
+            setattr(cls, key, _Rate(rate))
+
     def __init__(self, data, unit="", magnitud=""):
         """Constructor
 
@@ -225,10 +267,8 @@ class unidad(float):
         self.magnitud = magnitud
 
         if data is None:
-            self._data = 0
             self.code = "n/a"
         else:
-            self._data = float(data)
             self.code = ""
 
         if unit == "conf":
@@ -238,16 +278,6 @@ class unidad(float):
             unit = self.__units__[0]
         self._data = self._getBaseValue(data, unit, magnitud)
 
-        for key in self.__class__.rates:
-            # Reject unused currencies
-            if self.__class__.__name__ == "Currency" and \
-                    key not in self.__units__ and key not in self._uUnused:
-                continue
-
-            self.__setattr__(key, self._data / self.__class__.rates[key])
-
-        logging.debug("%s, %f", self.__class__.__name__, self._data)
-
     def __new__(cls, data, unit="", magnitud=""):
         """Constructor to let multiple parameter input in float"""
         if not magnitud:
@@ -401,6 +431,7 @@ with support for class unidad operations: txt, config. func."""
 
 
 class Temperature(unidad):
+    __slots__ = ()
     __title__ = translate("unidades", "Temperature")
     __text__ = ['K', 'ºC', 'ºR', 'ºF', 'ºRe']
     __units__ = ['K', 'C', 'R', 'F', 'Re']
@@ -440,12 +471,25 @@ class Temperature(unidad):
         else:
             raise ValueError(translate("unidades", "Wrong input code"))
 
-        self.K = self._data
-        self.C = K2C(self._data)
-        self.F = K2F(self._data)
-        self.R = K2R(self._data)
-        self.Re = K2Re(self._data)
-        logging.debug("%s, %f" % (self.__class__.__name__, self._data))
+    @property
+    def K(self):
+        return self._data
+
+    @property
+    def C(self):
+        return K2C(self._data)
+
+    @property
+    def F(self):
+        return K2F(self._data)
+
+    @property
+    def R(self):
+        return K2R(self._data)
+
+    @property
+    def Re(self):
+        return K2Re(self._data)
 
     @classmethod
     def _getBaseValue(cls, data, unit, magnitud):
@@ -475,6 +519,7 @@ class Temperature(unidad):
 
 
 class DeltaT(unidad):
+    __slots__ = ()
     __title__ = translate("unidades", "Temperature increase")
     rates = {"K": 1.,
              "C": 1.,
@@ -491,6 +536,7 @@ class DeltaT(unidad):
 
 
 class Angle(unidad):
+    __slots__ = ()
     __title__ = translate("unidades", "Angle")
     rates = {"rad": 1.,
              "deg": 2*k.pi/360,
@@ -511,6 +557,7 @@ class Angle(unidad):
 
 
 class Length(unidad):
+    __slots__ = ()
     __title__ = translate("unidades", "Length")
     rates = {"m": 1.,
              "cm": k.centi,
@@ -562,6 +609,7 @@ class Length(unidad):
 
 
 class Area(unidad):
+    __slots__ = ()
     __title__ = translate("unidades", "Area")
     rates = {"m2": 1.,
              "cm2": k.centi**2,
@@ -592,6 +640,7 @@ class Area(unidad):
 
 
 class Volume(unidad):
+    __slots__ = ()
     __title__ = translate("unidades", "Volume")
     rates = {"m3": 1.,
              "cc": k.centi**3,
@@ -643,6 +692,7 @@ class Volume(unidad):
 
 
 class Time(unidad):
+    __slots__ = ()
     __title__ = translate("unidades", "Time")
     rates = {"s": 1.,
              "min": k.minute,
@@ -663,6 +713,7 @@ class Time(unidad):
 
 
 class Frequency(unidad):
+    __slots__ = ()
     __title__ = translate("unidades", "Frequency")
     rates = {"rpm": 1.,
              "rph": 1./60,
@@ -680,6 +731,7 @@ class Frequency(unidad):
 
 
 class Speed(unidad):
+    __slots__ = ()
     __title__ = translate("unidades", "Speed")
     rates = {"ms": 1.,
              "cms": k.centi,
@@ -712,6 +764,7 @@ class Speed(unidad):
 
 
 class Acceleration(unidad):
+    __slots__ = ()
     __title__ = translate("unidades", "Acceleration")
     rates = {"ms2": 1.,
              "cms2": k.centi,
@@ -734,6 +787,7 @@ class Acceleration(unidad):
 
 
 class Mass(unidad):
+    __slots__ = ()
     __title__ = translate("unidades", "Mass")
     rates = {"kg": 1.,
              "g": 1./k.kilo,
@@ -768,6 +822,7 @@ class Mass(unidad):
 
 
 class Mol(unidad):
+    __slots__ = ()
     __title__ = translate("unidades", "Mol")
     rates = {"kmol": 1.,
              "mol": 1./k.kilo,
@@ -782,6 +837,7 @@ class Mol(unidad):
 
 
 class SpecificVolume(unidad):
+    __slots__ = ()
     __title__ = translate("unidades", "Specific Volume")
     rates = {"m3kg": 1.,
              "lg": 1.,
@@ -816,6 +872,7 @@ class SpecificVolume(unidad):
 
 
 class SpecificVolume_square(unidad):
+    __slots__ = ()
     __title__ = translate("unidades", "Third virial coefficient")
     rates = {"m3kg": 1.,
              "lg": 1.,
@@ -853,6 +910,7 @@ class SpecificVolume_square(unidad):
 
 
 class MolarVolume(unidad):
+    __slots__ = ()
     __title__ = translate("unidades", "Molar Volume")
     rates = {"m3kmol": 1.,
              "lmol": 1.,
@@ -874,6 +932,7 @@ class MolarVolume(unidad):
 
 
 class Density(unidad):
+    __slots__ = ()
     __title__ = translate("unidades", "Density")
     rates = {"kgm3": 1.,
              "gl": 1.,
@@ -917,6 +976,7 @@ class Density(unidad):
 
 
 class MolarDensity(unidad):
+    __slots__ = ()
     __title__ = translate("unidades", "Molar Density")
     rates = {"kmolm3": 1.,
              "moll": 1.,
@@ -936,6 +996,7 @@ class MolarDensity(unidad):
 
 
 class Force(unidad):
+    __slots__ = ()
     __title__ = translate("unidades", "Force")
     rates = {"N": 1.,
              "kN": k.kilo,
@@ -965,6 +1026,7 @@ class Force(unidad):
 
 
 class Pressure(unidad):
+    __slots__ = ()
     __title__ = translate("unidades", "Pressure")
     rates = {"Pa": 1.,
              "MPa": k.mega,
@@ -1050,13 +1112,17 @@ class Pressure(unidad):
         else:
             self._data = data * self.__class__.rates[unit]
 
-        for key in self.__class__.rates:
-            self.__setattr__(key, self._data/self.__class__.rates[key])
+    @property
+    def barg(self):
+        return (self.Pa-k.atm)/k.bar
+
+    @property
+    def psig(self):
+        return (self.Pa-k.atm)/k.psi
 
-        self.barg = (self.Pa-k.atm)/k.bar
-        self.psig = (self.Pa-k.atm)/k.psi
-        self.kgcm2g = (self.Pa-k.atm)*k.centi**2/k.g
-        logging.debug("%s, %f" % (self.__class__.__name__, self._data))
+    @property
+    def kgcm2g(self):
+        return (self.Pa-k.atm)*k.centi**2/k.g
 
     @classmethod
     def _getBaseValue(cls, data, unit, magnitud):
@@ -1087,6 +1153,7 @@ class Pressure(unidad):
 
 
 class DeltaP(unidad):
+    __slots__ = ()
     __title__ = translate("unidades", "Pressure increase")
     rates = {"Pa": 1.,
              "MPa": k.mega,
@@ -1150,6 +1217,7 @@ class DeltaP(unidad):
 
 
 class Energy(unidad):
+    __slots__ = ()
     __title__ = translate("unidades", "Energy")
     rates = {"J": 1.,
              "kJ": k.kilo,
@@ -1214,6 +1282,7 @@ class Energy(unidad):
 
 
 class Enthalpy(unidad):
+    __slots__ = ()
     __title__ = translate("unidades", "Enthalpy")
     rates = {"Jkg": 1.,
              "kJkg": k.kilo,
@@ -1238,6 +1307,7 @@ class Enthalpy(unidad):
 
 
 class MolarEnthalpy(unidad):
+    __slots__ = ()
     __title__ = translate("unidades", "Molar Enthalpy")
     rates = {"Jkmol": 1.,
              "kJkmol": k.kilo,
@@ -1262,6 +1332,7 @@ class MolarEnthalpy(unidad):
 
 
 class Entropy(unidad):
+    __slots__ = ()
     __title__ = translate("unidades", "Entropy")
     rates = {"JK": 1.,
              "kJK": k.kilo,
@@ -1287,6 +1358,7 @@ class Entropy(unidad):
 
 
 class SpecificHeat(unidad):
+    __slots__ = ()
     __title__ = translate("unidades", "Specific Heat")
     rates = {"JkgK": 1.,
              "kJkgK": k.kilo,
@@ -1314,6 +1386,7 @@ class SpecificHeat(unidad):
 
 
 class MolarSpecificHeat(unidad):
+    __slots__ = ()
     __title__ = translate("unidades", "Molar Specific Heat")
     rates = {"JkmolK": 1.,
              "kJkmolK": k.kilo,
@@ -1335,6 +1408,7 @@ class MolarSpecificHeat(unidad):
 
 
 class Power(unidad):
+    __slots__ = ()
     __title__ = translate("unidades", "Power")
     rates = {"W": 1.,
              "kW": k.kilo,
@@ -1391,6 +1465,7 @@ class Power(unidad):
 
 
 class MassFlow(unidad):
+    __slots__ = ()
     __title__ = translate("unidades", "Mass Flow")
     rates = {"kgs": 1.,
              "kgmin": 1./k.minute,
@@ -1425,6 +1500,7 @@ class MassFlow(unidad):
 
 
 class MolarFlow(unidad):
+    __slots__ = ()
     __title__ = translate("unidades", "Molar Flow")
     rates = {"kmols": 1.,
              "kmolmin": 1./k.minute,
@@ -1447,6 +1523,7 @@ class MolarFlow(unidad):
 
 
 class VolFlow(unidad):
+    __slots__ = ()
     __title__ = translate("unidades", "Volumetric Flow")
     rates = {"m3s": 1.,
              "m3min": 1./k.minute,
@@ -1499,6 +1576,7 @@ class VolFlow(unidad):
 
 
 class Diffusivity(unidad):
+    __slots__ = ()
     __title__ = translate("unidades", "Diffusivity")
     rates = {"m2s": 1.,
              "cm2s": k.centi**2,
@@ -1529,6 +1607,7 @@ class Diffusivity(unidad):
 
 
 class HeatFlux(unidad):
+    __slots__ = ()
     __title__ = translate("unidades", "Heat Flux")
     rates = {"Wm2": 1.,
              "kWm2": k.kilo,
@@ -1548,6 +1627,7 @@ class HeatFlux(unidad):
 
 
 class ThermalConductivity(unidad):
+    __slots__ = ()
     __title__ = translate("unidades", "Thermal Conductivity")
     rates = {"WmK": 1.,
              "mWmK": 1./k.kilo,
@@ -1573,6 +1653,7 @@ class ThermalConductivity(unidad):
 
 
 class UA(unidad):
+    __slots__ = ()
     __title__ = translate("unidades", "UA")
     rates = {"WK": 1.,
              "kWK": k.kilo,
@@ -1596,6 +1677,7 @@ class UA(unidad):
 
 
 class HeatTransfCoef(unidad):
+    __slots__ = ()
     __title__ = translate("unidades", "Heat Transfer Coefficient")
     rates = {"Wm2K": 1.,
              "kWm2K": k.kilo,
@@ -1622,6 +1704,7 @@ class HeatTransfCoef(unidad):
 
 
 class Fouling(unidad):
+    __slots__ = ()
     __title__ = translate("unidades", "Fouling Factor")
     rates = {"m2KW": 1.,
              "m2KkW": 1./k.kilo,
@@ -1648,6 +1731,7 @@ class Fouling(unidad):
 
 
 class Tension(unidad):
+    __slots__ = ()
     __title__ = translate("unidades", "Surface Tension")
     rates = {"Nm": 1.,
              "mNm": k.milli,
@@ -1662,6 +1746,7 @@ class Tension(unidad):
 
 
 class Viscosity(unidad):
+    __slots__ = ()
     __title__ = translate("unidades", "Viscosity")
     rates = {"Pas": 1.,
              "mPas": k.milli,
@@ -1691,6 +1776,7 @@ class Viscosity(unidad):
 
 
 class SolubilityParameter(unidad):
+    __slots__ = ()
     __title__ = translate("unidades", "Solubility Parameter")
     rates = {"Jm3": 1.,
              "calcc": (k.calorie*k.mega)**0.5,
@@ -1704,6 +1790,7 @@ class SolubilityParameter(unidad):
 
 
 class PotencialElectric(unidad):
+    __slots__ = ()
     __title__ = translate("unidades", "Electric Potencial")
     rates = {"Vm": 1.,
              "kVm": k.kilo,
@@ -1724,6 +1811,7 @@ class PotencialElectric(unidad):
 
 
 class DipoleMoment(unidad):
+    __slots__ = ()
     __title__ = translate("unidades", "Dipole Moment")
     rates = {"Cm": 1.,
              "Debye": k.debye}
@@ -1738,6 +1826,7 @@ class DipoleMoment(unidad):
 
 
 class CakeResistance(unidad):
+    __slots__ = ()
     __title__ = translate("unidades", "Cake Resistance")
     rates = {"mkg": 1.,
              "cmg": k.centi/k.kilo,
@@ -1751,6 +1840,7 @@ class CakeResistance(unidad):
 
 
 class PackingDP(unidad):
+    __slots__ = ()
     __title__ = translate("unidades", "Packing Pressure drop")
     rates = {"mmH2Om": 1.,
              "inH2Oft": k.inch/k.milli/k.foot}
@@ -1763,6 +1853,7 @@ class PackingDP(unidad):
 
 
 class V2V(unidad):
+    __slots__ = ()
     __title__ = translate("unidades", "Gas-Oil ratio")
     rates = {"m3m3": 1.,
              "ft3ft3": 1.,
@@ -1778,6 +1869,7 @@ class V2V(unidad):
 
 
 class InvTemperature(unidad):
+    __slots__ = ()
     __title__ = translate("unidades", "Temperature inverse")
     rates = {"K": 1.,
              "C": 1.,
@@ -1795,6 +1887,7 @@ class InvTemperature(unidad):
 
 
 class InvPressure(unidad):
+    __slots__ = ()
     __title__ = translate("unidades", "Pressure inverse")
     rates = {"Pa": 1.,
              "MPa": 1./k.mega,
@@ -1857,6 +1950,7 @@ class InvPressure(unidad):
 
 
 class EnthalpyPressure(unidad):
+    __slots__ = ()
     __title__ = translate("unidades", "Enthalpy per pressure")
     rates = {"JkgPa": 1.,
              "kJkgkPa": 1.,
@@ -1875,6 +1969,7 @@ class EnthalpyPressure(unidad):
 
 
 class EnthalpyDensity(unidad):
+    __slots__ = ()
     __title__ = translate("unidades", "Enthalpy per density")
     rates = {"Jkgkgm3": 1.,
              "kJkgkgm3": k.kilo,
@@ -1888,6 +1983,7 @@ class EnthalpyDensity(unidad):
 
 
 class TemperaturePressure(unidad):
+    __slots__ = ()
     __title__ = translate("unidades", "Temperature per pressure")
     rates = {"KPa": 1.,
              "KkPa": k.milli,
@@ -1904,6 +2000,7 @@ class TemperaturePressure(unidad):
 
 
 class PressureTemperature(unidad):
+    __slots__ = ()
     __title__ = translate("unidades", "Pressure per Temperature")
     rates = {"PaK": 1.,
              "kPaK": k.kilo,
@@ -1920,6 +2017,7 @@ class PressureTemperature(unidad):
 
 
 class PressureDensity(unidad):
+    __slots__ = ()
     __title__ = translate("unidades", "Pressure per density")
     rates = {"Pakgm3": 1.,
              "kPakgm3": k.kilo,
@@ -1939,6 +2037,7 @@ class PressureDensity(unidad):
 
 
 class DensityPressure(unidad):
+    __slots__ = ()
     __title__ = translate("unidades", "Density per pressure")
     rates = {"kgm3Pa": 1.,
              "kgm3kPa": k.milli,
@@ -1959,6 +2058,7 @@ class DensityPressure(unidad):
 
 
 class DensityTemperature(unidad):
+    __slots__ = ()
     __title__ = translate("unidades", "Density per temperature")
     rates = {"kgm3K": 1.,
              "gccK": 1./k.liter,
@@ -1978,6 +2078,7 @@ class Currency(unidad):
 
     >>> S=Currency(5, "eur")
     """
+    __slots__ = ()
     filename = conf_dir+"moneda.dat"
     try:
         archivo = open(filename, "r")
@@ -2274,7 +2375,7 @@ class Currency(unidad):
         return " "+txt+num
 
 
-if os.environ["icu"] == "True":
+if os.environ["icu"] == "True" and QtCore is not None:
     import icu
     locale = QtCore.QLocale.system().name()
 
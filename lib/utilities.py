@@ -26,6 +26,8 @@ Module with miscelaneous utilities used in other parts of program:
   * :func:`spreadsheetColumn`: Convert index column to AAA spreadsheet column \
           namestyle
   * :func:`formatLine`: Return a matplotlib line formatting kw
+  * :func:`readCache`: Read the chart data saved in a cache file
+  * :func:`saveCache`: Save chart data to a cache file with limited size
   * :func:`SimpleEq`: Common procedure for calculation of simple properties \
          like the ancillary equation in mEoS
   * :func:`refDoc`: Function decorator used to automatic addiction of \
@@ -37,11 +39,18 @@ API reference
 '''
 
 
+import json
 import os
 import random
 from math import exp
 
-from tools.qt import translate
+try:
+    from tools.qt import translate
+except ImportError:
+    # Headless use without qt, see run.py, the texts aren't translated
+    def translate(context, text):
+        """Replacement of qt translate function without translation"""
+        return text
 
 
 def representacion(number, fmt=0, total=0, decimales=4, eng=False, tol=5,
@@ -318,6 +327,66 @@ def formatLine(config, section, name):
     return kw
 
 
+def readCache(filename):
+    """Return the dict with the data of all charts saved in a cache file, by
+    key of chart
+
+    Parameters
+    ----------
+    filename : str
+        Path of cache file
+
+    Returns
+    -------
+    cache : dict
+        Data of charts, empty if the file isn't available
+    """
+    try:
+        with open(filename, "r", encoding="utf-8") as file:
+            cache = json.load(file)
+    except (OSError, ValueError):
+        cache = {}
+
+    # File saved with a previous version with the data of only a chart
+    if not all(isinstance(data, dict) for data in cache.values()):
+        cache = {}
+    return cache
+
+
+def saveCache(filename, key, data, size=10):
+    """Save the data of a chart to a cache file, discarding the oldest
+    charts to keep the file size limited
+
+    Parameters
+    ----------
+    filename : str
+        Path of cache file
+    key : str
+        Key of chart, unique for its configuration
+    data : dict
+        Data of chart, json serializable
+    size : int, optional
+        Maximum number of charts saved in file
+
+    Examples
+    --------
+    >>> import tempfile
+    >>> filename = os.path.join(tempfile.mkdtemp(), "chart.dat")
+    >>> for i in range(4):
+    ...     saveCache(filename, str(i), {"x": [i]}, size=3)
+    >>> saveCache(filename, "2", {"x": [5]}, size=3)
+    >>> readCache(filename)
+    {'1': {'x': [1]}, '3': {'x': [3]}, '2': {'x': [5]}}
+    """
+    cache = readCache(filename)
+    cache.pop(key, None)
+    cache[key] = data
+    while len(cache) > size:
+        del cache[next(iter(cache))]
+    with open(filename, "w", encoding="utf-8") as file:
+        json.dump(cache, file)
+
+
 def SimpleEq(Tc, T, coef):
     r"""Common procedure for calculation of simple properties like the
     ancillary equation for vapor pressure, saturated densities of liquid
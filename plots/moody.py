@@ -27,22 +27,20 @@ API Reference
 The module include all related moody chart functionality
     * :class:`Moody`: Chart dialog
     * :func:`calculate`: Calculate procedure
+    * :func:`load`: Load chart data, from cache file if it's calculated yet
     * :class:`CalculateDialog`: Dialog to calculate a specified point \
 and its configuration
     * :class:`Config`: Moody chart configuration
 '''
 
 
-import json
-import os
-
-from numpy import logspace
+from numpy import array, logspace
 from numpy.lib.scimath import log10
 from matplotlib.patches import ConnectionPatch
 
 from lib.config import conf_dir, Preferences
 from lib.friction import f_list, eD
-from lib.utilities import formatLine, representacion
+from lib.utilities import formatLine, readCache, representacion, saveCache
 from tools.qt import QtWidgets, translate
 from UI.widgets import Entrada_con_unidades, GridConfig, LineConfig
 
@@ -54,11 +52,22 @@ Re_turbulent = logspace(log10(2400), 8, 50)
 Re_fully = logspace(log10(4000), 8, 50)
 
 
+def _key(config):
+    """Key of chart data in cache file, by method, fanning and the relative
+    roughness list"""
+    fanning = config.getboolean("Moody", "fanning")
+    method = config.getint("Moody", "method")
+    ed = [float(e) for e in config.get("Moody", "eD").split(",")]
+    return "%i:%s:%s" % (method, fanning, ",".join(map(str, ed)))
+
+
 def calculate(config):
-    """Calculate procedure, the data are saved to file to fast load again"""
+    """Calculate procedure, the data are saved to a cache file to fast load
+    again, keeping the data of last charts by method, fanning and relative
+    roughness list"""
     fanning = config.getboolean("Moody", "fanning")
     method = config.getint("Moody", "method")
-    ed = map(float, config.get("Moody", "eD").split(","))
+    ed = [float(e) for e in config.get("Moody", "eD").split(",")]
     F = f_list[method]
 
     dat = {}
@@ -72,18 +81,25 @@ def calculate(config):
         dat["laminar"] = [64./R for R in Re_laminar]
         x = 1
 
-    # turbulent
-    turb = {}
-    for e in ed:
-        turb[e] = [F(Rei, e)/x for Rei in Re_turbulent]
-        dat["turbulent"] = turb
+    # turbulent, all lines at once
+    f = F(Re_turbulent[None, :], array(ed)[:, None])/x
+    dat["turbulent"] = {str(e): fi.tolist() for e, fi in zip(ed, f)}
 
     # Line to define the fully desarrolled turbulent flux
-    dat["fully"] = [(1/(1.14-2*log10(3500/R)))**2/x for R in Re_fully]
+    dat["fully"] = ((1/(1.14-2*log10(3500/Re_fully)))**2/x).tolist()
+
+    # Save to file, discarding the oldest charts
+    saveCache(conf_dir+"moody.dat", _key(config), dat)
+    return dat
 
-    # Save to file
-    with open(conf_dir+"moody.dat", "w", encoding="utf-8") as file:
-        json.dump(dat, file, indent=4)
+
+def load(config):
+    """Return the chart data for config, from cache file if it's calculated
+    yet"""
+    dat = readCache(conf_dir+"moody.dat").get(_key(config))
+    if dat is None:
+        dat = calculate(config)
+    return dat
 
 
 class Config(QtWidgets.QWidget):
@@ -218,7 +234,6 @@ class Moody(Chart):
     def plot(self):
         """Plot the Moody chart using the indicate method """
         fanning = Preferences.getboolean("Moody", "fanning")
-        method = Preferences.getint("Moody", "method")
 
         if fanning:
             x = 4
@@ -285,25 +300,7 @@ class Moody(Chart):
         self.plt.ax.set_yticks(yticks)
         self.plt.ax.set_yticklabels(ytickslabel)
 
-        if not os.path.isfile(conf_dir+"moody.dat"):
-            calculate(Preferences)
-
-        load = False
-        with open(conf_dir+"moody.dat", "r", encoding="utf-8") as file:
-            try:
-                dat = json.load(file)
-            except ValueError:
-                calculate(Preferences)
-                load = True
-
-            if dat["fanning"] != fanning or dat["method"] != method:
-                calculate(Preferences)
-                load = True
-
-        # Reload file if it's created in last with statement
-        if load:
-            with open(conf_dir+"moody.dat", "r", encoding="utf-8") as file:
-                dat = json.load(file)
+        dat = load(Preferences)
 
         # Plot data
         kw = formatLine(Preferences, "Moody", "line")
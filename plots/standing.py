@@ -37,11 +37,11 @@ import json
 import os
 import re
 
-from numpy import arange
+from numpy import arange, array
 from scipy.optimize import fsolve
 
 from lib.config import conf_dir, Preferences
-from lib.crude import Z_list
+from lib.crude import Z_array, Z_list
 from lib.plot import PlotWidget
 from lib.utilities import formatLine
 from tools.qt import QtCore, QtGui, QtWidgets, translate
@@ -72,7 +72,7 @@ def calculate(config, dat=None):
     calculated yet
     """
     method = config.getint("Standing_Katz", "method")
-    Tr = map(float, config.get("Standing_Katz", "Tr").split(","))
+    Tr = list(map(float, config.get("Standing_Katz", "Tr").split(",")))
     Z = Z_list[method]
 
     Pr = arange(1e-3, 15, 0.01)
@@ -80,22 +80,15 @@ def calculate(config, dat=None):
     if dat is None:
         dat = {}
 
-    lines = {}
-    for t in Tr:
-        pr = []
-        z = []
-        for p in Pr:
-            try:
-                z.append(Z(t, p))
-                pr.append(p)
-            except NotImplementedError:
-                pass
-            except ValueError:
-                pass
+    # Calculate all lines at once, a row for each Tr
+    z, inRange, converged = Z_array(Z, array(Tr)[:, None], Pr)
+    valid = inRange & converged
 
+    lines = {}
+    for t, zi, mask in zip(Tr, z, valid):
         # Only save the lines with data
-        if pr:
-            lines[t] = {"Pr": pr, "Z": z}
+        if mask.any():
+            lines[t] = {"Pr": Pr[mask].tolist(), "Z": zi[mask].tolist()}
 
     dat[method] = lines
 
@@ -0,0 +1,122 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+
+"""Pychemqt, Chemical Engineering Process simulator
+Copyright (C) 2009-2025, Juan José Gómez Romera <jjgomera@gmail.com>
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <http://www.gnu.org/licenses/>."""
+
+
+# Headless calculation of pychemqt project files, without display or qt
+# application, intended to run case studies in servers:
+#
+#     python -m pychemqt.run Samples/compressor.pcq -r s2.T \
+#         --sweep e1.Pout=2e5:8e5:100 -w 4 -o results.csv
+#
+# from the parent folder of pychemqt, or python3 run.py from pychemqt folder.
+# Run with --help to see all options, see lib/batch.py
+
+
+from configparser import ConfigParser
+import logging
+import os
+import shutil
+import sys
+import warnings
+
+
+# Add pychemqt folder to python path
+path = os.path.dirname(os.path.realpath(__file__))
+sys.path.insert(0, path)
+
+# Define pychemqt environment
+os.environ["pychemqt"] = path + os.sep
+conf_dir = os.path.expanduser("~") + os.sep + ".pychemqt" + os.sep
+
+# Check external optional modules, not using tools.dependences because it
+# import qt. The qt modules and the unicode collation of user interface aren't
+# necessary
+for module in ("freesteam", "CoolProp", "refprop", "openbabel", "ezodf",
+               "openpyxl", "xlwt", "reportlab"):
+    try:
+        __import__(module)
+        os.environ[module] = "True"
+    except ImportError:
+        os.environ[module] = ""
+os.environ["icu"] = ""
+os.environ["Qsci"] = ""
+
+# Logging configuration, to standard error
+loglevel = os.environ.get("PYCHEMQT_LOGLEVEL", "WARNING")
+logging.basicConfig(level=getattr(logging, loglevel.upper()),
+                    format="%(levelname)s: %(message)s")
+
+import numpy as np  # noqa
+np.seterr("ignore")
+warnings.simplefilter("ignore")
+
+# Checking config files
+if not os.path.isdir(conf_dir):
+    os.mkdir(conf_dir)
+
+from tools import firstrun  # noqa
+if not os.path.isfile(conf_dir + "pychemqtrc"):
+    with open(conf_dir + "pychemqtrc", "w") as conf_file:
+        firstrun.Preferences().write(conf_file)
+else:
+    # Check Preferences options to find set new options
+    default_Preferences = firstrun.Preferences()
+    Preferences = ConfigParser()
+    Preferences.read(conf_dir + "pychemqtrc")
+    change = False
+    for section in default_Preferences.sections():
+        if not Preferences.has_section(section):
+            Preferences.add_section(section)
+            change = True
+        for option in default_Preferences.options(section):
+            if not Preferences.has_option(section, option):
+                value = default_Preferences.get(section, option)
+                Preferences.set(section, option, value)
+                change = True
+                logging.warning("Using default configuration option for "
+                                "%s:%s", section, option)
+    if change:
+        with open(conf_dir + "pychemqtrc", "w") as conf_file:
+            Preferences.write(conf_file)
+
+if not os.path.isfile(conf_dir + "pychemqtrc_temporal"):
+    with open(conf_dir + "pychemqtrc_temporal", "w") as conf_file:
+        firstrun.config().write(conf_file)
+
+if not os.path.isfile(conf_dir + "CostIndex.dat"):
+    orig = os.path.join(os.environ["pychemqt"], "dat", "costindex.dat")
+    with open(orig) as cost_index:
+        lista = cost_index.readlines()[-1].split(" ")
+        with open(conf_dir + "CostIndex.dat", "w") as archivo:
+            for data in lista:
+                archivo.write(data.replace(os.linesep, "") + os.linesep)
+
+# Archived currency rates, without try to update from internet
+if not os.path.isfile(conf_dir + "moneda.dat"):
+    origen = os.path.join(os.environ["pychemqt"], "dat", "moneda.dat")
+    shutil.copy(origen, conf_dir + "moneda.dat")
+
+if not os.path.isfile(conf_dir + "databank.db"):
+    firstrun.createDatabase(conf_dir + "databank.db")
+
+
+from lib.batch import main  # noqa
+
+if __name__ == "__main__":
+    sys.exit(main())
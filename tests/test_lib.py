@@ -38,6 +38,11 @@ tests = loader.discover(os.path.join(path, "lib", "mEoS"), pattern="*.py")
 TestMEOS = TestSuite(tests)
 TestLib.addTest(TestMEOS)
 
+# Add lib.project test, the module isn't included in lib.__all__
+from lib import project  # noqa
+TestLib.addTest(DocTestSuite(project))
+TestLib.addTest(loader.loadTestsFromModule(project))
+
 # Add lib.EoS submodule test
 for module in EoS.__all__:
     TestLib.addTest(DocTestSuite(module))
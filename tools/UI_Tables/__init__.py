@@ -58,6 +58,13 @@ Library function for plugin
     * :func:`library.get_propiedades`: Get the properties to show in tables
     * :func:`library._getData`: Get values of properties in fluid
 
+Calculation backend of plot data, without Qt dependence:
+    * :func:`backend.isoline`: Calculate the points of an isoline
+    * :func:`backend.meshRow`: Calculate a row of 3D mesh data
+    * :func:`backend.saturation`: Calculate the points of saturation line
+    * :class:`backend.PlotCalculator`: Pool of workers to calculate lines in \
+    parallel
+
 Plot functionality:
     * :class:`plot.PlotMEoS`: Plot widget to show meos data as plot
     * :class:`plot.Plot2D`: Dialog for select a special 2D plot
@@ -100,12 +107,12 @@ from lib.thermo import ThermoAdvanced
 from UI.widgets import createAction
 from tools.qt import QtGui, QtWidgets, QtCore, translate
 
+from tools.UI_Tables.backend import PlotCalculator
 from tools.UI_Tables.chooseFluid import Ui_ChooseFluid
 from tools.UI_Tables.library import N_PROP, KEYS, UNITS
 from tools.UI_Tables.library import (getClassFluid, getMethod, calcPoint,
                                      saveProperties)
-from tools.UI_Tables.plot import (PlotMEoS, Plot2D, Plot3D, calcIsoline,
-                                  get_points, plot2D3D, calcMesh)
+from tools.UI_Tables.plot import PlotMEoS, Plot2D, Plot3D, get_points, plot2D3D
 from tools.UI_Tables.prefMEOS import Dialog as ConfDialog
 from tools.UI_Tables.reference import Ui_ReferenceState, Ui_Properties
 from tools.UI_Tables.table import Ui_Saturation, Ui_Isoproperty, createTabla
@@ -403,7 +410,7 @@ class plugin():
             kwarg = {}
             # Define option parameter for transport method, only available
             # for internal meos method
-            if method == "meos":
+            if method in ("meos", "tabular"):
                 for key in ("eq", "visco", "thermal"):
                     kwarg[key] = self.config.getint("MEoS", key)
 
@@ -563,13 +570,13 @@ class plugin():
             self.parent().statusBar().showMessage(
                 translate("meos", "Calculating data, be patient..."))
             QtWidgets.QApplication.processEvents()
-            data = self.calculatePlot(fluid)
             conf = {}
             conf["method"] = method
             conf["fluid"] = self.config.getint("MEoS", "fluid")
             conf["eq"] = self.config.getint("MEoS", "eq")
             conf["visco"] = self.config.getint("MEoS", "visco")
             conf["thermal"] = self.config.getint("MEoS", "thermal")
+            data = self.calculatePlot(fluid, conf)
             data["config"] = conf
             grafico._saveData(data)
             self.parent().progressBar.setVisible(False)
@@ -610,15 +617,19 @@ class plugin():
         self.parent().statusBar().clearMessage()
         grafico.mouseMove.connect(grafico.updatePosition)
 
-    def calculatePlot(self, fluid):
+    def calculatePlot(self, fluid, conf):
         """Calculate data for plot
-            fluid: class of meos fluid to calculate"""
+            fluid: class of meos fluid to calculate
+            conf: dict with the configuration of fluid
+
+        The lines are calculated in parallel with
+        :class:`backend.PlotCalculator`, here only the results are collected"""
         data = {}
         points = get_points(config.Preferences)
         method = getMethod()
 
         # Melting and sublimation line only supported in internal meos method
-        if method == "meos":
+        if method in ("meos", "tabular"):
             # Calculate melting line
             if fluid._melting:
                 self.parent().statusBar().showMessage(
@@ -654,43 +665,15 @@ class plugin():
                     data["sublimation"] = saveProperties(fluidos)
 
         # Define the saturation temperature
-        T = list(concatenate([linspace(fluid.Tt, 0.9*fluid.Tc, points),
-                              linspace(0.9*fluid.Tc, 0.99*fluid.Tc, points),
-                              linspace(0.99*fluid.Tc, fluid.Tc, points)]))
+        Tsat = list(concatenate([
+            linspace(fluid.Tt, 0.9*fluid.Tc, points),
+            linspace(0.9*fluid.Tc, 0.99*fluid.Tc, points),
+            linspace(0.99*fluid.Tc, fluid.Tc, points)]))
         for i in range(2, 0, -1):
-            del T[points*i]
-
-        # Calculate saturation
-        self.parent().statusBar().showMessage(translate("meos",
-    "Calculating Liquid-Vapour saturation line..."))
-        for fase in [0, 1]:
-            fluidos = []
-            for Ti in T:
-                print("x = %i" % fase, Ti)
-                try:
-                    fluidos.append(fluid._new(T=Ti, x=fase))
-                except:
-                    pass
-                self.parent().progressBar.setValue(
-                    10+5*fase+5*len(fluidos)/len(T))
-                QtWidgets.QApplication.processEvents()
-
-            data["saturation_%i" % fase] = saveProperties(fluidos)
-
-        # Calculate isoquality lines
-        data["x"] = {}
-        self.parent().statusBar().showMessage(translate("meos",
-    "Calculating isoquality lines..."))
-        values = self.LineList("Isoquality", config.Preferences)
-        for i, value in enumerate(values):
-            fluidos = calcIsoline(fluid, self.config,
-                                  "T", "x", T, value, 20, i, 20,
-                                  len(values), self.parent().progressBar)
-
-            data["x"][value] = saveProperties(fluidos)
+            del Tsat[points*i]
 
         # Get limit equation
-        if method == "meos":
+        if method in ("meos", "tabular"):
             eq = fluid.eq[self.parent().currentConfig.getint("MEoS", "eq")]
             Tmin = eq["Tmin"]
             Tmax = eq["Tmax"]
@@ -738,74 +721,58 @@ class plugin():
             del T[points*i]
             del P[points*i]
 
-        # Calculate isotherm lines
-        data["T"] = {}
-        self.parent().statusBar().showMessage(translate("meos",
-    "Calculating isotherm lines..."))
-        QtWidgets.QApplication.processEvents()
-        values = self.LineList("Isotherm", config.Preferences, fluid)
-        for i, value in enumerate(values):
-            fluidos = calcIsoline(fluid, self.config,
-                                  "P", "T", P, value, 40, i, 10,
-                                  len(values), self.parent().progressBar)
+        calc = PlotCalculator(conf)
+        self.parent().statusBar().showMessage(
+            translate("meos", "Calculating data, be patient..."))
 
-            data["T"][value] = saveProperties(fluidos)
-
-        # Calculate isobar lines
-        data["P"] = {}
-        self.parent().statusBar().showMessage(translate("meos",
-    "Calculating isobar lines..."))
-        QtWidgets.QApplication.processEvents()
-        values = self.LineList("Isobar", config.Preferences, fluid)
-        for i, value in enumerate(values):
-            fluidos = calcIsoline(fluid, self.config,
-                                  "T", "P", T, value, 50, i, 10,
-                                  len(values), self.parent().progressBar)
-            data["P"][value] = saveProperties(fluidos)
-
-        # Calculate isochor lines
-        data["v"] = {}
-        self.parent().statusBar().showMessage(translate("meos",
-    "Calculating isochor lines..."))
-        QtWidgets.QApplication.processEvents()
-        values = self.LineList("Isochor", config.Preferences, fluid)
-        for i, value in enumerate(values):
-            fluidos = calcIsoline(fluid, self.config,
-                                  "T", "v", T, value, 60, i, 10,
-                                  len(values), self.parent().progressBar)
-            data["v"][value] = saveProperties(fluidos)
-
-        # Calculate isoenthalpic lines
-        data["h"] = {}
-        self.parent().statusBar().showMessage(translate("meos",
-    "Calculating isoenthalpic lines..."))
-        QtWidgets.QApplication.processEvents()
-        vals = self.LineList("Isoenthalpic", config.Preferences, fluid)
-        for i, value in enumerate(vals):
-            fluidos = calcIsoline(fluid, self.config,
-                                  "P", "h", P, value, 70, i, 10,
-                                  len(values), self.parent().progressBar)
-            data["h"][value] = saveProperties(fluidos)
-
-        # Calculate isoentropic lines
-        data["s"] = {}
-        self.parent().statusBar().showMessage(translate("meos",
-    "Calculating isoentropic lines..."))
-        QtWidgets.QApplication.processEvents()
-        values = self.LineList("Isoentropic", config.Preferences, fluid)
-        for i, value in enumerate(values):
-            fluidos = calcIsoline(fluid, self.config,
-                                  "P", "s", P, value, 80, i, 20,
-                                  len(values), self.parent().progressBar)
-            data["s"][value] = saveProperties(fluidos)
-
-        # Calculate 3D mesh
-        self.parent().statusBar().showMessage(translate("meos",
-    "Calculating 3D mesh data..."))
-        QtWidgets.QApplication.processEvents()
-        fluidos = calcMesh(fluid, self.config, T, P)
-        print(len(fluidos), len(fluidos[0]))
-        data["mesh"] = saveProperties(fluidos)
+        # Saturation lines
+        for fase in [0, 1]:
+            calc.saturation(("saturation_%i" % fase, None), Tsat, fase)
+
+        # Isolines, with the variable property and the values to calculate,
+        # the isoquality lines don't use the critical point values
+        lines = (("x", "Isoquality", "T", Tsat, None),
+                 ("T", "Isotherm", "P", P, fluid),
+                 ("P", "Isobar", "T", T, fluid),
+                 ("v", "Isochor", "T", T, fluid),
+                 ("h", "Isoenthalpic", "P", P, fluid),
+                 ("s", "Isoentropic", "P", P, fluid))
+        for fix, name, var, values, critic in lines:
+            data[fix] = {}
+            for value in self.LineList(name, config.Preferences, critic):
+                # Define the entry to keep the order of lines
+                data[fix][value] = None
+                calc.isoline((fix, value), var, fix, values, value, points)
+
+        # 3D mesh
+        calc.mesh("mesh", T, P)
+        mesh = [None]*len(T)
+
+        try:
+            while calc.pending:
+                for (key, value), dat in calc.poll(0.1):
+                    if key == "mesh":
+                        mesh[value] = dat
+                    elif value is None:
+                        data[key] = dat
+                    else:
+                        data[key][value] = dat
+
+                done = calc.total-calc.pending
+                self.parent().progressBar.setValue(10+90*done/calc.total)
+                QtWidgets.QApplication.processEvents()
+        except BaseException:
+            calc.cancel()
+            raise
+        finally:
+            calc.close()
+
+        # The failed or cancelled rows are filled with nan values
+        empty = saveProperties([[None]*len(P)])
+        mesh = [row if row is not None else empty for row in mesh]
+        data["mesh"] = {}
+        for key in empty:
+            data["mesh"][key] = [row[key][0] for row in mesh]
 
         return data
 
@@ -0,0 +1,320 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+
+'''Pychemqt, Chemical Engineering Process simulator
+Copyright (C) 2009-2025, Juan José Gómez Romera <jjgomera@gmail.com>
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <http://www.gnu.org/licenses/>.'''
+
+
+###############################################################################
+# Calculation backend for plot data of plugin, without any Qt dependence
+#   - isoline: Calculate the points of an isoline
+#   - meshRow: Calculate a row of 3D mesh data
+#   - saturation: Calculate the points of saturation line
+#   - PlotCalculator: Pool of workers to calculate lines in parallel
+###############################################################################
+
+
+from concurrent.futures import ProcessPoolExecutor
+import multiprocessing
+import os
+import queue
+
+from numpy import linspace
+
+from .library import calcPoint, getClassFluid, saveProperties
+
+
+# Cancel event and fluid instances of worker process
+_cancel = None
+_fluids = {}
+
+
+def isoline(fluid, conf, var, fix, vvar, vfix, points, cancel=None,
+            progress=None):
+    """Procedure to calculate isoline. In isotherm and isobar add to calculate
+    point the saturated states in two-phases region
+
+    Parameters
+    ----------
+    fluid : object
+        Base instance of fluid to calculate
+    conf : ConfigParser | dict
+        Configuration of equation of fluid, see :func:`library.getLimit`
+    var : str
+        Name of variable property along the line
+    fix : str
+        Name of property fixed in the line
+    vvar : list
+        Values of variable property
+    vfix : float
+        Value of fixed property
+    points : int
+        Number of points to calculate in two phase region
+    cancel : threading.Event | multiprocessing.Event, optional
+        Event to stop the calculation, the points calculated are returned
+    progress : function, optional
+        Function called after each point with the number of points done and
+        the number of points estimated in the line
+
+    Returns
+    -------
+    fluids : list
+        List with fluid instance of points
+    """
+    fluidos = []
+    fail = 0
+    fase = None
+    rhoo = 0
+    To = 0
+    total = len(vvar)+points
+    for Ti in vvar:
+        if cancel is not None and cancel.is_set():
+            break
+
+        kwargs = {var: Ti, fix: vfix, "rho0": rhoo, "T0": To}
+        fluido = calcPoint(fluid, conf, **kwargs)
+
+        if progress is not None:
+            progress(len(fluidos)+fail, total)
+
+        if fluido and fluido.status and (fluido.rho != rhoo or fluido.T != To):
+            fluidos.append(fluido)
+
+            # Save values of last point as initial guess for next calculation
+            if var not in ("T", "P") or fix not in ("T", "P"):
+                rhoo = fluido.rho
+                To = fluido.T
+
+            if var in ("T", "P") and fix in ("T", "P"):
+                if fase is None:
+                    fase = fluido.x
+
+                if fase == fluido.x:
+                    continue
+
+                # Calculating two phase additional point
+                if fluido.P < fluid.Pc and fluido.T < fluid.Tc:
+                    if fase != fluido.x and fase <= 0:
+                        xi = linspace(0, 1, points)
+                    elif fase != fluido.x and fase >= 1:
+                        xi = linspace(1, 0, points)
+
+                    for x in xi:
+                        kwargs = {fix: vfix, "x": x}
+                        fluido_x = calcPoint(fluid, conf, **kwargs)
+                        fluidos.insert(-1, fluido_x)
+                        if progress is not None:
+                            progress(len(fluidos)+fail, total)
+
+                fase = fluido.x
+        else:
+            fail += 1
+
+    return fluidos
+
+
+def meshRow(fluid, conf, T, Pi, cancel=None):
+    """Calculate a row of mesh data for a 3D plot, the points at temperature
+    T and the pressures in Pi list, with None for failed points"""
+    fluids = []
+    for P in Pi:
+        if cancel is not None and cancel.is_set():
+            break
+        fluid_i = calcPoint(fluid, conf, T=T, P=P)
+        if fluid_i and fluid_i.status:
+            fluids.append(fluid_i)
+        else:
+            fluids.append(None)
+    return fluids
+
+
+def saturation(fluid, Ti, x, cancel=None):
+    """Calculate the saturation line with quality x, liquid (0) or vapour (1),
+    for the temperatures in Ti list, the failed points are skipped"""
+    fluids = []
+    for T in Ti:
+        if cancel is not None and cancel.is_set():
+            break
+        try:
+            fluids.append(fluid._new(T=T, x=x))
+        except Exception:
+            pass
+    return fluids
+
+
+def _plain(value):
+    """Convert the unidades values of saveProperties output to float, to
+    reduce the size of the data interchanged between process"""
+    if isinstance(value, dict):
+        return {key: _plain(v) for key, v in value.items()}
+    if isinstance(value, list):
+        return [_plain(v) for v in value]
+    if isinstance(value, float):
+        return float(value)
+    return value
+
+
+def _init(cancel):
+    """Initializer of worker process, save the shared cancel event"""
+    global _cancel
+    _cancel = cancel
+
+
+def _job(conf, kind, args):
+    """Calculate a line in a worker, return the saved properties of points"""
+    cancel = _cancel
+
+    # The fluid instance is reused for all lines calculated in a worker
+    key = (conf["method"], conf["fluid"])
+    if key not in _fluids:
+        _fluids[key] = getClassFluid(*key)
+    fluid = _fluids[key]
+
+    if kind == "isoline":
+        fluids = isoline(fluid, conf, *args, cancel=cancel)
+    elif kind == "mesh":
+        fluids = [meshRow(fluid, conf, *args, cancel=cancel)]
+    elif kind == "saturation":
+        fluids = saturation(fluid, *args, cancel=cancel)
+    else:
+        raise ValueError("Unknown job kind %s" % kind)
+
+    if cancel is not None and cancel.is_set():
+        return None
+    return _plain(saveProperties(fluids))
+
+
+class PlotCalculator():
+    """Calculate the lines of a plot in a pool of worker process. Each line
+    is a job, the finished lines are streamed back in a queue in completion
+    order, so the user interface only has to consume the results.
+
+    The worker process are started with forkserver, or spawn in platforms
+    without it, fork isn't safe from the multithreaded qt application. The
+    jobs get the configuration of fluid, so each worker loads the fluid class
+    by itself.
+
+    Parameters
+    ----------
+    conf : dict
+        Configuration of fluid, with keys method, fluid, eq, visco, thermal
+    workers : int, optional
+        Number of workers, default the number of cpus
+
+    Examples
+    --------
+    >>> from lib.mEoS import __all__ as mEoS
+    >>> index = [f.__name__ for f in mEoS].index("R134a")
+    >>> conf = {"method": "meos", "fluid": index, "eq": 0, "visco": 0,
+    ...         "thermal": 0}
+    >>> with PlotCalculator(conf, workers=2) as calc:
+    ...     calc.isoline(("P", 1e6), "T", "P", [250, 300, 350], 1e6, 3)
+    ...     calc.saturation(("saturation", 0), [250, 300], 0)
+    ...     data = dict(calc.results())
+    >>> len(data[("P", 1e6)]["T"]), len(data[("saturation", 0)]["T"])
+    (6, 2)
+    >>> "%0.2f" % (data[("saturation", 0)]["P"][1]/1e3)
+    '702.82'
+    """
+
+    def __init__(self, conf, workers=None):
+        self.conf = conf
+        if workers is None:
+            workers = os.cpu_count()
+
+        if "forkserver" in multiprocessing.get_all_start_methods():
+            context = multiprocessing.get_context("forkserver")
+
+            # The server imports the calculation modules only once
+            context.set_forkserver_preload([__name__])
+        else:
+            context = multiprocessing.get_context("spawn")
+        self._cancel = context.Event()
+        self._pool = ProcessPoolExecutor(
+            workers, context, initializer=_init, initargs=(self._cancel, ))
+
+        self._queue = queue.Queue()
+        self.pending = 0
+        self.total = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is not None:
+            self.cancel()
+        self.close()
+
+    def _submit(self, key, kind, args):
+        """Send a job to the pool, the future is put in the queue with its
+        key when finished"""
+        future = self._pool.submit(_job, self.conf, kind, args)
+        future.add_done_callback(lambda f: self._queue.put((key, f)))
+        self.pending += 1
+        self.total += 1
+
+    def isoline(self, key, var, fix, vvar, vfix, points):
+        """Add an isoline to calculate, see :func:`isoline` for parameters.
+        The key is used to identify the line in results"""
+        self._submit(key, "isoline", (var, fix, vvar, vfix, points))
+
+    def mesh(self, key, Ti, Pi):
+        """Add the mesh data to calculate, each temperature row is a job and
+        it's returned with the key (key, index of row)"""
+        for i, T in enumerate(Ti):
+            self._submit((key, i), "mesh", (T, Pi))
+
+    def saturation(self, key, Ti, x):
+        """Add a saturation line to calculate, see :func:`saturation`"""
+        self._submit(key, "saturation", (Ti, x))
+
+    def poll(self, timeout=None):
+        """Return a list of (key, data) tuples of lines finished, waiting
+        timeout seconds for the first one. The data is the output of
+        :func:`library.saveProperties` for the points of line. The exception
+        raised in a job is raised here"""
+        done = []
+        block = True
+        while self.pending:
+            try:
+                key, future = self._queue.get(block, timeout)
+            except queue.Empty:
+                break
+            block = False
+            self.pending -= 1
+            if future.cancelled():
+                continue
+            data = future.result()
+            if data is not None:
+                done.append((key, data))
+        return done
+
+    def results(self):
+        """Iterator over the (key, data) tuples of lines in completion order,
+        blocking until all lines are finished"""
+        while self.pending:
+            yield from self.poll()
+
+    def cancel(self):
+        """Stop the calculation, the pending jobs are discarded and the
+        running jobs stop in the next point"""
+        self._cancel.set()
+        self._pool.shutdown(wait=False, cancel_futures=True)
+        self.pending = 0
+
+    def close(self):
+        """Shutdown the worker pool"""
+        self._pool.shutdown(wait=True)
@@ -33,7 +33,7 @@ from configparser import ConfigParser
 
 from numpy import nan
 
-from lib import mEoS, coolProp, refProp, config, unidades
+from lib import mEoS, coolProp, refProp, config, tabular, unidades
 from lib.thermo import ThermoAdvanced
 
 
@@ -53,6 +53,8 @@ def getMethod(pref=None):
             txt = "refprop"
         elif pref.getboolean("MEOS", 'coolprop'):
             txt = "coolprop"
+        elif pref.getboolean("MEOS", 'tabular', fallback=False):
+            txt = "tabular"
         else:
             txt = "meos"
     else:
@@ -77,6 +79,11 @@ def getClassFluid(method, fluid):
         index = mEoS.__all__[fluid].id
         fluid = coolProp.CoolProp(ids=[index])
 
+    elif method == "tabular":
+        # Interpolated tables case, the instance with the mEoS subclass and
+        # its tables loaded
+        fluid = tabular.Tabular(fluid=mEoS.__all__[fluid])
+
     else:
         # MEOS case, the instance of specified mEoS subclass
         fluid = mEoS.__all__[fluid]()
@@ -85,8 +92,14 @@ def getClassFluid(method, fluid):
 
 
 def getLimit(fluid, conf):
-    method = getMethod()
-    if method == "meos":
+    """Return the limits of equation, Tmin, Tmax, Pmin, Pmax. The conf can be
+    the configparser instance with project configuration or a dict with the
+    eq, visco, thermal and optionally the method keys"""
+    if isinstance(conf, dict) and "method" in conf:
+        method = getMethod(conf)
+    else:
+        method = getMethod()
+    if method in ("meos", "tabular"):
         if isinstance(conf, dict):
             option = conf
         else:
@@ -122,7 +135,10 @@ def getLimit(fluid, conf):
 
 def calcPoint(fluid, conf, **kwargs):
     """Procedure to calculate point state and check state in P-T range of eq"""
-    method = getMethod()
+    if isinstance(conf, dict) and "method" in conf:
+        method = getMethod(conf)
+    else:
+        method = getMethod()
     Tmin, Tmax, Pmin, Pmax = getLimit(fluid, conf)
 
     if "T" in kwargs:
@@ -138,7 +154,7 @@ def calcPoint(fluid, conf, **kwargs):
         return None
 
     # Discard any point below the melting line, in solid state
-    if method == "meos":
+    if method in ("meos", "tabular"):
         if fluido._melting and fluido._melting["Tmin"] <= fluido.T \
                 <= fluido._melting["Tmax"]:
             Pmel = fluido._Melting_Pressure(fluido.T)
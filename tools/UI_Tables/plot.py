@@ -28,6 +28,7 @@ along with this program.  If not, see <http://www.gnu.org/licenses/>.'''
 #   - EditAxis: Dialog to configure axes plot properties
 #   - AxisWidget: Dialog to configure axes plot properties
 #   - calcIsoline: Isoline calculation procedure
+#   - calcMesh: Mesh data calculation procedure
 #   - get_points: Get point number to plot lines from Preferences
 #   - getLineFormat: get matplotlib line format from preferences
 #   - plotIsoline: plot isoline procedure
@@ -55,6 +56,7 @@ from lib.utilities import formatLine
 from UI.widgets import (Entrada_con_unidades, createAction, LineStyleCombo,
                         MarkerCombo, ColorSelector, InputFont, ClickableLabel)
 
+from .backend import isoline, meshRow
 from .library import calcPoint, getLimit, getClassFluid, getMethod
 from .chooseFluid import Dialog_InfoFluid
 
@@ -439,7 +441,7 @@ class PlotMEoS(QtWidgets.QWidget):
         data["visco"] = self.config["visco"]
         data["thermal"] = self.config["thermal"]
 
-        if self.config["method"] == "meos":
+        if self.config["method"] in ("meos", "tabular"):
             data["external_dependences"] = ""
         elif self.config["method"] == "coolprop":
             data["external_dependences"] = "CoolProp"
@@ -1530,76 +1532,23 @@ class AxisWidget(QtWidgets.QGroupBox):
 
 
 def calcIsoline(f, conf, var, fix, vvar, vfix, ini, step, end, total, bar):
-    """Procedure to calculate isoline. In isotherm and isobar add to calculate
-    point the saturated states in two-phases region"""
-    fluidos = []
-    fail = 0
-    N_points = get_points(config.Preferences)
-    fase = None
-    rhoo = 0
-    To = 0
-    for Ti in vvar:
-        kwargs = {var: Ti, fix: vfix, "rho0": rhoo, "T0": To}
-        print(kwargs)
-        fluido = calcPoint(f, conf, **kwargs)
-
-        avance = ini + end*step/total + \
-            end/total*(len(fluidos)+fail)/(len(vvar)+N_points)
+    """Procedure to calculate isoline in the gui thread, updating the progress
+    bar, see :func:`backend.isoline`"""
+    def progress(done, points):
+        avance = ini + end*step/total + end/total*done/points
         bar.setValue(avance)
         QtWidgets.QApplication.processEvents()
 
-        if fluido and fluido.status and (fluido.rho != rhoo or fluido.T != To):
-            fluidos.append(fluido)
-
-            # Save values of last point as initial guess for next calculation
-            if var not in ("T", "P") or fix not in ("T", "P"):
-                rhoo = fluido.rho
-                To = fluido.T
-
-            if var in ("T", "P") and fix in ("T", "P"):
-                if fase is None:
-                    fase = fluido.x
-
-                if fase == fluido.x:
-                    continue
-
-                print("Calculating two phase additional point")
-                if fluido.P < f.Pc and fluido.T < f.Tc:
-                    if fase != fluido.x and fase <= 0:
-                        xi = linspace(0, 1, N_points)
-                    elif fase != fluido.x and fase >= 1:
-                        xi = linspace(1, 0, N_points)
-
-                    for x in xi:
-                        print({fix: vfix, "x": x})
-                        fluido_x = calcPoint(f, conf, **{fix: vfix, "x": x})
-                        fluidos.insert(-1, fluido_x)
-                        avance = ini + end*step/total + end/total * \
-                            (len(fluidos)+fail)/(len(vvar)+N_points)
-                        bar.setValue(avance)
-
-                fase = fluido.x
-        else:
-            fail += 1
-
-    return fluidos
+    N_points = get_points(config.Preferences)
+    return isoline(f, conf, var, fix, vvar, vfix, N_points, progress=progress)
 
 
 def calcMesh(f, conf, Ti, Pi):
     """Calculate mesh data for a 3D plot"""
     fluids = []
     for T in Ti:
-        fluids_i = []
-        for P in Pi:
-            kwargs = {"T": T, "P": P}
-            print(kwargs)
-            QtWidgets.QApplication.processEvents()
-            fluid = calcPoint(f, conf, **kwargs)
-            if fluid and fluid.status:
-                fluids_i.append(fluid)
-            else:
-                fluids_i.append(None)
-        fluids.append(fluids_i)
+        QtWidgets.QApplication.processEvents()
+        fluids.append(meshRow(f, conf, T, Pi))
     return fluids
 
 
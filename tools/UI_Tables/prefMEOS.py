@@ -272,6 +272,9 @@ class Widget(QtWidgets.QDialog):
         dlg = QtWidgets.QWidget()
         layout = QtWidgets.QGridLayout(dlg)
 
+        self.tabular = QtWidgets.QCheckBox(
+            self.tr("Use interpolated property tables (faster, approximate)"))
+        layout.addWidget(self.tabular, 2, 1, 1, 2)
         self.coolProp = QtWidgets.QCheckBox(
             self.tr("Use external library coolProp (faster)"))
         self.coolProp.setEnabled(False)
@@ -356,6 +359,8 @@ class Widget(QtWidgets.QDialog):
         if config.has_section("MEOS"):
             self.coolProp.setChecked(config.getboolean("MEOS", 'coolprop'))
             self.refprop.setChecked(config.getboolean("MEOS", 'refprop'))
+            self.tabular.setChecked(
+                config.getboolean("MEOS", 'tabular', fallback=False))
             self.lineconfig.setConfig(config)
             self.definition.setCurrentIndex(
                 config.getint("MEOS", 'definition'))
@@ -374,6 +379,7 @@ class Widget(QtWidgets.QDialog):
 
         config.set("MEOS", "coolprop", str(self.coolProp.isChecked()))
         config.set("MEOS", "refprop", str(self.refprop.isChecked()))
+        config.set("MEOS", "tabular", str(self.tabular.isChecked()))
         config = self.lineconfig.value(config)
 
         for indice in range(self.Isolineas.count()):
@@ -37,7 +37,7 @@ import os
 from numpy import delete, insert
 from tools.qt import QtCore, QtGui, QtWidgets, translate
 
-from lib import meos, mEoS, coolProp, unidades, config
+from lib import meos, mEoS, coolProp, tabular, unidades, config
 from lib.thermo import ThermoAdvanced
 from lib.utilities import representacion, exportTable
 from UI.widgets import (Entrada_con_unidades, createAction, Status, Tabla,
@@ -626,6 +626,10 @@ class TablaMEoS(Tabla):
             data["method"] = "meos"
             data["fluid"] = mEoS.__all__.index(self.Point.__class__)
             data["external_dependences"] = ""
+        elif isinstance(self.Point, tabular.Tabular):
+            data["method"] = "tabular"
+            data["fluid"] = mEoS.__all__.index(self.Point.table.fluid)
+            data["external_dependences"] = ""
         elif isinstance(self.Point, coolProp.CoolProp):
             data["method"] = "coolprop"
             data["fluid"] = mEoS.id_mEoS.index(self.Point.kwargs["ids"][0])
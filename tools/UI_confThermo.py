@@ -121,23 +121,29 @@ class UI_confThermo_widget(QtWidgets.QWidget):
         self.refprop.setEnabled(False)
         self.refprop.toggled.connect(self.changed.emit)
         layout.addWidget(self.refprop, 9, 1, 1, 3)
+        self.tabular = QtWidgets.QCheckBox(
+            self.tr("Use interpolated property tables (faster, approximate)"))
+        self.tabular.setEnabled(False)
+        self.tabular.toggled.connect(self.changed.emit)
+        layout.addWidget(self.tabular, 10, 1, 1, 3)
 
         self.iapws = QtWidgets.QCheckBox(self.tr("Use IAPWS97 for water"))
         self.iapws.toggled.connect(self.changed.emit)
-        layout.addWidget(self.iapws, 10, 0, 1, 4)
+        layout.addWidget(self.iapws, 11, 0, 1, 4)
         self.freesteam = QtWidgets.QCheckBox(
             self.tr("Use freesteam library (faster)"))
         self.freesteam.setEnabled(False)
         self.freesteam.toggled.connect(self.changed.emit)
-        layout.addWidget(self.freesteam, 11, 1, 1, 3)
+        layout.addWidget(self.freesteam, 12, 1, 1, 3)
         self.GERG = QtWidgets.QCheckBox(
             self.tr("Use GERG EoS for mix if it's posible"))
         self.GERG.toggled.connect(self.changed.emit)
-        layout.addWidget(self.GERG, 12, 0, 1, 4)
+        layout.addWidget(self.GERG, 13, 0, 1, 4)
         layout.addItem(QtWidgets.QSpacerItem(
             10, 10, QtWidgets.QSizePolicy.Policy.Expanding,
-            QtWidgets.QSizePolicy.Policy.Expanding), 13, 0, 1, 5)
+            QtWidgets.QSizePolicy.Policy.Expanding), 14, 0, 1, 5)
 
+        self.MEoS.toggled.connect(self.tabular.setEnabled)
         if os.environ["freesteam"] == "True":
             self.iapws.toggled.connect(self.freesteam.setEnabled)
         if os.environ["CoolProp"] == "True":
@@ -163,13 +169,15 @@ class UI_confThermo_widget(QtWidgets.QWidget):
             self.freesteam.setChecked(config.getboolean("Thermo", "freesteam"))
             self.coolProp.setChecked(config.getboolean("Thermo", "coolProp"))
             self.refprop.setChecked(config.getboolean("Thermo", "refprop"))
+            self.tabular.setChecked(
+                config.getboolean("Thermo", "tabular", fallback=False))
 
     def setKwargs(self, kwarg):
         """Set values from kwargs dict"""
         config = getMainWindowConfig()
         self.setConfig(config)
         for key in ["MEoS", "iapws", "GERG", "freesteam", "coolProp",
-                    "refprop"]:
+                    "refprop", "tabular"]:
             if kwarg[key] != Corriente.kwargs[key]:
                 getattr(self, key).setChecked(kwarg[key])
 
@@ -206,6 +214,7 @@ class UI_confThermo_widget(QtWidgets.QWidget):
         kw["freesteam"] = self.freesteam.isChecked()
         kw["coolProp"] = self.coolProp.isChecked()
         kw["refprop"] = self.refprop.isChecked()
+        kw["tabular"] = self.tabular.isChecked()
         return kw
 
     def value(self, config):
@@ -223,6 +232,7 @@ class UI_confThermo_widget(QtWidgets.QWidget):
         config.set("Thermo", "freesteam", str(self.freesteam.isChecked()))
         config.set("Thermo", "coolProp", str(self.coolProp.isChecked()))
         config.set("Thermo", "refprop", str(self.refprop.isChecked()))
+        config.set("Thermo", "tabular", str(self.tabular.isChecked()))
         return config
 
     @classmethod
@@ -240,6 +250,7 @@ class UI_confThermo_widget(QtWidgets.QWidget):
         config.set("Thermo", "freesteam", "False")
         config.set("Thermo", "coolProp", "False")
         config.set("Thermo", "refprop", "False")
+        config.set("Thermo", "tabular", "False")
         return config
 
     def updateBIP(self, index):
@@ -35,7 +35,6 @@ and its configuration
 
 from configparser import ConfigParser
 from functools import partial
-import json
 import logging
 from math import pi
 import os
@@ -47,12 +46,23 @@ from lib.plot import PlotWidget
 from lib.psycrometry import PsyState, PsychroState, _Pbar, _height
 from lib.unidades import (Temperature, Pressure, Length, Mass,
                           SpecificVolume, Enthalpy)
-from lib.utilities import formatLine
+from lib.utilities import formatLine, readCache, saveCache
 from tools.qt import QtCore, QtGui, QtWidgets, translate
 from tools.UI_Tables.prefMEOS import Isolinea
 from UI.widgets import Entrada_con_unidades, LineConfig
 
 
+def _key(config, P):
+    """Key of chart data in cache file, by calculation method, pressure and
+    the values of isolines"""
+    lines = []
+    for name in ("isotdb", "isow", "isohr", "isotwb", "isochor"):
+        values = PsyState.LineList(name, config)
+        lines.append(",".join("%g" % value for value in values))
+    method = PsychroState().__class__.__name__
+    return "%s:%0.0f:%s" % (method, P, ":".join(lines))
+
+
 class PsychroPlot(PlotWidget):
     """
     Plot widget for psychrometric chart
@@ -401,27 +411,24 @@ class UI_Psychrometry(QtWidgets.QDialog):
         self.plt.ax.clear()
         chart = self.Preferences.getboolean("Psychr", "chart")
         self.plt.config(self.Preferences)
-        filename = conf_dir + f"{PsychroState().__class__.__name__}_" \
-            + f"{self.inputs.P.value:0.0f}.json"
-        if os.path.isfile(filename):
-            with open(filename, "r") as archivo:
-                data = json.load(archivo)
-                self.status.setText(self.tr("Loading cached data..."))
-                QtWidgets.QApplication.processEvents()
+        key = _key(self.Preferences, self.inputs.P.value)
+        data = readCache(conf_dir+"psychrometry.dat").get(key)
+        if data is not None:
+            self.status.setText(self.tr("Loading cached data..."))
+            QtWidgets.QApplication.processEvents()
         else:
             self.progressBar.setVisible(True)
             self.status.setText(self.tr("Calculating data..."))
             QtWidgets.QApplication.processEvents()
             data = PsychroState.calculatePlot(self)
-            with open(filename, "w") as file:
-                json.dump(data, file, indent=4)
-
+            saveCache(conf_dir+"psychrometry.dat", key, data)
             self.progressBar.setVisible(False)
         self.status.setText(self.tr("Plotting..."))
         QtWidgets.QApplication.processEvents()
 
         # Saturation line
-        t = [Temperature(ti).config() for ti in data["t"]]
+        func = Temperature.func()
+        t = [getattr(Temperature(ti), func) for ti in data["t"]]
         Hs = data["Hs"]
         fmt = formatLine(self.Preferences, "Psychr", "saturation")
         if chart:
@@ -445,7 +452,7 @@ class UI_Psychrometry(QtWidgets.QDialog):
         tm = Temperature(self.Preferences.getfloat("Psychr", "isotdbEnd"))
         fmt = formatLine(self.Preferences, "Psychr", "isow")
         for i, H in enumerate(H):
-            ts = Temperature(th[i]).config()
+            ts = getattr(Temperature(th[i]), func)
             if chart:
                 self.plt.plot([ts, tm.config()], [H, H], **fmt)
             else:
@@ -465,7 +472,7 @@ class UI_Psychrometry(QtWidgets.QDialog):
         fmt = formatLine(self.Preferences, "Psychr", "isotwb")
         for T, (H, Tw) in list(data["Twb"].items()):
             value = Temperature(T).config()
-            Tw_conf = [Temperature(Twi).config() for Twi in Tw]
+            Tw_conf = [getattr(Temperature(Twi), func) for Twi in Tw]
             txt = Temperature.text()
             if chart:
                 self.plt.plot(Tw_conf, H, **fmt)
@@ -478,7 +485,7 @@ class UI_Psychrometry(QtWidgets.QDialog):
         fmt = formatLine(self.Preferences, "Psychr", "isochor")
         for v, (Td, H) in list(data["v"].items()):
             value = SpecificVolume(v).config()
-            Td_conf = [Temperature(Tdi).config() for Tdi in Td]
+            Td_conf = [getattr(Temperature(Tdi), func) for Tdi in Td]
             txt = SpecificVolume.text()
             if chart:
                 self.plt.plot(Td_conf, H, **fmt)
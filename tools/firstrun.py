@@ -361,6 +361,7 @@ def Preferences():
     conf.add_section("MEOS")
     conf.set("MEOS", "coolprop", "False")
     conf.set("MEOS", "refprop", "False")
+    conf.set("MEOS", "tabular", "False")
     conf.set("MEOS", "saturation"+"Color", "#000000")
     conf.set("MEOS", "saturation"+"alpha", "255")
     conf.set("MEOS", "saturation"+"lineWidth", "1.0")
@@ -625,6 +626,7 @@ def config():
     conf.set("Thermo", "freesteam", "False")
     conf.set("Thermo", "coolProp", "False")
     conf.set("Thermo", "refprop", "False")
+    conf.set("Thermo", "tabular", "False")
 
     # Transport
     conf.add_section("Transport")
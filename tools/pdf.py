@@ -62,7 +62,9 @@ def openPDF(file, title=None):
         Optional title for the window used only when use the internal viewer
     """
 
-    if Preferences.getboolean("Applications", "PDF"):
+    # Use the external viewer too if QtWebEngine isn't available
+    if Preferences.getboolean("Applications", "PDF") or \
+            not QtWebEngineWidgets:
         app = Preferences.get("Applications", 'PDFExternal')
         subprocess.Popen([app, file])
     else:
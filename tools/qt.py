@@ -26,7 +26,13 @@ along with this program.  If not, see <http://www.gnu.org/licenses/>."""
 
 try:
     from PyQt6 import QtWidgets, QtGui, QtCore, QtSvg, QtSvgWidgets
-    from PyQt6 import QtWebEngineWidgets
+
+    # QtWebEngine need system libraries of display server, unavailable in
+    # headless servers
+    try:
+        from PyQt6 import QtWebEngineWidgets
+    except ImportError:
+        QtWebEngineWidgets = False
 
     try:
         from PyQt6 import Qsci
@@ -42,7 +48,11 @@ try:
 
 except ImportError:
     from PyQt5 import QtWidgets, QtGui, QtCore, QtSvg
-    from PyQt5 import QtWebEngineWidgets
+
+    try:
+        from PyQt5 import QtWebEngineWidgets
+    except ImportError:
+        QtWebEngineWidgets = False
 
     try:
         from PyQt5 import Qsci